@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Memory and definition time of MutaProp descriptors.
+
+Defines a class with many mutaproperties (getter + setter, i.e. two
+decoration steps each) and mutasources, the way generated device classes
+do, and reports the time of the class definition and the memory taken by
+the descriptors.
+
+Usage::
+
+    python benchmarks/bench_props.py [number of props]
+
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from mutaprops import *
+
+
+def make_namespace(count):
+    """ Class body with `count` mutaproperties and `count` // 10
+    mutasources.
+    """
+    namespace = {}
+    for i in range(count):
+        def fget(self, _i=i):
+            """ Register value."""
+            return self._values.get(_i, 0)
+
+        def fset(self, value, _i=i):
+            self._values[_i] = value
+
+        fget.__name__ = fset.__name__ = 'reg_{0}'.format(i)
+        prop = mutaproperty("Register {0}".format(i), MutaTypes.INT,
+                            min_val=0, max_val=65535,
+                            hierarchy="Bank {0}".format(i // 100))(fget)
+        namespace[fget.__name__] = prop.setter(fset)
+
+    for i in range(count // 10):
+        def fget(self, _i=i):
+            return bool(self._values.get(_i, 0))
+
+        fget.__name__ = 'flag_{0}'.format(i)
+        namespace[fget.__name__] = mutasource(fget)
+    return namespace
+
+
+def define_class(count):
+    namespace = make_namespace(count)
+    return mutaprop_class("Device")(type('Device', (object,), namespace))
+
+
+def main(count):
+    gc.collect()
+    start = time.perf_counter()
+    define_class(count)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    cls = define_class(count)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in
+                    after.compare_to(before, 'filename')
+                    if stat.traceback[0].filename.endswith('mutaprops.py'))
+
+    props = len(cls.muta_prop_table())
+    print("Props:            {0}".format(props))
+    print("Definition time:  {0:.1f} ms ({1:.1f} us per prop)".format(
+        elapsed * 1e3, elapsed * 1e6 / props))
+    print("Descriptor memory: {0:.0f} kB ({1:.0f} B per prop)".format(
+        allocated / 1024, allocated / props))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -50,8 +50,9 @@ class Hoovercraft:
 
     # Following is the example of raw HTML support. It's basically an
     # attribute containing HTML code.
-    # In case of change, the entier code is forwarded over websocket,
-    # so it's not very efficient solution. Some upgrades are planned.
+    # In case of change, the entier code is forwarded over websocket, unless
+    # the manager is created with `delta_threshold` - then only the changed
+    # part of the code is sent (see the manager setup below).
     @mutaproperty("Eel loading process",
                   MutaTypes.HTML,
                   hierarchy='Eel control')  # Note the hierarchy argument, explained below
@@ -193,7 +194,8 @@ if __name__ == '__main__':
     man = HttpMutaManager("Hoovercraft manager", proxy_log=logger,
                           loop=loop,  # UI manager will run in app's loop.
                           local_dir="assets",
-                          help_doc=rest_to_html(custom_help))
+                          help_doc=rest_to_html(custom_help),
+                          delta_threshold=200)  # Patch HTML over 200 chars
     man.add_object(test)
 
     man.add_object(test2, "Hoovercraft #2")  # We can also muta-init object while adding, just by specifying the ID as the argument.
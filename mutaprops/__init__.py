@@ -7,6 +7,6 @@ __version__ = '0.7.4'
 
 from .decorators import mutaprop_class, mutaproperty, mutaprop_action, \
     mutasource
-from .mutaprops import MutaTypes
+from .mutaprops import MutaTypes, ChangeDetection
 from .managers import HttpMutaManager
 
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import gzip
+import logging
+import mimetypes
+import os
+import re
+from aiohttp import web
+from .utils import content_tag
+
+try:
+    import brotli
+except ImportError:  # Optional, only gzip is offered without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Long enough for the hashed URLs, which change with the content
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE = 'no-cache'
+
+# Types which are worth compressing
+_COMPRESSIBLE = re.compile(r'^(text/|application/(javascript|json|xml))|'
+                           r'\+xml$')
+
+
+def _accepted_encodings(request):
+    """ Returns set of encodings acceptable according to the request's
+    Accept-Encoding header (ignoring those with zero quality).
+    """
+    accepted = set()
+    for item in request.headers.get('Accept-Encoding', '').split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = params.strip()
+        if quality.startswith('q='):
+            try:
+                if float(quality[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class StaticAsset(object):
+    """
+    Static file kept in memory together with its compressed variants.
+    """
+
+    def __init__(self, name, body, content_type, encoded=None):
+        """
+        :param name:  File name, used in the URL.
+        :param body:  Raw content (bytes).
+        :param content_type:  MIME type of the content.
+        :param encoded:  Dict {content_coding: body} of precompressed variants.
+        """
+        self.name = name
+        self.body = body
+        self.content_type = content_type
+        self.encoded = encoded or {}
+        self.tag = content_tag(body)
+        self.etag = '"{0}"'.format(self.tag)
+
+    @classmethod
+    def from_bytes(cls, name, body, content_type=None, precompressed=None):
+        """ Creates the asset, compressing the body if the type is worth it and
+        the variant was not supplied already.
+        """
+        if content_type is None:
+            content_type = mimetypes.guess_type(name)[0] or \
+                'application/octet-stream'
+        encoded = dict(precompressed or {})
+        if _COMPRESSIBLE.search(content_type):
+            if 'gzip' not in encoded:
+                encoded['gzip'] = gzip.compress(body, 9)
+            if brotli is not None and 'br' not in encoded:
+                encoded['br'] = brotli.compress(body)
+        # Variants not smaller than the original are useless
+        encoded = {coding: data for coding, data in encoded.items()
+                   if len(data) < len(body)}
+        return cls(name, body, content_type, encoded)
+
+    def response(self, request, cache_control=REVALIDATE_CACHE):
+        """ Returns response with the best acceptable variant of the body,
+        or 304 if the client's copy is still valid.
+        """
+        headers = {'ETag': self.etag, 'Cache-Control': cache_control,
+                   'Vary': 'Accept-Encoding'}
+        if_none_match = request.headers.get('If-None-Match', '')
+        if self.etag in (tag.strip()[2:] if tag.strip().startswith('W/')
+                         else tag.strip()
+                         for tag in if_none_match.split(',')):
+            return web.Response(status=304, headers=headers)
+
+        accepted = _accepted_encodings(request)
+        body = self.body
+        for coding in ('br', 'gzip'):
+            if coding in self.encoded and coding in accepted:
+                headers['Content-Encoding'] = coding
+                body = self.encoded[coding]
+                break
+        return web.Response(body=body, content_type=self.content_type,
+                            headers=headers)
+
+
+class AssetBundle(object):
+    """
+    In-memory store of the web UI files. Everything is read and compressed
+    once, when the bundle is loaded.
+
+    Precompressed variants found on the disk next to the files
+    (``build.js.gz``, ``build.js.br``) are used instead of compressing
+    the files on load.
+    """
+
+    _VARIANT_SUFFIXES = {'.gz': 'gzip', '.br': 'br'}
+
+    def __init__(self):
+        self._assets = {}
+
+    def __contains__(self, name):
+        return name in self._assets
+
+    def __getitem__(self, name):
+        return self._assets[name]
+
+    def add(self, asset):
+        self._assets[asset.name] = asset
+
+    def load(self, directory):
+        """ Loads all files of the directory (not recursively)."""
+        names = sorted(os.listdir(directory))
+        for name in names:
+            path = os.path.join(directory, name)
+            suffix = os.path.splitext(name)[1]
+            if not os.path.isfile(path) or suffix in self._VARIANT_SUFFIXES:
+                continue
+
+            precompressed = {}
+            for variant_suffix, coding in self._VARIANT_SUFFIXES.items():
+                if name + variant_suffix in names:
+                    with open(path + variant_suffix, 'rb') as variant_file:
+                        precompressed[coding] = variant_file.read()
+
+            with open(path, 'rb') as asset_file:
+                self.add(StaticAsset.from_bytes(name, asset_file.read(),
+                                                precompressed=precompressed))
+            logger.debug("Loaded static asset %s" % name)
+        return self
+
+    def url(self, name, prefix='dist/'):
+        """ Returns URL of the asset with the content hash, which can be cached
+        forever.
+        """
+        return '{0}{1}?v={2}'.format(prefix, name, self._assets[name].tag)
+
+    def versioned_html(self, html, prefix='dist/'):
+        """ Replaces the asset links (``href``/``src`` attributes starting
+        with `prefix`) in the HTML by their content-hashed URLs.
+        """
+        pattern = re.compile(r'((?:href|src)=")' + re.escape(prefix) +
+                             r'([^"?#]+)(")')
+
+        def replace(match):
+            if match.group(2) not in self._assets:
+                return match.group(0)
+            return match.group(1) + self.url(match.group(2), prefix) + \
+                match.group(3)
+
+        return pattern.sub(replace, html)
+
+    def response(self, request, name):
+        """ Response for the asset request. Requests with the current content
+        hash get long-lived cache headers, others have to revalidate.
+        """
+        asset = self._assets.get(name, None)
+        if asset is None:
+            return web.HTTPNotFound()
+        if request.query.get('v', None) == asset.tag:
+            return asset.response(request, IMMUTABLE_CACHE)
+        return asset.response(request)
@@ -8,7 +8,8 @@ logger = logging.getLogger(__name__)
 
 
 def mutaprop_class(display_name, gui_id=None, gui_major_version=0,
-                   gui_minor_version=0):
+                   gui_minor_version=0, blocking=False,
+                   change_detection='getter'):
     """ Class-level decorator. It is required for classes whose instances should
     be visible for the Mutaprop UI manager.
 
@@ -18,20 +19,38 @@ def mutaprop_class(display_name, gui_id=None, gui_major_version=0,
                          In most cases, it's not really important.
     :param gui_major_version:  Reserved for future use.
     :param gui_minor_version:  Reserved for future use.
+    :param blocking:  Default for the ``blocking`` argument of the class'
+                      mutaproperties, mutasources and actions. Functions of
+                      blocking props are run by the manager in executor
+                      (thread pool), one at a time per object.
+    :param change_detection:  Default for the ``change_detection`` argument
+                      of the class' mutaproperties and mutasources, see
+                      :class:`~mutaprops.mutaprops.ChangeDetection`.
     """
 
     def decorator(cls):
         logger.debug("Registered mutaprop class: %s", cls.__name__)
-        return type("MutaProp{0}".format(cls.__name__), (cls, MutaPropClass),
-                    {MutaPropClass.muta_attr(MutaPropClass.MP_NAME):
-                         display_name,
-                     MutaPropClass.muta_attr(MutaPropClass.MP_GUI_ID): gui_id,
-                     MutaPropClass.muta_attr(
-                         MutaPropClass.MP_GUI_MAJOR_VERSION): gui_major_version,
-                     MutaPropClass.muta_attr(
-                         MutaPropClass.MP_GUI_MINOR_VERSION): gui_minor_version,
-                     "__doc__": cls.__doc__,
-                     "_orig_cls": cls})
+        muta_cls = type("MutaProp{0}".format(cls.__name__),
+                        (cls, MutaPropClass),
+                        {MutaPropClass.muta_attr(MutaPropClass.MP_NAME):
+                            display_name,
+                         MutaPropClass.muta_attr(MutaPropClass.MP_GUI_ID):
+                            gui_id,
+                         MutaPropClass.muta_attr(
+                             MutaPropClass.MP_GUI_MAJOR_VERSION):
+                            gui_major_version,
+                         MutaPropClass.muta_attr(
+                             MutaPropClass.MP_GUI_MINOR_VERSION):
+                            gui_minor_version,
+                         MutaPropClass.muta_attr(MutaPropClass.MP_BLOCKING):
+                            blocking,
+                         MutaPropClass.muta_attr(
+                             MutaPropClass.MP_CHANGE_DETECTION):
+                            change_detection,
+                         "__doc__": cls.__doc__,
+                         "_orig_cls": cls})
+        muta_cls.muta_prerender_docs()
+        return muta_cls
 
     return decorator
 
@@ -82,8 +101,37 @@ def mutaproperty(display_name, value_type, **kwargs):
                     If priority is not used, the order at which
                     MutaProps are listed in GUI is defined by deford.
 
+    :param blocking:  bool
+                      The getter/setter blocks (e.g. device I/O), the manager
+                      runs it in executor. Defaults to the class setting.
+
+    :param change_detection:  ``'getter'``, ``'cached'``, ``'hash'`` or
+                      ``'always'``
+                      How a set is found to change the value (and be
+                      notified): by comparing with the getter's value, with
+                      the last notified value, with hash of the last notified
+                      value, or not at all. Defaults to the class setting.
+                      See :class:`~mutaprops.mutaprops.ChangeDetection`.
+
+    :param poll_interval:  float
+                      [seconds] The manager reads the value periodically and
+                      notifies the UI if it changed. For values which change
+                      without the setter being called (e.g. device
+                      registers).
+
     Optional arguments - numerical type (`MutaTypes.INT`, `MutaTypes.REAL`)
 
+    :param history:  int
+                     Number of recent values the manager keeps with their
+                     timestamps, see
+                     :meth:`~mutaprops.managers.HttpMutaManager.prop_history`.
+
+    :param stream:  bool
+                    Changes are sent as binary samples over the stream
+                    channel (``/api/stream``), the notifications carry only
+                    the latest value once per stream interval. For values
+                    changing at high rates.
+
     :param min_val:  int, dynamic_
                      Minimum possible value,
 
@@ -152,7 +200,8 @@ def mutaproperty(display_name, value_type, **kwargs):
     return decorator
 
 
-def mutasource(func=None, class_scope=False):
+def mutasource(func=None, class_scope=False, blocking=None,
+               change_detection=None, poll_interval=None):
     """ Decorated attribute's changes will be notified to the UI layer, but
         will not be displayed.
 
@@ -163,6 +212,10 @@ def mutasource(func=None, class_scope=False):
 
     :param class_scope:  [True, False]
                          Set to reflect class-level attribute.
+    :param blocking:  [True, False]
+                      Getter blocks, the manager runs it in executor.
+    :param change_detection:  See :func:`mutaproperty`.
+    :param poll_interval:  See :func:`mutaproperty`.
     """
     if func:
         logger.debug("Registered mutasource: %s", func.__name__)
@@ -172,7 +225,10 @@ def mutasource(func=None, class_scope=False):
         def decorator(fget):
             logger.debug("Registered mutasource: %s", fget.__name__)
             return MutaSource(fget.__name__, None, None,
-                              class_scope=class_scope, fget=fget)
+                              class_scope=class_scope, fget=fget,
+                              blocking=blocking,
+                              change_detection=change_detection,
+                              poll_interval=poll_interval)
         return decorator
 
 
@@ -197,6 +253,10 @@ def mutaprop_action(display_name, **kwargs):
                     automatically based on the decorator calls.
                     If priority is not used, the order at which
                     MutaProps are listed in GUI is defined by deford.
+
+    :param blocking:  bool
+                      The action blocks (e.g. long calibration), the manager
+                      runs it in executor. Defaults to the class setting.
     """
 
     def decorator(func):
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from array import array
+
+
+class HistoryBuffer(object):
+    """
+    Fixed-size ring buffer of (timestamp, value) samples of a numeric prop.
+
+    Timestamps and values are kept in two preallocated ``array('d')``, the
+    oldest samples are overwritten when the buffer is full. Samples are
+    expected to come in time order, so the time ranges are found by
+    bisection. Queries walk only the requested range, the buffer itself is
+    never copied.
+    """
+
+    def __init__(self, size):
+        """
+        :param size:  Maximum number of samples kept.
+        """
+        if size < 1:
+            raise ValueError("History size must be positive.")
+        self._size = size
+        self._times = array('d', [0.0]) * size
+        self._values = array('d', [0.0]) * size
+        self._start = 0  # Physical index of the oldest sample
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def size(self):
+        return self._size
+
+    def append(self, timestamp, value):
+        """ Adds a sample, overwriting the oldest one if the buffer is full.
+        Values which are not numbers are ignored.
+        """
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return
+        if self._count < self._size:
+            index = (self._start + self._count) % self._size
+            self._count += 1
+        else:
+            index = self._start
+            self._start = (self._start + 1) % self._size
+        self._times[index] = timestamp
+        self._values[index] = value
+
+    def clear(self):
+        self._start = 0
+        self._count = 0
+
+    def _time(self, position):
+        return self._times[(self._start + position) % self._size]
+
+    def _bisect(self, timestamp, after=False):
+        """ Returns position (0 = oldest) of the first sample not older than
+        `timestamp` (newer than `timestamp` if `after` is set).
+        """
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            mid_time = self._time(mid)
+            if mid_time < timestamp or (after and mid_time == timestamp):
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _range(self, start, end):
+        """ Returns (first, stop) positions of the samples within
+        [`start`, `end`].
+        """
+        first = 0 if start is None else self._bisect(start)
+        stop = self._count if end is None else self._bisect(end, after=True)
+        return first, max(first, stop)
+
+    def _iter(self, first, stop):
+        size = self._size
+        times = self._times
+        values = self._values
+        for position in range(first, stop):
+            index = (self._start + position) % size
+            yield times[index], values[index]
+
+    def samples(self, start=None, end=None):
+        """ Returns the samples within the time range as
+        ``{'t': [timestamps], 'v': [values]}``.
+        """
+        temp = {'t': [], 'v': []}
+        for timestamp, value in self._iter(*self._range(start, end)):
+            temp['t'].append(timestamp)
+            temp['v'].append(value)
+        return temp
+
+    def downsample(self, buckets, start=None, end=None):
+        """ Splits the time range into `buckets` intervals of equal length
+        and returns minimum and maximum of each non-empty one as
+        ``{'t': [bucket start times], 'min': [...], 'max': [...],
+        'count': [...]}``.
+        """
+        temp = {'t': [], 'min': [], 'max': [], 'count': []}
+        first, stop = self._range(start, end)
+        if first >= stop or buckets < 1:
+            return temp
+        if start is None:
+            start = self._time(first)
+        if end is None:
+            end = self._time(stop - 1)
+        width = (end - start) / buckets
+
+        current = None
+        for timestamp, value in self._iter(first, stop):
+            bucket = min(int((timestamp - start) / width), buckets - 1) \
+                if width > 0 else 0
+            if bucket != current:
+                current = bucket
+                temp['t'].append(start + bucket * width)
+                temp['min'].append(value)
+                temp['max'].append(value)
+                temp['count'].append(1)
+            else:
+                if value < temp['min'][-1]:
+                    temp['min'][-1] = value
+                elif value > temp['max'][-1]:
+                    temp['max'][-1] = value
+                temp['count'][-1] += 1
+        return temp
@@ -2,23 +2,159 @@
 # -*- coding: utf-8 -*-
 
 import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import inspect
+import random
 import urllib.parse
 from aiohttp import web, ClientSession, WSMsgType, WSServerHandshakeError,\
-    ClientOSError
+    ClientOSError, TCPConnector
 from aiohttp import __version__ as aiohttp_version
-from .mutaprops import MutaPropError, MutaPropClass, MutaAction, MutaTypes
+from .mutaprops import MutaPropError, MutaPropClass, MutaAction, MutaTypes, \
+    MutaProperty, MutaSource
+from .notifications import ChangeCoalescer, DeltaEncoder, Subscription, \
+    ChangeBridge, PollScheduler, running_loop
+from .assets import AssetBundle, StaticAsset
+from .history import HistoryBuffer
+from .streaming import SampleStreamer
+from .utils import content_tag, LruCache
 from collections import OrderedDict
 import threading
+import time
 import sockjs
+from sockjs.protocol import message_frame
 import json
 import logging
 import os
 
+try:
+    from aiohttp import ClientTimeout
+except ImportError:  # aiohttp < 3.3
+    ClientTimeout = None
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency for the binary wire format
+    msgpack = None
+
+CONTENT_JSON = 'application/json'
+CONTENT_MSGPACK = 'application/msgpack'
+CONTENT_NDJSON = 'application/x-ndjson'
+_MSGPACK_TYPES = (CONTENT_MSGPACK, 'application/x-msgpack')
+WIRE_FORMATS = {'json': CONTENT_JSON, 'msgpack': CONTENT_MSGPACK}
+
 
 class MutaManagerError(MutaPropError):
     pass
 
 
+def _encode_body(data, content_type):
+    if content_type in _MSGPACK_TYPES:
+        return msgpack.packb(data, use_bin_type=True)
+    return json.dumps(data).encode('utf-8')
+
+
+def _decode_body(body, content_type):
+    if content_type in _MSGPACK_TYPES:
+        return msgpack.unpackb(body, raw=False)
+    return json.loads(body.decode('utf-8'))
+
+
+def _preferred_type(accept):
+    """ Returns the supported content type with the highest quality in
+    the Accept header value (ignoring those with zero quality), JSON if
+    none of them is acceptable. Wildcard ranges stand for JSON.
+    """
+    supported = {CONTENT_JSON: CONTENT_JSON, 'application/*': CONTENT_JSON,
+                 '*/*': CONTENT_JSON}
+    if msgpack is not None:
+        supported.update((content_type, CONTENT_MSGPACK)
+                         for content_type in _MSGPACK_TYPES)
+
+    preferred, preferred_quality = CONTENT_JSON, 0
+    for item in accept.split(','):
+        media_range, *params = item.split(';')
+        content_type = supported.get(media_range.strip().lower(), None)
+        if content_type is None:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0
+        if quality > preferred_quality:
+            preferred, preferred_quality = content_type, quality
+    return preferred
+
+
+def _relay_response(status, content_type, body, accept, headers=None):
+    """ Creates response from a remote manager's response, transcoding
+    the body if the remote content type differs from the accepted one.
+    """
+    if content_type != accept and body and \
+            content_type in (CONTENT_JSON,) + _MSGPACK_TYPES:
+        body = _encode_body(_decode_body(body, content_type), accept)
+        content_type = accept
+    return web.Response(body=body, status=status, content_type=content_type,
+                        headers=headers)
+
+
+class ReconnectStats(object):
+    """
+    Reconnection history and backoff of one remote manager.
+
+    After each failed attempt the delay before the next one doubles (from
+    the base period up to the maximal delay) and a random half of it is
+    dropped, so the managers which went down together don't retry in sync.
+    """
+
+    def __init__(self):
+        self.attempts = 0
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_latency = None
+        self.total_latency = 0.0
+        self.last_error = None
+        self.next_attempt = 0
+
+    def due(self, now):
+        return self.next_attempt <= now
+
+    def succeeded(self, latency):
+        self.attempts += 1
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.last_latency = latency
+        self.total_latency += latency
+        self.next_attempt = 0
+
+    def failed(self, now, latency, error, base, max_delay):
+        self.attempts += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_latency = latency
+        self.total_latency += latency
+        self.last_error = str(error)
+        delay = min(max_delay,
+                    base * 2 ** min(self.consecutive_failures - 1, 32))
+        self.next_attempt = now + delay / 2 + random.uniform(0, delay / 2)
+
+    def to_dict(self, now):
+        return {'attempts': self.attempts, 'successes': self.successes,
+                'failures': self.failures,
+                'consecutiveFailures': self.consecutive_failures,
+                'lastLatency': self.last_latency,
+                'meanLatency': (self.total_latency / self.attempts
+                                if self.attempts else None),
+                'lastError': self.last_error,
+                'nextAttemptIn': max(self.next_attempt - now, 0)}
+
+
 class HttpMutaManager(object):
     """
     Manages HTML5 gateway for controlling the MutaObjects.
@@ -35,29 +171,153 @@ class HttpMutaManager(object):
     WEB_ASSETS = os.path.join(os.path.dirname(__file__), r"web_ui/dist/")
     INDEX_FILE = open(os.path.join(os.path.dirname(__file__),
                                    'web_ui', 'index.html'), 'rb').read()
+    _web_assets = None  # Shared by all managers, loaded on first use
     NOTIFICATION_PROPERTY_CHANGE = 'property_change'
+    NOTIFICATION_PROPERTIES_CHANGE = 'properties_change'
     NOTIFICATION_EXTERNAL_CHANGE = 'external_change'
     NOTIFICATION_LOG_MESSAGE = 'log'
+    NOTIFICATION_LOG_MESSAGES = 'logs'
     NOTIFICATION_OBJECTS_CHANGE = 'objects_change'
     NOTIFICATION_TERMINATION = 'terminated'
     HEADER_SUPERVISOR = "muta-supervisor"
+    HEADER_VERSION = "muta-version"
+    HEADER_TOTAL = "muta-total"
     EVENT_SOURCE_OBJECT = "object"
     EVENT_SOURCE_MASTER = "master"
     EVENT_SOURCE_USER = "user"
+    CLIENT_SUBSCRIBE = 'subscribe'
+    CLIENT_UNSUBSCRIBE = 'unsubscribe'
+    CLIENT_SUBSCRIBE_ALL = 'subscribe_all'
+    CLIENT_LOG_LEVEL = 'log_level'
 
     class WsHandler(logging.Handler):
-        """ Handler to forward logging messages over websocket."""
+        """ Handler to forward logging messages over websocket.
+
+        With a loop, the records are collected and sent in batches every
+        `interval` seconds, at most `max_rate` records per second; records
+        over the limit are dropped and reported by a summary record. The last
+        `buffer_size` forwarded records are kept for the clients connecting
+        later. Records can be emitted from any thread.
+
+        Without a loop, each record is sent immediately.
+        """
 
-        def __init__(self, msg_callback, level=logging.NOTSET):
+        def __init__(self, msg_callback, level=logging.NOTSET, loop=None,
+                     interval=0.2, max_rate=50, buffer_size=500):
             self._msg_callback = msg_callback
+            self._loop = loop
+            self._interval = interval
+            self._max_rate = max_rate
+            self._pending = []
+            self._scheduled = False
+            self._window_start = 0
+            self._window_count = 0
+            self._dropped = 0
+            self._flush_thread = None
+            self._recent = deque(maxlen=buffer_size)
             super().__init__(level)
 
+        @staticmethod
+        def serialize(record):
+            """ Returns JSON-serializable dict of the record."""
+            try:
+                msg = record.getMessage()
+            except Exception:
+                msg = str(record.msg)
+            temp = {'name': record.name, 'levelname': record.levelname,
+                    'levelno': record.levelno, 'created': record.created,
+                    'msg': msg, 'args': []}
+            if record.exc_info:
+                temp['exc_text'] = logging.Formatter().formatException(
+                    record.exc_info)
+            return temp
+
         def emit(self, record):
-            self._msg_callback(HttpMutaManager.NOTIFICATION_LOG_MESSAGE,
-                               **record.__dict__)
+            if self._loop is None:
+                self._msg_callback(HttpMutaManager.NOTIFICATION_LOG_MESSAGE,
+                                   **self.serialize(record))
+                return
+
+            # Records logged while sending the batch would feed back
+            if self._flush_thread == threading.get_ident():
+                return
+
+            # Emit is called with the handler lock held
+            now = time.monotonic()
+            if now - self._window_start >= 1:
+                self._window_start = now
+                self._window_count = 0
+            if self._max_rate and self._window_count >= self._max_rate:
+                self._dropped += 1
+            else:
+                self._window_count += 1
+                self._pending.append(self.serialize(record))
+
+            if not self._scheduled:
+                self._scheduled = True
+                try:
+                    self._loop.call_soon_threadsafe(self._loop.call_later,
+                                                    self._interval,
+                                                    self._send_pending)
+                except RuntimeError:
+                    # Loop is closed
+                    self._pending = []
+
+        def flush(self):
+            """ Does nothing, the records are sent from the loop only.
+
+            (Called by :func:`logging.shutdown` from the main thread.)
+            """
+            pass
+
+        def _send_pending(self):
+            """ Sends the collected records. Called in the loop thread."""
+            self.acquire()
+            try:
+                records, self._pending = self._pending, []
+                dropped, self._dropped = self._dropped, 0
+                self._scheduled = False
+            finally:
+                self.release()
+
+            if dropped:
+                records.append({
+                    'name': __name__, 'levelname': 'WARNING',
+                    'levelno': logging.WARNING, 'created': time.time(),
+                    'msg': "{0} log records dropped (more than {1} "
+                           "records/s).".format(dropped, self._max_rate),
+                    'args': []})
+            if not records:
+                return
+
+            self._recent.extend(records)
+            self._flush_thread = threading.get_ident()
+            try:
+                self._msg_callback(HttpMutaManager.NOTIFICATION_LOG_MESSAGES,
+                                   records=records)
+            finally:
+                self._flush_thread = None
+
+        def recent(self, level=logging.NOTSET, limit=None):
+            """ Returns list of the last forwarded records with at least
+            the given level, at most `limit` of them.
+            """
+            temp = [record for record in list(self._recent)
+                    if record['levelno'] >= level]
+            if limit is not None:
+                temp = temp[len(temp) - limit:] if limit > 0 else []
+            return temp
 
     def __init__(self, name, loop=None, master=None, local_dir=None,
-                 help_doc=None, proxy_log=None, log_level=logging.NOTSET):
+                 help_doc=None, proxy_log=None, log_level=logging.NOTSET,
+                 notification_interval=None, notification_max_rate=None,
+                 delta_threshold=None, delta_resync=20, wire_format='json',
+                 executor=None, blocking_workers=None, log_interval=0.2,
+                 log_max_rate=50, log_buffer_size=500, mirror_max_age=None,
+                 client_limit=200, client_limit_per_host=8,
+                 client_keepalive=30, client_timeout=10, client_dns_ttl=300,
+                 reconnect_period=10, reconnect_max_delay=300,
+                 reconnect_workers=8, stream_interval=0.05):
         """
         :param name:  Name displayed in the UI top menu.
 
@@ -78,6 +338,96 @@ class HttpMutaManager(object):
                            the UI.
 
         :param log_level:  A log level to be displayed at the UI level.
+                           Clients can further raise it for themselves.
+
+        :param log_interval:  [seconds] Log records are sent in batches
+                          collected for this interval.
+
+        :param log_max_rate:  [records/s] Maximum rate of forwarded log
+                          records, the surplus records are dropped (and their
+                          count reported).
+
+        :param log_buffer_size:  Number of recent log records kept for
+                          the newly connected clients (``/api/logs``).
+
+        :param notification_interval:  [seconds]
+                          If set, property changes are not notified
+                          immediately, but collected for the given interval
+                          and sent as one batch. Only the latest value of each
+                          property is sent.
+
+        :param notification_max_rate:  [Hz]
+                          If set, change of a single property is notified at
+                          most this many times per second, faster changes are
+                          coalesced. Can be combined with
+                          ``notification_interval``.
+
+        :param delta_threshold:  If set, changes of string values (HTML and
+                          STRING properties) at least this long are sent
+                          as patches against the last sent value.
+
+        :param delta_resync:  When patches are enabled, every n-th change
+                          of the property is still sent as a full value.
+
+        :param wire_format:  ``'json'`` or ``'msgpack'``
+                          Format used for the communication with remote
+                          (slave) managers. ``'msgpack'`` requires the
+                          `msgpack` package. Regardless of this setting,
+                          the manager itself serves MessagePack to clients
+                          asking for ``application/msgpack`` (if the package
+                          is installed) and JSON to all others.
+
+        :param executor:  :class:`concurrent.futures.Executor` running
+                          the functions of blocking props (see the ``blocking``
+                          argument of the decorators). If not specified,
+                          the manager creates its own thread pool.
+
+        :param blocking_workers:  Number of threads of the manager's own pool
+                          for blocking props.
+
+        :param mirror_max_age:  [seconds]
+                          If set, schemas and values of remote (slave)
+                          objects are mirrored locally and reads are served
+                          from the mirror. The values are kept up to date by
+                          the notifications of the remote manager, the whole
+                          mirror of an object is reloaded when it is older
+                          than this (to catch values changed without
+                          a notification). ``None`` reads every value from
+                          the remote manager.
+
+        :param client_limit:  Maximum number of connections to other
+                          (master and slave) managers, 0 for no limit. One
+                          connection per attached slave is held by its
+                          websocket.
+
+        :param client_limit_per_host:  Maximum number of connections to
+                          a single remote manager, 0 for no limit.
+
+        :param client_keepalive:  [seconds] Time for which the idle
+                          connections are kept open for reuse.
+
+        :param client_timeout:  [seconds] Timeout of connecting to a remote
+                          manager and of waiting for its response data
+                          (the websockets wait without a limit).
+
+        :param client_dns_ttl:  [seconds] Time for which the resolved
+                          addresses of remote managers are cached, None to
+                          cache forever.
+
+        :param reconnect_period:  [seconds] Delay before reconnecting
+                          a disconnected remote (slave) manager. The delay
+                          doubles after each failed attempt (randomly
+                          shortened by up to a half).
+
+        :param reconnect_max_delay:  [seconds] Upper limit of the delay
+                          between reconnect attempts.
+
+        :param reconnect_workers:  Maximum number of remote managers being
+                          reconnected at the same time.
+
+        :param stream_interval:  [seconds] Time for which the samples of
+                          props with ``stream`` are collected before sending
+                          them in one frame to the stream clients.
         """
         self._name = name
         self._loop = loop or asyncio.get_event_loop()
@@ -88,6 +438,8 @@ class HttpMutaManager(object):
         self._muta_objects = OrderedDict()
         self._init_router(local_dir=local_dir)
         self._sockjs_manager = None
+        self._sockjs_sessions = {}
+        self._binary_clients = {}
         self._logger = logging.getLogger(HttpMutaManager.__class__.__name__)
         self._manager_proxies = {}
         self._proxy_reconnector_task = None
@@ -96,6 +448,57 @@ class HttpMutaManager(object):
         self._host_port = None
         self._proxy_logger = None
         self._help_doc = help_doc
+        self._change_coalescer = None
+        self._delta_encoder = None
+
+        if wire_format not in WIRE_FORMATS:
+            raise MutaManagerError("Unknown wire format %s" % wire_format)
+        if wire_format == 'msgpack' and msgpack is None:
+            raise MutaManagerError("The msgpack package is required for " +
+                                   "the msgpack wire format.")
+        self._wire_format = WIRE_FORMATS[wire_format]
+
+        self._executor = executor
+        self._own_executor = None
+        self._blocking_workers = blocking_workers
+        self._object_locks = {}
+        self._mirror_max_age = mirror_max_age
+        self._client_session = None
+        self._client_limit = client_limit
+        self._client_limit_per_host = client_limit_per_host
+        self._client_keepalive = client_keepalive
+        self._client_timeout = client_timeout
+        if ClientTimeout is not None:
+            self._client_request_timeout = ClientTimeout(
+                total=None, connect=client_timeout, sock_read=client_timeout)
+        else:
+            self._client_request_timeout = client_timeout
+        self._client_dns_ttl = client_dns_ttl
+        self._reconnect_period = reconnect_period
+        self._reconnect_max_delay = reconnect_max_delay
+        self._reconnect_workers = reconnect_workers
+
+        # Changes made by other threads are passed to the loop through this
+        self._change_bridge = ChangeBridge(self._loop, self._properties_change)
+        # Value histories of props with `history` set, {(obj_id, prop_id): buf}
+        self._histories = {}
+        self._streamer = SampleStreamer(self._loop, self._send_binary,
+                                        stream_interval,
+                                        self._streamed_samples)
+        self._poller = PollScheduler(
+            self._loop,
+            lambda obj, prop_ids: obj.gather_prop_values(
+                prop_ids, offload=self._offload),
+            self._properties_change)
+
+        if notification_interval is not None or notification_max_rate:
+            self._change_coalescer = ChangeCoalescer(
+                self._loop, self._send_changes,
+                interval=notification_interval,
+                max_rate=notification_max_rate)
+
+        if delta_threshold is not None:
+            self._delta_encoder = DeltaEncoder(delta_threshold, delta_resync)
 
         # Logging
         if proxy_log is None:
@@ -104,8 +507,180 @@ class HttpMutaManager(object):
         else:
             self._proxy_logger = proxy_log
 
-        self._proxy_logger.addHandler(HttpMutaManager.WsHandler(
-                            self._send_notification, log_level))
+        self._log_handler = HttpMutaManager.WsHandler(
+            self._send_notification, log_level, loop=self._loop,
+            interval=log_interval, max_rate=log_max_rate,
+            buffer_size=log_buffer_size)
+        self._proxy_logger.addHandler(self._log_handler)
+
+    @property
+    def mirror_max_age(self):
+        """ Maximal age of the remote objects' mirror, None if disabled."""
+        return self._mirror_max_age
+
+    @property
+    def client_session(self):
+        """ Client session shared by all connections to other managers.
+        Created on first use, must be used from the manager's loop.
+        """
+        if self._client_session is None or self._client_session.closed:
+            kwargs = {}
+            connector_kwargs = {}
+            # Only the connecting is limited, the websockets are long-lived
+            # (see client_request_timeout)
+            if ClientTimeout is not None:
+                kwargs['timeout'] = ClientTimeout(
+                    total=None, connect=self._client_timeout)
+            else:
+                kwargs['conn_timeout'] = self._client_timeout
+            if aiohttp_version < "4.0":
+                kwargs['loop'] = self._loop
+                connector_kwargs['loop'] = self._loop
+            connector = TCPConnector(
+                limit=self._client_limit,
+                limit_per_host=self._client_limit_per_host,
+                keepalive_timeout=self._client_keepalive,
+                ttl_dns_cache=self._client_dns_ttl,
+                **connector_kwargs)
+            self._client_session = ClientSession(
+                connector=connector, headers={'Accept': self._wire_format},
+                **kwargs)
+        return self._client_session
+
+    @property
+    def client_request_timeout(self):
+        """ Timeout to be passed to the request/response calls on
+        :attr:`client_session`. Limits the inactivity of reading, so it
+        doesn't cut off a long streamed response (with aiohttp < 3.3 it
+        limits the whole request).
+        """
+        return self._client_request_timeout
+
+    @property
+    def wire_format(self):
+        """ Content type used for the communication with remote managers."""
+        return self._wire_format
+
+    def _response_type(self, request):
+        """ Returns content type negotiated by the request's Accept header."""
+        if msgpack is None:
+            return CONTENT_JSON
+        return _preferred_type(request.headers.get('Accept', ''))
+
+    def _entity_tag(self, request, schema_tag, values_tag=None):
+        """ Returns ETag made of separate schema and value validators, so
+        a change of value doesn't change the schema part.
+        """
+        tag = schema_tag
+        if values_tag is not None:
+            tag += '.' + values_tag
+        if self._response_type(request) != CONTENT_JSON:
+            tag += '.m'
+        return '"{0}"'.format(tag)
+
+    @staticmethod
+    def _not_modified(request, etag):
+        """ Returns 304 response if the request's If-None-Match header matches
+        the ETag, None otherwise.
+        """
+        header = request.headers.get('If-None-Match', None)
+        if header is None:
+            return None
+        tags = [tag.strip() for tag in header.split(',')]
+        # Weak comparison is sufficient for GET
+        if '*' in tags or etag in (tag[2:] if tag.startswith('W/') else tag
+                                   for tag in tags):
+            return web.Response(status=304, headers={'ETag': etag})
+        return None
+
+    def _validated(self, request, response):
+        """ Turns relayed response into 304 if the client has it already."""
+        etag = response.headers.get('ETag', None)
+        if response.status == 200 and etag is not None:
+            return self._not_modified(request, etag) or response
+        return response
+
+    def _response(self, request, data, status=200, headers=None):
+        """ Returns data encoded in the negotiated format."""
+        content_type = self._response_type(request)
+        if content_type == CONTENT_JSON:
+            return web.json_response(data, status=status, headers=headers)
+        return web.Response(body=_encode_body(data, content_type),
+                            status=status, content_type=content_type,
+                            headers=headers)
+
+    def _get_executor(self):
+        if self._executor is not None:
+            return self._executor
+        if self._own_executor is None:
+            self._own_executor = ThreadPoolExecutor(
+                max_workers=self._blocking_workers)
+        return self._own_executor
+
+    @asyncio.coroutine
+    def _offload(self, obj, func, *args):
+        """ Runs ``func(*args)`` of a blocking prop in the executor. Blocking
+        calls of one object are serialized, so the underlying device is never
+        accessed concurrently.
+        """
+        lock = self._object_locks.get(obj.muta_id, None)
+        if lock is None:
+            lock = self._object_locks[obj.muta_id] = asyncio.Lock()
+        yield from lock.acquire()
+        try:
+            return (yield from self._loop.run_in_executor(
+                self._get_executor(), functools.partial(func, *args)))
+        finally:
+            lock.release()
+
+    @asyncio.coroutine
+    def _muta_get(self, obj, prop):
+        if obj.is_blocking(prop):
+            return (yield from self._offload(obj, prop.__get__, obj))
+        return (yield from prop.muta_get(obj))
+
+    @asyncio.coroutine
+    def _muta_set(self, obj, prop, value):
+        if obj.is_blocking(prop):
+            return (yield from self._offload(obj, prop.muta_set, obj, value))
+        result = prop.muta_set(obj, value)
+        if inspect.isawaitable(result):
+            result = yield from result
+        return result
+
+    @asyncio.coroutine
+    def _muta_call(self, obj, action):
+        if obj.is_blocking(action):
+            return (yield from self._offload(obj, action.muta_call, obj))
+        result = action.muta_call(obj)
+        if inspect.isawaitable(result):
+            result = yield from result
+        return result
+
+    @staticmethod
+    def _parse_log_level(level):
+        """ Converts level name or number to number, raises ValueError."""
+        if isinstance(level, int):
+            return level
+        if str(level).isdigit():
+            return int(level)
+        temp = logging.getLevelName(str(level).upper())
+        if not isinstance(temp, int):
+            raise ValueError("Unknown log level %s" % level)
+        return temp
+
+    @asyncio.coroutine
+    def _get_logs(self, request):
+        """ Returns the recent forwarded log records. Optional query
+        parameters ``level`` (name or number) and ``limit``.
+        """
+        try:
+            level = self._parse_log_level(request.query.get('level', 0))
+            limit = request.query.get('limit', None)
+            limit = int(limit) if limit is not None else None
+        except ValueError as e:
+            return web.HTTPBadRequest(text=str(e))
+        return self._response(request, self._log_handler.recent(level, limit))
 
     @asyncio.coroutine
     def _get_app_name(self, request):
@@ -125,7 +700,51 @@ class HttpMutaManager(object):
         # temp = {'objects': [obj.muta_id for obj in self._muta_objects]}
         # temp = [obj.muta_id for obj in self._muta_objects]
         temp = list(self._muta_objects.keys())
-        return web.json_response(temp)
+        return self._response(request, temp)
+
+    @asyncio.coroutine
+    def _get_snapshot(self, request):
+        """ Streams all objects with their schemas and values, one record
+        per object::
+
+            {"objId": obj_id, "schemaTag": tag, "schema": {...},
+             "values": {prop_id: value}}
+
+        The records are newline-delimited JSON, or a sequence of MessagePack
+        maps for clients accepting MessagePack. The schema (see
+        :meth:`MutaPropClass.schema_to_dict`) is left out of the records
+        whose tag is listed in the repeated ``known`` query parameter.
+        """
+        known = set(request.query.getall('known', []))
+        content_type = self._response_type(request)
+        resp = web.StreamResponse(headers={'Cache-Control': 'no-cache'})
+        resp.content_type = content_type if content_type != CONTENT_JSON \
+            else CONTENT_NDJSON
+        yield from resp.prepare(request)
+
+        for obj_id, obj in list(self._muta_objects.items()):
+            if isinstance(obj, HttpMutaObjectProxy):
+                record = yield from obj.snapshot_record()
+                if record is None:
+                    continue
+            else:
+                values = yield from obj.gather_prop_values(
+                    offload=self._offload)
+                record = {'objId': obj_id, 'schemaTag': obj.schema_tag(),
+                          'values': values}
+                if record['schemaTag'] not in known:
+                    record['schema'] = obj.schema_to_dict()
+            if record['schemaTag'] in known:
+                record.pop('schema', None)
+
+            if content_type == CONTENT_JSON:
+                yield from resp.write(json.dumps(record).encode('utf-8') +
+                                      b'\n')
+            else:
+                yield from resp.write(_encode_body(record, content_type))
+
+        yield from resp.write_eof()
+        return resp
 
     def _find_object(self, request):
         return self._muta_objects[request.match_info['obj_id']]
@@ -135,25 +754,160 @@ class HttpMutaManager(object):
         try:
             obj = self._find_object(request)
             if isinstance(obj, HttpMutaObjectProxy):
-                return (yield from obj.get_object())
+                return self._validated(request, (yield from obj.get_object(
+                    accept=self._response_type(request))))
+
+            values = yield from obj.gather_prop_values(offload=self._offload)
+            etag = self._entity_tag(request, obj.schema_tag(),
+                                    obj.values_tag(values))
+            headers = {'ETag': etag, 'Cache-Control': 'no-cache',
+                       'Vary': 'Accept'}
+            not_modified = self._not_modified(request, etag)
+            if not_modified is not None:
+                return not_modified
+            elif self._response_type(request) == CONTENT_JSON:
+                return web.json_response(text=obj.to_json(values),
+                                         headers=headers)
             else:
-                return web.json_response(obj.to_dict())
+                return self._response(request, obj.to_dict(values),
+                                      headers=headers)
         except (KeyError, AssertionError):
             return web.HTTPNotFound()
 
+    PROPS_QUERY = ('offset', 'limit', 'hierarchy', 'type', 'prop_id')
+
+    @staticmethod
+    def _parse_count(request, name, default=None):
+        value = request.query.get(name, None)
+        if value is None:
+            return default
+        value = int(value)
+        if value < 0:
+            raise ValueError("{0} must not be negative.".format(name))
+        return value
+
+    def _selected_props(self, obj, request):
+        """ Returns (props, total count) selected by the query of the props
+        request, or (None, None) if the query selects everything.
+        """
+        if not any(key in request.query for key in self.PROPS_QUERY):
+            return None, None
+        prop_types = request.query.getall('type', None)
+        if prop_types is not None:
+            unknown = set(prop_types) - {MutaProperty.MP_CLASS_TYPE,
+                                         MutaSource.MP_CLASS_TYPE,
+                                         MutaAction.MP_CLASS_TYPE}
+            if unknown:
+                raise ValueError("Unknown prop type {0}.".format(
+                    ', '.join(sorted(unknown))))
+        offset = self._parse_count(request, 'offset', 0)
+        limit = self._parse_count(request, 'limit')
+
+        props = obj.select_props(request.query.get('hierarchy', None),
+                                 prop_types,
+                                 request.query.getall('prop_id', None))
+        stop = None if limit is None else offset + limit
+        return props[offset:stop], len(props)
+
     @asyncio.coroutine
     def _get_props(self, request):
+        """ Returns list of the object's props. The props can be filtered by
+        ``hierarchy`` path (including its sub-sections), repeated ``type``
+        and ``prop_id`` query parameters, and paged by ``offset`` and
+        ``limit``. Only the getters of the returned props are called.
+        The number of the props matching the filters is in the ``muta-total``
+        header.
+        """
         try:
             temp_obj = self._find_object(request)
             if isinstance(temp_obj, HttpMutaObjectProxy):
-                return (yield from temp_obj.get_props())
+                return self._validated(request, (yield from temp_obj.get_props(
+                    accept=self._response_type(request),
+                    query_string=request.query_string)))
+
+            props, total = self._selected_props(temp_obj, request)
+            values = yield from temp_obj.gather_prop_values(
+                None if props is None else [prop.prop_id for prop in props],
+                offload=self._offload)
+            etag = self._entity_tag(request, temp_obj.schema_tag(),
+                                    temp_obj.values_tag(values))
+            headers = {'ETag': etag, 'Cache-Control': 'no-cache',
+                       'Vary': 'Accept'}
+            if total is not None:
+                headers[self.HEADER_TOTAL] = str(total)
+            not_modified = self._not_modified(request, etag)
+            if not_modified is not None:
+                return not_modified
+            elif self._response_type(request) == CONTENT_JSON:
+                return web.json_response(
+                    text=temp_obj.props_to_json(values, props),
+                    headers=headers)
             else:
-                temp_props = [prop.to_dict(obj=temp_obj)
-                              for prop in temp_obj.props.values()]
-                return web.json_response(temp_props)
+                return self._response(request,
+                                      temp_obj.props_to_dict(values, props),
+                                      headers=headers)
+        except ValueError as e:
+            return web.HTTPBadRequest(text=str(e))
         except (KeyError, AssertionError):
             return web.HTTPNotFound()
 
+    @asyncio.coroutine
+    def _get_values(self, request):
+        """ Returns values of all props of all (or selected) objects in one
+        response as {obj_id: {prop_id: value}}. Objects can be selected by
+        repeated ``obj_id`` query parameters, props by ``prop_id`` parameters.
+        Values of remote objects are requested in one call per remote manager.
+        """
+        obj_ids = request.query.getall('obj_id', None) or \
+            list(self._muta_objects.keys())
+        prop_ids = request.query.getall('prop_id', None)
+
+        temp = OrderedDict()
+        remote = OrderedDict()
+        local = []
+        for obj_id in obj_ids:
+            obj = self._muta_objects.get(obj_id, None)
+            if obj is None:
+                continue
+            if isinstance(obj, HttpMutaObjectProxy):
+                remote.setdefault(obj.manager_proxy, []).append(obj_id)
+            else:
+                local.append(obj_id)
+            # Placeholder to keep the order of objects
+            temp[obj_id] = None
+
+        # Coroutine getters of all objects are awaited concurrently
+        local_values = yield from asyncio.gather(
+            *(self._muta_objects[obj_id].gather_prop_values(
+                prop_ids, offload=self._offload) for obj_id in local))
+        temp.update(zip(local, local_values))
+
+        for manager_proxy, remote_ids in remote.items():
+            # Mirrored objects don't need the remote call
+            mirrored = yield from asyncio.gather(
+                *(self._muta_objects[obj_id].mirrored_values(prop_ids)
+                  for obj_id in remote_ids))
+            for obj_id, values in zip(list(remote_ids), mirrored):
+                if values is not None:
+                    temp[obj_id] = values
+                    remote_ids.remove(obj_id)
+            if not remote_ids:
+                continue
+
+            try:
+                remote_values = yield from manager_proxy.get_values(remote_ids,
+                                                                    prop_ids)
+            except (ClientOSError, MutaManagerError) as e:
+                self._logger.debug("Cannot get remote values: %s" % e)
+                remote_values = {}
+            for obj_id in remote_ids:
+                if obj_id in remote_values:
+                    temp[obj_id] = remote_values[obj_id]
+                else:
+                    temp.pop(obj_id)
+
+        return self._response(request, temp)
+
     def _find_prop(self, obj, request):
         return obj.props[request.match_info['prop_id']]
 
@@ -162,24 +916,107 @@ class HttpMutaManager(object):
         try:
             temp_obj = self._find_object(request)
             if isinstance(temp_obj, HttpMutaObjectProxy):
-                return (yield from temp_obj.get_prop(
-                    request.match_info['prop_id']))
+                return self._validated(request, (yield from temp_obj.get_prop(
+                    request.match_info['prop_id'],
+                    accept=self._response_type(request))))
+
+            temp_prop = self._find_prop(temp_obj, request)
+            values = yield from temp_obj.gather_prop_values(
+                [temp_prop.prop_id], offload=self._offload)
+            if temp_prop.prop_id in values:
+                overlay = {MutaProperty.MP_VALUE: values[temp_prop.prop_id]}
             else:
+                overlay = temp_prop.value_overlay(temp_obj)
+            etag = self._entity_tag(
+                request, temp_prop.schema_tag(),
+                temp_obj.values_tag(overlay) if overlay else None)
+            headers = {'ETag': etag, 'Cache-Control': 'no-cache',
+                       'Vary': 'Accept'}
+            not_modified = self._not_modified(request, etag)
+            if not_modified is not None:
+                return not_modified
+            elif self._response_type(request) == CONTENT_JSON:
                 return web.json_response(
-                    self._find_prop(temp_obj, request).to_dict(obj=temp_obj))
+                    text=temp_prop.to_json(obj=temp_obj, overlay=overlay),
+                    headers=headers)
+            else:
+                temp = dict(temp_prop.schema())
+                temp.update(overlay)
+                return self._response(request, temp, headers=headers)
         except (KeyError, AssertionError):
             return web.HTTPNotFound()
 
+    @staticmethod
+    def _parse_time(request, name):
+        value = request.query.get(name, None)
+        return None if value is None else float(value)
+
+    def prop_history(self, obj_id, prop_id, start=None, end=None,
+                     buckets=None):
+        """ Returns recorded values of the prop with ``history`` within
+        the time range [`start`, `end`] (UNIX timestamps, open if None).
+
+        :param buckets: If set, the range is split into this number of
+                        intervals and only their minimum and maximum values
+                        are returned.
+        :raises KeyError: If the prop does not record its history.
+        """
+        history = self._histories[(obj_id, prop_id)]
+        if buckets is not None:
+            return history.downsample(buckets, start, end)
+        return history.samples(start, end)
+
+    @asyncio.coroutine
+    def _get_prop_history(self, request):
+        try:
+            temp_obj = self._find_object(request)
+            if isinstance(temp_obj, HttpMutaObjectProxy):
+                return (yield from temp_obj.get_prop_history(
+                    request.match_info['prop_id'], request.query_string,
+                    accept=self._response_type(request)))
+            start = self._parse_time(request, 'start')
+            end = self._parse_time(request, 'end')
+            buckets = request.query.get('buckets', None)
+            if buckets is not None:
+                buckets = int(buckets)
+                if buckets < 1:
+                    raise ValueError("Number of buckets must be positive.")
+        except ValueError as e:
+            return web.HTTPBadRequest(text=str(e))
+        except (KeyError, AssertionError):
+            return web.HTTPNotFound()
+
+        try:
+            temp = self.prop_history(temp_obj.muta_id,
+                                     request.match_info['prop_id'],
+                                     start, end, buckets)
+        except KeyError:
+            return web.HTTPNotFound(text="Prop has no history.")
+        return self._response(request, temp,
+                              headers={'Cache-Control': 'no-cache'})
+
     @asyncio.coroutine
     def _get_prop_value(self, request):
         try:
             temp_obj = self._find_object(request)
             if isinstance(temp_obj, HttpMutaObjectProxy):
                 return (yield from temp_obj.get_prop_value(
-                    request.match_info['prop_id']))
+                    request.match_info['prop_id'],
+                    accept=self._response_type(request)))
             else:
-                return web.json_response(
-                    self._find_prop(temp_obj, request).__get__(temp_obj))
+                temp_prop = self._find_prop(temp_obj, request)
+                if isinstance(temp_prop, MutaAction):
+                    return web.HTTPMethodNotAllowed(
+                        'value', [], text="Actions have no value.")
+                value = yield from self._muta_get(temp_obj, temp_prop)
+                headers = {}
+                if self._delta_encoder is not None:
+                    # Lets the client continue with patches from this value
+                    version = self._delta_encoder.version(
+                        temp_obj.muta_id, request.match_info['prop_id'], value)
+                    if version is not None:
+                        headers[self.HEADER_VERSION] = str(version)
+                return self._response(request, value, headers=headers)
         except (KeyError, AssertionError):
             return web.HTTPNotFound()
 
@@ -190,7 +1027,8 @@ class HttpMutaManager(object):
             value = urllib.parse.parse_qs(request.query_string)['value'][0]
             if isinstance(temp_obj, HttpMutaObjectProxy):
                 return (yield from temp_obj.set_prop_value(
-                    request.match_info['prop_id'], value))
+                    request.match_info['prop_id'], value,
+                    accept=self._response_type(request)))
             else:
                 temp_prop = self._find_prop(temp_obj, request)
 
@@ -200,7 +1038,8 @@ class HttpMutaManager(object):
 
                 # The setting of property itself
                 value = MutaTypes.typecast(temp_prop.value_type, value)
-                set_result = temp_prop.muta_set(temp_obj, value)
+                set_result = yield from self._muta_set(temp_obj, temp_prop,
+                                                       value)
 
                 # In case of this action being from master manager,
                 # update the UI
@@ -215,10 +1054,157 @@ class HttpMutaManager(object):
 
                 # TODO: This should translate muta_set validation result to
                 # HTTP Resp.
-                return web.json_response(set_result)
+                return self._response(request, set_result)
         except (KeyError, AssertionError):
             return web.HTTPNotFound()
 
+    @asyncio.coroutine
+    def _set_values(self, obj, values):
+        """ Typecasts and sets {prop_id: value} on a local object. Coroutine
+        setters are awaited one after another, in the order of the values.
+
+        :return: Tuple of per-prop results {prop_id: {'status': http_status}}
+                 (with 'error' message for failed props) and list of
+                 successfully set (prop_id, value) pairs.
+        """
+        results = OrderedDict()
+        changes = []
+        for prop_id, value in values.items():
+            temp_prop = obj.props.get(prop_id, None)
+            if temp_prop is None:
+                results[prop_id] = {'status': 404,
+                                    'error': "Property not found."}
+                continue
+
+            # Sources (no value type) can't be set from the UI either
+            if isinstance(temp_prop, MutaAction) or \
+                    temp_prop.value_type is None or \
+                    not temp_prop.is_writeable():
+                results[prop_id] = {'status': 405,
+                                    'error': "Property is read only."}
+                continue
+
+            try:
+                value = MutaTypes.typecast(temp_prop.value_type, value)
+            except (ValueError, TypeError, AttributeError,
+                    MutaPropError) as e:
+                results[prop_id] = {'status': 400, 'error': str(e)}
+                continue
+
+            try:
+                yield from self._muta_set(obj, temp_prop, value)
+            except MutaPropError as e:
+                results[prop_id] = {'status': 405, 'error': str(e)}
+                continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.exception("Setting %s failed" % prop_id)
+                results[prop_id] = {'status': 500, 'error': str(e)}
+                continue
+
+            results[prop_id] = {'status': 200}
+            changes.append((prop_id, value))
+
+        return results, changes
+
+    def _get_event_source(self, request):
+        if self.HEADER_SUPERVISOR in request.headers:
+            return self.EVENT_SOURCE_MASTER
+        else:
+            return self.EVENT_SOURCE_USER
+
+    @asyncio.coroutine
+    def _read_values_body(self, request):
+        """ Reads JSON (or MessagePack) object from the request body, raises
+        ValueError if the body is not an object.
+        """
+        if msgpack is not None and request.content_type in _MSGPACK_TYPES:
+            data = _decode_body((yield from request.read()),
+                                request.content_type)
+        else:
+            data = yield from request.json()
+        if not isinstance(data, dict):
+            raise ValueError("JSON object expected.")
+        return data
+
+    @asyncio.coroutine
+    def _set_prop_values(self, request):
+        """ Sets several props of one object at once. Request body is JSON
+        object {prop_id: value}, response is {prop_id: result}.
+        All changes are notified in a single notification.
+        """
+        try:
+            temp_obj = self._find_object(request)
+            values = yield from self._read_values_body(request)
+            if isinstance(temp_obj, HttpMutaObjectProxy):
+                return (yield from temp_obj.set_prop_values(
+                    values, accept=self._response_type(request)))
+            else:
+                results, changes = yield from self._set_values(temp_obj,
+                                                               values)
+                self._properties_change(
+                    [(temp_obj.muta_id, prop_id, value)
+                     for prop_id, value in changes],
+                    self._get_event_source(request))
+                return self._response(request, results)
+        except (KeyError, AssertionError):
+            return web.HTTPNotFound()
+        except ValueError as e:
+            return web.HTTPBadRequest(text=str(e))
+
+    @asyncio.coroutine
+    def _set_all_values(self, request):
+        """ Sets props of several objects at once. Request body is JSON
+        object {obj_id: {prop_id: value}}, response is
+        {obj_id: {prop_id: result}}. Remote objects are set in one request
+        per remote manager. All local changes are notified in a single
+        notification.
+        """
+        try:
+            data = yield from self._read_values_body(request)
+            if not all(isinstance(values, dict) for values in data.values()):
+                raise ValueError("JSON object expected for each object.")
+        except ValueError as e:
+            return web.HTTPBadRequest(text=str(e))
+
+        temp = OrderedDict()
+        remote = OrderedDict()
+        all_changes = []
+        for obj_id, values in data.items():
+            obj = self._muta_objects.get(obj_id, None)
+            if obj is None:
+                temp[obj_id] = {prop_id: {'status': 404,
+                                          'error': "Object not found."}
+                                for prop_id in values}
+            elif isinstance(obj, HttpMutaObjectProxy):
+                remote.setdefault(obj.manager_proxy, OrderedDict())[obj_id] = \
+                    values
+                temp[obj_id] = None
+            else:
+                temp[obj_id], changes = yield from self._set_values(obj,
+                                                                    values)
+                all_changes.extend((obj_id, prop_id, value)
+                                   for prop_id, value in changes)
+
+        self._properties_change(all_changes, self._get_event_source(request))
+
+        for manager_proxy, remote_values in remote.items():
+            try:
+                remote_results = yield from manager_proxy.set_values(
+                    remote_values)
+            except (ClientOSError, MutaManagerError) as e:
+                remote_results = {}
+                error = str(e)
+            else:
+                error = "Object not found."
+            for obj_id, values in remote_values.items():
+                temp[obj_id] = remote_results.get(obj_id, None) or \
+                    {prop_id: {'status': 404, 'error': error}
+                     for prop_id in values}
+
+        return self._response(request, temp)
+
     @asyncio.coroutine
     def _set_prop_action(self, request):
         # TODO broadcast notification in case a "supervisor header" is present
@@ -226,11 +1212,12 @@ class HttpMutaManager(object):
             temp_obj = self._find_object(request)
             if isinstance(temp_obj, HttpMutaObjectProxy):
                 return (yield from temp_obj.set_prop_action(
-                    request.match_info['prop_id']))
+                    request.match_info['prop_id'],
+                    accept=self._response_type(request)))
             else:
                 temp_prop = self._find_prop(temp_obj, request)
                 if isinstance(temp_prop, MutaAction):
-                    temp_prop.muta_call(temp_obj)
+                    yield from self._muta_call(temp_obj, temp_prop)
                     return web.HTTPOk()
                 else:
                     return web.HTTPMethodNotAllowed(
@@ -263,21 +1250,90 @@ class HttpMutaManager(object):
             return web.HTTPBadRequest()
 
     @asyncio.coroutine
-    def _remote_manager_reconnector(self, period=10):
+    def _remote_manager_reconnector(self, period=None):
         """
-        Periodically try to re-connect to remote managers which got reconnected.
-        :param period:  [seconds] Time interval between reconnect attempts.
+        Re-connects remote managers which got disconnected. The managers are
+        reconnected concurrently (at most ``reconnect_workers`` at a time),
+        each with its own backoff, so an unreachable one doesn't hold up
+        the others.
+
+        :param period:  [seconds] Base interval between reconnect attempts,
+                        ``reconnect_period`` if not specified.
         """
-        while True:
-            yield from asyncio.sleep(10)
-            for addr, proxy in self._manager_proxies.items():
-                if (not proxy.is_attached) and (not proxy.is_being_removed):
-                    self._logger.debug(
-                        "Attempting reconnection to remote manager @ %s" % addr)
-                    try:
-                        yield from proxy.attach(self)
-                    except Exception as e:
-                        self._logger.debug("Reconnect failed with %s" % e)
+        period = period or self._reconnect_period
+        semaphore = asyncio.Semaphore(self._reconnect_workers)
+        running = {}
+        try:
+            while True:
+                now = self._loop.time()
+                wake_time = now + period
+                for addr, proxy in list(self._manager_proxies.items()):
+                    if proxy.is_attached or proxy.is_being_removed or \
+                            proxy in running:
+                        continue
+                    if proxy.reconnect_stats.due(now):
+                        task = self._loop.create_task(
+                            self._reconnect(proxy, semaphore, period))
+                        running[proxy] = task
+                        task.add_done_callback(
+                            lambda task, proxy=proxy: running.pop(proxy, None))
+                    else:
+                        wake_time = min(wake_time,
+                                        proxy.reconnect_stats.next_attempt)
+                yield from asyncio.sleep(max(wake_time - now, 0))
+        finally:
+            for task in list(running.values()):
+                task.cancel()
+
+    @asyncio.coroutine
+    def _reconnect(self, proxy, semaphore, period):
+        yield from semaphore.acquire()
+        try:
+            self._logger.debug(
+                "Attempting reconnection to remote manager @ %s" %
+                proxy.address)
+            start = self._loop.time()
+            try:
+                yield from proxy.attach(self)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.debug("Reconnect failed with %s" % e)
+                now = self._loop.time()
+                proxy.reconnect_stats.failed(now, now - start, e, period,
+                                             self._reconnect_max_delay)
+            else:
+                now = self._loop.time()
+                proxy.reconnect_stats.succeeded(now - start)
+        finally:
+            semaphore.release()
+
+    def reconnect_stats(self):
+        """ Returns reconnection statistics of the remote managers as
+        {address: {'attached': bool, 'attempts': n, ...}}.
+        """
+        now = self._loop.time()
+        temp = OrderedDict()
+        for addr, proxy in self._manager_proxies.items():
+            temp[addr] = dict(proxy.reconnect_stats.to_dict(now),
+                              attached=proxy.is_attached)
+        return temp
+
+    @asyncio.coroutine
+    def _get_remote_managers(self, request):
+        return self._response(request, self.reconnect_stats())
+
+    def poll_stats(self):
+        """ Returns statistics of the polling of props with ``poll_interval``:
+        overall load (fraction of time spent reading) and per interval
+        the number of props, ticks, overruns (skipped ticks), jitter and
+        duration of the reads.
+        """
+        return self._poller.stats()
+
+    @asyncio.coroutine
+    def _get_poll_stats(self, request):
+        return self._response(request, self.poll_stats())
 
     def _add_manager_proxy(self, proxy):
         if proxy.address not in self._manager_proxies:
@@ -297,47 +1353,396 @@ class HttpMutaManager(object):
             yield from temp.detach()
 
     def _sockjs_handler(self, msg, session):
-        """ SockJS handler is now not doing anything because we onlu use
-        SockJS for downstream.
+        """ SockJS is used mostly downstream. Upstream, the clients can only
+        send subscription messages, limiting the property change
+        notifications to the objects/props they are interested in::
+
+            {"type": "subscribe", "objects": [obj_id, ...],
+             "props": [[obj_id, prop_id], ...], "replace": true}
+            {"type": "unsubscribe", "objects": [...], "props": [...]}
+            {"type": "subscribe_all"}
+
+        Clients which never subscribe get all notifications.
         :param session:
         :return:
         """
         if msg.tp == sockjs.MSG_OPEN:
             self._sockjs_manager = session.manager
+            self._sockjs_sessions[session.id] = (session, Subscription())
             # session.manager.broadcast("Someone joined.")
         elif msg.tp == sockjs.MSG_CLOSED:
-            self._sockjs_manager = None
+            self._sockjs_sessions.pop(session.id, None)
+            if not self._sockjs_sessions:
+                self._sockjs_manager = None
             # session.manager.broadcast("Someone left.")
+        elif msg.tp == sockjs.MSG_MESSAGE:
+            session_entry = self._sockjs_sessions.get(session.id, None)
+            if session_entry is not None:
+                try:
+                    data = json.loads(msg.data)
+                except (ValueError, TypeError):
+                    self._logger.debug("Invalid client message %s" % msg.data)
+                else:
+                    self._client_message(session_entry[1], data)
+
+    @asyncio.coroutine
+    def _binary_ws_handler(self, request):
+        """ Plain websocket notification channel sending MessagePack encoded
+        binary messages. Mainly for the master managers, accepts the same
+        subscription messages as the SockJS channel (as MessagePack or JSON).
+        """
+        if msgpack is None:
+            return web.HTTPNotImplemented(text="MessagePack not available.")
+
+        ws = web.WebSocketResponse()
+        yield from ws.prepare(request)
+        subscription = Subscription()
+        self._binary_clients[ws] = subscription
+        self._logger.debug("Binary notification client connected.")
+        try:
+            while True:
+                msg = yield from ws.receive()
+                if msg.type in (WSMsgType.BINARY, WSMsgType.TEXT):
+                    try:
+                        data = _decode_body(
+                            msg.data if msg.type == WSMsgType.BINARY else
+                            msg.data.encode('utf-8'),
+                            CONTENT_MSGPACK if msg.type == WSMsgType.BINARY
+                            else CONTENT_JSON)
+                    except ValueError:
+                        self._logger.debug("Invalid client message")
+                    else:
+                        self._client_message(subscription, data)
+                else:
+                    break
+        finally:
+            self._binary_clients.pop(ws, None)
+            self._logger.debug("Binary notification client disconnected.")
+        return ws
+
+    STREAM_CHANNELS = 'channels'
+    CLIENT_DECIMATION = 'decimation'
+
+    @asyncio.coroutine
+    def _stream_ws_handler(self, request):
+        """ Websocket sending the samples of props with ``stream`` as binary
+        frames (see :func:`~mutaprops.streaming.encode_frame`). The channel
+        table is sent as JSON text message on connect and whenever it
+        changes. Accepts the subscription messages of the notification
+        channel, and ``{"type": "decimation", "value": n}`` to receive only
+        every n-th sample (also as ``decimation`` query parameter).
+        """
+        try:
+            decimation = int(request.query.get('decimation', 1))
+            if decimation < 1:
+                raise ValueError("Decimation must be positive.")
+        except ValueError as e:
+            return web.HTTPBadRequest(text=str(e))
+
+        ws = web.WebSocketResponse()
+        yield from ws.prepare(request)
+        self._streamer.add_client(ws, decimation)
+        self._send_stream_channels(ws)
+        self._logger.debug("Stream client connected.")
+        try:
+            while True:
+                msg = yield from ws.receive()
+                if msg.type == WSMsgType.TEXT:
+                    try:
+                        data = json.loads(msg.data)
+                        if data.get('type') == self.CLIENT_DECIMATION:
+                            self._streamer.set_decimation(
+                                ws, data.get('value'))
+                        else:
+                            self._client_message(
+                                self._streamer.subscription(ws), data)
+                    except (ValueError, TypeError, AttributeError):
+                        self._logger.debug("Invalid stream client message")
+                elif msg.type != WSMsgType.BINARY:
+                    break
+        finally:
+            self._streamer.remove_client(ws)
+            self._logger.debug("Stream client disconnected.")
+        return ws
+
+    def _send_stream_channels(self, ws=None):
+        """ Sends the channel table to one or all stream clients."""
+        text = json.dumps({'type': self.STREAM_CHANNELS,
+                           'channels': self._streamer.channels()})
+        for client in ([ws] if ws is not None else
+                       self._streamer.clients()):
+            if not client.closed:
+                result = client.send_str(text)
+                if asyncio.iscoroutine(result):
+                    self._loop.create_task(result)
+
+    def _send_binary(self, ws, frame):
+        if ws.closed:
+            return
+        result = ws.send_bytes(frame)
+        # Coroutine in newer aiohttp versions
+        if asyncio.iscoroutine(result):
+            self._loop.create_task(result)
+
+    def _client_message(self, subscription, data):
+        try:
+            msg_type = data.get('type')
+        except AttributeError:
+            self._logger.debug("Invalid client message %s" % data)
+            return
+
+        if msg_type == self.CLIENT_SUBSCRIBE:
+            subscription.subscribe(data.get('objects', ()),
+                                   data.get('props', ()),
+                                   data.get('replace', False))
+        elif msg_type == self.CLIENT_UNSUBSCRIBE:
+            subscription.unsubscribe(data.get('objects', ()),
+                                     data.get('props', ()))
+        elif msg_type == self.CLIENT_SUBSCRIBE_ALL:
+            subscription.subscribe_all()
+        elif msg_type == self.CLIENT_LOG_LEVEL:
+            try:
+                subscription.log_level = self._parse_log_level(
+                    data.get('level', logging.NOTSET))
+            except ValueError as e:
+                self._logger.debug(str(e))
+        else:
+            self._logger.debug("Unknown client message %s" % msg_type)
+
+    def _record_history(self, obj_id, prop_id, value):
+        history = self._histories.get((obj_id, prop_id), None)
+        if history is not None:
+            history.append(time.time(), value)
 
     def _property_change(self, obj_id, prop_id, value,
                          event_source=EVENT_SOURCE_OBJECT):
-        self._send_notification(self.NOTIFICATION_PROPERTY_CHANGE,
-                                objId=obj_id, propId=prop_id, value=value,
-                                eventSource=event_source)
+        # Streamed props are notified with their samples, as in the batch
+        if self._streamer.push(obj_id, prop_id, value):
+            return
+        self._poller.observe(obj_id, prop_id, value)
+        if self._histories:
+            self._record_history(obj_id, prop_id, value)
+        if self._change_coalescer is not None:
+            self._change_coalescer.push(obj_id, prop_id, value, event_source)
+        else:
+            self._send_notification(self.NOTIFICATION_PROPERTY_CHANGE,
+                                    **self._encode_change(
+                                        {'objId': obj_id, 'propId': prop_id,
+                                         'value': value,
+                                         'eventSource': event_source}))
         self._logger.debug("Property {0} changed value to {1} on {2}".format(
             obj_id, prop_id, value))
 
+    def _object_change(self, obj_id, prop_id, value):
+        """ Change callback of the managed objects. Changes made outside of
+        the loop thread are queued and notified from the loop thread.
+        Samples of the streamed props are passed to the streamer directly.
+        """
+        if self._streamer.push(obj_id, prop_id, value):
+            return
+        if running_loop() is self._loop:
+            self._property_change(obj_id, prop_id, value)
+        else:
+            self._change_bridge.push(obj_id, prop_id, value)
+
+    def _properties_change(self, changes, event_source=EVENT_SOURCE_OBJECT):
+        """ Notifies several property changes in one message.
+
+        :param changes:  List of (obj_id, prop_id, value) tuples.
+        """
+        if self._streamer.has_channels:
+            changes = [(obj_id, prop_id, value)
+                       for obj_id, prop_id, value in changes
+                       if not self._streamer.push(obj_id, prop_id, value)]
+        for obj_id, prop_id, value in changes:
+            self._poller.observe(obj_id, prop_id, value)
+            if self._histories:
+                self._record_history(obj_id, prop_id, value)
+        self._notify_changes(changes, event_source)
+
+    def _streamed_samples(self, samples):
+        """ Samples collected by the streamer, with their timestamps. All of
+        them go to the history, only the latest value of each prop is
+        notified (so the UI and the masters see the streamed props too).
+
+        :param samples:  List of (obj_id, prop_id, timestamps, values).
+        """
+        changes = []
+        for obj_id, prop_id, timestamps, values in samples:
+            history = self._histories.get((obj_id, prop_id), None)
+            if history is not None:
+                for timestamp, value in zip(timestamps, values):
+                    history.append(timestamp, value)
+            self._poller.observe(obj_id, prop_id, values[-1])
+            changes.append((obj_id, prop_id, values[-1]))
+        self._notify_changes(changes)
+
+    def _notify_changes(self, changes, event_source=EVENT_SOURCE_OBJECT):
+        """ Sends (or coalesces) list of (obj_id, prop_id, value) changes."""
+        if self._change_coalescer is not None:
+            for obj_id, prop_id, value in changes:
+                self._change_coalescer.push(obj_id, prop_id, value,
+                                            event_source)
+        else:
+            self._send_changes([{'objId': obj_id, 'propId': prop_id,
+                                 'value': value, 'eventSource': event_source}
+                                for obj_id, prop_id, value in changes])
+
+    def _send_changes(self, changes):
+        """ Sends list of change dicts as one notification."""
+        if not changes:
+            return
+        self._send_notification(self.NOTIFICATION_PROPERTIES_CHANGE,
+                                changes=[self._encode_change(change)
+                                         for change in changes])
+        self._logger.debug("{0} properties changed".format(len(changes)))
+
+    def _encode_change(self, change):
+        if self._delta_encoder is not None:
+            return self._delta_encoder.encode(change)
+        return change
+
+    def _relay_ws_message(self, msg):
+        """ Relays notification received from a remote (slave) manager.
+        Remote property changes go through the same coalescing as local ones.
+        """
+        if self._change_coalescer is not None:
+            msg_type = msg.get('type')
+            params = msg.get('params', {})
+            if msg_type == self.NOTIFICATION_PROPERTY_CHANGE:
+                changes = [params]
+            elif msg_type == self.NOTIFICATION_PROPERTIES_CHANGE:
+                changes = params.get('changes', [])
+            else:
+                changes = None
+
+            # Patches from the remote manager can't be coalesced
+            if changes is not None and \
+                    all('value' in change for change in changes):
+                for change in changes:
+                    self._change_coalescer.push(change.get('objId'),
+                                                change.get('propId'),
+                                                change.get('value'),
+                                                change.get('eventSource'))
+                return
+
+        self._send_ws_message(msg)
+
     def _send_notification(self, msg_type, **kwargs):
         temp = {'type': msg_type, 'params': kwargs}
         self._send_ws_message(temp)
 
     def _send_ws_message(self, msg):
         if self._sockjs_manager:
-            self._sockjs_manager.broadcast(msg)
+            if msg.get('type') not in (self.NOTIFICATION_PROPERTY_CHANGE,
+                                       self.NOTIFICATION_PROPERTIES_CHANGE,
+                                       self.NOTIFICATION_LOG_MESSAGE,
+                                       self.NOTIFICATION_LOG_MESSAGES) \
+                    or all(subscription.everything and
+                           subscription.log_level == logging.NOTSET
+                           for session, subscription
+                           in self._sockjs_sessions.values()):
+                self._sockjs_manager.broadcast(msg)
+            else:
+                for session, frame in self._routed_frames(
+                        msg, list(self._sockjs_sessions.values()),
+                        message_frame):
+                    session.send_frame(frame)
+
+        if self._binary_clients:
+            for ws, frame in self._routed_frames(
+                    msg, list(self._binary_clients.items()),
+                    lambda data: _encode_body(data, CONTENT_MSGPACK)):
+                self._send_binary(ws, frame)
+
+    def _routed_frames(self, msg, clients, encode):
+        """ Yields (client, frame) for each of the (client, subscription) pairs
+        which should receive the message. Property changes are limited to the
+        subscribed ones, each distinct selection is encoded only once.
+        """
+        msg_type = msg.get('type')
+        if msg_type == self.NOTIFICATION_PROPERTY_CHANGE:
+            items, key = [msg['params']], 'changes'
+        elif msg_type == self.NOTIFICATION_PROPERTIES_CHANGE:
+            items, key = msg['params'].get('changes', []), 'changes'
+        elif msg_type == self.NOTIFICATION_LOG_MESSAGE:
+            items, key = [msg['params']], 'records'
+        elif msg_type == self.NOTIFICATION_LOG_MESSAGES:
+            items, key = msg['params'].get('records', []), 'records'
+        else:
+            items, key = None, None
+
+        frames = {}
+        for client, subscription in clients:
+            if items is None:
+                selected = None
+            elif key == 'records':
+                if subscription.log_level == logging.NOTSET:
+                    selected = None
+                else:
+                    selected = tuple(
+                        i for i, record in enumerate(items)
+                        if record.get('levelno', logging.CRITICAL) >=
+                        subscription.log_level)
+            elif subscription.everything:
+                selected = None
+            else:
+                selected = tuple(i for i, change in enumerate(items)
+                                 if subscription.matches(change.get('objId'),
+                                                         change.get('propId')))
+            if selected is not None:
+                if not selected:
+                    continue
+                if len(selected) == len(items):
+                    selected = None
+
+            frame = frames.get(selected, None)
+            if frame is None:
+                if selected is None:
+                    frame = encode(msg)
+                else:
+                    # Single-item messages are never split
+                    frame = encode({'type': msg_type,
+                                    'params': {key: [items[i]
+                                                     for i in selected]}})
+                frames[selected] = frame
+            yield client, frame
+
+    @classmethod
+    def _get_web_assets(cls):
+        """ Returns the web UI files with their compressed variants, loaded to
+        memory once per process. The index page links the assets by
+        content-hashed URLs, so they can be cached by the browser for good.
+        """
+        if HttpMutaManager._web_assets is None:
+            assets = AssetBundle().load(cls.WEB_ASSETS)
+            index = assets.versioned_html(cls.INDEX_FILE.decode('utf-8'))
+            assets.add(StaticAsset.from_bytes('index.html',
+                                              index.encode('utf-8'),
+                                              'text/html'))
+            HttpMutaManager._web_assets = assets
+        return HttpMutaManager._web_assets
 
     @asyncio.coroutine
     def _index(self, request):
-        return web.Response(body=self.INDEX_FILE, content_type='text/html')
+        return self._get_web_assets()['index.html'].response(request)
+
+    @asyncio.coroutine
+    def _get_asset(self, request):
+        return self._get_web_assets().response(request,
+                                               request.match_info['filename'])
 
     def _init_router(self, local_dir=None):
+        self._get_web_assets()
         self._app.router.add_get('/', self._index)
-        self._app.router.add_static('/dist', self.WEB_ASSETS, show_index=True)
+        self._app.router.add_get('/dist/{filename}', self._get_asset)
 
         if local_dir:
             self._app.router.add_static('/local', local_dir, show_index=True)
 
         self._app.router.add_get('/api/appname', self._get_app_name)
         self._app.router.add_get('/api/help', self._get_help_doc)
+        self._app.router.add_get('/api/logs', self._get_logs)
         self._app.router.add_get('/api/objects', self._get_object_list)
         self._app.router.add_get('/api/objects/{obj_id}', self._get_object)
         self._app.router.add_get('/api/objects/{obj_id}/props', self._get_props)
@@ -345,15 +1750,28 @@ class HttpMutaManager(object):
                                  self._get_prop)
         self._app.router.add_get('/api/objects/{obj_id}/props/{prop_id}/value',
                                  self._get_prop_value)
+        self._app.router.add_get(
+            '/api/objects/{obj_id}/props/{prop_id}/history',
+            self._get_prop_history)
+        self._app.router.add_get('/api/values', self._get_values)
+        self._app.router.add_get('/api/snapshot', self._get_snapshot)
+        self._app.router.add_put('/api/values', self._set_all_values)
+        self._app.router.add_put('/api/objects/{obj_id}/values',
+                                 self._set_prop_values)
         self._app.router.add_put('/api/objects/{obj_id}/props/{prop_id}',
                                  self._set_prop_value)
 
         # http://programmers.stackexchange.com/questions/141410/restful-state-changing-actions
         self._app.router.add_put('/api/objects/{obj_id}/props/{prop_id}/action',
                                  self._set_prop_action)
+        self._app.router.add_get('/api/remote', self._get_remote_managers)
+        self._app.router.add_get('/api/polling', self._get_poll_stats)
         self._app.router.add_post('/api/remote', self._register_remote_manager)
         sockjs.add_endpoint(self._app, self._sockjs_handler, name='notifier',
                             prefix='/api/notifications/')
+        self._app.router.add_get('/api/binary-notifications',
+                                 self._binary_ws_handler)
+        self._app.router.add_get('/api/stream', self._stream_ws_handler)
 
     def add_object(self, muta_object, obj_id=None):
         """ Add decorated object to the UI manager.
@@ -378,13 +1796,13 @@ class HttpMutaManager(object):
 
         if muta_object.is_muta_ready():
             if obj_id:
-                muta_object.muta_init(obj_id, self._property_change)
+                muta_object.muta_init(obj_id, self._object_change)
             else:
                 muta_object.muta_init(muta_object.muta_id,
-                                      self._property_change)
+                                      self._object_change)
 
         else:
-            muta_object.muta_init(obj_id, self._property_change)
+            muta_object.muta_init(obj_id, self._object_change)
 
         # Check that we won't have two objects with the same id
         if muta_object.muta_id in self._muta_objects:
@@ -392,7 +1810,24 @@ class HttpMutaManager(object):
                 "MutaObject with id {0} is already registered.".format(
                     muta_object.muta_id))
 
+        # Warm up the docstring cache before the first UI request comes
+        if isinstance(muta_object, MutaPropClass):
+            muta_object.muta_prerender_docs()
+            for prop in muta_object.props.values():
+                if getattr(prop, 'poll_interval', None):
+                    self._poller.add(muta_object, prop.prop_id,
+                                     prop.poll_interval)
+                if getattr(prop, 'history', None):
+                    self._histories[(muta_object.muta_id, prop.prop_id)] = \
+                        HistoryBuffer(prop.history)
+                if getattr(prop, 'stream', False):
+                    self._streamer.add_channel(
+                        muta_object.muta_id, prop.prop_id,
+                        'd' if prop.value_type == MutaTypes.REAL else 'q')
+
         self._muta_objects[muta_object.muta_id] = muta_object
+        if self._streamer.has_channels:
+            self._send_stream_channels()
         self._send_notification(self.NOTIFICATION_OBJECTS_CHANGE,
                                 objId=muta_object.muta_id, action='added')
         self._logger.debug("Added object %s" % muta_object.muta_id)
@@ -406,6 +1841,17 @@ class HttpMutaManager(object):
         try:
             temp = self._muta_objects.pop(muta_object.muta_id)
             temp.muta_unregister()
+            self._poller.remove(temp.muta_id)
+            if self._streamer.remove_object(temp.muta_id):
+                self._send_stream_channels()
+            for key in [key for key in self._histories
+                        if key[0] == temp.muta_id]:
+                del self._histories[key]
+            if self._change_coalescer is not None:
+                self._change_coalescer.forget(temp.muta_id)
+            if self._delta_encoder is not None:
+                self._delta_encoder.forget(temp.muta_id)
+            self._object_locks.pop(temp.muta_id, None)
             self._send_notification(self.NOTIFICATION_OBJECTS_CHANGE,
                                     objId=temp.muta_id, action='removed')
             self._logger.debug("Removed object %s" % temp.muta_id)
@@ -415,35 +1861,49 @@ class HttpMutaManager(object):
     @asyncio.coroutine
     def _on_shutdown(self, app):
         self._logger.debug("On Shutdown got called...")
+        # Send out the changes waiting for notification
+        if self._change_coalescer is not None:
+            self._change_coalescer.close()
         # Broadcast termination
         self._send_notification(self.NOTIFICATION_TERMINATION)
         # Close all proxies
-        for addr, proxy in self._manager_proxies.items():
-            self._remove_manager_proxy(proxy)
+        for proxy in list(self._manager_proxies.values()):
+            yield from self._remove_manager_proxy(proxy)
         # Stop the reconnector
-        yield from self._proxy_reconnector_task.cancel()
+        if self._proxy_reconnector_task is not None:
+            self._proxy_reconnector_task.cancel()
 
         # Remove all objects
         objects_to_remove = list(self._muta_objects.values())
         for obj in objects_to_remove:
             self.remove_object(obj)
+        self._poller.close()
+        self._streamer.close()
+
+        if self._own_executor is not None:
+            self._own_executor.shutdown(wait=False)
+            self._own_executor = None
+
+        # Send the last log records and stop forwarding
+        self._log_handler._send_pending()
+        self._proxy_logger.removeHandler(self._log_handler)
+
+        # Close the pooled connections to other managers
+        if self._client_session is not None:
+            yield from self._client_session.close()
+            self._client_session = None
 
     @asyncio.coroutine
     def register_on_master(self, master_addr):
-        # I know that it's not good to re-load session for single request,
-        # but in this case it's so infrequent it doesn't matter
-        if aiohttp_version >= "4.0":
-            temp_session = ClientSession()
-        else:
-            temp_session = ClientSession(loop=self._loop)
-
-        resp = yield from temp_session.post(
+        resp = yield from self.client_session.post(
             master_addr + '/api/remote',
             json={'address': "http://{0}:{1}".format(self._host_addr,
-                                                     self._host_port)})
+                                                     self._host_port)},
+            timeout=self.client_request_timeout)
+        # Release the connection back to the pool
+        yield from resp.read()
         if resp.status != 200:
             raise MutaManagerError("Couldn't register to the master")
-        yield from temp_session.close()
 
     def _run(self, host='0.0.0.0', port='8080'):
 
@@ -521,6 +1981,7 @@ class HttpManagerProxy:
     def __init__(self, address):
         self._address = address
         self._session = None
+        self._request_timeout = None
         self._logger = logging.getLogger(self.__class__.__name__)
         self._registered_objects = {}
         self._host_manager = None
@@ -528,11 +1989,19 @@ class HttpManagerProxy:
         self._ws = None
         self._ws_man = None
         self._is_being_removed = False
+        self._wire_format = CONTENT_JSON
+        self._reconnect_stats = ReconnectStats()
+        # Object schemas from the last snapshot {schema_tag: schema}
+        self._schemas = {}
 
     @property
     def session(self):
         return self._session
 
+    @property
+    def request_timeout(self):
+        return self._request_timeout
+
     @property
     def is_attached(self):
         return self._is_attached
@@ -541,6 +2010,11 @@ class HttpManagerProxy:
     def address(self):
         return self._address
 
+    @property
+    def reconnect_stats(self):
+        """ :class:`ReconnectStats` maintained by the host manager."""
+        return self._reconnect_stats
+
     @property
     def is_being_removed(self):
         """
@@ -549,6 +2023,46 @@ class HttpManagerProxy:
         """
         return self._is_being_removed
 
+    @property
+    def wire_format(self):
+        """ Content type requested from the remote manager."""
+        return self._wire_format
+
+    @property
+    def mirror_max_age(self):
+        """ Maximal age of the remote objects' mirror, None if disabled."""
+        if self._host_manager is None:
+            return None
+        return self._host_manager.mirror_max_age
+
+    @asyncio.coroutine
+    def read_body(self, resp):
+        """ Decodes body of the remote manager's response."""
+        return _decode_body((yield from resp.read()), resp.content_type)
+
+    def encode_body(self, data):
+        """ Returns (body, headers) for sending data to the remote manager."""
+        return (_encode_body(data, self._wire_format),
+                {'Content-Type': self._wire_format,
+                 HttpMutaManager.HEADER_SUPERVISOR: 'true'})
+
+    @asyncio.coroutine
+    def _open_websocket(self):
+        if self._wire_format != CONTENT_JSON:
+            addr = self._address + '/api/binary-notifications'
+            try:
+                self._ws = yield from self._session.ws_connect(addr)
+                self._logger.debug("Opened binary websocket at %s" % addr)
+                return
+            except WSServerHandshakeError:
+                # Older remote manager, use the SockJS websocket
+                self._logger.debug("Binary websocket not available at %s" %
+                                   addr)
+
+        addr = self._address + '/api/notifications/websocket'
+        self._ws = yield from self._session.ws_connect(addr)
+        self._logger.debug("Opened websocket at %s" % addr)
+
     def _add_remote_object(self, obj):
         obj_proxy = HttpMutaObjectProxy(self, obj)
         try:
@@ -557,6 +2071,7 @@ class HttpManagerProxy:
             # The object may already be there sometimes
             pass
         self._registered_objects[obj_proxy.muta_id] = obj_proxy
+        return obj_proxy
 
     def _remove_remote_object(self, obj):
         obj_proxy = self._registered_objects.pop(obj, None)
@@ -564,6 +2079,69 @@ class HttpManagerProxy:
             self._host_manager.remove_object(obj_proxy)
 
 
+    @asyncio.coroutine
+    def _read_records(self, resp, callback):
+        """ Reads the streamed snapshot records, calling `callback` for each
+        record as soon as it's received.
+        """
+        if resp.content_type in _MSGPACK_TYPES:
+            unpacker = msgpack.Unpacker(raw=False)
+            while True:
+                chunk = yield from resp.content.read(65536)
+                if not chunk:
+                    break
+                unpacker.feed(chunk)
+                for record in unpacker:
+                    callback(record)
+        else:
+            while True:
+                line = yield from resp.content.readline()
+                if not line:
+                    break
+                if line.strip():
+                    callback(json.loads(line.decode('utf-8')))
+
+    @asyncio.coroutine
+    def _load_snapshot(self):
+        """ Adds all remote objects, with their schemas and values, from
+        one streamed snapshot. Schemas known from the previous attach are not
+        transferred again.
+
+        :return:  False if the remote manager doesn't provide snapshots.
+        """
+        resp = yield from self._session.get(
+            self._address + '/api/snapshot',
+            params=[('known', tag) for tag in self._schemas],
+            timeout=self._request_timeout)
+        if resp.status == 404:
+            yield from resp.read()
+            return False
+        elif resp.status != 200:
+            yield from resp.read()
+            raise MutaManagerError("Cannot access remote objects at %s" %
+                                   self._address)
+
+        schemas = {}
+
+        def add_record(record):
+            tag = record.get('schemaTag', None)
+            schema = record.get('schema', None) or self._schemas.get(tag, None)
+            obj_proxy = self._add_remote_object(record['objId'])
+            if schema is not None:
+                schemas[tag] = schema
+                obj_proxy.load_snapshot(tag, schema, record.get('values', {}))
+
+        yield from self._read_records(resp, add_record)
+        self._schemas = schemas
+        return True
+
+    def _mirror_changes(self, changes):
+        """ Updates mirrors of the remote objects by notified changes."""
+        for change in changes:
+            obj_proxy = self._registered_objects.get(change.get('objId'), None)
+            if obj_proxy is not None:
+                obj_proxy.mirror_change(change)
+
     @asyncio.coroutine
     def attach(self, host_manager):
         """
@@ -576,16 +2154,13 @@ class HttpManagerProxy:
         :return:
         """
         self._host_manager = host_manager
-        if aiohttp_version >= "4.0":
-            self._session = ClientSession()
-        else:
-            self._session = ClientSession(loop=self._host_manager._loop)
+        self._wire_format = host_manager.wire_format
+        self._session = host_manager.client_session
+        self._request_timeout = host_manager.client_request_timeout
 
         # Open the WebSocket
         try:
-            addr = self._address + '/api/notifications/websocket'
-            self._ws = yield from self._session.ws_connect(addr)
-            self._logger.debug("Opened websocket at %s" % addr)
+            yield from self._open_websocket()
         except WSServerHandshakeError:
             raise MutaManagerError("Cannot establish WS connection to %s" %
                                    self._address)
@@ -594,19 +2169,79 @@ class HttpManagerProxy:
         self._ws_man = self._host_manager._loop.create_task(self.ws_manager())
 
         # Get and process the remote objects
-        resp = yield from self._session.get(self._address + '/api/objects')
+        try:
+            if not (yield from self._load_snapshot()):
+                # Older remote manager, only the object IDs are loaded
+                resp = yield from self._session.get(
+                    self._address + '/api/objects',
+                    timeout=self._request_timeout)
+
+                if resp.status != 200:
+                    yield from resp.read()
+                    raise MutaManagerError(
+                        "Cannot access remote objects at %s" % self._address)
+
+                for obj in (yield from self.read_body(resp)) or []:
+                    self._add_remote_object(obj)
+        except Exception:
+            # Don't leave the websocket and the objects of a failed attempt
+            # behind, the next attempt adds new proxies
+            self._ws_man.cancel()
+            yield from self._ws.close()
+            host_objects = self._host_manager._muta_objects
+            for obj_id, obj_proxy in self._registered_objects.items():
+                if host_objects.get(obj_id, None) is obj_proxy:
+                    self._host_manager.remove_object(obj_proxy)
+            self._registered_objects = {}
+            raise
+
+        self._is_attached = True
+        self._logger.debug("Remote manager %s attached." % self._address)
+
+    @asyncio.coroutine
+    def get_values(self, obj_ids, prop_ids=None):
+        """ Reads values of the given remote objects in one request.
 
+        :return: {obj_id: {prop_id: value}}
+        """
+        if not self.is_attached:
+            raise MutaManagerError("Remote manager is not attached.")
+
+        params = [('obj_id', obj_id) for obj_id in obj_ids]
+        params += [('prop_id', prop_id) for prop_id in (prop_ids or [])]
+        resp = yield from self._session.get(self._address + '/api/values',
+                                            params=params,
+                                            timeout=self._request_timeout)
         if resp.status != 200:
-            raise MutaManagerError("Cannot access remote objects at %s" %
+            yield from resp.read()
+            raise MutaManagerError("Cannot access remote values at %s" %
                                    self._address)
+        return (yield from self.read_body(resp))
 
-        objects = (yield from resp.json()) or []
+    @asyncio.coroutine
+    def set_values(self, values):
+        """ Sets values of several remote objects in one request.
 
-        for obj in objects:
-            self._add_remote_object(obj)
+        :param values:  {obj_id: {prop_id: value}}
+        :return: {obj_id: {prop_id: result}}
+        """
+        if not self.is_attached:
+            raise MutaManagerError("Remote manager is not attached.")
 
-        self._is_attached = True
-        self._logger.debug("Remote manager %s attached." % self._address)
+        body, headers = self.encode_body(values)
+        try:
+            resp = yield from self._session.put(self._address + '/api/values',
+                                                data=body, headers=headers,
+                                                timeout=self._request_timeout)
+        finally:
+            for obj_id in values:
+                if obj_id in self._registered_objects:
+                    self._registered_objects[obj_id].invalidate_mirror()
+        if resp.status != 200:
+            yield from resp.read()
+            raise MutaManagerError("Cannot set remote values at %s" %
+                                   self._address)
+        return (yield from self.read_body(resp))
 
     @asyncio.coroutine
     def detach(self):
@@ -621,9 +2256,8 @@ class HttpManagerProxy:
             # Disconnect the WS manager
             self._ws_man.cancel()
 
-            # Close the websocket and session
+            # Close the websocket, the session is shared by the host manager
             yield from self._ws.close()
-            yield from self._session.close()
 
             # Tell host manager that it's detached
             # self._host_manager._on_proxy_manager_detach(self)
@@ -644,8 +2278,11 @@ class HttpManagerProxy:
             try:
                 msg = yield from self._ws.receive()
                 self._logger.debug("Received ws msg %s" % str(msg))
-                if msg.type == WSMsgType.TEXT:
-                    data = json.loads(msg.data)
+                if msg.type in (WSMsgType.TEXT, WSMsgType.BINARY):
+                    if msg.type == WSMsgType.TEXT:
+                        data = json.loads(msg.data)
+                    else:
+                        data = _decode_body(msg.data, CONTENT_MSGPACK)
                     cmd = data.get('type')
                     if cmd == HttpMutaManager.NOTIFICATION_TERMINATION:
                         self._is_being_removed = True
@@ -660,8 +2297,15 @@ class HttpManagerProxy:
                         elif action == 'removed':
                             self._remove_remote_object(params['objId'])
 
+                    elif cmd == HttpMutaManager.NOTIFICATION_PROPERTY_CHANGE:
+                        self._mirror_changes([data.get('params', {})])
+
+                    elif cmd == HttpMutaManager.NOTIFICATION_PROPERTIES_CHANGE:
+                        self._mirror_changes(
+                            data.get('params', {}).get('changes', []))
+
                     self._logger.debug("Relaying wsmessage: %s" % str(data))
-                    self._host_manager._send_ws_message(data)
+                    self._host_manager._relay_ws_message(data)
 
                 elif msg.type == WSMsgType.CLOSED:
                     self._logger.debug("Websocket closed: %s" % msg.data)
@@ -672,6 +2316,8 @@ class HttpManagerProxy:
                     self._logger.debug("Websocket error: %s" % msg.data)
                     yield from self._disconnected()
                     break
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 self._logger.exception("WS manager error")
                 break
@@ -683,12 +2329,28 @@ class HttpMutaObjectProxy:
     """
     Utility class proxying remote MutaObjects through REST calls.
     """
+    RESOURCE_CACHE_SIZE = 64  # Revalidated responses kept per object
+
     def __init__(self, manager_proxy, obj_id):
         self._manager_proxy = manager_proxy
         self._address = "{0}/api/objects/{1}".format(
             self._manager_proxy.address, urllib.parse.quote(obj_id))
         self._obj_id = obj_id
         self._session = self._manager_proxy.session
+        self._timeout = self._manager_proxy.request_timeout
+        # Last responses of the schema resources, revalidated by ETag. Bounded,
+        # the addresses include the client's query strings
+        self._resource_cache = LruCache(self.RESOURCE_CACHE_SIZE)
+        # Local copy of the object resource, values kept up to date
+        # by the notifications
+        self._mirror = None
+        self._mirror_values = {}
+        self._mirror_versions = {}
+        self._mirror_time = None
+        self._mirror_loading = None
+        # Snapshot loaded on attach, not read yet (see _viewed())
+        self._snapshot_unread = False
+        self._schema_tag = None
 
     # For MutaClass type object compatibility
     def is_muta_ready(self):
@@ -704,54 +2366,308 @@ class HttpMutaObjectProxy:
     def muta_id(self):
         return self._obj_id
 
+    @property
+    def manager_proxy(self):
+        return self._manager_proxy
+
     @asyncio.coroutine
-    def _get_resource(self, resource_address):
+    def _get_resource(self, resource_address, accept=CONTENT_JSON):
         try:
             if not self._manager_proxy.is_attached:
                 raise MutaManagerError("Remote manager is not attached.")
+            cached = self._resource_cache.lookup(resource_address)
+            request_headers = {}
+            if cached is not None:
+                request_headers['If-None-Match'] = cached[0]
             resp = yield from self._session.get(self._address +
-                                                resource_address)
-            temp = yield from resp.text()
-            return web.json_response(text=temp)
+                                                resource_address,
+                                                headers=request_headers,
+                                                timeout=self._timeout)
+            if resp.status == 304 and cached is not None:
+                etag, content_type, body = cached
+                yield from resp.read()
+            else:
+                content_type = resp.content_type
+                body = yield from resp.read()
+                etag = resp.headers.get('ETag', None)
+                if resp.status == 200 and etag is not None:
+                    self._resource_cache[resource_address] = \
+                        (etag, content_type, body)
+                else:
+                    self._resource_cache.pop(resource_address, None)
+
+            headers = {}
+            for header in (HttpMutaManager.HEADER_VERSION,
+                           HttpMutaManager.HEADER_TOTAL, 'Cache-Control'):
+                if header in resp.headers:
+                    headers[header] = resp.headers[header]
+            if etag is not None:
+                # Transcoded body is a different representation
+                headers['ETag'] = etag if content_type == accept else \
+                    '"{0}.{1}"'.format(etag.strip('"'), 'm' if accept !=
+                                       CONTENT_JSON else 'j')
+            return _relay_response(200 if resp.status == 304 else resp.status,
+                                   content_type, body, accept,
+                                   headers=headers)
         except (ClientOSError, MutaManagerError) as e:
             return web.HTTPNotFound(text=str(e))
 
     @asyncio.coroutine
-    def _put_resource(self, resource_address):
+    def _put_resource(self, resource_address, data=None, accept=CONTENT_JSON):
         try:
             if not self._manager_proxy.is_attached:
                 raise MutaManagerError("Remote manager is not attached.")
             # Add header saying it's from supervisor manager
+            if data is not None:
+                body, headers = self._manager_proxy.encode_body(data)
+            else:
+                body, headers = None, {HttpMutaManager.HEADER_SUPERVISOR:
+                                       'true'}
             resp = yield from self._session.put(self._address +
-                resource_address,
-                headers={HttpMutaManager.HEADER_SUPERVISOR: 'true'})
-            text = yield from resp.text()
-            return web.json_response(status=resp.status, text=text)
+                                                resource_address,
+                                                data=body, headers=headers,
+                                                timeout=self._timeout)
+            body = yield from resp.read()
+            return _relay_response(resp.status, resp.content_type, body,
+                                   accept)
         except (ClientOSError, MutaManagerError) as e:
             return web.HTTPNotFound(text=str(e))
+
+    def invalidate_mirror(self):
+        """ Makes the next read reload the mirror from the remote manager."""
+        self._mirror_time = None
+        self._snapshot_unread = False
+
+    def mirror_change(self, change):
+        """ Applies a notified change (dict with ``propId`` and either
+        ``value`` or ``patch``) to the mirrored values.
+        """
+        if self._mirror is None:
+            return
+        prop_id = change.get('propId')
+        if 'value' in change:
+            self._mirror_values[prop_id] = change['value']
+        elif 'patch' in change and \
+                self._mirror_versions.get(prop_id, None) == change.get('base'):
+            start, delete_count, text = change['patch']
+            value = self._mirror_values[prop_id]
+            self._mirror_values[prop_id] = \
+                value[:start] + text + value[start + delete_count:]
+        else:
+            # Missed the base of the patch, nothing to apply it to
+            self._mirror_versions.pop(prop_id, None)
+            self.invalidate_mirror()
+            return
+
+        if 'version' in change:
+            self._mirror_versions[prop_id] = change['version']
+        else:
+            self._mirror_versions.pop(prop_id, None)
+
+    def _mirror_fresh(self):
+        max_age = self._manager_proxy.mirror_max_age
+        return self._mirror_time is not None and \
+            time.monotonic() - self._mirror_time <= max_age
+
+    def load_snapshot(self, schema_tag, schema, values):
+        """ Fills the mirror from a snapshot record.
+
+        :param schema:  Object dict without the object ID and values.
+        :param values:  {prop_id: value}
+        """
+        self._schema_tag = schema_tag
+        self._mirror = dict(schema)
+        self._mirror[MutaPropClass.MP_OBJ_ID] = self._obj_id
+        self._mirror_values = dict(values)
+        self._mirror_versions = {}
+        self._mirror_time = time.monotonic()
+        self._snapshot_unread = True
+
     @asyncio.coroutine
-    def get_object(self):
-        return (yield from self._get_resource(''))
+    def snapshot_record(self):
+        """ Returns record of the object for snapshot of the host manager,
+        or None if the remote manager is not accessible.
+        """
+        if (yield from self._mirrored()) is None:
+            try:
+                if not self._manager_proxy.is_attached:
+                    raise MutaManagerError("Remote manager is not attached.")
+                yield from self._load_mirror()
+            except (ClientOSError, MutaManagerError) as e:
+                self._manager_proxy._logger.debug(
+                    "Cannot read remote object: %s" % e)
+                return None
+
+        schema = {key: value for key, value in self._mirror.items()
+                  if key != MutaPropClass.MP_OBJ_ID}
+        schema[MutaPropClass.MP_PROPS] = [
+            {key: value for key, value in prop.items()
+             if key != MutaProperty.MP_VALUE}
+            for prop in schema.get(MutaPropClass.MP_PROPS, [])]
+        if self._schema_tag is None:
+            self._schema_tag = content_tag(json.dumps(schema, sort_keys=True))
+        return {'objId': self._obj_id, 'schemaTag': self._schema_tag,
+                'schema': schema, 'values': dict(self._mirror_values)}
 
     @asyncio.coroutine
-    def get_props(self):
-        return (yield from self._get_resource('/props'))
+    def _load_mirror(self):
+        resp = yield from self._session.get(self._address,
+                                            timeout=self._timeout)
+        if resp.status != 200:
+            yield from resp.read()
+            raise MutaManagerError("Cannot access remote object at %s" %
+                                   self._address)
+        temp = yield from self._manager_proxy.read_body(resp)
+        self._mirror = temp
+        self._schema_tag = None
+        self._mirror_values = {
+            prop[MutaProperty.MP_ID]: prop[MutaProperty.MP_VALUE]
+            for prop in temp.get(MutaPropClass.MP_PROPS, [])
+            if MutaProperty.MP_VALUE in prop}
+        self._mirror_versions = {}
+        self._mirror_time = time.monotonic()
 
     @asyncio.coroutine
-    def get_prop(self, prop_id):
-        return (yield from self._get_resource('/props/{0}'.format(prop_id)))
+    def _mirrored(self):
+        """ Returns the mirrored object resource (reloaded first if it's too
+        old), or None if mirroring is disabled or the remote manager is not
+        accessible.
+        """
+        if self._manager_proxy.mirror_max_age is None or \
+                not self._manager_proxy.is_attached:
+            return None
+        if not self._mirror_fresh():
+            # Concurrent reads wait for the same reload
+            if self._mirror_loading is None:
+                self._mirror_loading = asyncio.ensure_future(
+                    self._load_mirror())
+            loading = self._mirror_loading
+            try:
+                yield from asyncio.shield(loading)
+            except (ClientOSError, MutaManagerError) as e:
+                self._manager_proxy._logger.debug(
+                    "Cannot mirror remote object: %s" % e)
+                return None
+            finally:
+                if self._mirror_loading is loading:
+                    self._mirror_loading = None
+        return self._mirror
 
     @asyncio.coroutine
-    def get_prop_value(self, prop_id):
+    def _viewed(self):
+        """ Like :meth:`_mirrored`, for the object and props reads. Without
+        mirroring, the first of them after the attach is served from the
+        snapshot loaded by it (kept current by the notifications meanwhile),
+        the next ones go to the remote manager.
+        """
+        mirror = yield from self._mirrored()
+        if mirror is None and self._snapshot_unread and \
+                self._manager_proxy.is_attached:
+            self._snapshot_unread = False
+            mirror = self._mirror
+        return mirror
+
+    def _mirrored_props(self):
+        return [dict(prop, **{MutaProperty.MP_VALUE:
+                              self._mirror_values[prop[MutaProperty.MP_ID]]})
+                if prop[MutaProperty.MP_ID] in self._mirror_values else prop
+                for prop in self._mirror.get(MutaPropClass.MP_PROPS, [])]
+
+    @staticmethod
+    def _mirror_response(data, accept, headers=None):
+        body = _encode_body(data, accept)
+        temp = {'ETag': '"{0}"'.format(content_tag(body)),
+                'Cache-Control': 'no-cache'}
+        temp.update(headers or {})
+        return web.Response(body=body, content_type=accept, headers=temp)
+
+    @asyncio.coroutine
+    def mirrored_values(self, prop_ids=None):
+        """ Returns {prop_id: value} of the mirrored values, or None if
+        the mirror is not available.
+        """
+        if (yield from self._mirrored()) is None:
+            return None
+        temp = OrderedDict()
+        for prop in self._mirror.get(MutaPropClass.MP_PROPS, []):
+            prop_id = prop[MutaProperty.MP_ID]
+            if prop_id in self._mirror_values and \
+                    (prop_ids is None or prop_id in prop_ids):
+                temp[prop_id] = self._mirror_values[prop_id]
+        return temp
+
+    @asyncio.coroutine
+    def get_object(self, accept=CONTENT_JSON):
+        if (yield from self._viewed()) is not None:
+            temp = dict(self._mirror)
+            temp[MutaPropClass.MP_PROPS] = self._mirrored_props()
+            return self._mirror_response(temp, accept)
+        return (yield from self._get_resource('', accept))
+
+    @asyncio.coroutine
+    def get_props(self, accept=CONTENT_JSON, query_string=''):
+        if query_string:
+            # Filtered and paged by the remote manager
+            return (yield from self._get_resource('/props?' + query_string,
+                                                  accept))
+        if (yield from self._viewed()) is not None:
+            return self._mirror_response(self._mirrored_props(), accept)
+        return (yield from self._get_resource('/props', accept))
+
+    @asyncio.coroutine
+    def get_prop(self, prop_id, accept=CONTENT_JSON):
+        if (yield from self._mirrored()) is not None:
+            for prop in self._mirrored_props():
+                if prop[MutaProperty.MP_ID] == prop_id:
+                    return self._mirror_response(prop, accept)
+            return web.HTTPNotFound()
+        return (yield from self._get_resource('/props/{0}'.format(prop_id),
+                                              accept))
+
+    @asyncio.coroutine
+    def get_prop_value(self, prop_id, accept=CONTENT_JSON):
+        if (yield from self._mirrored()) is not None and \
+                prop_id in self._mirror_values:
+            headers = {}
+            if prop_id in self._mirror_versions:
+                headers[HttpMutaManager.HEADER_VERSION] = \
+                    str(self._mirror_versions[prop_id])
+            return self._mirror_response(self._mirror_values[prop_id], accept,
+                                         headers)
         return (yield from self._get_resource('/props/{0}/value'
-                                              .format(prop_id)))
+                                              .format(prop_id), accept))
 
     @asyncio.coroutine
-    def set_prop_value(self, prop_id, value):
-        return (yield from self._put_resource('/props/{0}?value={1}'
-                                              .format(prop_id, value)))
+    def get_prop_history(self, prop_id, query_string='', accept=CONTENT_JSON):
+        address = '/props/{0}/history'.format(prop_id)
+        if query_string:
+            address += '?' + query_string
+        return (yield from self._get_resource(address, accept))
+
+    @asyncio.coroutine
+    def set_prop_value(self, prop_id, value, accept=CONTENT_JSON):
+        try:
+            return (yield from self._put_resource('/props/{0}?value={1}'
+                                                  .format(prop_id, value),
+                                                  accept=accept))
+        finally:
+            # Reads after the write must not get the old value, even if
+            # they come before the notification
+            self.invalidate_mirror()
 
     @asyncio.coroutine
-    def set_prop_action(self, prop_id):
-        return (yield from self._put_resource('/props/{0}/action'
-                                              .format(prop_id)))
+    def set_prop_values(self, values, accept=CONTENT_JSON):
+        try:
+            return (yield from self._put_resource('/values', data=values,
+                                                  accept=accept))
+        finally:
+            self.invalidate_mirror()
+
+    @asyncio.coroutine
+    def set_prop_action(self, prop_id, accept=CONTENT_JSON):
+        try:
+            return (yield from self._put_resource('/props/{0}/action'
+                                                  .format(prop_id),
+                                                  accept=accept))
+        finally:
+            self.invalidate_mirror()
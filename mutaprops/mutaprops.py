@@ -2,14 +2,34 @@
 # -*- coding: utf-8 -*-
 
 from enum import Enum
+import asyncio
+import inspect
 import logging
 import types
+import json
 from collections import OrderedDict
-from .utils import MutaPropError, rest_to_html
+from .utils import MutaPropError, rest_to_html, content_tag
 
 logger = logging.getLogger(__name__)
 
 
+class ChangeDetection(Enum):
+    """ Strategies deciding if setting a MutaProperty changes its value
+    (and has to be notified).
+    """
+    GETTER = 'getter'  # Compare with the value read by the getter
+    CACHED = 'cached'  # Compare with the last notified value
+    HASH = 'hash'      # Compare with hash of the last notified value
+    ALWAYS = 'always'  # Every set is a change
+
+    @staticmethod
+    def value_hash(value):
+        """ Short hash of a (JSON-serializable) value."""
+        if not isinstance(value, (str, bytes)):
+            value = json.dumps(value, sort_keys=True, default=str)
+        return content_tag(value)
+
+
 class MutaTypes(Enum):
     """ Representation of allowed MutaProperty types.
     """
@@ -22,23 +42,42 @@ class MutaTypes(Enum):
     @classmethod
     def typecast(cls, muta_type, string_value):
         """ Cast string representation of the value to the particular
-            python type.
+            python type. Values which are not strings (e.g. decoded from
+            JSON) are cast directly.
         """
 
         if muta_type == cls.STRING:
-            return string_value
+            return str(string_value)
         elif muta_type == cls.INT:
             return int(string_value)
         elif muta_type == cls.REAL:
             return float(string_value)
         elif muta_type == cls.BOOL:
-            return bool(string_value.lower() == 'true')
+            if isinstance(string_value, str):
+                return bool(string_value.lower() == 'true')
+            return bool(string_value)
         elif muta_type == cls.HTML:
-            return string_value
+            return str(string_value)
         else:
             raise MutaPropError("Unknown value type {0}".format(muta_type))
 
 
+class _PropDoc(object):
+    """ ``__doc__`` of the slotted MutaProp classes: the class docstring when
+    accessed on the class, the prop's own docstring on the instances (so
+    ``help()`` of the decorated classes shows them).
+    """
+    __slots__ = ('_class_doc',)
+
+    def __init__(self, class_doc):
+        self._class_doc = class_doc
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self._class_doc
+        return obj._muta_doc
+
+
 class MutaProp(object):
     """ Abstract class defining a generic MutaProp object.
         Such object holds basic information about a "property" of a
@@ -54,8 +93,16 @@ class MutaProp(object):
          * :const:`~mutaprops.MutaProp.MP_CLASS_TYPE` constant defining
             the MutaProp class for GUI use (the utilization of this parameter
             is GUI-implementation-dependent).
+
+        The MutaProps are kept compact (``__slots__``), as the device classes
+        can define many thousands of them. Subclasses have to list their
+        attributes in ``__slots__`` too.
     """
 
+    __slots__ = ('_muta_id', '_muta_name', '_muta_priority', '_muta_hierarchy',
+                 '_muta_view', '_muta_deford', '_muta_blocking', '_muta_doc',
+                 '_muta_schema', '_muta_schema_json', '_muta_schema_tag')
+
     __definition_counter = 0
     MP_ID = 'id'    # ID of the prop (usually matches the property name)
     MP_NAME = 'name'  # Human-readable name
@@ -65,16 +112,46 @@ class MutaProp(object):
     MP_DOC = 'doc'  # Prop's docstring
     MP_VIEW = 'view'  # Alternative view widget assignment where applicable
     MP_TYPE = 'type'  # Type of the Prop (Property/Action/Source)
+    MP_BLOCKING = 'blocking'  # Run the functions in executor
 
     MP_CLASS_TYPE = 'abstract'
 
     # I'm using classmethods instead of class constants because of easier
     # inheritance
+    @classmethod
+    def _all_slots(cls):
+        # Looking directly to the __dict__, subclasses must have their own
+        slots = cls.__dict__.get('_muta_all_slots', None)
+        if slots is None:
+            slots = tuple(slot for klass in reversed(cls.__mro__)
+                          for slot in klass.__dict__.get('__slots__', ()))
+            cls._muta_all_slots = slots
+        return slots
+
+    def _replace(self, **kwargs):
+        """ Returns copy of the prop with the attributes given by `kwargs`
+        (constructor kwargs names) replaced. Used by the decorator steps
+        (getter, setter...) instead of building all the kwargs and going
+        through the constructor again.
+        """
+        temp = object.__new__(type(self))
+        for slot in self._all_slots():
+            try:
+                setattr(temp, slot, getattr(self, slot))
+            except AttributeError:  # Not set by this class (e.g. MutaSource)
+                pass
+        if hasattr(self, '__dict__'):  # Subclass without __slots__
+            temp.__dict__.update(self.__dict__)
+        for key, value in kwargs.items():
+            setattr(temp, "_muta_{0}".format(key), value)
+        temp.invalidate_schema()
+        return temp
+
     @classmethod
     def _allowed_kwargs(cls):
         """ Define kwargs which are allowed in the constructor."""
         return cls.MP_PRIORITY, cls.MP_HIERARCHY, cls.MP_DEFINITION_ORDER, \
-               cls.MP_DOC, cls.MP_VIEW
+               cls.MP_DOC, cls.MP_VIEW, cls.MP_BLOCKING
 
     @classmethod
     def _exported_params(cls):
@@ -98,13 +175,18 @@ class MutaProp(object):
                             MutaProps are listed in GUI is defined by deford.
             * `view` :      string
                             identifier of recommended GUI view type
+            * `blocking` :  bool
+                            Functions block for long time, the manager runs
+                            them in executor. If None, the setting of the
+                            class is used.
         """
         self._muta_id = pid
         self._muta_name = display_name
 
         # Check for invalid kwargs
-        for key in kwargs.keys():
-            if key not in self._allowed_kwargs():
+        allowed = self._allowed_kwargs()
+        for key in kwargs:
+            if key not in allowed:
                 raise MutaPropError("Invalid argument {0}".format(key))
 
         # Assign with defaults
@@ -113,12 +195,18 @@ class MutaProp(object):
         self._muta_hierarchy = kwargs.get(self.MP_HIERARCHY, None)
         self._muta_view = kwargs.get(self.MP_VIEW, None)
         self._muta_deford = kwargs.get(self.MP_DEFINITION_ORDER, None)
+        self._muta_blocking = kwargs.get(self.MP_BLOCKING, None)
 
         if self._muta_deford is None:
             self._muta_deford = MutaProp.__definition_counter
             MutaProp.__definition_counter += 1
 
-        self.__doc__ = kwargs.get(self.MP_DOC, None)
+        self._muta_doc = kwargs.get(self.MP_DOC, None)
+
+        # Serialization caches, see schema()
+        self._muta_schema = None
+        self._muta_schema_json = None
+        self._muta_schema_tag = None
 
     def _assign_kwarg(self, kwarg_key, kwarg_value):
         """ Converts
@@ -128,10 +216,8 @@ class MutaProp(object):
         :return:
         """
         if kwarg_key in self._allowed_kwargs():
-            if kwarg_key == 'doc':
-                self.__doc__ = kwarg_value
-            else:
-                setattr(self, "_muta_{0}".format(kwarg_key), kwarg_value)
+            setattr(self, "_muta_{0}".format(kwarg_key), kwarg_value)
+            self.invalidate_schema()
         else:
             raise MutaPropError("Invalid keyword {0}".format(kwarg_key))
 
@@ -159,6 +245,13 @@ class MutaProp(object):
     def definition_order(self):
         return self._muta_deford
 
+    @property
+    def blocking(self):
+        return self._muta_blocking
+
+    def is_async(self):
+        return False
+
     def __str__(self):
         temp = (
             "ID: {pid}: {name}\n" +
@@ -168,15 +261,15 @@ class MutaProp(object):
                                          deford=self._muta_deford,
                                          priority=self._muta_priority,
                                          hierarchy=self._muta_hierarchy,
-                                         doc=self.__doc__)
+                                         doc=self._muta_doc)
         return temp
 
-    def to_dict(self, obj=None):
+    def _build_schema(self):
         temp = {}
         for attr in self._exported_params():
             if attr == self.MP_DOC:
                 # Docstring is here converted from reST to HTML
-                temp[self.MP_DOC] = rest_to_html(self.__doc__)
+                temp[self.MP_DOC] = rest_to_html(self._muta_doc)
             elif attr == self.MP_TYPE:
                 temp[self.MP_TYPE] = self.MP_CLASS_TYPE
             else:
@@ -185,6 +278,61 @@ class MutaProp(object):
 
         return temp
 
+    def schema(self):
+        """ Returns the static part of the serialized MutaProp, i.e. everything
+        except the values read from the object. As MutaProp definitions don't
+        change after the class is defined, it's built only once.
+
+        The returned dict is shared, don't modify it.
+        """
+        if self._muta_schema is None:
+            self._muta_schema = self._build_schema()
+        return self._muta_schema
+
+    def schema_json(self):
+        """ Returns :meth:`schema` pre-encoded as JSON string."""
+        if self._muta_schema_json is None:
+            self._muta_schema_json = json.dumps(self.schema())
+        return self._muta_schema_json
+
+    def schema_tag(self):
+        """ Returns validator (hash) of the :meth:`schema`, changing only
+        when the schema itself changes.
+        """
+        if self._muta_schema_tag is None:
+            self._muta_schema_tag = content_tag(self.schema_json())
+        return self._muta_schema_tag
+
+    def invalidate_schema(self):
+        self._muta_schema = None
+        self._muta_schema_json = None
+        self._muta_schema_tag = None
+
+    def value_overlay(self, obj):
+        """ Returns the live (object dependent) part of the serialized MutaProp,
+        which is merged over the :meth:`schema`.
+        """
+        return {}
+
+    def to_dict(self, obj=None):
+        temp = dict(self.schema())
+        if obj is not None:
+            temp.update(self.value_overlay(obj))
+        return temp
+
+    def to_json(self, obj=None, overlay=None):
+        """ Same as :meth:`to_dict`, but returns JSON string. Only the values
+        are encoded, the schema part is spliced in already encoded.
+
+        :param overlay:  Already read :meth:`value_overlay`, if available.
+        """
+        if overlay is None and obj is not None:
+            overlay = self.value_overlay(obj)
+        if not overlay:
+            return self.schema_json()
+        return '{0}, {1}}}'.format(self.schema_json()[:-1],
+                                   json.dumps(overlay)[1:-1])
+
 
 class MutaProperty(MutaProp):
     """Emulate PyProperty_Type() in Objects/descrobject.c"""
@@ -198,6 +346,10 @@ class MutaProperty(MutaProp):
     MP_FSET = 'fset'  # Setter function
     MP_FDEL = 'fdel'  # Deleter function
     MP_CHANGE_CALLBACK = 'change_callback'  # Callback called on change
+    MP_CHANGE_DETECTION = 'change_detection'  # ChangeDetection strategy
+    MP_POLL_INTERVAL = 'poll_interval'  # Period of reading by the manager
+    MP_HISTORY = 'history'  # Number of values kept by the manager
+    MP_STREAM = 'stream'  # Changes are sent over the binary stream channel
 
     MP_VALUE = 'value'  # Value of the MutaProperty
     MP_VALUE_TYPE = 'value_type'  # Type of the value (INT/BOOL...)
@@ -207,6 +359,12 @@ class MutaProperty(MutaProp):
 
     MP_CLASS_TYPE = 'property'
 
+    __slots__ = ('_muta_value_type', '_muta_min_val', '_muta_max_val',
+                 '_muta_step', '_muta_fget', '_muta_fset', '_muta_fdel',
+                 '_muta_change_callback', '_muta_change_detection',
+                 '_muta_poll_interval', '_muta_history', '_muta_stream',
+                 '_muta_select', '_muta_read_only', '_muta_toggle')
+
     @classmethod
     def _allowed_kwargs(cls):
         return super()._allowed_kwargs() + (cls.MP_MAXVAL, cls.MP_MINVAL,
@@ -214,14 +372,18 @@ class MutaProperty(MutaProp):
                                             cls.MP_FSET, cls.MP_FDEL,
                                             cls.MP_CHANGE_CALLBACK,
                                             cls.MP_SELECT, cls.MP_TOGGLE,
-                                            cls.MP_READ_ONLY)
+                                            cls.MP_READ_ONLY,
+                                            cls.MP_CHANGE_DETECTION,
+                                            cls.MP_POLL_INTERVAL,
+                                            cls.MP_HISTORY, cls.MP_STREAM)
 
     @classmethod
     def _exported_params(cls):
         return super()._exported_params() + (cls.MP_MINVAL, cls.MP_MAXVAL,
                                              cls.MP_STEP, cls.MP_READ_ONLY,
                                              cls.MP_VALUE_TYPE,
-                                             cls.MP_SELECT, cls.MP_TOGGLE)
+                                             cls.MP_SELECT, cls.MP_TOGGLE,
+                                             cls.MP_HISTORY, cls.MP_STREAM)
 
     def __init__(self, pid, display_name, value_type, **kwargs):
         """
@@ -265,6 +427,20 @@ class MutaProperty(MutaProp):
                             If set, a toggle-switch like control will be used
                             as GUI. Valid only for BOOL types, otherwise
                             ignored.
+            * `change_detection` : :class:`ChangeDetection` or its value
+                            How to decide if a set changes the value. If not
+                            set, the class' setting is used.
+            * `poll_interval` : float
+                            [seconds] If set, the manager reads the value
+                            periodically and notifies its changes.
+            * `history` :   int
+                            Number of recent values (with timestamps) kept by
+                            the manager. Only for INT and REAL types.
+            * `stream` :    bool
+                            Changes are sent as binary samples over the
+                            stream channel, the notifications carry only
+                            the latest value once per stream interval.
+                            Only for INT and REAL types.
         """
 
         doc = kwargs.get(self.MP_DOC, None)
@@ -283,6 +459,15 @@ class MutaProperty(MutaProp):
         self._muta_fset = kwargs.get(self.MP_FSET, None)
         self._muta_fdel = kwargs.get(self.MP_FDEL, None)
         self._muta_change_callback = kwargs.get(self.MP_CHANGE_CALLBACK, None)
+        self._muta_change_detection = kwargs.get(self.MP_CHANGE_DETECTION,
+                                                 None)
+        self._muta_poll_interval = kwargs.get(self.MP_POLL_INTERVAL, None)
+        self._muta_history = kwargs.get(self.MP_HISTORY, None)
+        self._muta_stream = kwargs.get(self.MP_STREAM, False)
+        if (self._muta_history or self._muta_stream) and \
+                value_type not in (MutaTypes.INT, MutaTypes.REAL):
+            raise MutaPropError("History and streaming are available only "
+                                "for INT and REAL properties.")
         self._muta_select = kwargs.get(self.MP_SELECT, {})
         self._muta_read_only = kwargs.get(self.MP_READ_ONLY, False)
         # logger.debug("Initializing mutaprop %s with selector %s" % (pid, temp_select))
@@ -299,16 +484,83 @@ class MutaProperty(MutaProp):
     def value_type(self):
         return self._muta_value_type
 
-    def _get_kwargs(self):
-        temp = {}
-        for kwarg in self._allowed_kwargs():
-            if kwarg == self.MP_DOC:
-                temp[kwarg] = self.__doc__
-            else:
-                temp[kwarg] = getattr(self, '_muta_{0}'.format(kwarg))
+    @property
+    def change_detection(self):
+        """ The prop's own :class:`ChangeDetection`, None if not set."""
+        return self._muta_change_detection
+
+    @property
+    def poll_interval(self):
+        """ [seconds] Period of polling by the manager, None if not polled."""
+        return self._muta_poll_interval
 
+    @property
+    def history(self):
+        """ Number of values kept in the manager's history, None if none."""
+        return self._muta_history
+
+    @property
+    def stream(self):
+        """ True if the changes are sent over the binary stream channel."""
+        return self._muta_stream
+
+    def _change_detection(self, obj):
+        strategy = self._muta_change_detection
+        if strategy is None:
+            strategy = getattr(obj, MutaPropClass.muta_attr(
+                MutaPropClass.MP_CHANGE_DETECTION), None)
+        return ChangeDetection(strategy or ChangeDetection.GETTER)
+
+    def _last_values(self, obj):
+        """ Returns dict of the last notified values (or their hashes) kept
+        in the object, None if it can't keep one.
+        """
+        attr = MutaPropClass.muta_attr(MutaPropClass.MP_LAST_VALUES)
+        temp = getattr(obj, attr, None)
+        if temp is None and obj is not None:
+            try:
+                temp = {}
+                setattr(obj, attr, temp)
+            except AttributeError:
+                return None
         return temp
 
+    def is_change(self, obj, value):
+        """ Decides if setting `value` changes the prop, by the prop's or
+        class' change detection strategy. The value is not remembered, call
+        :meth:`remember_value` once it is set.
+
+        For coroutine getters, the ``getter`` strategy can't compare and
+        treats every set as a change.
+        """
+        strategy = self._change_detection(obj)
+        if strategy == ChangeDetection.GETTER:
+            if asyncio.iscoroutinefunction(self._muta_fget):
+                return True
+            return self._muta_fget(obj) != value
+        elif strategy == ChangeDetection.ALWAYS:
+            return True
+
+        last_values = self._last_values(obj)
+        if last_values is None:
+            return True
+        key = value if strategy == ChangeDetection.CACHED else \
+            ChangeDetection.value_hash(value)
+        return self._muta_id not in last_values or \
+            last_values[self._muta_id] != key
+
+    def remember_value(self, obj, value):
+        """ Records `value` as the last set or notified one (e.g. by
+        polling), for the ``cached`` and ``hash`` change detection.
+        """
+        strategy = self._change_detection(obj)
+        if strategy in (ChangeDetection.CACHED, ChangeDetection.HASH):
+            last_values = self._last_values(obj)
+            if last_values is not None:
+                last_values[self._muta_id] = value \
+                    if strategy == ChangeDetection.CACHED else \
+                    ChangeDetection.value_hash(value)
+
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
@@ -320,9 +572,14 @@ class MutaProperty(MutaProp):
     def __set__(self, obj, value):
         if self._muta_fset is None:
             raise MutaPropError("No setter defined.")
+        if asyncio.iscoroutinefunction(self._muta_fset):
+            raise MutaPropError("Coroutine setter can't be assigned to, " +
+                                "await muta_set() instead.")
 
-        different = (self._muta_fget(obj) != value)
+        different = self.is_change(obj, value)
         self._muta_fset(obj, value)
+        if different:
+            self.remember_value(obj, value)
 
         # Notify of property change
         try:
@@ -357,11 +614,11 @@ class MutaProperty(MutaProp):
         """ Decorator function for constructing MutaProperty on getter function.
             Takes all ``kwargs`` from :meth:`~mutaprops.MutaProperty.__init__`
         """
-        logger.debug("{0}: Getter set".format(self._muta_id))
-        temp_kwargs = self._get_kwargs()
-        temp_kwargs[self.MP_FGET] = fget
-        return type(self)(self._muta_id, self._muta_name, self._muta_value_type,
-                          **temp_kwargs)
+        logger.debug("%s: Getter set", self._muta_id)
+        temp = self._replace(fget=fget)
+        if temp._muta_doc is None:
+            temp._muta_doc = fget.__doc__
+        return temp
 
     def setter(self, func=None, min_val=None, max_val=None, step=None,
                select={}):
@@ -391,39 +648,29 @@ class MutaProperty(MutaProp):
 
         :returns: MutaProp object
         """
-        temp_kwargs = self._get_kwargs()
-        temp_kwargs[self.MP_MINVAL] = min_val or self._muta_min_val
-        temp_kwargs[self.MP_MAXVAL] = max_val or self._muta_max_val
-        temp_kwargs[self.MP_STEP] = step or self._muta_step
-        temp_kwargs[self.MP_SELECT] = select or self._muta_select
+        def decorator(fset):
+            logger.debug("%s: Setter set", self._muta_id)
+            return self._replace(fset=fset,
+                                 min_val=min_val or self._muta_min_val,
+                                 max_val=max_val or self._muta_max_val,
+                                 step=step or self._muta_step,
+                                 select=select or self._muta_select)
 
         if func:
-            logger.debug("{0}: Setter set".format(self._muta_id))
-            temp_kwargs[self.MP_FSET] = func
-            return type(self)(self._muta_id, self._muta_name,
-                              self._muta_value_type, **temp_kwargs)
-
+            return decorator(func)
         else:
-            def decorator(fset):
-                logger.debug("{0}: Setter set".format(self._muta_id))
-                temp_kwargs[self.MP_FSET] = fset
-                return type(self)(self._muta_id, self._muta_name,
-                                  self._muta_value_type, **temp_kwargs)
             return decorator
 
     def deleter(self, fdel):
-        logger.debug("{0}: Deleter set".format(self._muta_id))
-        temp_kwargs = self._get_kwargs()
-        temp_kwargs[self.MP_FDEL] = fdel
-        return type(self)(self._muta_id, self._muta_name, self._muta_value_type,
-                          **temp_kwargs)
+        logger.debug("%s: Deleter set", self._muta_id)
+        return self._replace(fdel=fdel)
 
     def register_change_callback(self, callback):
         self._muta_change_callback = callback
 
-    def to_dict(self, obj=None):
+    def _build_schema(self):
 
-        temp = super().to_dict()
+        temp = super()._build_schema()
 
         # Some specific/derived properties follows
 
@@ -431,8 +678,6 @@ class MutaProperty(MutaProp):
         if not self.is_writeable():
             temp[self.MP_READ_ONLY] = True
 
-        if obj:
-            temp[self.MP_VALUE] = self.__get__(obj)
         temp[self.MP_VALUE_TYPE] = self._muta_value_type.name
 
         # Remove toggle parameter for non-bool items
@@ -441,11 +686,48 @@ class MutaProperty(MutaProp):
 
         return temp
 
+    def value_overlay(self, obj):
+        return {self.MP_VALUE: self.__get__(obj)}
+
+    @asyncio.coroutine
+    def muta_get(self, obj):
+        """ Coroutine returning the value, regardless if the getter is plain
+        function or coroutine.
+        """
+        value = self.__get__(obj)
+        if inspect.isawaitable(value):
+            value = yield from value
+        return value
+
     def muta_set(self, obj, value):
+        """ Sets the value from the GUI layer. For properties with coroutine
+        getter or setter returns a coroutine, which has to be awaited.
+        """
         # TODO: Validation!
-        if self._muta_fget(obj) != value:
+        if self.is_async():
+            return self._muta_set_async(obj, value)
+        if self.is_change(obj, value):
             logger.debug("Set remotely to %s", str(value))
             self._muta_fset(obj, value)
+            self.remember_value(obj, value)
+
+    @asyncio.coroutine
+    def _muta_set_async(self, obj, value):
+        if self._change_detection(obj) == ChangeDetection.GETTER:
+            different = (yield from self.muta_get(obj)) != value
+        else:
+            different = self.is_change(obj, value)
+        if different:
+            logger.debug("Set remotely to %s", str(value))
+            result = self._muta_fset(obj, value)
+            if inspect.isawaitable(result):
+                yield from result
+            self.remember_value(obj, value)
+
+    def is_async(self):
+        """ Returns true if the getter or setter is a coroutine function."""
+        return asyncio.iscoroutinefunction(self._muta_fget) or \
+            asyncio.iscoroutinefunction(self._muta_fset)
 
     def is_writeable(self):
         """ Returns true if only getter is defined.
@@ -476,11 +758,13 @@ class MutaSource(MutaProperty):
     MP_CLASS_SCOPE = 'class_scope'
     MP_OWNER_CLASS = 'owner_class'
 
+    __slots__ = ('_muta_class_scope', '_muta_owner_class')
 
     @classmethod
     def _allowed_kwargs(cls):
         return cls.MP_DOC, cls.MP_CLASS_SCOPE, cls.MP_FGET, cls.MP_FSET, \
-               cls.MP_FDEL, cls.MP_CHANGE_CALLBACK, cls.MP_OWNER_CLASS
+               cls.MP_FDEL, cls.MP_CHANGE_CALLBACK, cls.MP_OWNER_CLASS, \
+               cls.MP_BLOCKING, cls.MP_CHANGE_DETECTION, cls.MP_POLL_INTERVAL
 
     @classmethod
     def _exported_params(cls):
@@ -521,6 +805,9 @@ class MutaSource(MutaProperty):
         self._muta_fset = kwargs.get(self.MP_FSET, None)
         self._muta_fdel = kwargs.get(self.MP_FDEL, None)
         self._muta_change_callback = kwargs.get(self.MP_CHANGE_CALLBACK, None)
+        self._muta_change_detection = kwargs.get(self.MP_CHANGE_DETECTION,
+                                                 None)
+        self._muta_poll_interval = kwargs.get(self.MP_POLL_INTERVAL, None)
         self._muta_class_scope = kwargs.get(self.MP_CLASS_SCOPE, False)
         self._muta_owner_class = kwargs.get(self.MP_OWNER_CLASS, None)
 
@@ -548,7 +835,7 @@ class MutaSource(MutaProperty):
     def __str__(self):
         return "MutaSource ID: {pid}, Description: {doc}".format(
             pid=self._muta_id,
-            doc=self.__doc__
+            doc=self._muta_doc
         )
 
     def __call__(self, value):
@@ -573,12 +860,8 @@ class MutaSource(MutaProperty):
         :param func:
         :return: MutaSource object.
         """
-        temp_kwargs = self._get_kwargs()
-
-        logger.debug("{0}: Setter set".format(self._muta_id))
-        temp_kwargs[self.MP_FSET] = func
-        return type(self)(self._muta_id, self._muta_name,
-                          self._muta_value_type, **temp_kwargs)
+        logger.debug("%s: Setter set", self._muta_id)
+        return self._replace(fset=func)
 
     def setter_classproperty(self, func):
 
@@ -600,13 +883,9 @@ class MutaSource(MutaProperty):
 
         return classmethod(class_scoped_setter)
 
-    def to_dict(self, obj=None):
-        temp = MutaProp.to_dict(self)
+    def _build_schema(self):
+        temp = MutaProp._build_schema(self)
         logger.debug("Serializing mutasource: {0}".format(temp))
-
-        if obj:
-            temp[self.MP_VALUE] = self.__get__(obj)
-
         return temp
 
 
@@ -615,6 +894,8 @@ class MutaAction(MutaProp):
     MP_CLASS_TYPE = 'action'
     MP_READ_ONLY = 'read_only'  # GUI Read only setting
 
+    __slots__ = ('_muta_read_only', '_callback')
+
     @classmethod
     def _allowed_kwargs(cls):
         return super()._allowed_kwargs() + (cls.MP_READ_ONLY,)
@@ -637,17 +918,24 @@ class MutaAction(MutaProp):
         self._callback = callback
 
     def muta_call(self, obj):
+        """ Executes the action from the GUI layer. For coroutine callbacks
+        returns the coroutine, which has to be awaited.
+        """
         if not hasattr(obj, '_muta_obj_id'):
             raise MutaPropError("Executing action on uninitialized MutaObject.")
 
         logger.debug("%s: External execution call on %s", self._muta_id,
                      obj._muta_obj_id)
-        self.__call__(obj)
+        return self.__call__(obj)
 
     def __call__(self, obj):
         if self._callback is None:
             raise MutaPropError("No callback is defined.")
-        self._callback(obj)
+        return self._callback(obj)
+
+    def is_async(self):
+        """ Returns true if the callback is a coroutine function."""
+        return asyncio.iscoroutinefunction(self._callback)
 
     # It's necessary to use non-data descriptor to make this callable class
     # capable of binding a method
@@ -658,6 +946,11 @@ class MutaAction(MutaProp):
         return types.MethodType(self, obj)
 
 
+for _cls in (MutaProp, MutaProperty, MutaSource, MutaAction):
+    _cls.__doc__ = _PropDoc(_cls.__dict__.get('__doc__', None))
+del _cls
+
+
 class MutaPropClass(object):
 
     MP_OBJ_ID = 'obj_id'
@@ -668,6 +961,17 @@ class MutaPropClass(object):
     MP_GUI_MAJOR_VERSION = 'gui_major_version'
     MP_GUI_MINOR_VERSION = 'gui_minor_version'
     MP_DOC = 'doc'
+    MP_CLASS_SCHEMA = 'class_schema'
+    MP_CLASS_SCHEMA_JSON = 'class_schema_json'
+    MP_SCHEMA_TAG = 'schema_tag'
+    MP_PROP_TABLE = 'prop_table'
+    MP_NOTIFYING_PROPS = 'notifying_props'
+    MP_CLASS_SCOPED_SOURCES = 'class_scoped_sources'
+    MP_BLOCKING = 'blocking'
+    MP_CHANGE_DETECTION = 'change_detection'
+    MP_LAST_VALUES = 'last_values'  # Last notified values, per object
+
+    HIERARCHY_SEPARATOR = '/'  # Separates sub-sections of hierarchy paths
 
     @classmethod
     def _exported_params(cls):
@@ -675,27 +979,118 @@ class MutaPropClass(object):
                 cls.MP_GUI_MAJOR_VERSION, cls.MP_GUI_MINOR_VERSION,
                 cls.MP_DOC, cls.MP_CLASS_ID)
 
+    @classmethod
+    def class_schema(cls):
+        """ Returns the serialized parameters shared by all instances of
+        the class (everything except object ID and the props). Built once per
+        class and stored in the class itself.
+
+        The returned dict is shared, don't modify it.
+        """
+        # Looking directly to the __dict__, subclasses must have their own
+        schema = cls.__dict__.get(cls.muta_attr(cls.MP_CLASS_SCHEMA))
+        if schema is None:
+            schema = {}
+            for attr in cls._exported_params():
+                if attr == cls.MP_DOC:
+                    schema[cls.MP_DOC] = rest_to_html(cls.__doc__)
+                elif attr == cls.MP_CLASS_ID:
+                    schema[cls.MP_CLASS_ID] = cls._orig_cls.__name__
+                elif attr not in (cls.MP_OBJ_ID, cls.MP_PROPS):
+                    schema[attr] = getattr(cls, cls.muta_attr(attr))
+            setattr(cls, cls.muta_attr(cls.MP_CLASS_SCHEMA), schema)
+            setattr(cls, cls.muta_attr(cls.MP_CLASS_SCHEMA_JSON),
+                    json.dumps(schema))
+        return schema
+
+    @classmethod
+    def class_schema_json(cls):
+        """ Returns :meth:`class_schema` pre-encoded as JSON string."""
+        cls.class_schema()
+        return cls.__dict__[cls.muta_attr(cls.MP_CLASS_SCHEMA_JSON)]
+
+    @classmethod
+    def schema_tag(cls):
+        """ Returns validator (hash) of the class schema including the schemas
+        of all its props. Values of the props don't affect it.
+        """
+        tag = cls.__dict__.get(cls.muta_attr(cls.MP_SCHEMA_TAG))
+        if tag is None:
+            tag = content_tag(' '.join(
+                [cls.class_schema_json()] +
+                [prop.schema_tag() for prop in cls.muta_prop_table().values()]))
+            setattr(cls, cls.muta_attr(cls.MP_SCHEMA_TAG), tag)
+        return tag
+
+    @staticmethod
+    def values_tag(values):
+        """ Returns validator (hash) of the values returned by
+        :meth:`prop_values`.
+        """
+        return content_tag(json.dumps(list(values.items())))
+
+    @classmethod
+    def muta_prop_table(cls):
+        """ Returns ordered dict {prop_id: prop} of all MutaProps of the class
+        (including the inherited ones), sorted by definition order.
+
+        Because this is potentially heavy operation and property definitions
+        are not likely to be changed during class lifetime, it's done only
+        once per class and the result is shared by all its instances.
+        Use :meth:`muta_invalidate_props` when the class definition changes.
+
+        The returned dict is shared, don't modify it.
+        """
+        # Looking directly to the __dict__, subclasses must have their own
+        table = cls.__dict__.get(cls.muta_attr(cls.MP_PROP_TABLE))
+        if table is None:
+            temp = []
+            for basecls in cls.mro():
+                for value in basecls.__dict__.values():
+                    if isinstance(value, MutaProp):
+                        logger.debug("Adding mutaprop: {0}".format(
+                            value.prop_id))
+                        temp.append(value)
+
+            temp.sort(key=lambda x: x.definition_order)
+            table = OrderedDict([(prop.prop_id, prop) for prop in temp])
+            setattr(cls, cls.muta_attr(cls.MP_PROP_TABLE), table)
+            setattr(cls, cls.muta_attr(cls.MP_NOTIFYING_PROPS),
+                    tuple(prop for prop in temp
+                          if isinstance(prop, MutaProperty)))
+            setattr(cls, cls.muta_attr(cls.MP_CLASS_SCOPED_SOURCES),
+                    tuple(prop for prop in temp
+                          if isinstance(prop, MutaSource) and
+                          prop.class_scoped))
+        return table
+
+    @classmethod
+    def muta_invalidate_props(cls):
+        """ Drops the cached prop table and schema of the class and all its
+        subclasses. Needed only if MutaProps are added to or removed from
+        the class after its definition.
+        """
+        for attr in (cls.MP_PROP_TABLE, cls.MP_NOTIFYING_PROPS,
+                     cls.MP_CLASS_SCOPED_SOURCES, cls.MP_CLASS_SCHEMA,
+                     cls.MP_CLASS_SCHEMA_JSON, cls.MP_SCHEMA_TAG):
+            if cls.muta_attr(attr) in cls.__dict__:
+                delattr(cls, cls.muta_attr(attr))
+        for subcls in cls.__subclasses__():
+            subcls.muta_invalidate_props()
+
     def update_props(self, change_callback=None):
-        """Because this is potentially heavy operation and property definitions
-        are not likely to be changed during objects lifetime, it's easier to
-        cache it.
+        """ Assigns the class prop table to the object and registers the
+        change callback.
         """
-        temp = []
+        cls = type(self)
+        table = cls.muta_prop_table()
+
+        for prop in cls.__dict__[cls.muta_attr(cls.MP_NOTIFYING_PROPS)]:
+            prop.register_change_callback(change_callback)
+        for prop in cls.__dict__[cls.muta_attr(cls.MP_CLASS_SCOPED_SOURCES)]:
+            prop.set_owner_class(cls)
 
-        for basecls in type(self).mro():
-            for prop, value in basecls.__dict__.items():
-                if isinstance(value, MutaProp):
-                    logger.debug("Adding mutaprop: {0}".format(value.prop_id))
-                    temp.append(value)
-                if isinstance(value, MutaProperty):
-                    value.register_change_callback(change_callback)
-                if isinstance(value, MutaSource):
-                    if value.class_scoped:
-                        value.set_owner_class(self.__class__)
-
-        temp.sort(key=lambda x: x.definition_order)
-        setattr(self, self.muta_attr(self.MP_PROPS),
-                OrderedDict([(prop.prop_id, prop) for prop in temp]))
+        setattr(self, self.muta_attr(self.MP_PROPS), table)
 
     @property
     def props(self):
@@ -723,6 +1118,15 @@ class MutaPropClass(object):
     def muta_attr(cls, attr):
         return '_muta_{0}'.format(attr)
 
+    @classmethod
+    def muta_prerender_docs(cls):
+        """ Renders docstrings of the class and all its MutaProps into the
+        reST rendering cache, so the first serialization doesn't have to.
+        """
+        rest_to_html(cls.__doc__)
+        for prop in cls.muta_prop_table().values():
+            rest_to_html(prop._muta_doc)
+
     def muta_init(self, object_id, change_callback=None):
         self.update_props(change_callback)
         setattr(self, self.muta_attr(self.MP_OBJ_ID), object_id)
@@ -737,20 +1141,147 @@ class MutaPropClass(object):
         else:
             return False
 
-    def to_dict(self):
-        temp = {}
-        for attr in self._exported_params():
-            if attr == self.MP_DOC:
-                temp[self.MP_DOC] = rest_to_html(self.__doc__)
-            elif attr == self.MP_CLASS_ID:
-                temp[self.MP_CLASS_ID] = self._orig_cls.__name__
-            else:
-                attr_value = getattr(self, self.muta_attr(attr))
-                if attr == self.MP_PROPS:
-                    attr_value = [prop.to_dict(obj=self) for prop in
-                                  attr_value.values()]
+    def _prop_overlay(self, prop, values):
+        if values is not None and prop.prop_id in values:
+            return {MutaProperty.MP_VALUE: values[prop.prop_id]}
+        return prop.value_overlay(self)
+
+    def select_props(self, hierarchy=None, prop_types=None, prop_ids=None):
+        """ Returns list of the props matching all the given filters, in the
+        order of :attr:`props`. No getter is called.
+
+        :param hierarchy:  Hierarchy path, matches the props in it and in its
+                           sub-sections (e.g. ``"Bank 1"`` matches
+                           ``"Bank 1/Status"``, but not ``"Bank 10"``).
+        :param prop_types:  Iterable of the prop types (``'property'``,
+                            ``'action'``, ``'source'``).
+        :param prop_ids:  Iterable of prop IDs.
+        """
+        if prop_types is not None:
+            prop_types = set(prop_types)
+        if prop_ids is not None:
+            prop_ids = set(prop_ids)
+        if hierarchy is not None:
+            hierarchy = hierarchy.rstrip(self.HIERARCHY_SEPARATOR)
+            sub_prefix = hierarchy + self.HIERARCHY_SEPARATOR
+
+        temp = []
+        for prop_id, prop in self.props.items():
+            if prop_ids is not None and prop_id not in prop_ids:
+                continue
+            if prop_types is not None and \
+                    prop.MP_CLASS_TYPE not in prop_types:
+                continue
+            if hierarchy is not None and prop.hierarchy != hierarchy and \
+                    not (prop.hierarchy or '').startswith(sub_prefix):
+                continue
+            temp.append(prop)
+        return temp
 
-                temp[attr] = attr_value
+    def props_to_dict(self, values=None, props=None):
+        """ Returns list of serialized props.
 
+        :param values:  Already read :meth:`prop_values`, if available.
+        :param props:  Props to be serialized (e.g. from
+                       :meth:`select_props`), all if None.
+        """
+        temp = []
+        for prop in self.props.values() if props is None else props:
+            prop_dict = dict(prop.schema())
+            prop_dict.update(self._prop_overlay(prop, values))
+            temp.append(prop_dict)
+        return temp
+
+    def props_to_json(self, values=None, props=None):
+        """ Same as :meth:`props_to_dict`, but returns JSON string."""
+        return '[{0}]'.format(', '.join(
+            prop.to_json(obj=self, overlay=self._prop_overlay(prop, values))
+            for prop in (self.props.values() if props is None else props)))
+
+    def schema_to_dict(self):
+        """ Returns the serialized object without the object ID and values,
+        i.e. the part identified by :meth:`schema_tag`.
+        """
+        temp = dict(self.class_schema())
+        temp[self.MP_PROPS] = [prop.schema() for prop in self.props.values()]
         return temp
 
+    def to_dict(self, values=None):
+        """
+        :param values:  Already read :meth:`prop_values`, if available.
+        """
+        temp = dict(self.class_schema())
+        temp[self.MP_OBJ_ID] = self.muta_id
+        temp[self.MP_PROPS] = self.props_to_dict(values)
+        return temp
+
+    def prop_values(self, prop_ids=None):
+        """ Returns current values of the object's MutaProperties and
+        MutaSources (actions have no value) as {prop_id: value}. Only the
+        getters are called, no schema is serialized.
+
+        :param prop_ids:  Iterable of prop IDs to be read, all props are read
+                          if not specified. Unknown IDs and actions are
+                          ignored.
+        """
+        if prop_ids is None:
+            props = self.props.values()
+        else:
+            props = (self.props[prop_id] for prop_id in prop_ids
+                     if prop_id in self.props)
+
+        return OrderedDict((prop.prop_id, prop.__get__(self))
+                           for prop in props
+                           if isinstance(prop, MutaProperty))
+
+    @classmethod
+    def is_blocking(cls, prop):
+        """ Returns True if the prop's functions shall be run in executor,
+        according to the prop's or class' ``blocking`` setting. Coroutine
+        functions are never blocking.
+        """
+        if prop.is_async():
+            return False
+        if prop.blocking is not None:
+            return bool(prop.blocking)
+        return bool(getattr(cls, cls.muta_attr(cls.MP_BLOCKING), False))
+
+    @asyncio.coroutine
+    def gather_prop_values(self, prop_ids=None, offload=None):
+        """ Coroutine version of :meth:`prop_values`, which awaits values of
+        the props with coroutine getters. These are awaited concurrently.
+
+        :param offload:  Function called as ``offload(obj, func, *args)`` for
+                         getters of the blocking props (see
+                         :meth:`is_blocking`), returning awaitable. If None,
+                         the blocking getters are called directly.
+        """
+        if offload is None:
+            values = self.prop_values(prop_ids)
+        else:
+            if prop_ids is None:
+                props = self.props.values()
+            else:
+                props = (self.props[prop_id] for prop_id in prop_ids
+                         if prop_id in self.props)
+            values = OrderedDict(
+                (prop.prop_id, offload(self, prop.__get__, self)
+                 if self.is_blocking(prop) else prop.__get__(self))
+                for prop in props if isinstance(prop, MutaProperty))
+        pending = [prop_id for prop_id, value in values.items()
+                   if inspect.isawaitable(value)]
+        if pending:
+            results = yield from asyncio.gather(*(values[prop_id]
+                                                  for prop_id in pending))
+            values.update(zip(pending, results))
+        return values
+
+    def to_json(self, values=None):
+        """ Same as :meth:`to_dict`, but returns JSON string built from
+        the pre-encoded class and prop schemas.
+        """
+        return '{0}, {1}: {2}, {3}: {4}}}'.format(
+            self.class_schema_json()[:-1],
+            json.dumps(self.MP_OBJ_ID), json.dumps(self.muta_id),
+            json.dumps(self.MP_PROPS), self.props_to_json(values))
+
@@ -0,0 +1,493 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict, deque
+import asyncio
+import logging
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeCoalescer(object):
+    """
+    Buffer between property change callbacks and the notification channel.
+
+    Only the latest value for each (obj_id, prop_id) pair is kept. Pending
+    changes are flushed as one batch after `interval`, and no single prop is
+    flushed more often than `max_rate` times per second. Values changed faster
+    than that are simply overwritten in the buffer.
+    """
+
+    def __init__(self, loop, flush_callback, interval=None, max_rate=None):
+        """
+        :param loop:  Asyncio loop used for scheduling of the flushes.
+        :param flush_callback:  Called with list of change dicts
+                                (``objId``, ``propId``, ``value``,
+                                ``eventSource``) for each flushed batch.
+        :param interval:  [seconds] Time for which the changes are collected
+                          before flushing. Zero or None flushes on the next
+                          loop iteration.
+        :param max_rate:  [Hz] Maximum rate of notifications per single prop.
+                          None for no limit.
+        """
+        self._loop = loop
+        self._flush_callback = flush_callback
+        self._interval = interval or 0
+        self._min_period = (1.0 / max_rate) if max_rate else 0
+        self._pending = OrderedDict()
+        self._last_sent = {}
+        self._handle = None
+        self._handle_time = None
+
+    @property
+    def pending_count(self):
+        return len(self._pending)
+
+    def _ready_time(self, key, now):
+        last = self._last_sent.get(key, None)
+        if last is None or not self._min_period:
+            return now
+        return max(now, last + self._min_period)
+
+    def _schedule(self, when):
+        if self._handle is not None:
+            if self._handle_time <= when:
+                return
+            self._handle.cancel()
+        self._handle_time = when
+        self._handle = self._loop.call_at(when, self.flush)
+
+    def push(self, obj_id, prop_id, value, event_source):
+        """ Adds change to the buffer, replacing older change of the same prop.
+        """
+        key = (obj_id, prop_id)
+        self._pending[key] = (value, event_source)
+        now = self._loop.time()
+        self._schedule(max(now + self._interval, self._ready_time(key, now)))
+
+    def flush(self, force=False):
+        """ Sends all pending changes which are allowed by the rate limit.
+
+        :param force:  Send all pending changes regardless of the rate limit.
+        """
+        self._handle = None
+        self._handle_time = None
+        now = self._loop.time()
+        batch = []
+        next_time = None
+
+        for key, (value, event_source) in list(self._pending.items()):
+            ready_time = self._ready_time(key, now)
+            if force or ready_time <= now:
+                del self._pending[key]
+                self._last_sent[key] = now
+                batch.append({'objId': key[0], 'propId': key[1],
+                              'value': value, 'eventSource': event_source})
+            elif next_time is None or ready_time < next_time:
+                next_time = ready_time
+
+        if next_time is not None:
+            self._schedule(next_time)
+
+        if batch:
+            self._flush_callback(batch)
+
+    def forget(self, obj_id):
+        """ Drops pending changes and rate-limit history of an object."""
+        for key in [key for key in self._pending if key[0] == obj_id]:
+            del self._pending[key]
+        for key in [key for key in self._last_sent if key[0] == obj_id]:
+            del self._last_sent[key]
+
+    def close(self):
+        """ Cancels the scheduled flush and sends everything pending."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self.flush(force=True)
+
+
+def running_loop():
+    """ Returns the event loop running in the current thread, or None."""
+    try:
+        return asyncio.get_running_loop()
+    except AttributeError:  # Python < 3.7
+        return asyncio._get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class ChangeBridge(object):
+    """
+    Thread-safe entry point for property changes made outside of the loop
+    thread (e.g. when the manager is run by ``run_in_thread``).
+
+    Producers only append to a deque, they never block on the loop or touch
+    any asyncio object except scheduling one drain per batch by
+    ``call_soon_threadsafe``. The drain runs in the loop thread and passes
+    the collected changes on, repeated changes of the same prop reduced to
+    the latest one.
+    """
+
+    def __init__(self, loop, drain_callback):
+        """
+        :param loop:  Loop whose thread processes the changes.
+        :param drain_callback:  Called in the loop thread with list of
+                                (obj_id, prop_id, value) tuples.
+        """
+        self._loop = loop
+        self._drain_callback = drain_callback
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._scheduled = False
+
+    @property
+    def pending_count(self):
+        return len(self._queue)
+
+    def push(self, obj_id, prop_id, value):
+        """ Adds change to the queue. Can be called from any thread."""
+        self._queue.append((obj_id, prop_id, value))
+        if self._scheduled:
+            return
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self._loop.call_soon_threadsafe(self.drain)
+        except RuntimeError:
+            # Loop is closed, nobody to notify anymore
+            self._queue.clear()
+
+    def drain(self):
+        """ Processes all queued changes. Must be called in the loop thread."""
+        with self._lock:
+            # Changes pushed from now on schedule another drain
+            self._scheduled = False
+
+        changes = OrderedDict()
+        while True:
+            try:
+                obj_id, prop_id, value = self._queue.popleft()
+            except IndexError:
+                break
+            # Latest value wins, ordered by the latest change
+            changes.pop((obj_id, prop_id), None)
+            changes[(obj_id, prop_id)] = value
+
+        if changes:
+            self._drain_callback([(obj_id, prop_id, value) for
+                                  (obj_id, prop_id), value in changes.items()])
+
+
+class _PollGroup(object):
+    """ Props polled with the same interval, with the timing statistics."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.props = OrderedDict()  # {obj_id: [prop_id, ...]}
+        self.task = None
+        self.ticks = 0
+        self.overruns = 0
+        self.total_jitter = 0.0
+        self.max_jitter = 0.0
+        self.busy = 0.0
+        self.started = None
+
+    def to_dict(self, now):
+        elapsed = (now - self.started) if self.started is not None else 0
+        return {'interval': self.interval,
+                'props': sum(len(prop_ids)
+                             for prop_ids in self.props.values()),
+                'ticks': self.ticks, 'overruns': self.overruns,
+                'meanJitter': (self.total_jitter / self.ticks
+                               if self.ticks else None),
+                'maxJitter': self.max_jitter,
+                'meanDuration': (self.busy / self.ticks
+                                 if self.ticks else None),
+                'load': (self.busy / elapsed) if elapsed > 0 else 0}
+
+
+class PollScheduler(object):
+    """
+    Periodically reads props whose values change without their setters
+    being called (e.g. registers of a device), and notifies the changed
+    values.
+
+    Props with the same interval share one timer. On each tick, the props
+    of one object are read by one batch call, objects are read
+    concurrently. Only values which differ from the last seen value of
+    the prop (polled, or notified otherwise and passed to :meth:`observe`)
+    are passed on; the first poll of a prop is not notified.
+    """
+
+    def __init__(self, loop, read_callback, change_callback):
+        """
+        :param loop:  Asyncio loop running the timers.
+        :param read_callback:  Coroutine function ``read(obj, prop_ids)``
+                               returning {prop_id: value}.
+        :param change_callback:  Called with list of (obj_id, prop_id, value)
+                                 tuples of the changed values.
+        """
+        self._loop = loop
+        self._read_callback = read_callback
+        self._change_callback = change_callback
+        self._groups = {}
+        self._objects = {}
+        self._last = {}
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def add(self, obj, prop_id, interval):
+        """ Starts polling of the prop of `obj` every `interval` seconds."""
+        group = self._groups.get(interval, None)
+        if group is None:
+            group = self._groups[interval] = _PollGroup(interval)
+            group.task = self._loop.create_task(self._run(group))
+        self._objects[obj.muta_id] = obj
+        prop_ids = group.props.setdefault(obj.muta_id, [])
+        if prop_id not in prop_ids:
+            prop_ids.append(prop_id)
+
+    def remove(self, obj_id):
+        """ Stops polling of all props of the object."""
+        self._objects.pop(obj_id, None)
+        for key in [key for key in self._last if key[0] == obj_id]:
+            del self._last[key]
+        for interval, group in list(self._groups.items()):
+            group.props.pop(obj_id, None)
+            if not group.props:
+                group.task.cancel()
+                del self._groups[interval]
+
+    def observe(self, obj_id, prop_id, value):
+        """ Updates the last seen value of a polled prop, so the same value
+        isn't notified again by the next poll.
+        """
+        if (obj_id, prop_id) in self._last:
+            self._last[(obj_id, prop_id)] = value
+
+    @asyncio.coroutine
+    def _run(self, group):
+        group.started = self._loop.time()
+        next_time = group.started + group.interval
+        while True:
+            yield from asyncio.sleep(max(next_time - self._loop.time(), 0))
+            start = self._loop.time()
+            jitter = start - next_time
+            group.ticks += 1
+            group.total_jitter += jitter
+            group.max_jitter = max(group.max_jitter, jitter)
+
+            yield from self.poll(group)
+
+            end = self._loop.time()
+            group.busy += end - start
+            next_time += group.interval
+            if next_time < end:
+                # Poll took longer than the interval, skip the missed ticks
+                missed = int((end - next_time) // group.interval) + 1
+                group.overruns += missed
+                next_time += missed * group.interval
+
+    @asyncio.coroutine
+    def poll(self, group):
+        """ Reads all props of the group and notifies the changed ones."""
+        obj_ids = [obj_id for obj_id in group.props
+                   if obj_id in self._objects]
+        results = yield from asyncio.gather(
+            *(self._read_callback(self._objects[obj_id],
+                                  list(group.props[obj_id]))
+              for obj_id in obj_ids), return_exceptions=True)
+
+        changes = []
+        for obj_id, values in zip(obj_ids, results):
+            if isinstance(values, Exception):
+                self._logger.warning("Polling of %s failed: %s" %
+                                     (obj_id, values))
+                continue
+            obj = self._objects.get(obj_id, None)
+            for prop_id, value in values.items():
+                key = (obj_id, prop_id)
+                if key in self._last and self._last[key] == value:
+                    continue
+                # The first sample only seeds the last value, the clients
+                # read the current values when they load the object
+                if key in self._last:
+                    changes.append((obj_id, prop_id, value))
+                self._last[key] = value
+                if obj is not None:
+                    obj.props[prop_id].remember_value(obj, value)
+        if changes:
+            self._change_callback(changes)
+
+    def stats(self):
+        """ Returns timing statistics of the polling, overall and per
+        interval.
+        """
+        now = self._loop.time()
+        groups = [group.to_dict(now) for interval, group in
+                  sorted(self._groups.items())]
+        return {'load': sum(group['load'] for group in groups),
+                'groups': groups}
+
+    def close(self):
+        """ Stops all the timers."""
+        for group in self._groups.values():
+            group.task.cancel()
+        self._groups.clear()
+        self._objects.clear()
+        self._last.clear()
+
+
+def _common_prefix_length(first, second):
+    """ Length of the common prefix of two strings. Uses bisection over slice
+    comparisons, so the character comparing runs in C.
+    """
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if first[low:mid] == second[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix_length(first, second, limit):
+    """ Length of the common suffix of two strings, at most `limit`."""
+    low, high = 0, min(len(first), len(second), limit)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if first[len(first) - mid:len(first) - low] == \
+                second[len(second) - mid:len(second) - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class DeltaEncoder(object):
+    """
+    Replaces values of large string changes by patches against the last
+    broadcast value of the same prop.
+
+    A patch is a single splice ``[start, delete_count, text]``: the client
+    replaces ``delete_count`` characters at ``start`` of its current value
+    with ``text``. Each broadcast value gets a version number; a patch carries
+    the ``base`` version it applies to, so the client can detect a missed
+    message and fetch the full value instead. Every `resync`-th message
+    carries the full value anyway.
+    """
+
+    # Characters outside of BMP are indexed differently in JavaScript,
+    # such strings are always sent whole
+    _NON_BMP = re.compile('[\U00010000-\U0010FFFF]')
+
+    def __init__(self, threshold, resync=20):
+        """
+        :param threshold:  Minimal length of a string value to be patched.
+        :param resync:  Number of messages after which full value is sent.
+        """
+        self._threshold = threshold
+        self._resync = resync
+        self._last = {}
+
+    def version(self, obj_id, prop_id, value):
+        """ Returns version number of the `value` if it's the last broadcast
+        value of the prop, None otherwise.
+        """
+        last = self._last.get((obj_id, prop_id), None)
+        if last is not None and last[1] is not None and last[1] == value:
+            return last[0]
+        return None
+
+    def encode(self, change):
+        """ Returns the change dict, either with full value and version, or
+        with patch instead of the value.
+        """
+        key = (change['objId'], change['propId'])
+        value = change['value']
+        if not isinstance(value, str) or len(value) < self._threshold or \
+                self._NON_BMP.search(value):
+            # Keeps the version counting, a patch must never refer to
+            # a version number the client might know from an older value
+            last = self._last.get(key, None)
+            if last is not None:
+                self._last[key] = (last[0] + 1, None, 0)
+            return change
+
+        last = self._last.get(key, None)
+        if last is None or last[1] is None or last[2] + 1 >= self._resync:
+            version = (last[0] + 1) if last else 1
+            self._last[key] = (version, value, 0)
+            return dict(change, version=version)
+
+        base_version, base, count = last
+        start = _common_prefix_length(base, value)
+        end = _common_suffix_length(base, value,
+                                    min(len(base), len(value)) - start)
+        text = value[start:len(value) - end]
+
+        version = base_version + 1
+        if len(text) >= len(value) // 2:
+            # Patch wouldn't save much, send the full value
+            self._last[key] = (version, value, 0)
+            return dict(change, version=version)
+
+        self._last[key] = (version, value, count + 1)
+        temp = {k: v for k, v in change.items() if k != 'value'}
+        temp.update(patch=[start, len(base) - start - end, text],
+                    base=base_version, version=version)
+        return temp
+
+    def forget(self, obj_id):
+        """ Drops the stored values of an object."""
+        for key in [key for key in self._last if key[0] == obj_id]:
+            del self._last[key]
+
+
+class Subscription(object):
+    """
+    Set of objects and props a notification client is interested in.
+    A fresh subscription matches everything, until the client subscribes
+    to something specific. Also holds the minimal level of log records
+    the client wants to receive.
+    """
+
+    def __init__(self):
+        self._everything = True
+        self._objects = set()
+        self._props = set()
+        self.log_level = logging.NOTSET
+
+    @property
+    def everything(self):
+        return self._everything
+
+    def subscribe(self, objects=(), props=(), replace=False):
+        """
+        :param objects:  Object IDs whose all props are subscribed.
+        :param props:  (obj_id, prop_id) pairs of subscribed props.
+        :param replace:  Drop the previous subscriptions.
+        """
+        if self._everything or replace:
+            self._everything = False
+            self._objects.clear()
+            self._props.clear()
+        self._objects.update(objects)
+        self._props.update(tuple(prop) for prop in props)
+
+    def unsubscribe(self, objects=(), props=()):
+        self._objects.difference_update(objects)
+        self._props.difference_update(tuple(prop) for prop in props)
+
+    def subscribe_all(self):
+        self._everything = True
+        self._objects.clear()
+        self._props.clear()
+
+    def matches(self, obj_id, prop_id):
+        return self._everything or (obj_id in self._objects) or \
+            ((obj_id, prop_id) in self._props)
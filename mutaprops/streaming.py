@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from array import array
+from collections import deque
+import struct
+import sys
+import time
+from .notifications import Subscription, running_loop
+
+STREAM_VERSION = 1
+
+# Frame header: version, reserved, number of blocks
+_FRAME_HEADER = struct.Struct('<BBH')
+# Block header: channel, value typecode, number of samples. The block
+# continues with the float64 timestamps and then the values.
+_BLOCK_HEADER = struct.Struct('<HcI')
+
+_SWAP = sys.byteorder != 'little'
+
+
+def _little_endian_bytes(values):
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def encode_frame(blocks):
+    """ Packs samples into one binary stream frame.
+
+    :param blocks:  List of (channel, timestamps, values) with timestamps
+                    as ``array('d')`` and values as ``array('d')`` (REAL) or
+                    ``array('q')`` (INT).
+    :return:  bytes, all numbers little-endian.
+    """
+    parts = [_FRAME_HEADER.pack(STREAM_VERSION, 0, len(blocks))]
+    for channel, timestamps, values in blocks:
+        parts.append(_BLOCK_HEADER.pack(channel,
+                                        values.typecode.encode('ascii'),
+                                        len(values)))
+        parts.append(_little_endian_bytes(timestamps))
+        parts.append(_little_endian_bytes(values))
+    return b''.join(parts)
+
+
+def decode_frame(frame):
+    """ Unpacks a frame made by :func:`encode_frame`.
+
+    :return:  List of (channel, timestamps, values) with the arrays.
+    :raises ValueError:  If the frame is malformed or of unknown version.
+    """
+    try:
+        version, _, block_count = _FRAME_HEADER.unpack_from(frame, 0)
+        if version != STREAM_VERSION:
+            raise ValueError("Unknown stream version %s." % version)
+        offset = _FRAME_HEADER.size
+        blocks = []
+        for _ in range(block_count):
+            channel, typecode, count = _BLOCK_HEADER.unpack_from(frame, offset)
+            offset += _BLOCK_HEADER.size
+            arrays = []
+            for code in ('d', typecode.decode('ascii')):
+                temp = array(code)
+                length = count * temp.itemsize
+                if offset + length > len(frame):
+                    raise ValueError("Truncated stream frame.")
+                temp.frombytes(frame[offset:offset + length])
+                if _SWAP:
+                    temp.byteswap()
+                offset += length
+                arrays.append(temp)
+            blocks.append((channel, arrays[0], arrays[1]))
+        return blocks
+    except struct.error as e:
+        raise ValueError(str(e))
+
+
+class _StreamClient(object):
+
+    def __init__(self, decimation):
+        self.subscription = Subscription()
+        self.decimation = decimation
+
+
+class SampleStreamer(object):
+    """
+    Collects samples of the streamed props and sends them to the stream
+    clients as binary frames (see :func:`encode_frame`).
+
+    Each streamed prop gets a numeric channel. Samples are pushed with their
+    timestamps (from any thread) and sent in one frame per client every
+    `interval`. Every client receives only its subscribed channels and only
+    every n-th sample of each, by its decimation. Clients with the same
+    selection share one encoded frame.
+    """
+
+    def __init__(self, loop, send_callback, interval=0.05,
+                 samples_callback=None):
+        """
+        :param loop:  Asyncio loop used for scheduling of the flushes.
+        :param send_callback:  Called with (client, frame bytes).
+        :param interval:  [seconds] Time for which the samples are collected
+                          before sending.
+        :param samples_callback:  Called in the loop thread on each flush
+                          with list of (obj_id, prop_id, timestamps, values)
+                          of all the collected samples, regardless of
+                          the clients.
+        """
+        self._loop = loop
+        self._send_callback = send_callback
+        self._samples_callback = samples_callback
+        self._interval = interval
+        self._channels = {}  # {(obj_id, prop_id): (channel, typecode)}
+        self._next_channel = 0
+        self._sequence = {}  # {channel: number of samples so far}
+        self._clients = {}
+        self._samples = deque()
+        self._scheduled = False
+
+    def add_channel(self, obj_id, prop_id, typecode):
+        """ Starts streaming of the prop.
+
+        :param typecode:  ``'d'`` for REAL or ``'q'`` for INT values.
+        :return:  Channel number.
+        """
+        key = (obj_id, prop_id)
+        if key not in self._channels:
+            self._channels[key] = (self._next_channel, typecode)
+            self._sequence[self._next_channel] = 0
+            self._next_channel += 1
+        return self._channels[key][0]
+
+    def remove_object(self, obj_id):
+        """ Stops streaming of all props of the object.
+
+        :return:  True if any channel was removed.
+        """
+        keys = [key for key in self._channels if key[0] == obj_id]
+        for key in keys:
+            channel, typecode = self._channels.pop(key)
+            self._sequence.pop(channel, None)
+        return bool(keys)
+
+    @property
+    def has_channels(self):
+        return bool(self._channels)
+
+    def channels(self):
+        """ Returns the channel table as list of dicts (``channel``,
+        ``objId``, ``propId``, ``typecode``).
+        """
+        return [{'channel': channel, 'objId': obj_id, 'propId': prop_id,
+                 'typecode': typecode}
+                for (obj_id, prop_id), (channel, typecode)
+                in sorted(self._channels.items(), key=lambda item: item[1])]
+
+    def is_streamed(self, obj_id, prop_id):
+        return (obj_id, prop_id) in self._channels
+
+    def add_client(self, client, decimation=1):
+        self._clients[client] = _StreamClient(max(int(decimation), 1))
+
+    def remove_client(self, client):
+        self._clients.pop(client, None)
+
+    def clients(self):
+        return list(self._clients)
+
+    def subscription(self, client):
+        return self._clients[client].subscription
+
+    def set_decimation(self, client, decimation):
+        """ Client will receive only every `decimation`-th sample."""
+        decimation = int(decimation)
+        if decimation < 1:
+            raise ValueError("Decimation must be positive.")
+        self._clients[client].decimation = decimation
+
+    def push(self, obj_id, prop_id, value, timestamp=None):
+        """ Adds a sample of a streamed prop. Can be called from any thread.
+
+        :return:  False if the prop is not streamed (and nothing was done).
+        """
+        entry = self._channels.get((obj_id, prop_id), None)
+        if entry is None:
+            return False
+        channel, typecode = entry
+        try:
+            value = float(value) if typecode == 'd' else int(value)
+        except (TypeError, ValueError):
+            return True
+        self._samples.append((channel, time.time() if timestamp is None
+                              else timestamp, value))
+        if not self._scheduled:
+            self._scheduled = True
+            if running_loop() is self._loop:
+                self._loop.call_later(self._interval, self.flush)
+            else:
+                try:
+                    self._loop.call_soon_threadsafe(
+                        self._loop.call_later, self._interval, self.flush)
+                except RuntimeError:
+                    # Loop is closed, nobody to send the samples to anymore
+                    self._samples.clear()
+        return True
+
+    def _drain(self):
+        """ Returns the collected samples as {channel: (first sequence
+        number, timestamps, values)}.
+        """
+        typecodes = {channel: typecode
+                     for channel, typecode in self._channels.values()}
+        collected = {}
+        while self._samples:
+            channel, timestamp, value = self._samples.popleft()
+            if channel not in typecodes:
+                continue  # Removed meanwhile
+            arrays = collected.get(channel, None)
+            if arrays is None:
+                arrays = collected[channel] = (array('d'),
+                                               array(typecodes[channel]))
+            arrays[0].append(timestamp)
+            arrays[1].append(value)
+
+        temp = {}
+        for channel, (timestamps, values) in collected.items():
+            temp[channel] = (self._sequence[channel], timestamps, values)
+            self._sequence[channel] += len(values)
+        return temp
+
+    def flush(self):
+        """ Sends the collected samples to the clients."""
+        self._scheduled = False
+        collected = self._drain()
+        if not collected:
+            return
+
+        channel_keys = {channel: key
+                        for key, (channel, typecode) in self._channels.items()}
+        if self._samples_callback is not None:
+            self._samples_callback(
+                [channel_keys[channel] + (timestamps, values)
+                 for channel, (sequence, timestamps, values)
+                 in collected.items()])
+        if not self._clients:
+            return
+
+        frames = {}
+        for client, state in list(self._clients.items()):
+            selected = tuple(channel for channel in sorted(collected)
+                             if state.subscription.matches(
+                                 *channel_keys[channel]))
+            if not selected:
+                continue
+            frame_key = (state.decimation, selected)
+            if frame_key not in frames:
+                blocks = self._decimated(collected, selected,
+                                         state.decimation)
+                frames[frame_key] = encode_frame(blocks) if blocks else None
+            if frames[frame_key] is not None:
+                self._send_callback(client, frames[frame_key])
+
+    @staticmethod
+    def _decimated(collected, channels, decimation):
+        blocks = []
+        for channel in channels:
+            sequence, timestamps, values = collected[channel]
+            if decimation > 1:
+                # Keeps the samples whose overall sequence number is divisible
+                # by the decimation, so the kept ones don't depend on batching
+                first = -sequence % decimation
+                timestamps = timestamps[first::decimation]
+                values = values[first::decimation]
+            if len(values):
+                blocks.append((channel, timestamps, values))
+        return blocks
+
+    def close(self):
+        """ Sends the collected samples and drops the clients."""
+        self.flush()
+        self._clients.clear()
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from collections import OrderedDict
+import hashlib
 import logging
 import inspect
 from docutils.core import publish_parts
@@ -13,6 +14,15 @@ class MutaPropError(Exception):
     pass
 
 
+def content_tag(data):
+    """ Returns short hex digest of the given string (or bytes), used as
+    entity tag.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha1(data).hexdigest()[:16]
+
+
 class BiDict(OrderedDict):
     """
     Bidirectional dictionary for handling both getters and setters of
@@ -39,15 +49,105 @@ class BiDict(OrderedDict):
         return [(select, value) for select, value in self.items()]
 
 
+class LruCache(OrderedDict):
+    """
+    Size-bounded dictionary discarding the least recently used items.
+    Keeps hit/miss counters so the cache efficiency can be checked at runtime.
+    """
+    def __init__(self, maxsize=128):
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        super().__init__()
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        self._maxsize = value
+        self._evict()
+
+    def _evict(self):
+        while self._maxsize is not None and len(self) > self._maxsize:
+            self.popitem(last=False)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self._evict()
+
+    def lookup(self, key, default=None):
+        """ Returns cached value for `key` (marking it as recently used), or
+        `default` on a miss.
+        """
+        try:
+            value = self[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.move_to_end(key)
+        return value
+
+    def get_or_create(self, key, factory):
+        """ Return cached value for `key`, calling `factory(key)` on a miss."""
+        try:
+            value = self[key]
+        except KeyError:
+            self.misses += 1
+            value = factory(key)
+            self[key] = value
+            self._evict()
+        else:
+            self.hits += 1
+            self.move_to_end(key)
+        return value
+
+    def info(self):
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self), 'maxsize': self._maxsize}
+
+    def clear(self):
+        super().clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_rest_html_cache = LruCache(maxsize=1024)
+
+
+def _render_rest(docstring):
+    return publish_parts(inspect.cleandoc(docstring),
+                         writer_name='html')['html_body']
+
+
 def rest_to_html(docstring):
     """ Converts reSTructured text from docstrings to HTML.
 
     As it uses quite strange docutils implementations, it adds some unnecessary
     clutter to the HTML <div class="document"> etc.
 
+    Rendered docstrings are cached by their content (see
+    :func:`rest_cache_info`), so the docutils are run only once per docstring.
     """
     if docstring:
-        return publish_parts(inspect.cleandoc(docstring),
-                             writer_name='html')['html_body']
+        return _rest_html_cache.get_or_create(docstring, _render_rest)
     else:
         return None
+
+
+def rest_cache_info():
+    """ Returns hits, misses, size and maxsize of the reST rendering cache."""
+    return _rest_html_cache.info()
+
+
+def set_rest_cache_size(maxsize):
+    """ Sets the number of rendered docstrings kept in the cache.
+
+    :param maxsize:  Maximum number of cached docstrings, ``None`` for
+                     unbounded cache. Least recently used docstrings are
+                     evicted first.
+    """
+    _rest_html_cache.maxsize = maxsize
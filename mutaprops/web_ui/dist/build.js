@@ -20,7 +20,7 @@ var q=0,H=1,G=2;r.reject=function(t){return new r(function(e,n){n(t)})},r.resolv
  * @license MIT
  */
 var S=function(t){function e(){var t=this.$options;t.store?this.$store=t.store:t.parent&&t.parent.$store&&(this.$store=t.parent.$store)}var n=Number(t.version.split(".")[0]);if(n>=2){var r=t.config._lifecycleHooks.indexOf("init")>-1;t.mixin(r?{init:e}:{beforeCreate:e})}else{var o=t.prototype._init;t.prototype._init=function(t){void 0===t&&(t={}),t.init=t.init?[e].concat(t.init):e,o.call(this,t)}}},j="undefined"!=typeof window&&window.__VUE_DEVTOOLS_GLOBAL_HOOK__,C=function(t,e){this.runtime=e,this._children=Object.create(null),this._rawModule=t;var n=t.state;this.state=("function"==typeof n?n():n)||{}},E={namespaced:{}};E.namespaced.get=function(){return!!this._rawModule.namespaced},C.prototype.addChild=function(t,e){this._children[t]=e},C.prototype.removeChild=function(t){delete this._children[t]},C.prototype.getChild=function(t){return this._children[t]},C.prototype.update=function(t){this._rawModule.namespaced=t.namespaced,t.actions&&(this._rawModule.actions=t.actions),t.mutations&&(this._rawModule.mutations=t.mutations),t.getters&&(this._rawModule.getters=t.getters)},C.prototype.forEachChild=function(t){o(this._children,t)},C.prototype.forEachGetter=function(t){this._rawModule.getters&&o(this._rawModule.getters,t)},C.prototype.forEachAction=function(t){this._rawModule.actions&&o(this._rawModule.actions,t)},C.prototype.forEachMutation=function(t){this._rawModule.mutations&&o(this._rawModule.mutations,t)},Object.defineProperties(C.prototype,E);var k=function(t){var e=this;this.root=new C(t,!1),t.modules&&o(t.modules,function(t,n){e.register([n],t,!1)})};k.prototype.get=function(t){return t.reduce(function(t,e){return t.getChild(e)},this.root)},k.prototype.getNamespace=function(t){var e=this.root;return t.reduce(function(t,n){return e=e.getChild(n),t+(e.namespaced?n+"/":"")},"")},k.prototype.update=function(t){s(this.root,t)},k.prototype.register=function(t,e,n){var r=this;void 0===n&&(n=!0);var i=this.get(t.slice(0,-1)),a=new C(e,n);i.addChild(t[t.length-1],a),e.modules&&o(e.modules,function(e,o){r.register(t.concat(o),e,n)})},k.prototype.unregister=function(t){var e=this.get(t.slice(0,-1)),n=t[t.length-1];e.getChild(n).runtime&&e.removeChild(n)};var A,T=function(t){var e=this;void 0===t&&(t={}),u(A,"must call Vue.use(Vuex) before creating a store instance."),u("undefined"!=typeof Promise,"vuex requires a Promise polyfill in this browser.");var n=t.state;void 0===n&&(n={});var o=t.plugins;void 0===o&&(o=[]);var i=t.strict;void 0===i&&(i=!1),this._committing=!1,this._actions=Object.create(null),this._mutations=Object.create(null),this._wrappedGetters=Object.create(null),this._modules=new k(t),this._modulesNamespaceMap=Object.create(null),this._subscribers=[],this._watcherVM=new A;var a=this,s=this,c=s.dispatch,p=s.commit;this.dispatch=function(t,e){return c.call(a,t,e)},this.commit=function(t,e,n){return p.call(a,t,e,n)},this.strict=i,l(this,n,[],this._modules.root),f(this,n),o.concat(r).forEach(function(t){return t(e)})},$={state:{}};$.state.get=function(){return this._vm._data.$$state},$.state.set=function(t){u(!1,"Use store.replaceState() to explicit replace store state.")},T.prototype.commit=function(t,e,n){var r=this,o=b(t,e,n),i=o.type,a=o.payload,u=o.options,s={type:i,payload:a},c=this._mutations[i];return c?(this._withCommit(function(){c.forEach(function(t){t(a)})}),this._subscribers.forEach(function(t){return t(s,r.state)}),void(u&&u.silent&&console.warn("[vuex] mutation type: "+i+". Silent option has been removed. Use the filter functionality in the vue-devtools"))):void console.error("[vuex] unknown mutation type: "+i)},T.prototype.dispatch=function(t,e){var n=b(t,e),r=n.type,o=n.payload,i=this._actions[r];return i?i.length>1?Promise.all(i.map(function(t){return t(o)})):i[0](o):void console.error("[vuex] unknown action type: "+r)},T.prototype.subscribe=function(t){var e=this._subscribers;return e.indexOf(t)<0&&e.push(t),function(){var n=e.indexOf(t);n>-1&&e.splice(n,1)}},T.prototype.watch=function(t,e,n){var r=this;return u("function"==typeof t,"store.watch only accepts a function."),this._watcherVM.$watch(function(){return t(r.state,r.getters)},e,n)},T.prototype.replaceState=function(t){var e=this;this._withCommit(function(){e._vm._data.$$state=t})},T.prototype.registerModule=function(t,e){"string"==typeof t&&(t=[t]),u(Array.isArray(t),"module path must be a string or an Array."),this._modules.register(t,e),l(this,this.state,t,this._modules.get(t)),f(this,this.state)},T.prototype.unregisterModule=function(t){var e=this;"string"==typeof t&&(t=[t]),u(Array.isArray(t),"module path must be a string or an Array."),this._modules.unregister(t),this._withCommit(function(){var n=m(e.state,t.slice(0,-1));A.delete(n,t[t.length-1])}),c(this)},T.prototype.hotUpdate=function(t){this._modules.update(t),c(this,!0)},T.prototype._withCommit=function(t){var e=this._committing;this._committing=!0,t(),this._committing=e},Object.defineProperties(T.prototype,$),"undefined"!=typeof window&&window.Vue&&_(window.Vue);var I=x(function(t,e){var n={};return w(e).forEach(function(e){var r=e.key,o=e.val;n[r]=function(){var e=this.$store.state,n=this.$store.getters;if(t){var r=O(this.$store,"mapState",t);if(!r)return;e=r.context.state,n=r.context.getters}return"function"==typeof o?o.call(this,e,n):e[o]},n[r].vuex=!0}),n}),P=x(function(t,e){var n={};return w(e).forEach(function(e){var r=e.key,o=e.val;o=t+o,n[r]=function(){for(var e=[],n=arguments.length;n--;)e[n]=arguments[n];if(!t||O(this.$store,"mapMutations",t))return this.$store.commit.apply(this.$store,[o].concat(e))}}),n}),M=x(function(t,e){var n={};return w(e).forEach(function(e){var r=e.key,o=e.val;o=t+o,n[r]=function(){if(!t||O(this.$store,"mapGetters",t))return o in this.$store.getters?this.$store.getters[o]:void console.error("[vuex] unknown getter: "+o)},n[r].vuex=!0}),n}),L=x(function(t,e){var n={};return w(e).forEach(function(e){var r=e.key,o=e.val;o=t+o,n[r]=function(){for(var e=[],n=arguments.length;n--;)e[n]=arguments[n];if(!t||O(this.$store,"mapActions",t))return this.$store.dispatch.apply(this.$store,[o].concat(e))}}),n}),N={Store:T,install:_,version:"2.3.0",mapState:I,mapMutations:P,mapGetters:M,mapActions:L};e.a=N},function(t,e,n){var r=n(22);t.exports=function(t,e){if("number"!=typeof t&&"Number"!=r(t))throw TypeError(e);return+t}},function(t,e,n){"use strict";var r=n(11),o=n(47),i=n(10);t.exports=[].copyWithin||function(t,e){var n=r(this),a=i(n.length),u=o(t,a),s=o(e,a),c=arguments.length>2?arguments[2]:void 0,f=Math.min((void 0===c?a:o(c,a))-s,a-u),l=1;for(s<u&&u<s+f&&(l=-1,s+=f-1,u+=f-1);f-- >0;)s in n?n[u]=n[s]:delete n[u],u+=l,s+=l;return n}},function(t,e,n){var r=n(40);t.exports=function(t,e){var n=[];return r(t,!1,n.push,n,e),n}},function(t,e,n){var r=n(12),o=n(11),i=n(57),a=n(10);t.exports=function(t,e,n,u,s){r(e);var c=o(t),f=i(c),l=a(c.length),p=s?l-1:0,h=s?-1:1;if(n<2)for(;;){if(p in f){u=f[p],p+=h;break}if(p+=h,s?p<0:l<=p)throw TypeError("Reduce of empty array with no initial value")}for(;s?p>=0:l>p;p+=h)p in f&&(u=e(u,f[p],p,c));return u}},function(t,e,n){"use strict";var r=n(12),o=n(5),i=n(66),a=[].slice,u={},s=function(t,e,n){if(!(e in u)){for(var r=[],o=0;o<e;o++)r[o]="a["+o+"]";u[e]=Function("F,a","return new F("+r.join(",")+")")}return u[e](t,n)};t.exports=Function.bind||function(t){var e=r(this),n=a.call(arguments,1),u=function(){var r=n.concat(a.call(arguments));return this instanceof u?s(e,r.length,r):i(e,r,t)};return o(e.prototype)&&(u.prototype=e.prototype),u}},function(t,e,n){"use strict";var r=n(9).f,o=n(42),i=n(45),a=n(23),u=n(39),s=n(40),c=n(90),f=n(127),l=n(46),p=n(8),h=n(35).fastKey,d=n(53),v=p?"_s":"size",g=function(t,e){var n,r=h(e);if("F"!==r)return t._i[r];for(n=t._f;n;n=n.n)if(n.k==e)return n};t.exports={getConstructor:function(t,e,n,c){var f=t(function(t,r){u(t,f,e,"_i"),t._t=e,t._i=o(null),t._f=void 0,t._l=void 0,t[v]=0,void 0!=r&&s(r,n,t[c],t)});return i(f.prototype,{clear:function(){for(var t=d(this,e),n=t._i,r=t._f;r;r=r.n)r.r=!0,r.p&&(r.p=r.p.n=void 0),delete n[r.i];t._f=t._l=void 0,t[v]=0},delete:function(t){var n=d(this,e),r=g(n,t);if(r){var o=r.n,i=r.p;delete n._i[r.i],r.r=!0,i&&(i.n=o),o&&(o.p=i),n._f==r&&(n._f=o),n._l==r&&(n._l=i),n[v]--}return!!r},forEach:function(t){d(this,e);for(var n,r=a(t,arguments.length>1?arguments[1]:void 0,3);n=n?n.n:this._f;)for(r(n.v,n.k,this);n&&n.r;)n=n.p},has:function(t){return!!g(d(this,e),t)}}),p&&r(f.prototype,"size",{get:function(){return d(this,e)[v]}}),f},def:function(t,e,n){var r,o,i=g(t,e);return i?i.v=n:(t._l=i={i:o=h(e,!0),k:e,v:n,p:r=t._l,n:void 0,r:!1},t._f||(t._f=i),r&&(r.n=i),t[v]++,"F"!==o&&(t._i[o]=i)),t},getEntry:g,setStrong:function(t,e,n){c(t,e,function(t,n){this._t=d(t,e),this._k=n,this._l=void 0},function(){for(var t=this,e=t._k,n=t._l;n&&n.r;)n=n.p;return t._t&&(t._l=n=n?n.n:t._t._f)?"keys"==e?f(0,n.k):"values"==e?f(0,n.v):f(0,[n.k,n.v]):(t._t=void 0,f(1))},n?"entries":"values",!n,!0),l(e)}}},function(t,e,n){var r=n(56),o=n(117);t.exports=function(t){return function(){if(r(this)!=t)throw TypeError(t+"#toJSON isn't generic");return o(this)}}},function(t,e,n){"use strict";var r=n(45),o=n(35).getWeak,i=n(1),a=n(5),u=n(39),s=n(40),c=n(25),f=n(14),l=n(53),p=c(5),h=c(6),d=0,v=function(t){return t._l||(t._l=new g)},g=function(){this.a=[]},y=function(t,e){return p(t.a,function(t){return t[0]===e})};g.prototype={get:function(t){var e=y(this,t);if(e)return e[1]},has:function(t){return!!y(this,t)},set:function(t,e){var n=y(this,t);n?n[1]=e:this.a.push([t,e])},delete:function(t){var e=h(this.a,function(e){return e[0]===t});return~e&&this.a.splice(e,1),!!~e}},t.exports={getConstructor:function(t,e,n,i){var c=t(function(t,r){u(t,c,e,"_i"),t._t=e,t._i=d++,t._l=void 0,void 0!=r&&s(r,n,t[i],t)});return r(c.prototype,{delete:function(t){if(!a(t))return!1;var n=o(t);return n===!0?v(l(this,e)).delete(t):n&&f(n,this._i)&&delete n[this._i]},has:function(t){if(!a(t))return!1;var n=o(t);return n===!0?v(l(this,e)).has(t):n&&f(n,this._i)}}),c},def:function(t,e,n){var r=o(i(e),!0);return r===!0?v(t).set(e,n):r[t._i]=n,t},ufstore:v}},function(t,e,n){"use strict";function r(t,e,n,c,f,l,p,h){for(var d,v,g=f,y=0,m=!!p&&u(p,h,3);y<c;){if(y in n){if(d=m?m(n[y],y,e):n[y],v=!1,i(d)&&(v=d[s],v=void 0!==v?!!v:o(d)),v&&l>0)g=r(t,e,d,a(d.length),g,l-1)-1;else{if(g>=9007199254740991)throw TypeError();t[g]=d}g++}y++}return g}var o=n(67),i=n(5),a=n(10),u=n(23),s=n(6)("isConcatSpreadable");t.exports=r},function(t,e,n){t.exports=!n(8)&&!n(3)(function(){return 7!=Object.defineProperty(n(83)("div"),"a",{get:function(){return 7}}).a})},function(t,e,n){var r=n(5),o=Math.floor;t.exports=function(t){return!r(t)&&isFinite(t)&&o(t)===t}},function(t,e,n){var r=n(1);t.exports=function(t,e,n,o){try{return o?e(r(n)[0],n[1]):e(n)}catch(e){var i=t.return;throw void 0!==i&&r(i.call(t)),e}}},function(t,e){t.exports=function(t,e){return{value:e,done:!!t}}},function(t,e,n){var r=n(92),o=Math.pow,i=o(2,-52),a=o(2,-23),u=o(2,127)*(2-a),s=o(2,-126),c=function(t){return t+1/i-1/i};t.exports=Math.fround||function(t){var e,n,o=Math.abs(t),f=r(t);return o<s?f*c(o/s/a)*s*a:(e=(1+a/i)*o,n=e-(e-o),n>u||n!=n?f*(1/0):f*n)}},function(t,e){t.exports=Math.log1p||function(t){return(t=+t)>-1e-8&&t<1e-8?t-t*t/2:Math.log(1+t)}},function(t,e){t.exports=Math.scale||function(t,e,n,r,o){return 0===arguments.length||t!=t||e!=e||n!=n||r!=r||o!=o?NaN:t===1/0||t===-(1/0)?t:(t-e)*(o-r)/(n-e)+r}},function(t,e,n){"use strict";var r=n(36),o=n(71),i=n(58),a=n(11),u=n(57),s=Object.assign;t.exports=!s||n(3)(function(){var t={},e={},n=Symbol(),r="abcdefghijklmnopqrst";return t[n]=7,r.split("").forEach(function(t){e[t]=t}),7!=s({},t)[n]||Object.keys(s({},e)).join("")!=r})?function(t,e){for(var n=a(t),s=arguments.length,c=1,f=o.f,l=i.f;s>c;)for(var p,h=u(arguments[c++]),d=f?r(h).concat(f(h)):r(h),v=d.length,g=0;v>g;)l.call(h,p=d[g++])&&(n[p]=h[p]);return n}:s},function(t,e,n){var r=n(9),o=n(1),i=n(36);t.exports=n(8)?Object.defineProperties:function(t,e){o(t);for(var n,a=i(e),u=a.length,s=0;u>s;)r.f(t,n=a[s++],e[n]);return t}},function(t,e,n){var r=n(18),o=n(43).f,i={}.toString,a="object"==typeof window&&window&&Object.getOwnPropertyNames?Object.getOwnPropertyNames(window):[],u=function(t){try{return o(t)}catch(t){return a.slice()}};t.exports.f=function(t){return a&&"[object Window]"==i.call(t)?u(t):o(r(t))}},function(t,e,n){var r=n(14),o=n(18),i=n(62)(!1),a=n(96)("IE_PROTO");t.exports=function(t,e){var n,u=o(t),s=0,c=[];for(n in u)n!=a&&r(u,n)&&c.push(n);for(;e.length>s;)r(u,n=e[s++])&&(~i(c,n)||c.push(n));return c}},function(t,e,n){var r=n(36),o=n(18),i=n(58).f;t.exports=function(t){return function(e){for(var n,a=o(e),u=r(a),s=u.length,c=0,f=[];s>c;)i.call(a,n=u[c++])&&f.push(t?[n,a[n]]:a[n]);return f}}},function(t,e,n){var r=n(43),o=n(71),i=n(1),a=n(2).Reflect;t.exports=a&&a.ownKeys||function(t){var e=r.f(i(t)),n=o.f;return n?e.concat(n(t)):e}},function(t,e,n){var r=n(2).parseFloat,o=n(52).trim;t.exports=1/r(n(100)+"-0")!==-(1/0)?function(t){var e=o(String(t),3),n=r(e);return 0===n&&"-"==e.charAt(0)?-0:n}:r},function(t,e,n){var r=n(2).parseInt,o=n(52).trim,i=n(100),a=/^[-+]?0[xX]/;t.exports=8!==r(i+"08")||22!==r(i+"0x16")?function(t,e){var n=o(String(t),3);return r(n,e>>>0||(a.test(n)?16:10))}:r},function(t,e){t.exports=function(t){try{return{e:!1,v:t()}}catch(t){return{e:!0,v:t}}}},function(t,e,n){var r=n(94);t.exports=function(t,e){var n=r.f(t),o=n.resolve;return o(e),n.promise}},function(t,e,n){var r=n(10),o=n(99),i=n(27);t.exports=function(t,e,n,a){var u=String(i(t)),s=u.length,c=void 0===n?" ":String(n),f=r(e);if(f<=s||""==c)return u;var l=f-s,p=o.call(c,Math.ceil(l/c.length));return p.length>l&&(p=p.slice(0,l)),a?p+u:u+p}},function(t,e,n){var r=n(29),o=n(10);t.exports=function(t){if(void 0===t)return 0;var e=r(t),n=o(e);if(e!==n)throw RangeError("Wrong length!");return n}},function(t,e,n){e.f=n(6)},function(t,e,n){"use strict";var r=n(120),o=n(53),i="Map";t.exports=n(63)(i,function(t){return function(){return t(this,arguments.length>0?arguments[0]:void 0)}},{get:function(t){var e=r.getEntry(o(this,i),t);return e&&e.v},set:function(t,e){return r.def(o(this,i),0===t?0:t,e)}},r,!0)},function(t,e,n){n(8)&&"g"!=/./g.flags&&n(9).f(RegExp.prototype,"flags",{configurable:!0,get:n(65)})},function(t,e,n){"use strict";var r=n(120),o=n(53),i="Set";t.exports=n(63)(i,function(t){return function(){return t(this,arguments.length>0?arguments[0]:void 0)}},{add:function(t){return r.def(o(this,i),t=0===t?0:t,t)}},r)},function(t,e,n){"use strict";var r,o=n(25)(0),i=n(16),a=n(35),u=n(131),s=n(122),c=n(5),f=n(3),l=n(53),p="WeakMap",h=a.getWeak,d=Object.isExtensible,v=s.ufstore,g={},y=function(t){return function(){return t(this,arguments.length>0?arguments[0]:void 0)}},m={get:function(t){if(c(t)){var e=h(t);return e===!0?v(l(this,p)).get(t):e?e[this._i]:void 0}},set:function(t,e){return s.def(l(this,p),t,e)}},b=t.exports=n(63)(p,y,m,s,!0,!0);f(function(){return 7!=(new b).set((Object.freeze||Object)(g),7).get(g)})&&(r=s.getConstructor(y,p),u(r.prototype,m),a.NEED=!0,o(["delete","has","get","set"],function(t){var e=b.prototype,n=e[t];i(e,t,function(e,o){if(c(e)&&!d(e)){this._f||(this._f=new r);var i=this._f[t](e,o);return"set"==t?this:i}return n.call(this,e,o)})}))},function(t,e){"use strict";function n(){this._listeners={}}n.prototype.addEventListener=function(t,e){t in this._listeners||(this._listeners[t]=[]);var n=this._listeners[t];n.indexOf(e)===-1&&(n=n.concat([e])),this._listeners[t]=n},n.prototype.removeEventListener=function(t,e){var n=this._listeners[t];if(n){var r=n.indexOf(e);return r!==-1?void(n.length>1?this._listeners[t]=n.slice(0,r).concat(n.slice(r+1)):delete this._listeners[t]):void 0}},n.prototype.dispatchEvent=function(){var t=arguments[0],e=t.type,n=1===arguments.length?[t]:Array.apply(null,arguments);if(this["on"+e]&&this["on"+e].apply(this,n),e in this._listeners)for(var r=this._listeners[e],o=0;o<r.length;o++)r[o].apply(this,n)},t.exports=n},function(t,e,n){"use strict";function r(t,e){o.call(this);var n=this,r=+new Date;this.xo=new e("GET",t),this.xo.once("finish",function(t,e){var o,i;if(200===t){if(i=+new Date-r,e)try{o=a.parse(e)}catch(t){s("bad json",e)}u.isObject(o)||(o={})}n.emit("finish",o,i),n.removeAllListeners()})}var o=n(13).EventEmitter,i=n(4),a=n(33),u=n(111),s=function(){};i(r,o),r.prototype.close=function(){this.removeAllListeners(),this.xo.close()},t.exports=r},function(t,e,n){"use strict";function r(t){var e=this;i.call(this),this.ir=new s(t,u),this.ir.once("finish",function(t,n){e.ir=null,e.emit("message",a.stringify([t,n]))})}var o=n(4),i=n(13).EventEmitter,a=n(33),u=n(59),s=n(149);o(r,i),r.transportName="iframe-info-receiver",r.prototype.close=function(){this.ir&&(this.ir.close(),this.ir=null),this.removeAllListeners()},t.exports=r},function(t,e,n){"use strict";(function(e){t.exports=e.location||{origin:"http://localhost:80",protocol:"http",host:"localhost",port:80,href:"http://localhost/",hash:""}}).call(e,n(7))},function(t,e,n){"use strict";(function(e){function r(t,e,n,r){c(t,e);var i=this;o.call(this),setTimeout(function(){i._start(t,e,n,r)},0)}var o=n(13).EventEmitter,i=n(4),a=n(37),u=n(21),s=e.XMLHttpRequest,c=function(){};i(r,o),r.prototype._start=function(t,e,n,o){var i=this;try{this.xhr=new s}catch(t){}if(!this.xhr)return c("no xhr"),this.emit("finish",0,"no xhr support"),void this._cleanup();e=u.addQuery(e,"t="+ +new Date),this.unloadRef=a.unloadAdd(function(){c("unload cleanup"),i._cleanup(!0)});try{this.xhr.open(t,e,!0),this.timeout&&"timeout"in this.xhr&&(this.xhr.timeout=this.timeout,this.xhr.ontimeout=function(){c("xhr timeout"),i.emit("finish",0,""),i._cleanup(!1)})}catch(t){return c("exception",t),this.emit("finish",0,""),void this._cleanup(!1)}if(o&&o.noCredentials||!r.supportsCORS||(c("withCredentials"),this.xhr.withCredentials="true"),o&&o.headers)for(var f in o.headers)this.xhr.setRequestHeader(f,o.headers[f]);this.xhr.onreadystatechange=function(){if(i.xhr){var t,e,n=i.xhr;switch(c("readyState",n.readyState),n.readyState){case 3:try{e=n.status,t=n.responseText}catch(t){}c("status",e),1223===e&&(e=204),200===e&&t&&t.length>0&&(c("chunk"),i.emit("chunk",e,t));break;case 4:e=n.status,c("status",e),1223===e&&(e=204),12005!==e&&12029!==e||(e=0),c("finish",e,n.responseText),i.emit("finish",e,n.responseText),i._cleanup(!1)}}};try{i.xhr.send(n)}catch(t){i.emit("finish",0,""),i._cleanup(!1)}},r.prototype._cleanup=function(t){if(c("cleanup"),this.xhr){if(this.removeAllListeners(),a.unloadDel(this.unloadRef),this.xhr.onreadystatechange=function(){},this.xhr.ontimeout&&(this.xhr.ontimeout=null),t)try{this.xhr.abort()}catch(t){}this.unloadRef=this.xhr=null}},r.prototype.close=function(){c("close"),this._cleanup(!0)},r.enabled=!!s;var f=["Active"].concat("Object").join("X");!r.enabled&&f in e&&(c("overriding xmlhttprequest"),s=function(){try{return new e[f]("Microsoft.XMLHTTP")}catch(t){return null}},r.enabled=!!new s);var l=!1;try{l="withCredentials"in new s}catch(t){}r.supportsCORS=l,t.exports=r}).call(e,n(7))},function(t,e,n){(function(e){t.exports=e.EventSource}).call(e,n(7))},function(t,e,n){"use strict";function r(t){if(!r.enabled())throw new Error("Transport created when disabled");i.call(this,t,"/eventsource",a,u)}var o=n(4),i=n(54),a=n(397),u=n(78),s=n(153);o(r,i),r.enabled=function(){return!!s},r.transportName="eventsource",r.roundTrips=2,t.exports=r},function(t,e,n){"use strict";function r(t){if(!i.enabled)throw new Error("Transport created when disabled");u.call(this,t,"/htmlfile",i,a)}var o=n(4),i=n(398),a=n(59),u=n(54);o(r,u),r.enabled=function(t){return i.enabled&&t.sameOrigin},r.transportName="htmlfile",r.roundTrips=2,t.exports=r},function(t,e,n){"use strict";function r(t,e,n){if(!r.enabled())throw new Error("Transport created when disabled");a.call(this);var o=this;this.origin=s.getOrigin(n),this.baseUrl=n,this.transUrl=e,this.transport=t,this.windowId=l.string(8);var i=s.addPath(n,"/iframe.html")+"#"+this.windowId;p(t,e,i),this.iframeObj=c.createIframe(i,function(t){p("err callback"),o.emit("close",1006,"Unable to load an iframe ("+t+")"),o.close()}),this.onmessageCallback=this._message.bind(this),f.attachEvent("message",this.onmessageCallback)}var o=n(4),i=n(33),a=n(13).EventEmitter,u=n(160),s=n(21),c=n(61),f=n(37),l=n(55),p=function(){};o(r,a),r.prototype.close=function(){if(p("close"),this.removeAllListeners(),this.iframeObj){f.detachEvent("message",this.onmessageCallback);try{this.postMessage("c")}catch(t){}this.iframeObj.cleanup(),this.iframeObj=null,this.onmessageCallback=this.iframeObj=null}},r.prototype._message=function(t){if(p("message",t.data),!s.isOriginEqual(t.origin,this.origin))return void p("not same origin",t.origin,this.origin);var e;try{e=i.parse(t.data)}catch(e){return void p("bad json",t.data)}if(e.windowId!==this.windowId)return void p("mismatched window id",e.windowId,this.windowId);switch(e.type){case"s":this.iframeObj.loaded(),this.postMessage("s",i.stringify([u,this.transport,this.transUrl,this.baseUrl]));break;case"t":this.emit("message",e.data);break;case"c":var n;try{n=i.parse(e.data)}catch(t){return void p("bad json",e.data)}this.emit("close",n[0],n[1]),this.close()}},r.prototype.postMessage=function(t,e){p("postMessage",t,e),this.iframeObj.post(i.stringify({windowId:this.windowId,type:t,data:e||""}),this.origin)},r.prototype.send=function(t){p("send",t),this.postMessage("m",t)},r.enabled=function(){return c.iframeEnabled},r.transportName="iframe",r.roundTrips=2,t.exports=r},function(t,e,n){"use strict";function r(t,e,n,r,o){var c=i.addPath(t,e);s(c);var f=this;a.call(this,t,n),this.poll=new u(r,c,o),this.poll.on("message",function(t){s("poll message",t),f.emit("message",t)}),this.poll.once("close",function(t,e){s("poll close",t,e),f.poll=null,f.emit("close",t,e),f.close()})}var o=n(4),i=n(21),a=n(395),u=n(396),s=function(){};o(r,a),r.prototype.close=function(){a.prototype.close.call(this),s("close"),this.removeAllListeners(),this.poll&&(this.poll.abort(),this.poll=null)},t.exports=r},function(t,e,n){"use strict";function r(t){if(!u.enabled)throw new Error("Transport created when disabled");i.call(this,t,"/xhr_streaming",a,u)}var o=n(4),i=n(54),a=n(77),u=n(110);o(r,i),r.enabled=function(t){return!t.cookie_needed&&!t.nullOrigin&&(u.enabled&&t.sameScheme)},r.transportName="xdr-streaming",r.roundTrips=2,t.exports=r},function(t,e,n){"use strict";function r(t){if(!s.enabled&&!u.enabled)throw new Error("Transport created when disabled");i.call(this,t,"/xhr",a,u)}var o=n(4),i=n(54),a=n(77),u=n(78),s=n(59);o(r,i),r.enabled=function(t){return!t.nullOrigin&&(!(!s.enabled||!t.sameOrigin)||u.enabled)},r.transportName="xhr-polling",r.roundTrips=2,t.exports=r},function(t,e){t.exports="1.1.4"},function(t,e,n){"use strict";(function(e){function r(t){t=t||e.location||{};var n,r={},o=typeof t;if("blob:"===t.protocol)r=new a(unescape(t.pathname),{});else if("string"===o){r=new a(t,{});for(n in d)delete r[n]}else if("object"===o){for(n in t)n in d||(r[n]=t[n]);void 0===r.slashes&&(r.slashes=p.test(t.href))}return r}function o(t){var e=l.exec(t);return{protocol:e[1]?e[1].toLowerCase():"",slashes:!!e[2],rest:e[3]}}function i(t,e){for(var n=(e||"/").split("/").slice(0,-1).concat(t.split("/")),r=n.length,o=n[r-1],i=!1,a=0;r--;)"."===n[r]?n.splice(r,1):".."===n[r]?(n.splice(r,1),a++):a&&(0===r&&(i=!0),n.splice(r,1),a--);return i&&n.unshift(""),"."!==o&&".."!==o||n.push(""),n.join("/")}function a(t,e,n){if(!(this instanceof a))return new a(t,e,n);var u,s,l,p,d,v,g=h.slice(),y=typeof e,m=this,b=0;for("object"!==y&&"string"!==y&&(n=e,e=null),n&&"function"!=typeof n&&(n=f.parse),e=r(e),s=o(t||""),u=!s.protocol&&!s.slashes,m.slashes=s.slashes||u&&e.slashes,m.protocol=s.protocol||e.protocol||"",t=s.rest,s.slashes||(g[2]=[/(.*)/,"pathname"]);b<g.length;b++)p=g[b],l=p[0],v=p[1],l!==l?m[v]=t:"string"==typeof l?~(d=t.indexOf(l))&&("number"==typeof p[2]?(m[v]=t.slice(0,d),t=t.slice(d+p[2])):(m[v]=t.slice(d),t=t.slice(0,d))):(d=l.exec(t))&&(m[v]=d[1],t=t.slice(0,d.index)),m[v]=m[v]||(u&&p[3]?e[v]||"":""),p[4]&&(m[v]=m[v].toLowerCase());n&&(m.query=n(m.query)),u&&e.slashes&&"/"!==m.pathname.charAt(0)&&(""!==m.pathname||""!==e.pathname)&&(m.pathname=i(m.pathname,e.pathname)),c(m.port,m.protocol)||(m.host=m.hostname,m.port=""),m.username=m.password="",m.auth&&(p=m.auth.split(":"),m.username=p[0]||"",m.password=p[1]||""),m.origin=m.protocol&&m.host&&"file:"!==m.protocol?m.protocol+"//"+m.host:"null",m.href=m.toString()}function u(t,e,n){var r=this;switch(t){case"query":"string"==typeof e&&e.length&&(e=(n||f.parse)(e)),r[t]=e;break;case"port":r[t]=e,c(e,r.protocol)?e&&(r.host=r.hostname+":"+e):(r.host=r.hostname,r[t]="");break;case"hostname":r[t]=e,r.port&&(e+=":"+r.port),r.host=e;break;case"host":r[t]=e,/:\d+$/.test(e)?(e=e.split(":"),r.port=e.pop(),r.hostname=e.join(":")):(r.hostname=e,r.port="");break;case"protocol":r.protocol=e.toLowerCase(),r.slashes=!n;break;case"pathname":r.pathname=e.length&&"/"!==e.charAt(0)?"/"+e:e;break;default:r[t]=e}for(var o=0;o<h.length;o++){var i=h[o];i[4]&&(r[i[1]]=r[i[1]].toLowerCase())}return r.origin=r.protocol&&r.host&&"file:"!==r.protocol?r.protocol+"//"+r.host:"null",r.href=r.toString(),r}function s(t){t&&"function"==typeof t||(t=f.stringify);var e,n=this,r=n.protocol;r&&":"!==r.charAt(r.length-1)&&(r+=":");var o=r+(n.slashes?"//":"");return n.username&&(o+=n.username,n.password&&(o+=":"+n.password),o+="@"),o+=n.host+n.pathname,e="object"==typeof n.query?t(n.query):n.query,e&&(o+="?"!==e.charAt(0)?"?"+e:e),n.hash&&(o+=n.hash),o}var c=n(382),f=n(410),l=/^([a-z][a-z0-9.+-]*:)?(\/\/)?([\S\s]*)/i,p=/^[A-Za-z][A-Za-z0-9+-.]*:\/\//,h=[["#","hash"],["?","query"],["/","pathname"],["@","auth",1],[NaN,"host",void 0,1,1],[/:(\d+)$/,"port",void 0,1],[NaN,"hostname",void 0,1,1]],d={hash:1,query:1};a.prototype={set:u,toString:s},a.extractProtocol=o,a.location=r,a.qs=f,t.exports=a}).call(e,n(7))},function(t,e){t.exports=function(t){return t.webpackPolyfill||(t.deprecate=function(){},t.paths=[],t.children||(t.children=[]),Object.defineProperty(t,"loaded",{enumerable:!0,configurable:!1,get:function(){return t.l}}),Object.defineProperty(t,"id",{enumerable:!0,configurable:!1,get:function(){return t.i}}),t.webpackPolyfill=1),t}},function(t,e,n){"use strict";(function(t){function e(t,e,n){t[e]||Object[r](t,e,{writable:!0,configurable:!0,value:n})}if(n(377),n(381),n(175),t._babelPolyfill)throw new Error("only one instance of babel-polyfill is allowed");t._babelPolyfill=!0;var r="defineProperty";e(String.prototype,"padLeft","".padStart),e(String.prototype,"padRight","".padEnd),"pop,reverse,shift,keys,values,entries,indexOf,every,some,forEach,map,filter,find,findIndex,includes,join,slice,concat,push,splice,unshift,sort,lastIndexOf,reduce,reduceRight,copyWithin,fill".split(",").forEach(function(t){[][t]&&e(Array,t,Function.call.bind([][t]))})}).call(e,n(7))},function(t,e,n){var r,o;n(425),r=n(168);var i=n(417);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){var r,o;n(427),r=n(170);var i=n(422);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){"use strict";function r(t,e){}function o(t){return Object.prototype.toString.call(t).indexOf("Error")>-1}function i(t,e){switch(typeof e){case"undefined":return;case"object":return e;case"function":return e(t);case"boolean":return e?t.params:void 0}}function a(t,e,n){void 0===e&&(e={});var r,o=n||u;try{r=o(t||"")}catch(t){r={}}for(var i in e){var a=e[i];r[i]=Array.isArray(a)?a.slice():a}return r}function u(t){var e={};return(t=t.trim().replace(/^(\?|#|&)/,""))?(t.split("&").forEach(function(t){var n=t.replace(/\+/g," ").split("="),r=Lt(n.shift()),o=n.length>0?Lt(n.join("=")):null;void 0===e[r]?e[r]=o:Array.isArray(e[r])?e[r].push(o):e[r]=[e[r],o]}),e):e}function s(t){var e=t?Object.keys(t).map(function(e){var n=t[e];if(void 0===n)return"";if(null===n)return Mt(e);if(Array.isArray(n)){var r=[];return n.forEach(function(t){void 0!==t&&(null===t?r.push(Mt(e)):r.push(Mt(e)+"="+Mt(t)))}),r.join("&")}return Mt(e)+"="+Mt(n)}).filter(function(t){return t.length>0}).join("&"):null;return e?"?"+e:""}function c(t,e,n,r){var o=r&&r.options.stringifyQuery,i={name:e.name||t&&t.name,meta:t&&t.meta||{},path:e.path||"/",hash:e.hash||"",query:e.query||{},params:e.params||{},fullPath:l(e,o),matched:t?f(t):[]};return n&&(i.redirectedFrom=l(n,o)),Object.freeze(i)}function f(t){for(var e=[];t;)e.unshift(t),t=t.parent;return e}function l(t,e){var n=t.path,r=t.query;void 0===r&&(r={});var o=t.hash;void 0===o&&(o="");var i=e||s;return(n||"/")+i(r)+o}function p(t,e){return e===Rt?t===e:!!e&&(t.path&&e.path?t.path.replace(Nt,"")===e.path.replace(Nt,"")&&t.hash===e.hash&&h(t.query,e.query):!(!t.name||!e.name)&&(t.name===e.name&&t.hash===e.hash&&h(t.query,e.query)&&h(t.params,e.params)))}function h(t,e){void 0===t&&(t={}),void 0===e&&(e={});var n=Object.keys(t),r=Object.keys(e);return n.length===r.length&&n.every(function(n){var r=t[n],o=e[n];return"object"==typeof r&&"object"==typeof o?h(r,o):String(r)===String(o)})}function d(t,e){return 0===t.path.replace(Nt,"/").indexOf(e.path.replace(Nt,"/"))&&(!e.hash||t.hash===e.hash)&&v(t.query,e.query)}function v(t,e){for(var n in e)if(!(n in t))return!1;return!0}function g(t){if(!(t.metaKey||t.altKey||t.ctrlKey||t.shiftKey||t.defaultPrevented||void 0!==t.button&&0!==t.button)){if(t.currentTarget&&t.currentTarget.getAttribute){var e=t.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(e))return}return t.preventDefault&&t.preventDefault(),!0}}function y(t){if(t)for(var e,n=0;n<t.length;n++){if(e=t[n],"a"===e.tag)return e;if(e.children&&(e=y(e.children)))return e}}function m(t){if(!m.installed){m.installed=!0,At=t;var e=function(t){return void 0!==t},n=function(t,n){var r=t.$options._parentVnode;e(r)&&e(r=r.data)&&e(r=r.registerRouteInstance)&&r(t,n)};t.mixin({beforeCreate:function(){e(this.$options.router)?(this._routerRoot=this,this._router=this.$options.router,this._router.init(this),t.util.defineReactive(this,"_route",this._router.history.current)):this._routerRoot=this.$parent&&this.$parent._routerRoot||this,n(this,this)},destroyed:function(){n(this)}}),Object.defineProperty(t.prototype,"$router",{get:function(){return this._routerRoot._router}}),Object.defineProperty(t.prototype,"$route",{get:function(){return this._routerRoot._route}}),t.component("router-view",Tt),t.component("router-link",Dt);var r=t.config.optionMergeStrategies;r.beforeRouteEnter=r.beforeRouteLeave=r.beforeRouteUpdate=r.created}}function b(t,e,n){var r=t.charAt(0);if("/"===r)return t;if("?"===r||"#"===r)return e+t;var o=e.split("/");n&&o[o.length-1]||o.pop();for(var i=t.replace(/^\//,"").split("/"),a=0;a<i.length;a++){var u=i[a];".."===u?o.pop():"."!==u&&o.push(u)}return""!==o[0]&&o.unshift(""),o.join("/")}function _(t){var e="",n="",r=t.indexOf("#");r>=0&&(e=t.slice(r),t=t.slice(0,r));var o=t.indexOf("?");return o>=0&&(n=t.slice(o+1),t=t.slice(0,o)),{path:t,query:n,hash:e}}function w(t){return t.replace(/\/\//g,"/")}function x(t,e){for(var n,r=[],o=0,i=0,a="",u=e&&e.delimiter||"/";null!=(n=Jt.exec(t));){var s=n[0],c=n[1],f=n.index;if(a+=t.slice(i,f),i=f+s.length,c)a+=c[1];else{var l=t[i],p=n[2],h=n[3],d=n[4],v=n[5],g=n[6],y=n[7];a&&(r.push(a),a="");var m=null!=p&&null!=l&&l!==p,b="+"===g||"*"===g,_="?"===g||"*"===g,w=n[2]||u,x=d||v;r.push({name:h||o++,prefix:p||"",delimiter:w,optional:_,repeat:b,partial:m,asterisk:!!y,pattern:x?k(x):y?".*":"[^"+E(w)+"]+?"})}}return i<t.length&&(a+=t.substr(i)),a&&r.push(a),r}function O(t,e){return C(x(t,e))}function S(t){return encodeURI(t).replace(/[\/?#]/g,function(t){return"%"+t.charCodeAt(0).toString(16).toUpperCase()})}function j(t){return encodeURI(t).replace(/[?#]/g,function(t){return"%"+t.charCodeAt(0).toString(16).toUpperCase()})}function C(t){for(var e=new Array(t.length),n=0;n<t.length;n++)"object"==typeof t[n]&&(e[n]=new RegExp("^(?:"+t[n].pattern+")$"));
-return function(n,r){for(var o="",i=n||{},a=r||{},u=a.pretty?S:encodeURIComponent,s=0;s<t.length;s++){var c=t[s];if("string"!=typeof c){var f,l=i[c.name];if(null==l){if(c.optional){c.partial&&(o+=c.prefix);continue}throw new TypeError('Expected "'+c.name+'" to be defined')}if(Bt(l)){if(!c.repeat)throw new TypeError('Expected "'+c.name+'" to not repeat, but received `'+JSON.stringify(l)+"`");if(0===l.length){if(c.optional)continue;throw new TypeError('Expected "'+c.name+'" to not be empty')}for(var p=0;p<l.length;p++){if(f=u(l[p]),!e[s].test(f))throw new TypeError('Expected all "'+c.name+'" to match "'+c.pattern+'", but received `'+JSON.stringify(f)+"`");o+=(0===p?c.prefix:c.delimiter)+f}}else{if(f=c.asterisk?j(l):u(l),!e[s].test(f))throw new TypeError('Expected "'+c.name+'" to match "'+c.pattern+'", but received "'+f+'"');o+=c.prefix+f}}else o+=c}return o}}function E(t){return t.replace(/([.+*?=^!:${}()[\]|\/\\])/g,"\\$1")}function k(t){return t.replace(/([=!:$\/()])/g,"\\$1")}function A(t,e){return t.keys=e,t}function T(t){return t.sensitive?"":"i"}function $(t,e){var n=t.source.match(/\((?!\?)/g);if(n)for(var r=0;r<n.length;r++)e.push({name:r,prefix:null,delimiter:null,optional:!1,repeat:!1,partial:!1,asterisk:!1,pattern:null});return A(t,e)}function I(t,e,n){for(var r=[],o=0;o<t.length;o++)r.push(L(t[o],e,n).source);var i=new RegExp("(?:"+r.join("|")+")",T(n));return A(i,e)}function P(t,e,n){return M(x(t,n),e,n)}function M(t,e,n){Bt(e)||(n=e||n,e=[]),n=n||{};for(var r=n.strict,o=n.end!==!1,i="",a=0;a<t.length;a++){var u=t[a];if("string"==typeof u)i+=E(u);else{var s=E(u.prefix),c="(?:"+u.pattern+")";e.push(u),u.repeat&&(c+="(?:"+s+c+")*"),c=u.optional?u.partial?s+"("+c+")?":"(?:"+s+"("+c+"))?":s+"("+c+")",i+=c}}var f=E(n.delimiter||"/"),l=i.slice(-f.length)===f;return r||(i=(l?i.slice(0,-f.length):i)+"(?:"+f+"(?=$))?"),i+=o?"$":r&&l?"":"(?="+f+"|$)",A(new RegExp("^"+i,T(n)),e)}function L(t,e,n){return Bt(e)||(n=e||n,e=[]),n=n||{},t instanceof RegExp?$(t,e):Bt(t)?I(t,e,n):P(t,e,n)}function N(t,e,n){try{var r=Kt[t]||(Kt[t]=Wt.compile(t));return r(e||{},{pretty:!0})}catch(t){return""}}function R(t,e,n,r){var o=e||[],i=n||Object.create(null),a=r||Object.create(null);t.forEach(function(t){F(o,i,a,t)});for(var u=0,s=o.length;u<s;u++)"*"===o[u]&&(o.push(o.splice(u,1)[0]),s--,u--);return{pathList:o,pathMap:i,nameMap:a}}function F(t,e,n,r,o,i){var a=r.path,u=r.name,s=D(a,o),c=r.pathToRegexpOptions||{};"boolean"==typeof r.caseSensitive&&(c.sensitive=r.caseSensitive);var f={path:s,regex:U(s,c),components:r.components||{default:r.component},instances:{},name:u,parent:o,matchAs:i,redirect:r.redirect,beforeEnter:r.beforeEnter,meta:r.meta||{},props:null==r.props?{}:r.components?r.props:{default:r.props}};if(r.children&&r.children.forEach(function(r){var o=i?w(i+"/"+r.path):void 0;F(t,e,n,r,f,o)}),void 0!==r.alias){var l=Array.isArray(r.alias)?r.alias:[r.alias];l.forEach(function(i){var a={path:i,children:r.children};F(t,e,n,a,o,f.path||"/")})}e[f.path]||(t.push(f.path),e[f.path]=f),u&&(n[u]||(n[u]=f))}function U(t,e){var n=Wt(t,[],e);return n}function D(t,e){return t=t.replace(/\/$/,""),"/"===t[0]?t:null==e?t:w(e.path+"/"+t)}function V(t,e,n,r){var o="string"==typeof t?{path:t}:t;if(o.name||o._normalized)return o;if(!o.path&&o.params&&e){o=B({},o),o._normalized=!0;var i=B(B({},e.params),o.params);if(e.name)o.name=e.name,o.params=i;else if(e.matched.length){var u=e.matched[e.matched.length-1].path;o.path=N(u,i,"path "+e.path)}return o}var s=_(o.path||""),c=e&&e.path||"/",f=s.path?b(s.path,c,n||o.append):c,l=a(s.query,o.query,r&&r.options.parseQuery),p=o.hash||s.hash;return p&&"#"!==p.charAt(0)&&(p="#"+p),{_normalized:!0,path:f,query:l,hash:p}}function B(t,e){for(var n in e)t[n]=e[n];return t}function W(t,e){function n(t){R(t,s,f,l)}function r(t,n,r){var o=V(t,n,!1,e),i=o.name;if(i){var u=l[i];if(!u)return a(null,o);var c=u.regex.keys.filter(function(t){return!t.optional}).map(function(t){return t.name});if("object"!=typeof o.params&&(o.params={}),n&&"object"==typeof n.params)for(var p in n.params)!(p in o.params)&&c.indexOf(p)>-1&&(o.params[p]=n.params[p]);if(u)return o.path=N(u.path,o.params,'named route "'+i+'"'),a(u,o,r)}else if(o.path){o.params={};for(var h=0;h<s.length;h++){var d=s[h],v=f[d];if(z(v.regex,o.path,o.params))return a(v,o,r)}}return a(null,o)}function o(t,n){var o=t.redirect,i="function"==typeof o?o(c(t,n,null,e)):o;if("string"==typeof i&&(i={path:i}),!i||"object"!=typeof i)return a(null,n);var u=i,s=u.name,f=u.path,p=n.query,h=n.hash,d=n.params;if(p=u.hasOwnProperty("query")?u.query:p,h=u.hasOwnProperty("hash")?u.hash:h,d=u.hasOwnProperty("params")?u.params:d,s){l[s];return r({_normalized:!0,name:s,query:p,hash:h,params:d},void 0,n)}if(f){var v=q(f,t),g=N(v,d,'redirect route with path "'+v+'"');return r({_normalized:!0,path:g,query:p,hash:h},void 0,n)}return a(null,n)}function i(t,e,n){var o=N(n,e.params,'aliased route with path "'+n+'"'),i=r({_normalized:!0,path:o});if(i){var u=i.matched,s=u[u.length-1];return e.params=i.params,a(s,e)}return a(null,e)}function a(t,n,r){return t&&t.redirect?o(t,r||n):t&&t.matchAs?i(t,n,t.matchAs):c(t,n,r,e)}var u=R(t),s=u.pathList,f=u.pathMap,l=u.nameMap;return{match:r,addRoutes:n}}function z(t,e,n){var r=e.match(t);if(!r)return!1;if(!n)return!0;for(var o=1,i=r.length;o<i;++o){var a=t.keys[o-1],u="string"==typeof r[o]?decodeURIComponent(r[o]):r[o];a&&(n[a.name]=u)}return!0}function q(t,e){return b(t,e.parent?e.parent.path:"/",!0)}function H(){window.addEventListener("popstate",function(t){J(),t.state&&t.state.key&&rt(t.state.key)})}function G(t,e,n,r){if(t.app){var o=t.options.scrollBehavior;o&&t.app.$nextTick(function(){var t=K(),i=o(e,n,r?t:null);if(i){var a="object"==typeof i;if(a&&"string"==typeof i.selector){var u=document.querySelector(i.selector);if(u){var s=i.offset&&"object"==typeof i.offset?i.offset:{};s=Q(s),t=Y(u,s)}else Z(i)&&(t=X(i))}else a&&Z(i)&&(t=X(i));t&&window.scrollTo(t.x,t.y)}})}}function J(){var t=nt();t&&(Yt[t]={x:window.pageXOffset,y:window.pageYOffset})}function K(){var t=nt();if(t)return Yt[t]}function Y(t,e){var n=document.documentElement,r=n.getBoundingClientRect(),o=t.getBoundingClientRect();return{x:o.left-r.left-e.x,y:o.top-r.top-e.y}}function Z(t){return tt(t.x)||tt(t.y)}function X(t){return{x:tt(t.x)?t.x:window.pageXOffset,y:tt(t.y)?t.y:window.pageYOffset}}function Q(t){return{x:tt(t.x)?t.x:0,y:tt(t.y)?t.y:0}}function tt(t){return"number"==typeof t}function et(){return Xt.now().toFixed(3)}function nt(){return Qt}function rt(t){Qt=t}function ot(t,e){J();var n=window.history;try{e?n.replaceState({key:Qt},"",t):(Qt=et(),n.pushState({key:Qt},"",t))}catch(n){window.location[e?"replace":"assign"](t)}}function it(t){ot(t,!0)}function at(t,e,n){var r=function(o){o>=t.length?n():t[o]?e(t[o],function(){r(o+1)}):r(o+1)};r(0)}function ut(t){return function(e,n,r){var i=!1,a=0,u=null;st(t,function(t,e,n,s){if("function"==typeof t&&void 0===t.cid){i=!0,a++;var c,f=ft(function(e){e.__esModule&&e.default&&(e=e.default),t.resolved="function"==typeof e?e:At.extend(e),n.components[s]=e,a--,a<=0&&r()}),l=ft(function(t){var e="Failed to resolve async component "+s+": "+t;u||(u=o(t)?t:new Error(e),r(u))});try{c=t(f,l)}catch(t){l(t)}if(c)if("function"==typeof c.then)c.then(f,l);else{var p=c.component;p&&"function"==typeof p.then&&p.then(f,l)}}}),i||r()}}function st(t,e){return ct(t.map(function(t){return Object.keys(t.components).map(function(n){return e(t.components[n],t.instances[n],t,n)})}))}function ct(t){return Array.prototype.concat.apply([],t)}function ft(t){var e=!1;return function(){for(var n=[],r=arguments.length;r--;)n[r]=arguments[r];if(!e)return e=!0,t.apply(this,n)}}function lt(t){if(!t)if(Vt){var e=document.querySelector("base");t=e&&e.getAttribute("href")||"/",t=t.replace(/^https?:\/\/[^\/]+/,"")}else t="/";return"/"!==t.charAt(0)&&(t="/"+t),t.replace(/\/$/,"")}function pt(t,e){var n,r=Math.max(t.length,e.length);for(n=0;n<r&&t[n]===e[n];n++);return{updated:e.slice(0,n),activated:e.slice(n),deactivated:t.slice(n)}}function ht(t,e,n,r){var o=st(t,function(t,r,o,i){var a=dt(t,e);if(a)return Array.isArray(a)?a.map(function(t){return n(t,r,o,i)}):n(a,r,o,i)});return ct(r?o.reverse():o)}function dt(t,e){return"function"!=typeof t&&(t=At.extend(t)),t.options[e]}function vt(t){return ht(t,"beforeRouteLeave",yt,!0)}function gt(t){return ht(t,"beforeRouteUpdate",yt)}function yt(t,e){if(e)return function(){return t.apply(e,arguments)}}function mt(t,e,n){return ht(t,"beforeRouteEnter",function(t,r,o,i){return bt(t,o,i,e,n)})}function bt(t,e,n,r,o){return function(i,a,u){return t(i,a,function(t){u(t),"function"==typeof t&&r.push(function(){_t(t,e.instances,n,o)})})}}function _t(t,e,n,r){e[n]?t(e[n]):r()&&setTimeout(function(){_t(t,e,n,r)},16)}function wt(t){var e=window.location.pathname;return t&&0===e.indexOf(t)&&(e=e.slice(t.length)),(e||"/")+window.location.search+window.location.hash}function xt(t){var e=wt(t);if(!/^\/#/.test(e))return window.location.replace(w(t+"/#"+e)),!0}function Ot(){var t=St();return"/"===t.charAt(0)||(Ct("/"+t),!1)}function St(){var t=window.location.href,e=t.indexOf("#");return e===-1?"":t.slice(e+1)}function jt(t){window.location.hash=t}function Ct(t){var e=window.location.href,n=e.indexOf("#"),r=n>=0?e.slice(0,n):e;window.location.replace(r+"#"+t)}function Et(t,e){return t.push(e),function(){var n=t.indexOf(e);n>-1&&t.splice(n,1)}}function kt(t,e,n){var r="hash"===n?"#"+e:e;return t?w(t+"/"+r):r}var At,Tt={name:"router-view",functional:!0,props:{name:{type:String,default:"default"}},render:function(t,e){var n=e.props,r=e.children,o=e.parent,a=e.data;a.routerView=!0;for(var u=o.$createElement,s=n.name,c=o.$route,f=o._routerViewCache||(o._routerViewCache={}),l=0,p=!1;o&&o._routerRoot!==o;)o.$vnode&&o.$vnode.data.routerView&&l++,o._inactive&&(p=!0),o=o.$parent;if(a.routerViewDepth=l,p)return u(f[s],a,r);var h=c.matched[l];if(!h)return f[s]=null,u();var d=f[s]=h.components[s];return a.registerRouteInstance=function(t,e){var n=h.instances[s];(e&&n!==t||!e&&n===t)&&(h.instances[s]=e)},(a.hook||(a.hook={})).prepatch=function(t,e){h.instances[s]=e.componentInstance},a.props=i(c,h.props&&h.props[s]),u(d,a,r)}},$t=/[!'()*]/g,It=function(t){return"%"+t.charCodeAt(0).toString(16)},Pt=/%2C/g,Mt=function(t){return encodeURIComponent(t).replace($t,It).replace(Pt,",")},Lt=decodeURIComponent,Nt=/\/?$/,Rt=c(null,{path:"/"}),Ft=[String,Object],Ut=[String,Array],Dt={name:"router-link",props:{to:{type:Ft,required:!0},tag:{type:String,default:"a"},exact:Boolean,append:Boolean,replace:Boolean,activeClass:String,exactActiveClass:String,event:{type:Ut,default:"click"}},render:function(t){var e=this,n=this.$router,r=this.$route,o=n.resolve(this.to,r,this.append),i=o.location,a=o.route,u=o.href,s={},f=n.options.linkActiveClass,l=n.options.linkExactActiveClass,h=null==f?"router-link-active":f,v=null==l?"router-link-exact-active":l,m=null==this.activeClass?h:this.activeClass,b=null==this.exactActiveClass?v:this.exactActiveClass,_=i.path?c(null,i,null,n):a;s[b]=p(r,_),s[m]=this.exact?s[b]:d(r,_);var w=function(t){g(t)&&(e.replace?n.replace(i):n.push(i))},x={click:g};Array.isArray(this.event)?this.event.forEach(function(t){x[t]=w}):x[this.event]=w;var O={class:s};if("a"===this.tag)O.on=x,O.attrs={href:u};else{var S=y(this.$slots.default);if(S){S.isStatic=!1;var j=At.util.extend,C=S.data=j({},S.data);C.on=x;var E=S.data.attrs=j({},S.data.attrs);E.href=u}else O.on=x}return t(this.tag,O,this.$slots.default)}},Vt="undefined"!=typeof window,Bt=Array.isArray||function(t){return"[object Array]"==Object.prototype.toString.call(t)},Wt=L,zt=x,qt=O,Ht=C,Gt=M,Jt=new RegExp(["(\\\\.)","([\\/.])?(?:(?:\\:(\\w+)(?:\\(((?:\\\\.|[^\\\\()])+)\\))?|\\(((?:\\\\.|[^\\\\()])+)\\))([+*?])?|(\\*))"].join("|"),"g");Wt.parse=zt,Wt.compile=qt,Wt.tokensToFunction=Ht,Wt.tokensToRegExp=Gt;var Kt=Object.create(null),Yt=Object.create(null),Zt=Vt&&function(){var t=window.navigator.userAgent;return(t.indexOf("Android 2.")===-1&&t.indexOf("Android 4.0")===-1||t.indexOf("Mobile Safari")===-1||t.indexOf("Chrome")!==-1||t.indexOf("Windows Phone")!==-1)&&(window.history&&"pushState"in window.history)}(),Xt=Vt&&window.performance&&window.performance.now?window.performance:Date,Qt=et(),te=function(t,e){this.router=t,this.base=lt(e),this.current=Rt,this.pending=null,this.ready=!1,this.readyCbs=[],this.readyErrorCbs=[],this.errorCbs=[]};te.prototype.listen=function(t){this.cb=t},te.prototype.onReady=function(t,e){this.ready?t():(this.readyCbs.push(t),e&&this.readyErrorCbs.push(e))},te.prototype.onError=function(t){this.errorCbs.push(t)},te.prototype.transitionTo=function(t,e,n){var r=this,o=this.router.match(t,this.current);this.confirmTransition(o,function(){r.updateRoute(o),e&&e(o),r.ensureURL(),r.ready||(r.ready=!0,r.readyCbs.forEach(function(t){t(o)}))},function(t){n&&n(t),t&&!r.ready&&(r.ready=!0,r.readyErrorCbs.forEach(function(e){e(t)}))})},te.prototype.confirmTransition=function(t,e,n){var i=this,a=this.current,u=function(t){o(t)&&(i.errorCbs.length?i.errorCbs.forEach(function(e){e(t)}):(r(!1,"uncaught error during route navigation:"),console.error(t))),n&&n(t)};if(p(t,a)&&t.matched.length===a.matched.length)return this.ensureURL(),u();var s=pt(this.current.matched,t.matched),c=s.updated,f=s.deactivated,l=s.activated,h=[].concat(vt(f),this.router.beforeHooks,gt(c),l.map(function(t){return t.beforeEnter}),ut(l));this.pending=t;var d=function(e,n){if(i.pending!==t)return u();try{e(t,a,function(t){t===!1||o(t)?(i.ensureURL(!0),u(t)):"string"==typeof t||"object"==typeof t&&("string"==typeof t.path||"string"==typeof t.name)?(u(),"object"==typeof t&&t.replace?i.replace(t):i.push(t)):n(t)})}catch(t){u(t)}};at(h,d,function(){var n=[],r=function(){return i.current===t},o=mt(l,n,r),a=o.concat(i.router.resolveHooks);at(a,d,function(){return i.pending!==t?u():(i.pending=null,e(t),void(i.router.app&&i.router.app.$nextTick(function(){n.forEach(function(t){t()})})))})})},te.prototype.updateRoute=function(t){var e=this.current;this.current=t,this.cb&&this.cb(t),this.router.afterHooks.forEach(function(n){n&&n(t,e)})};var ee=function(t){function e(e,n){var r=this;t.call(this,e,n);var o=e.options.scrollBehavior;o&&H(),window.addEventListener("popstate",function(t){var n=r.current;r.transitionTo(wt(r.base),function(t){o&&G(e,t,n,!0)})})}return t&&(e.__proto__=t),e.prototype=Object.create(t&&t.prototype),e.prototype.constructor=e,e.prototype.go=function(t){window.history.go(t)},e.prototype.push=function(t,e,n){var r=this,o=this,i=o.current;this.transitionTo(t,function(t){ot(w(r.base+t.fullPath)),G(r.router,t,i,!1),e&&e(t)},n)},e.prototype.replace=function(t,e,n){var r=this,o=this,i=o.current;this.transitionTo(t,function(t){it(w(r.base+t.fullPath)),G(r.router,t,i,!1),e&&e(t)},n)},e.prototype.ensureURL=function(t){if(wt(this.base)!==this.current.fullPath){var e=w(this.base+this.current.fullPath);t?ot(e):it(e)}},e.prototype.getCurrentLocation=function(){return wt(this.base)},e}(te),ne=function(t){function e(e,n,r){t.call(this,e,n),r&&xt(this.base)||Ot()}return t&&(e.__proto__=t),e.prototype=Object.create(t&&t.prototype),e.prototype.constructor=e,e.prototype.setupListeners=function(){var t=this;window.addEventListener("hashchange",function(){Ot()&&t.transitionTo(St(),function(t){Ct(t.fullPath)})})},e.prototype.push=function(t,e,n){this.transitionTo(t,function(t){jt(t.fullPath),e&&e(t)},n)},e.prototype.replace=function(t,e,n){this.transitionTo(t,function(t){Ct(t.fullPath),e&&e(t)},n)},e.prototype.go=function(t){window.history.go(t)},e.prototype.ensureURL=function(t){var e=this.current.fullPath;St()!==e&&(t?jt(e):Ct(e))},e.prototype.getCurrentLocation=function(){return St()},e}(te),re=function(t){function e(e,n){t.call(this,e,n),this.stack=[],this.index=-1}return t&&(e.__proto__=t),e.prototype=Object.create(t&&t.prototype),e.prototype.constructor=e,e.prototype.push=function(t,e,n){var r=this;this.transitionTo(t,function(t){r.stack=r.stack.slice(0,r.index+1).concat(t),r.index++,e&&e(t)},n)},e.prototype.replace=function(t,e,n){var r=this;this.transitionTo(t,function(t){r.stack=r.stack.slice(0,r.index).concat(t),e&&e(t)},n)},e.prototype.go=function(t){var e=this,n=this.index+t;if(!(n<0||n>=this.stack.length)){var r=this.stack[n];this.confirmTransition(r,function(){e.index=n,e.updateRoute(r)})}},e.prototype.getCurrentLocation=function(){var t=this.stack[this.stack.length-1];return t?t.fullPath:"/"},e.prototype.ensureURL=function(){},e}(te),oe=function(t){void 0===t&&(t={}),this.app=null,this.apps=[],this.options=t,this.beforeHooks=[],this.resolveHooks=[],this.afterHooks=[],this.matcher=W(t.routes||[],this);var e=t.mode||"hash";switch(this.fallback="history"===e&&!Zt&&t.fallback!==!1,this.fallback&&(e="hash"),Vt||(e="abstract"),this.mode=e,e){case"history":this.history=new ee(this,t.base);break;case"hash":this.history=new ne(this,t.base,this.fallback);break;case"abstract":this.history=new re(this,t.base)}},ie={currentRoute:{}};oe.prototype.match=function(t,e,n){return this.matcher.match(t,e,n)},ie.currentRoute.get=function(){return this.history&&this.history.current},oe.prototype.init=function(t){var e=this;if(this.apps.push(t),!this.app){this.app=t;var n=this.history;if(n instanceof ee)n.transitionTo(n.getCurrentLocation());else if(n instanceof ne){var r=function(){n.setupListeners()};n.transitionTo(n.getCurrentLocation(),r,r)}n.listen(function(t){e.apps.forEach(function(e){e._route=t})})}},oe.prototype.beforeEach=function(t){return Et(this.beforeHooks,t)},oe.prototype.beforeResolve=function(t){return Et(this.resolveHooks,t)},oe.prototype.afterEach=function(t){return Et(this.afterHooks,t)},oe.prototype.onReady=function(t,e){this.history.onReady(t,e)},oe.prototype.onError=function(t){this.history.onError(t)},oe.prototype.push=function(t,e,n){this.history.push(t,e,n)},oe.prototype.replace=function(t,e,n){this.history.replace(t,e,n)},oe.prototype.go=function(t){this.history.go(t)},oe.prototype.back=function(){this.go(-1)},oe.prototype.forward=function(){this.go(1)},oe.prototype.getMatchedComponents=function(t){var e=t?t.matched?t:this.resolve(t).route:this.currentRoute;return e?[].concat.apply([],e.matched.map(function(t){return Object.keys(t.components).map(function(e){return t.components[e]})})):[]},oe.prototype.resolve=function(t,e,n){var r=V(t,e||this.history.current,n,this),o=this.match(r,e),i=o.redirectedFrom||o.fullPath,a=this.history.base,u=kt(a,i,this.mode);return{location:r,route:o,href:u,normalizedTo:r,resolved:o}},oe.prototype.addRoutes=function(t){this.matcher.addRoutes(t),this.history.current!==Rt&&this.history.transitionTo(this.history.getCurrentLocation())},Object.defineProperties(oe.prototype,ie),oe.install=m,oe.version="2.7.0",Vt&&window.Vue&&window.Vue.use(oe),e.a=oe},function(t,e,n){"use strict";e.default={name:"BeatLoader",props:{loading:{type:Boolean,default:!0},color:{type:String,default:"#5dc596"},size:{type:String,default:"15px"},margin:{type:String,default:"2px"},radius:{type:String,default:"100%"}},data:function(){return{spinnerStyle:{backgroundColor:this.color,height:this.size,width:this.size,margin:this.margin,borderRadius:this.radius}}}}},function(t,e,n){"use strict";var r=n(38),o=(n.n(r),n(383)),i=n.n(o),a=n(49),u=n.n(a),s=n(409);n.n(s),n(79);e.default={data:function(){return{sock:null,appName:"Connecting...",helpDoc:"No help, sorry...",appStatus:"",logs:[],logFilterString:"",logDisplay:!1,unseenLogs:0}},computed:{filteredLog:function(){if(""!==this.logFilterString){var t=this.logFilterString.toLowerCase();return u.a.filter(this.logs,function(e){return u.a.includes(e.levelname.toLowerCase(),t)||u.a.includes(e.msg.toLowerCase(),t)})}return this.logs},unseenLogCount:function(){return this.unseenLogs>0?this.unseenLogs:""}},methods:{sockjsSetup:u.a.throttle(function(){console.log("SockJS connecting"),this.sock=new i.a("/api/notifications/");var t=this;this.sock.onopen=function(e){console.log("Sockjs open"),t.appStatus=""},this.sock.onmessage=function(e){t.processNotification(e.data)},this.sock.onclose=function(e){console.log("SockJS closed - reconnecting."),t.appStatus="Disconnected",t.sockjsSetup()}},1e4),processNotification:function(t){var e=t;if(console.log(JSON.stringify(e)),"log"===e.type){var n=$("#log-area")[0],r=n.scrollTop>n.scrollHeight-n.clientHeight-30;this.logs.push(e.params),this.logDisplay||this.unseenLogs++,r&&$("#log-area").scrollTop(n.scrollHeight)}else"objects_change"==e.type?this.fetchObjects():"property_change"==e.type?this.$store.commit("muta_prop_change",e.params):window.eventBus.$emit(e.type,e.params)},fetchAppName:function(){var t=this;this.$http.get("api/appname").then(function(e){t.appName=e.body,document.title=t.appName},function(t){console.log(t)})},fetchHelpDoc:function(){var t=this;this.$http.get("api/help").then(function(e){t.helpDoc=e.body},function(t){console.log(t)})},fetchObjects:function(){var t=this;this.$http.get("api/objects").then(function(e){console.log("Storing the muta Objects"),t.$store.commit("set_muta_objects",e.body)},function(t){console.log(t)})},clearLogs:function(){for(var t=this.logs.length;t>0;t--)this.logs.pop()},logStyle:function(t){return"loglevel-"+t.toLowerCase()},logItem:function(t){var e=new Date(1e3*t.created),r=e.getHours()+":"+e.getMinutes()+":"+e.getSeconds()+"."+u.a.padStart(e.getMilliseconds(),3,"0");try{var o=n.i(s.vsprintf)(t.msg,t.args);return r+" ["+t.levelname+"] "+o}catch(e){if(0==t.args.length){var o=n.i(s.vsprintf)(t.msg.replace(/%/g,"%%"),t.args);return r+" ["+t.levelname+"] "+o}console.error("Could not format log message: "+e)}},toggleLogDisplay:function(){this.logDisplay||(this.unseenLogs=0),this.logDisplay=!this.logDisplay}},created:function(){this.fetchAppName(),this.fetchHelpDoc(),this.fetchObjects(),this.sockjsSetup()}}},function(t,e,n){"use strict";var r=n(112),o=n(38),i=n.n(o);i.a.use(r.a),e.default={props:["objectList","selectedObject"]}},function(t,e,n){"use strict";var r=n(412),o=n.n(r),i=n(414),a=n.n(i),u=n(38),s=n.n(u),c=n(112),f=n(49),l=n.n(f),p=n(411),h=n.n(p);s.a.use(c.a),e.default={components:{MutaObjectList:o.a,MutaPropList:a.a,BeatLoader:h.a},data:function(){return{mutaProps:[],mutaObjects:[],mutaListLoaded:!1,mutaObjectAvailable:!0,objectConnectionExists:!0}},computed:{viewedObjectId:function(){return this.$route.params.hasOwnProperty("id")?this.$route.params.id:null},objectConnectionExists:function(){return l.a.includes(this.$store.state.mutaObjectList,this.viewedObjectId)}},methods:{fetchObject:function(t){if(t){var e=this,n=this.$resource("api/objects/{id}");this.mutaListLoaded=!1,this.mutaObjectAvailable=!0,n.get({id:t}).then(function(t){e.mutaProps=t.body.props,e.mutaListLoaded=!0,e.objectConnectionExists=!0,e.$store.commit("set_muta_object",t.body)},function(t){e.mutaListLoaded=!0,e.mutaObjectAvailable=!1})}},updateRedirect:function(){null==this.viewedObjectId&&1==this.$store.getters.mutaObjectCount&&(console.log("Now we shall redirect"),this.$router.push({name:"object",params:{id:this.$store.state.mutaObjectList[0]}}))}},created:function(){var t=this;this.$store.watch(function(t){return t.mutaObjectList},function(){null==t.$store.state.selectedObjectId&&1==t.$store.getters.mutaObjectCount&&t.$router.push({name:"object",params:{id:t.$store.state.mutaObjectList[0]}})}),this.$store.commit("set_selected_object_id",this.viewedObjectId),this.fetchObject(this.viewedObjectId)},watch:{$route:function(){var t=this.viewedObjectId;t&&this.fetchObject(this.viewedObjectId),"/objects"==this.$route.path&&this.updateRedirect()}}}},function(t,e,n){"use strict";var r=n(38),o=(n.n(r),n(107)),i=n.n(o),a=n(416),u=n.n(a);e.default={components:{MutaPropValue:u.a},props:["propObject","objId"],data:function(){return{currentValue:this.propObject.value}},computed:{validId:function(){return i()(this.propObject.id).replace(/\_/g,"-")},doc:function(){return this.$store.getters.getDynamicValue(this.objId,this.propObject.doc)},htmlValue:function(){return this.$store.getters.getMutaPropValue(this.objId,this.propObject.id)}}}},function(t,e,n){"use strict";var r=n(38),o=(n.n(r),n(415)),i=n.n(o);e.default={components:{MutaPropPanel:i.a},props:["propList","objId","displayType"],computed:{propertyList:function(){return this.propByType("property")},actionList:function(){return this.propByType("action")},hierarchyList:function(){var t={};t.otherProps=[],t.otherActions=[],t.hierarchy={},console.log("Computing like stupid!");var e=!0,n=!1,r=void 0;try{for(var o,i=this.propList[Symbol.iterator]();!(e=(o=i.next()).done);e=!0){var a=o.value;if(null!=a.hierarchy)a.hierarchy in t.hierarchy?(console.log("Adding a prop"),t.hierarchy[a.hierarchy].push(a)):(console.log("Creating a panel"),t.hierarchy[a.hierarchy]=[a]);else switch(a.type){case"property":t.otherProps.push(a);break;case"action":t.otherActions.push(a)}}}catch(t){n=!0,r=t}finally{try{!e&&i.return&&i.return()}finally{if(n)throw r}}return console.log(t),t}},methods:{propByType:function(t){var e=[],n=!0,r=!1,o=void 0;try{for(var i,a=this.propList[Symbol.iterator]();!(n=(i=a.next()).done);n=!0){var u=i.value;u.type==t&&e.push(u)}}catch(t){r=!0,o=t}finally{try{!n&&a.return&&a.return()}finally{if(r)throw o}}return e}}}},function(t,e,n){"use strict";var r=n(49),o=n.n(r),i=n(107),a=n.n(i),u=n(413),s=n.n(u);e.default={components:{MutaProp:s.a},props:["propList","objId","heading"],computed:{hasContent:function(){return!o.a.isEmpty(this.propList)},collapseName:function(){return a()(this.heading)+"-collapse"}}}},function(t,e,n){"use strict";var r=n(38),o=n.n(r),i=n(49),a=n.n(i),u=n(107),s=n.n(u),c=n(112),f=n(79);n(114);o.a.use(c.a),e.default={props:["propObject","objId"],data:function(){return{labelVal:this.propObject.value,uiVal:this.propObject.value,inUserChange:!1,inObjectChange:!1,afterObjectChange:!1,inModelUpdate:!1,changeMode:null,trackedDependencies:{}}},computed:{objectVal:function(){return this.$store.getters.getMutaPropValue(this.objId,this.propObject.id)},displayVal:function(){return this.displayValue(this.val)},selectItems:function(){return n.i(f.a)(this.$store.getters.getDynamicValue(this.objId,this.propObject.select))},hasSelect:function(){return!a.a.isEmpty(this.selectItems)},max_val:function(){return this.$store.getters.getDynamicValue(this.objId,this.propObject.max_val)},min_val:function(){return this.$store.getters.getDynamicValue(this.objId,this.propObject.min_val)},step:function(){return this.$store.getters.getDynamicValue(this.objId,this.propObject.step)},read_only:function(){return this.$store.getters.getDynamicValue(this.objId,this.propObject.read_only)},isChangeLabelVisible:function(){return this.inUserChange||this.afterObjectChange},validId:function(){return s()(this.propObject.id)},labelClass:function(){var t="";return this.inUserChange&&(t="label-warning"),this.afterObjectChange&&(t="label-primary","user"!=this.changeMode&&"master"!=this.changeMode||(t="label-info")),["label","label-valchange",t]},inputClass:function(){return this.inModelUpdate?"updating-value":this.inUserChange?"unset-value":""},toggleSwitch:function(){return"BOOL"===this.propObject.value_type&&this.propObject.toggle?$("input[type='checkbox']#"+this.validId):null}},watch:{uiVal:function(t,e){this.inObjectChange?(this.inObjectChange=!1,this.afterObjectChange=!0):this.inUserChange||("BOOL"==this.propObject.value_type?this.labelVal="Updating":this.labelVal=this.displayValue(e),this.inUserChange=!0,this.afterObjectChange=!1)}},methods:{actionExecuted:function(){var t=this;this.$http.put("api/objects/"+encodeURIComponent(this.objId)+"/props/"+encodeURIComponent(this.propObject.id)+"/action").then(function(e){console.log("Action executed object:"+t.objId+" action:"+t.propObject.id)},function(t){console.error(t)})},updateToggleSwitch:function(){this.toggleSwitch&&(this.toggleSwitch.prop("checked",this.uiVal),this.toggleSwitch.data("bs.toggle").update(!0))},onUserChange:a.a.debounce(function(){var t=this;console.log("Updating object "+this.objId+" prop "+this.propObject.id+" with value "+this.val),this.inModelUpdate=!0,this.toggleSwitch&&(console.log(this.toggleSwitch.data("bs.toggle")),this.toggleSwitch.data("bs.toggle").$toggleGroup.find("label").addClass("btn-danger"));var e=this;this.$http.put("api/objects/"+encodeURIComponent(this.objId)+"/props/"+encodeURIComponent(this.propObject.id)+"?value="+encodeURIComponent(this.uiVal)).then(function(n){e.inUserChange=!1,e.afterObjectChange=!1,e.inModelUpdate=!1,t.toggleSwitch&&t.toggleSwitch.data("bs.toggle").$toggleGroup.find("label").removeClass("btn-danger"),console.log("Updated object "+t.objId+" prop "+t.propObject.id+" with value "+t.uiVal)},function(t){console.error(t)})},1e3),onSelectClick:function(){this.afterObjectChange=!1},getSelectText:function(t){var e=a.a.find(this.selectItems,["value",t]);return e?e.text:"Undefined"},displayValue:function(t){return this.toggleSwitch?this.propObject.toggle[t?"on":"off"]:this.hasSelect?this.getSelectText(t):t}},created:function(){var t=this,e=this;this.trackedDependecies={},this.trackedDependecies[this.propObject.id]="value",a.a.forOwn(this.propObject,function(t,r){n.i(f.b)(t)&&(e.trackedDependecies[t.id]=r)}),this.$store.subscribe(function(n,r){"muta_prop_change"!=n.type||n.payload.objId!=e.objId&&n.payload.objId!=e.$store.state.mutaObjects[e.objId].class_id||!a.a.has(e.trackedDependecies,n.payload.propId)||(e.changeMode=n.payload.eventSource,n.payload.propId==e.propObject.id?n.payload.value!=t.uiVal&&(e.inUserChange?(e.labelVal="Remote change to: "+e.displayValue(n.payload.value),e.afterObjectChange=!0):(e.labelVal="Remote change from "+e.displayValue(e.uiVal),e.inObjectChange=!0,e.uiVal=n.payload.value)):"read_only"!=e.trackedDependecies[n.payload.propId]&&(e.labelVal=e.trackedDependecies[n.payload.propId]+" changed",e.afterObjectChange=!0),e.updateToggleSwitch(!0))})},mounted:function(){if(this.toggleSwitch){var t=this,e=$("input[type='checkbox']#"+this.validId);e.bootstrapToggle(this.propObject.toggle),e.change(function(){t.uiVal=e.prop("checked"),t.onUserChange()})}}}},function(t,e,n){n(185),t.exports=n(26).RegExp.escape},function(t,e,n){var r=n(5),o=n(67),i=n(6)("species");t.exports=function(t){var e;return o(t)&&(e=t.constructor,"function"!=typeof e||e!==Array&&!o(e.prototype)||(e=void 0),r(e)&&(e=e[i],null===e&&(e=void 0))),void 0===e?Array:e}},function(t,e,n){"use strict";var r=n(3),o=Date.prototype.getTime,i=Date.prototype.toISOString,a=function(t){return t>9?t:"0"+t};t.exports=r(function(){return"0385-07-25T07:06:39.999Z"!=i.call(new Date(-5e13-1))})||!r(function(){i.call(new Date(NaN))})?function(){if(!isFinite(o.call(this)))throw RangeError("Invalid time value");var t=this,e=t.getUTCFullYear(),n=t.getUTCMilliseconds(),r=e<0?"-":e>9999?"+":"";return r+("00000"+Math.abs(e)).slice(r?-6:-4)+"-"+a(t.getUTCMonth()+1)+"-"+a(t.getUTCDate())+"T"+a(t.getUTCHours())+":"+a(t.getUTCMinutes())+":"+a(t.getUTCSeconds())+"."+(n>99?n:"0"+a(n))+"Z"}:i},function(t,e,n){"use strict";var r=n(1),o=n(30),i="number";t.exports=function(t){if("string"!==t&&t!==i&&"default"!==t)throw TypeError("Incorrect hint");return o(r(this),t!=i)}},function(t,e,n){var r=n(36),o=n(71),i=n(58);t.exports=function(t){var e=r(t),n=o.f;if(n)for(var a,u=n(t),s=i.f,c=0;u.length>c;)s.call(t,a=u[c++])&&e.push(a);return e}},function(t,e,n){var r=n(36),o=n(18);t.exports=function(t,e){for(var n,i=o(t),a=r(i),u=a.length,s=0;u>s;)if(i[n=a[s++]]===e)return n}},function(t,e,n){"use strict";var r=n(182),o=n(66),i=n(12);t.exports=function(){for(var t=i(this),e=arguments.length,n=Array(e),a=0,u=r._,s=!1;e>a;)(n[a]=arguments[a++])===u&&(s=!0);return function(){var r,i=this,a=arguments.length,c=0,f=0;if(!s&&!a)return o(t,n,i);if(r=n.slice(),s)for(;e>c;c++)r[c]===u&&(r[c]=arguments[f++]);for(;a>f;)r.push(arguments[f++]);return o(t,r,i)}}},function(t,e,n){t.exports=n(2)},function(t,e){t.exports=function(t,e){var n=e===Object(e)?function(t){return e[t]}:e;return function(e){return String(e).replace(t,n)}}},function(t,e){t.exports=Object.is||function(t,e){return t===e?0!==t||1/t===1/e:t!=t&&e!=e}},function(t,e,n){var r=n(0),o=n(183)(/[\\^$*+?.()|[\]{}]/g,"\\$&");
+return function(n,r){for(var o="",i=n||{},a=r||{},u=a.pretty?S:encodeURIComponent,s=0;s<t.length;s++){var c=t[s];if("string"!=typeof c){var f,l=i[c.name];if(null==l){if(c.optional){c.partial&&(o+=c.prefix);continue}throw new TypeError('Expected "'+c.name+'" to be defined')}if(Bt(l)){if(!c.repeat)throw new TypeError('Expected "'+c.name+'" to not repeat, but received `'+JSON.stringify(l)+"`");if(0===l.length){if(c.optional)continue;throw new TypeError('Expected "'+c.name+'" to not be empty')}for(var p=0;p<l.length;p++){if(f=u(l[p]),!e[s].test(f))throw new TypeError('Expected all "'+c.name+'" to match "'+c.pattern+'", but received `'+JSON.stringify(f)+"`");o+=(0===p?c.prefix:c.delimiter)+f}}else{if(f=c.asterisk?j(l):u(l),!e[s].test(f))throw new TypeError('Expected "'+c.name+'" to match "'+c.pattern+'", but received "'+f+'"');o+=c.prefix+f}}else o+=c}return o}}function E(t){return t.replace(/([.+*?=^!:${}()[\]|\/\\])/g,"\\$1")}function k(t){return t.replace(/([=!:$\/()])/g,"\\$1")}function A(t,e){return t.keys=e,t}function T(t){return t.sensitive?"":"i"}function $(t,e){var n=t.source.match(/\((?!\?)/g);if(n)for(var r=0;r<n.length;r++)e.push({name:r,prefix:null,delimiter:null,optional:!1,repeat:!1,partial:!1,asterisk:!1,pattern:null});return A(t,e)}function I(t,e,n){for(var r=[],o=0;o<t.length;o++)r.push(L(t[o],e,n).source);var i=new RegExp("(?:"+r.join("|")+")",T(n));return A(i,e)}function P(t,e,n){return M(x(t,n),e,n)}function M(t,e,n){Bt(e)||(n=e||n,e=[]),n=n||{};for(var r=n.strict,o=n.end!==!1,i="",a=0;a<t.length;a++){var u=t[a];if("string"==typeof u)i+=E(u);else{var s=E(u.prefix),c="(?:"+u.pattern+")";e.push(u),u.repeat&&(c+="(?:"+s+c+")*"),c=u.optional?u.partial?s+"("+c+")?":"(?:"+s+"("+c+"))?":s+"("+c+")",i+=c}}var f=E(n.delimiter||"/"),l=i.slice(-f.length)===f;return r||(i=(l?i.slice(0,-f.length):i)+"(?:"+f+"(?=$))?"),i+=o?"$":r&&l?"":"(?="+f+"|$)",A(new RegExp("^"+i,T(n)),e)}function L(t,e,n){return Bt(e)||(n=e||n,e=[]),n=n||{},t instanceof RegExp?$(t,e):Bt(t)?I(t,e,n):P(t,e,n)}function N(t,e,n){try{var r=Kt[t]||(Kt[t]=Wt.compile(t));return r(e||{},{pretty:!0})}catch(t){return""}}function R(t,e,n,r){var o=e||[],i=n||Object.create(null),a=r||Object.create(null);t.forEach(function(t){F(o,i,a,t)});for(var u=0,s=o.length;u<s;u++)"*"===o[u]&&(o.push(o.splice(u,1)[0]),s--,u--);return{pathList:o,pathMap:i,nameMap:a}}function F(t,e,n,r,o,i){var a=r.path,u=r.name,s=D(a,o),c=r.pathToRegexpOptions||{};"boolean"==typeof r.caseSensitive&&(c.sensitive=r.caseSensitive);var f={path:s,regex:U(s,c),components:r.components||{default:r.component},instances:{},name:u,parent:o,matchAs:i,redirect:r.redirect,beforeEnter:r.beforeEnter,meta:r.meta||{},props:null==r.props?{}:r.components?r.props:{default:r.props}};if(r.children&&r.children.forEach(function(r){var o=i?w(i+"/"+r.path):void 0;F(t,e,n,r,f,o)}),void 0!==r.alias){var l=Array.isArray(r.alias)?r.alias:[r.alias];l.forEach(function(i){var a={path:i,children:r.children};F(t,e,n,a,o,f.path||"/")})}e[f.path]||(t.push(f.path),e[f.path]=f),u&&(n[u]||(n[u]=f))}function U(t,e){var n=Wt(t,[],e);return n}function D(t,e){return t=t.replace(/\/$/,""),"/"===t[0]?t:null==e?t:w(e.path+"/"+t)}function V(t,e,n,r){var o="string"==typeof t?{path:t}:t;if(o.name||o._normalized)return o;if(!o.path&&o.params&&e){o=B({},o),o._normalized=!0;var i=B(B({},e.params),o.params);if(e.name)o.name=e.name,o.params=i;else if(e.matched.length){var u=e.matched[e.matched.length-1].path;o.path=N(u,i,"path "+e.path)}return o}var s=_(o.path||""),c=e&&e.path||"/",f=s.path?b(s.path,c,n||o.append):c,l=a(s.query,o.query,r&&r.options.parseQuery),p=o.hash||s.hash;return p&&"#"!==p.charAt(0)&&(p="#"+p),{_normalized:!0,path:f,query:l,hash:p}}function B(t,e){for(var n in e)t[n]=e[n];return t}function W(t,e){function n(t){R(t,s,f,l)}function r(t,n,r){var o=V(t,n,!1,e),i=o.name;if(i){var u=l[i];if(!u)return a(null,o);var c=u.regex.keys.filter(function(t){return!t.optional}).map(function(t){return t.name});if("object"!=typeof o.params&&(o.params={}),n&&"object"==typeof n.params)for(var p in n.params)!(p in o.params)&&c.indexOf(p)>-1&&(o.params[p]=n.params[p]);if(u)return o.path=N(u.path,o.params,'named route "'+i+'"'),a(u,o,r)}else if(o.path){o.params={};for(var h=0;h<s.length;h++){var d=s[h],v=f[d];if(z(v.regex,o.path,o.params))return a(v,o,r)}}return a(null,o)}function o(t,n){var o=t.redirect,i="function"==typeof o?o(c(t,n,null,e)):o;if("string"==typeof i&&(i={path:i}),!i||"object"!=typeof i)return a(null,n);var u=i,s=u.name,f=u.path,p=n.query,h=n.hash,d=n.params;if(p=u.hasOwnProperty("query")?u.query:p,h=u.hasOwnProperty("hash")?u.hash:h,d=u.hasOwnProperty("params")?u.params:d,s){l[s];return r({_normalized:!0,name:s,query:p,hash:h,params:d},void 0,n)}if(f){var v=q(f,t),g=N(v,d,'redirect route with path "'+v+'"');return r({_normalized:!0,path:g,query:p,hash:h},void 0,n)}return a(null,n)}function i(t,e,n){var o=N(n,e.params,'aliased route with path "'+n+'"'),i=r({_normalized:!0,path:o});if(i){var u=i.matched,s=u[u.length-1];return e.params=i.params,a(s,e)}return a(null,e)}function a(t,n,r){return t&&t.redirect?o(t,r||n):t&&t.matchAs?i(t,n,t.matchAs):c(t,n,r,e)}var u=R(t),s=u.pathList,f=u.pathMap,l=u.nameMap;return{match:r,addRoutes:n}}function z(t,e,n){var r=e.match(t);if(!r)return!1;if(!n)return!0;for(var o=1,i=r.length;o<i;++o){var a=t.keys[o-1],u="string"==typeof r[o]?decodeURIComponent(r[o]):r[o];a&&(n[a.name]=u)}return!0}function q(t,e){return b(t,e.parent?e.parent.path:"/",!0)}function H(){window.addEventListener("popstate",function(t){J(),t.state&&t.state.key&&rt(t.state.key)})}function G(t,e,n,r){if(t.app){var o=t.options.scrollBehavior;o&&t.app.$nextTick(function(){var t=K(),i=o(e,n,r?t:null);if(i){var a="object"==typeof i;if(a&&"string"==typeof i.selector){var u=document.querySelector(i.selector);if(u){var s=i.offset&&"object"==typeof i.offset?i.offset:{};s=Q(s),t=Y(u,s)}else Z(i)&&(t=X(i))}else a&&Z(i)&&(t=X(i));t&&window.scrollTo(t.x,t.y)}})}}function J(){var t=nt();t&&(Yt[t]={x:window.pageXOffset,y:window.pageYOffset})}function K(){var t=nt();if(t)return Yt[t]}function Y(t,e){var n=document.documentElement,r=n.getBoundingClientRect(),o=t.getBoundingClientRect();return{x:o.left-r.left-e.x,y:o.top-r.top-e.y}}function Z(t){return tt(t.x)||tt(t.y)}function X(t){return{x:tt(t.x)?t.x:window.pageXOffset,y:tt(t.y)?t.y:window.pageYOffset}}function Q(t){return{x:tt(t.x)?t.x:0,y:tt(t.y)?t.y:0}}function tt(t){return"number"==typeof t}function et(){return Xt.now().toFixed(3)}function nt(){return Qt}function rt(t){Qt=t}function ot(t,e){J();var n=window.history;try{e?n.replaceState({key:Qt},"",t):(Qt=et(),n.pushState({key:Qt},"",t))}catch(n){window.location[e?"replace":"assign"](t)}}function it(t){ot(t,!0)}function at(t,e,n){var r=function(o){o>=t.length?n():t[o]?e(t[o],function(){r(o+1)}):r(o+1)};r(0)}function ut(t){return function(e,n,r){var i=!1,a=0,u=null;st(t,function(t,e,n,s){if("function"==typeof t&&void 0===t.cid){i=!0,a++;var c,f=ft(function(e){e.__esModule&&e.default&&(e=e.default),t.resolved="function"==typeof e?e:At.extend(e),n.components[s]=e,a--,a<=0&&r()}),l=ft(function(t){var e="Failed to resolve async component "+s+": "+t;u||(u=o(t)?t:new Error(e),r(u))});try{c=t(f,l)}catch(t){l(t)}if(c)if("function"==typeof c.then)c.then(f,l);else{var p=c.component;p&&"function"==typeof p.then&&p.then(f,l)}}}),i||r()}}function st(t,e){return ct(t.map(function(t){return Object.keys(t.components).map(function(n){return e(t.components[n],t.instances[n],t,n)})}))}function ct(t){return Array.prototype.concat.apply([],t)}function ft(t){var e=!1;return function(){for(var n=[],r=arguments.length;r--;)n[r]=arguments[r];if(!e)return e=!0,t.apply(this,n)}}function lt(t){if(!t)if(Vt){var e=document.querySelector("base");t=e&&e.getAttribute("href")||"/",t=t.replace(/^https?:\/\/[^\/]+/,"")}else t="/";return"/"!==t.charAt(0)&&(t="/"+t),t.replace(/\/$/,"")}function pt(t,e){var n,r=Math.max(t.length,e.length);for(n=0;n<r&&t[n]===e[n];n++);return{updated:e.slice(0,n),activated:e.slice(n),deactivated:t.slice(n)}}function ht(t,e,n,r){var o=st(t,function(t,r,o,i){var a=dt(t,e);if(a)return Array.isArray(a)?a.map(function(t){return n(t,r,o,i)}):n(a,r,o,i)});return ct(r?o.reverse():o)}function dt(t,e){return"function"!=typeof t&&(t=At.extend(t)),t.options[e]}function vt(t){return ht(t,"beforeRouteLeave",yt,!0)}function gt(t){return ht(t,"beforeRouteUpdate",yt)}function yt(t,e){if(e)return function(){return t.apply(e,arguments)}}function mt(t,e,n){return ht(t,"beforeRouteEnter",function(t,r,o,i){return bt(t,o,i,e,n)})}function bt(t,e,n,r,o){return function(i,a,u){return t(i,a,function(t){u(t),"function"==typeof t&&r.push(function(){_t(t,e.instances,n,o)})})}}function _t(t,e,n,r){e[n]?t(e[n]):r()&&setTimeout(function(){_t(t,e,n,r)},16)}function wt(t){var e=window.location.pathname;return t&&0===e.indexOf(t)&&(e=e.slice(t.length)),(e||"/")+window.location.search+window.location.hash}function xt(t){var e=wt(t);if(!/^\/#/.test(e))return window.location.replace(w(t+"/#"+e)),!0}function Ot(){var t=St();return"/"===t.charAt(0)||(Ct("/"+t),!1)}function St(){var t=window.location.href,e=t.indexOf("#");return e===-1?"":t.slice(e+1)}function jt(t){window.location.hash=t}function Ct(t){var e=window.location.href,n=e.indexOf("#"),r=n>=0?e.slice(0,n):e;window.location.replace(r+"#"+t)}function Et(t,e){return t.push(e),function(){var n=t.indexOf(e);n>-1&&t.splice(n,1)}}function kt(t,e,n){var r="hash"===n?"#"+e:e;return t?w(t+"/"+r):r}var At,Tt={name:"router-view",functional:!0,props:{name:{type:String,default:"default"}},render:function(t,e){var n=e.props,r=e.children,o=e.parent,a=e.data;a.routerView=!0;for(var u=o.$createElement,s=n.name,c=o.$route,f=o._routerViewCache||(o._routerViewCache={}),l=0,p=!1;o&&o._routerRoot!==o;)o.$vnode&&o.$vnode.data.routerView&&l++,o._inactive&&(p=!0),o=o.$parent;if(a.routerViewDepth=l,p)return u(f[s],a,r);var h=c.matched[l];if(!h)return f[s]=null,u();var d=f[s]=h.components[s];return a.registerRouteInstance=function(t,e){var n=h.instances[s];(e&&n!==t||!e&&n===t)&&(h.instances[s]=e)},(a.hook||(a.hook={})).prepatch=function(t,e){h.instances[s]=e.componentInstance},a.props=i(c,h.props&&h.props[s]),u(d,a,r)}},$t=/[!'()*]/g,It=function(t){return"%"+t.charCodeAt(0).toString(16)},Pt=/%2C/g,Mt=function(t){return encodeURIComponent(t).replace($t,It).replace(Pt,",")},Lt=decodeURIComponent,Nt=/\/?$/,Rt=c(null,{path:"/"}),Ft=[String,Object],Ut=[String,Array],Dt={name:"router-link",props:{to:{type:Ft,required:!0},tag:{type:String,default:"a"},exact:Boolean,append:Boolean,replace:Boolean,activeClass:String,exactActiveClass:String,event:{type:Ut,default:"click"}},render:function(t){var e=this,n=this.$router,r=this.$route,o=n.resolve(this.to,r,this.append),i=o.location,a=o.route,u=o.href,s={},f=n.options.linkActiveClass,l=n.options.linkExactActiveClass,h=null==f?"router-link-active":f,v=null==l?"router-link-exact-active":l,m=null==this.activeClass?h:this.activeClass,b=null==this.exactActiveClass?v:this.exactActiveClass,_=i.path?c(null,i,null,n):a;s[b]=p(r,_),s[m]=this.exact?s[b]:d(r,_);var w=function(t){g(t)&&(e.replace?n.replace(i):n.push(i))},x={click:g};Array.isArray(this.event)?this.event.forEach(function(t){x[t]=w}):x[this.event]=w;var O={class:s};if("a"===this.tag)O.on=x,O.attrs={href:u};else{var S=y(this.$slots.default);if(S){S.isStatic=!1;var j=At.util.extend,C=S.data=j({},S.data);C.on=x;var E=S.data.attrs=j({},S.data.attrs);E.href=u}else O.on=x}return t(this.tag,O,this.$slots.default)}},Vt="undefined"!=typeof window,Bt=Array.isArray||function(t){return"[object Array]"==Object.prototype.toString.call(t)},Wt=L,zt=x,qt=O,Ht=C,Gt=M,Jt=new RegExp(["(\\\\.)","([\\/.])?(?:(?:\\:(\\w+)(?:\\(((?:\\\\.|[^\\\\()])+)\\))?|\\(((?:\\\\.|[^\\\\()])+)\\))([+*?])?|(\\*))"].join("|"),"g");Wt.parse=zt,Wt.compile=qt,Wt.tokensToFunction=Ht,Wt.tokensToRegExp=Gt;var Kt=Object.create(null),Yt=Object.create(null),Zt=Vt&&function(){var t=window.navigator.userAgent;return(t.indexOf("Android 2.")===-1&&t.indexOf("Android 4.0")===-1||t.indexOf("Mobile Safari")===-1||t.indexOf("Chrome")!==-1||t.indexOf("Windows Phone")!==-1)&&(window.history&&"pushState"in window.history)}(),Xt=Vt&&window.performance&&window.performance.now?window.performance:Date,Qt=et(),te=function(t,e){this.router=t,this.base=lt(e),this.current=Rt,this.pending=null,this.ready=!1,this.readyCbs=[],this.readyErrorCbs=[],this.errorCbs=[]};te.prototype.listen=function(t){this.cb=t},te.prototype.onReady=function(t,e){this.ready?t():(this.readyCbs.push(t),e&&this.readyErrorCbs.push(e))},te.prototype.onError=function(t){this.errorCbs.push(t)},te.prototype.transitionTo=function(t,e,n){var r=this,o=this.router.match(t,this.current);this.confirmTransition(o,function(){r.updateRoute(o),e&&e(o),r.ensureURL(),r.ready||(r.ready=!0,r.readyCbs.forEach(function(t){t(o)}))},function(t){n&&n(t),t&&!r.ready&&(r.ready=!0,r.readyErrorCbs.forEach(function(e){e(t)}))})},te.prototype.confirmTransition=function(t,e,n){var i=this,a=this.current,u=function(t){o(t)&&(i.errorCbs.length?i.errorCbs.forEach(function(e){e(t)}):(r(!1,"uncaught error during route navigation:"),console.error(t))),n&&n(t)};if(p(t,a)&&t.matched.length===a.matched.length)return this.ensureURL(),u();var s=pt(this.current.matched,t.matched),c=s.updated,f=s.deactivated,l=s.activated,h=[].concat(vt(f),this.router.beforeHooks,gt(c),l.map(function(t){return t.beforeEnter}),ut(l));this.pending=t;var d=function(e,n){if(i.pending!==t)return u();try{e(t,a,function(t){t===!1||o(t)?(i.ensureURL(!0),u(t)):"string"==typeof t||"object"==typeof t&&("string"==typeof t.path||"string"==typeof t.name)?(u(),"object"==typeof t&&t.replace?i.replace(t):i.push(t)):n(t)})}catch(t){u(t)}};at(h,d,function(){var n=[],r=function(){return i.current===t},o=mt(l,n,r),a=o.concat(i.router.resolveHooks);at(a,d,function(){return i.pending!==t?u():(i.pending=null,e(t),void(i.router.app&&i.router.app.$nextTick(function(){n.forEach(function(t){t()})})))})})},te.prototype.updateRoute=function(t){var e=this.current;this.current=t,this.cb&&this.cb(t),this.router.afterHooks.forEach(function(n){n&&n(t,e)})};var ee=function(t){function e(e,n){var r=this;t.call(this,e,n);var o=e.options.scrollBehavior;o&&H(),window.addEventListener("popstate",function(t){var n=r.current;r.transitionTo(wt(r.base),function(t){o&&G(e,t,n,!0)})})}return t&&(e.__proto__=t),e.prototype=Object.create(t&&t.prototype),e.prototype.constructor=e,e.prototype.go=function(t){window.history.go(t)},e.prototype.push=function(t,e,n){var r=this,o=this,i=o.current;this.transitionTo(t,function(t){ot(w(r.base+t.fullPath)),G(r.router,t,i,!1),e&&e(t)},n)},e.prototype.replace=function(t,e,n){var r=this,o=this,i=o.current;this.transitionTo(t,function(t){it(w(r.base+t.fullPath)),G(r.router,t,i,!1),e&&e(t)},n)},e.prototype.ensureURL=function(t){if(wt(this.base)!==this.current.fullPath){var e=w(this.base+this.current.fullPath);t?ot(e):it(e)}},e.prototype.getCurrentLocation=function(){return wt(this.base)},e}(te),ne=function(t){function e(e,n,r){t.call(this,e,n),r&&xt(this.base)||Ot()}return t&&(e.__proto__=t),e.prototype=Object.create(t&&t.prototype),e.prototype.constructor=e,e.prototype.setupListeners=function(){var t=this;window.addEventListener("hashchange",function(){Ot()&&t.transitionTo(St(),function(t){Ct(t.fullPath)})})},e.prototype.push=function(t,e,n){this.transitionTo(t,function(t){jt(t.fullPath),e&&e(t)},n)},e.prototype.replace=function(t,e,n){this.transitionTo(t,function(t){Ct(t.fullPath),e&&e(t)},n)},e.prototype.go=function(t){window.history.go(t)},e.prototype.ensureURL=function(t){var e=this.current.fullPath;St()!==e&&(t?jt(e):Ct(e))},e.prototype.getCurrentLocation=function(){return St()},e}(te),re=function(t){function e(e,n){t.call(this,e,n),this.stack=[],this.index=-1}return t&&(e.__proto__=t),e.prototype=Object.create(t&&t.prototype),e.prototype.constructor=e,e.prototype.push=function(t,e,n){var r=this;this.transitionTo(t,function(t){r.stack=r.stack.slice(0,r.index+1).concat(t),r.index++,e&&e(t)},n)},e.prototype.replace=function(t,e,n){var r=this;this.transitionTo(t,function(t){r.stack=r.stack.slice(0,r.index).concat(t),e&&e(t)},n)},e.prototype.go=function(t){var e=this,n=this.index+t;if(!(n<0||n>=this.stack.length)){var r=this.stack[n];this.confirmTransition(r,function(){e.index=n,e.updateRoute(r)})}},e.prototype.getCurrentLocation=function(){var t=this.stack[this.stack.length-1];return t?t.fullPath:"/"},e.prototype.ensureURL=function(){},e}(te),oe=function(t){void 0===t&&(t={}),this.app=null,this.apps=[],this.options=t,this.beforeHooks=[],this.resolveHooks=[],this.afterHooks=[],this.matcher=W(t.routes||[],this);var e=t.mode||"hash";switch(this.fallback="history"===e&&!Zt&&t.fallback!==!1,this.fallback&&(e="hash"),Vt||(e="abstract"),this.mode=e,e){case"history":this.history=new ee(this,t.base);break;case"hash":this.history=new ne(this,t.base,this.fallback);break;case"abstract":this.history=new re(this,t.base)}},ie={currentRoute:{}};oe.prototype.match=function(t,e,n){return this.matcher.match(t,e,n)},ie.currentRoute.get=function(){return this.history&&this.history.current},oe.prototype.init=function(t){var e=this;if(this.apps.push(t),!this.app){this.app=t;var n=this.history;if(n instanceof ee)n.transitionTo(n.getCurrentLocation());else if(n instanceof ne){var r=function(){n.setupListeners()};n.transitionTo(n.getCurrentLocation(),r,r)}n.listen(function(t){e.apps.forEach(function(e){e._route=t})})}},oe.prototype.beforeEach=function(t){return Et(this.beforeHooks,t)},oe.prototype.beforeResolve=function(t){return Et(this.resolveHooks,t)},oe.prototype.afterEach=function(t){return Et(this.afterHooks,t)},oe.prototype.onReady=function(t,e){this.history.onReady(t,e)},oe.prototype.onError=function(t){this.history.onError(t)},oe.prototype.push=function(t,e,n){this.history.push(t,e,n)},oe.prototype.replace=function(t,e,n){this.history.replace(t,e,n)},oe.prototype.go=function(t){this.history.go(t)},oe.prototype.back=function(){this.go(-1)},oe.prototype.forward=function(){this.go(1)},oe.prototype.getMatchedComponents=function(t){var e=t?t.matched?t:this.resolve(t).route:this.currentRoute;return e?[].concat.apply([],e.matched.map(function(t){return Object.keys(t.components).map(function(e){return t.components[e]})})):[]},oe.prototype.resolve=function(t,e,n){var r=V(t,e||this.history.current,n,this),o=this.match(r,e),i=o.redirectedFrom||o.fullPath,a=this.history.base,u=kt(a,i,this.mode);return{location:r,route:o,href:u,normalizedTo:r,resolved:o}},oe.prototype.addRoutes=function(t){this.matcher.addRoutes(t),this.history.current!==Rt&&this.history.transitionTo(this.history.getCurrentLocation())},Object.defineProperties(oe.prototype,ie),oe.install=m,oe.version="2.7.0",Vt&&window.Vue&&window.Vue.use(oe),e.a=oe},function(t,e,n){"use strict";e.default={name:"BeatLoader",props:{loading:{type:Boolean,default:!0},color:{type:String,default:"#5dc596"},size:{type:String,default:"15px"},margin:{type:String,default:"2px"},radius:{type:String,default:"100%"}},data:function(){return{spinnerStyle:{backgroundColor:this.color,height:this.size,width:this.size,margin:this.margin,borderRadius:this.radius}}}}},function(t,e,n){"use strict";var r=n(38),o=(n.n(r),n(383)),i=n.n(o),a=n(49),u=n.n(a),s=n(409);n.n(s),n(79);e.default={data:function(){return{sock:null,appName:"Connecting...",helpDoc:"No help, sorry...",appStatus:"",logs:[],logFilterString:"",logDisplay:!1,unseenLogs:0,subscription:null}},computed:{filteredLog:function(){if(""!==this.logFilterString){var t=this.logFilterString.toLowerCase();return u.a.filter(this.logs,function(e){return u.a.includes(e.levelname.toLowerCase(),t)||u.a.includes(e.msg.toLowerCase(),t)})}return this.logs},unseenLogCount:function(){return this.unseenLogs>0?this.unseenLogs:""}},methods:{sockjsSetup:u.a.throttle(function(){console.log("SockJS connecting"),this.sock=new i.a("/api/notifications/");var t=this;this.sock.onopen=function(e){console.log("Sockjs open"),t.appStatus="",t.subscription&&t.sock.send(JSON.stringify(t.subscription))},this.sock.onmessage=function(e){t.processNotification(e.data)},this.sock.onclose=function(e){console.log("SockJS closed - reconnecting."),t.appStatus="Disconnected",t.sockjsSetup()}},1e4),processNotification:function(t){var e=t;console.log(JSON.stringify(e)),"log"===e.type?this.addLogs([e.params]):"logs"===e.type?this.addLogs(e.params.records):"objects_change"==e.type?this.fetchObjects():"property_change"==e.type?this.$store.commit("muta_prop_change",e.params):"properties_change"==e.type?e.params.changes.forEach(function(t){this.$store.commit("muta_prop_change",t)},this):window.eventBus.$emit(e.type,e.params)},addLogs:function(t){var e=$("#log-area")[0],n=e&&e.scrollTop>e.scrollHeight-e.clientHeight-30;t.forEach(function(t){this.logs.push(t)},this),this.logDisplay||(this.unseenLogs+=t.length),n&&$("#log-area").scrollTop(e.scrollHeight)},fetchLogs:function(){var t=this;this.$http.get("api/logs").then(function(e){t.addLogs(e.body)},function(t){console.log(t)})},fetchAppName:function(){var t=this;this.$http.get("api/appname").then(function(e){t.appName=e.body,document.title=t.appName},function(t){console.log(t)})},fetchHelpDoc:function(){var t=this;this.$http.get("api/help").then(function(e){t.helpDoc=e.body},function(t){console.log(t)})},fetchObjects:function(){var t=this;this.$http.get("api/objects").then(function(e){console.log("Storing the muta Objects"),t.$store.commit("set_muta_objects",e.body)},function(t){console.log(t)})},clearLogs:function(){for(var t=this.logs.length;t>0;t--)this.logs.pop()},logStyle:function(t){return"loglevel-"+t.toLowerCase()},logItem:function(t){var e=new Date(1e3*t.created),r=e.getHours()+":"+e.getMinutes()+":"+e.getSeconds()+"."+u.a.padStart(e.getMilliseconds(),3,"0");try{var o=n.i(s.vsprintf)(t.msg,t.args);return r+" ["+t.levelname+"] "+o}catch(e){if(0==t.args.length){var o=n.i(s.vsprintf)(t.msg.replace(/%/g,"%%"),t.args);return r+" ["+t.levelname+"] "+o}console.error("Could not format log message: "+e)}},subscribe:function(e){this.subscription={type:"subscribe",objects:e,replace:!0},this.sock&&this.sock.readyState===i.a.OPEN&&this.sock.send(JSON.stringify(this.subscription))},resyncProp:function(e){var t=this;this.$http.get("api/objects/"+encodeURIComponent(e.objId)+"/props/"+encodeURIComponent(e.propId)+"/value").then(function(n){var r=n.headers.get("muta-version");t.$store.commit("muta_prop_change",{objId:e.objId,propId:e.propId,value:n.body,eventSource:e.eventSource,version:r?parseInt(r):void 0})},function(t){console.log(t)})},toggleLogDisplay:function(){this.logDisplay||(this.unseenLogs=0),this.logDisplay=!this.logDisplay}},created:function(){this.fetchAppName(),this.fetchHelpDoc(),this.fetchObjects(),this.fetchLogs(),this.sockjsSetup(),window.eventBus.$on("muta_prop_resync",this.resyncProp),window.eventBus.$on("muta_subscribe",this.subscribe)}}},function(t,e,n){"use strict";var r=n(112),o=n(38),i=n.n(o);i.a.use(r.a),e.default={props:["objectList","selectedObject"]}},function(t,e,n){"use strict";var r=n(412),o=n.n(r),i=n(414),a=n.n(i),u=n(38),s=n.n(u),c=n(112),f=n(49),l=n.n(f),p=n(411),h=n.n(p);s.a.use(c.a),e.default={components:{MutaObjectList:o.a,MutaPropList:a.a,BeatLoader:h.a},data:function(){return{mutaProps:[],mutaObjects:[],mutaListLoaded:!1,mutaObjectAvailable:!0,objectConnectionExists:!0}},computed:{viewedObjectId:function(){return this.$route.params.hasOwnProperty("id")?this.$route.params.id:null},objectConnectionExists:function(){return l.a.includes(this.$store.state.mutaObjectList,this.viewedObjectId)}},methods:{fetchObject:function(t){if(t){var e=this,objId=t,n=this.$resource("api/objects/{id}");this.mutaListLoaded=!1,this.mutaObjectAvailable=!0,n.get({id:t}).then(function(t){e.mutaProps=t.body.props,e.mutaListLoaded=!0,e.objectConnectionExists=!0,e.$store.commit("set_muta_object",t.body),window.eventBus.$emit("muta_subscribe",[objId,t.body.class_id])},function(t){e.mutaListLoaded=!0,e.mutaObjectAvailable=!1})}},updateRedirect:function(){null==this.viewedObjectId&&1==this.$store.getters.mutaObjectCount&&(console.log("Now we shall redirect"),this.$router.push({name:"object",params:{id:this.$store.state.mutaObjectList[0]}}))}},created:function(){var t=this;this.$store.watch(function(t){return t.mutaObjectList},function(){null==t.$store.state.selectedObjectId&&1==t.$store.getters.mutaObjectCount&&t.$router.push({name:"object",params:{id:t.$store.state.mutaObjectList[0]}})}),this.$store.commit("set_selected_object_id",this.viewedObjectId),this.fetchObject(this.viewedObjectId)},watch:{$route:function(){var t=this.viewedObjectId;t&&this.fetchObject(this.viewedObjectId),"/objects"==this.$route.path&&this.updateRedirect()}}}},function(t,e,n){"use strict";var r=n(38),o=(n.n(r),n(107)),i=n.n(o),a=n(416),u=n.n(a);e.default={components:{MutaPropValue:u.a},props:["propObject","objId"],data:function(){return{currentValue:this.propObject.value}},computed:{validId:function(){return i()(this.propObject.id).replace(/\_/g,"-")},doc:function(){return this.$store.getters.getDynamicValue(this.objId,this.propObject.doc)},htmlValue:function(){return this.$store.getters.getMutaPropValue(this.objId,this.propObject.id)}}}},function(t,e,n){"use strict";var r=n(38),o=(n.n(r),n(415)),i=n.n(o);e.default={components:{MutaPropPanel:i.a},props:["propList","objId","displayType"],computed:{propertyList:function(){return this.propByType("property")},actionList:function(){return this.propByType("action")},hierarchyList:function(){var t={};t.otherProps=[],t.otherActions=[],t.hierarchy={},console.log("Computing like stupid!");var e=!0,n=!1,r=void 0;try{for(var o,i=this.propList[Symbol.iterator]();!(e=(o=i.next()).done);e=!0){var a=o.value;if(null!=a.hierarchy)a.hierarchy in t.hierarchy?(console.log("Adding a prop"),t.hierarchy[a.hierarchy].push(a)):(console.log("Creating a panel"),t.hierarchy[a.hierarchy]=[a]);else switch(a.type){case"property":t.otherProps.push(a);break;case"action":t.otherActions.push(a)}}}catch(t){n=!0,r=t}finally{try{!e&&i.return&&i.return()}finally{if(n)throw r}}return console.log(t),t}},methods:{propByType:function(t){var e=[],n=!0,r=!1,o=void 0;try{for(var i,a=this.propList[Symbol.iterator]();!(n=(i=a.next()).done);n=!0){var u=i.value;u.type==t&&e.push(u)}}catch(t){r=!0,o=t}finally{try{!n&&a.return&&a.return()}finally{if(r)throw o}}return e}}}},function(t,e,n){"use strict";var r=n(49),o=n.n(r),i=n(107),a=n.n(i),u=n(413),s=n.n(u);e.default={components:{MutaProp:s.a},props:["propList","objId","heading"],computed:{hasContent:function(){return!o.a.isEmpty(this.propList)},collapseName:function(){return a()(this.heading)+"-collapse"}}}},function(t,e,n){"use strict";var r=n(38),o=n.n(r),i=n(49),a=n.n(i),u=n(107),s=n.n(u),c=n(112),f=n(79);n(114);o.a.use(c.a),e.default={props:["propObject","objId"],data:function(){return{labelVal:this.propObject.value,uiVal:this.propObject.value,inUserChange:!1,inObjectChange:!1,afterObjectChange:!1,inModelUpdate:!1,changeMode:null,trackedDependencies:{}}},computed:{objectVal:function(){return this.$store.getters.getMutaPropValue(this.objId,this.propObject.id)},displayVal:function(){return this.displayValue(this.val)},selectItems:function(){return n.i(f.a)(this.$store.getters.getDynamicValue(this.objId,this.propObject.select))},hasSelect:function(){return!a.a.isEmpty(this.selectItems)},max_val:function(){return this.$store.getters.getDynamicValue(this.objId,this.propObject.max_val)},min_val:function(){return this.$store.getters.getDynamicValue(this.objId,this.propObject.min_val)},step:function(){return this.$store.getters.getDynamicValue(this.objId,this.propObject.step)},read_only:function(){return this.$store.getters.getDynamicValue(this.objId,this.propObject.read_only)},isChangeLabelVisible:function(){return this.inUserChange||this.afterObjectChange},validId:function(){return s()(this.propObject.id)},labelClass:function(){var t="";return this.inUserChange&&(t="label-warning"),this.afterObjectChange&&(t="label-primary","user"!=this.changeMode&&"master"!=this.changeMode||(t="label-info")),["label","label-valchange",t]},inputClass:function(){return this.inModelUpdate?"updating-value":this.inUserChange?"unset-value":""},toggleSwitch:function(){return"BOOL"===this.propObject.value_type&&this.propObject.toggle?$("input[type='checkbox']#"+this.validId):null}},watch:{uiVal:function(t,e){this.inObjectChange?(this.inObjectChange=!1,this.afterObjectChange=!0):this.inUserChange||("BOOL"==this.propObject.value_type?this.labelVal="Updating":this.labelVal=this.displayValue(e),this.inUserChange=!0,this.afterObjectChange=!1)}},methods:{actionExecuted:function(){var t=this;this.$http.put("api/objects/"+encodeURIComponent(this.objId)+"/props/"+encodeURIComponent(this.propObject.id)+"/action").then(function(e){console.log("Action executed object:"+t.objId+" action:"+t.propObject.id)},function(t){console.error(t)})},updateToggleSwitch:function(){this.toggleSwitch&&(this.toggleSwitch.prop("checked",this.uiVal),this.toggleSwitch.data("bs.toggle").update(!0))},onUserChange:a.a.debounce(function(){var t=this;console.log("Updating object "+this.objId+" prop "+this.propObject.id+" with value "+this.val),this.inModelUpdate=!0,this.toggleSwitch&&(console.log(this.toggleSwitch.data("bs.toggle")),this.toggleSwitch.data("bs.toggle").$toggleGroup.find("label").addClass("btn-danger"));var e=this;this.$http.put("api/objects/"+encodeURIComponent(this.objId)+"/props/"+encodeURIComponent(this.propObject.id)+"?value="+encodeURIComponent(this.uiVal)).then(function(n){e.inUserChange=!1,e.afterObjectChange=!1,e.inModelUpdate=!1,t.toggleSwitch&&t.toggleSwitch.data("bs.toggle").$toggleGroup.find("label").removeClass("btn-danger"),console.log("Updated object "+t.objId+" prop "+t.propObject.id+" with value "+t.uiVal)},function(t){console.error(t)})},1e3),onSelectClick:function(){this.afterObjectChange=!1},getSelectText:function(t){var e=a.a.find(this.selectItems,["value",t]);return e?e.text:"Undefined"},displayValue:function(t){return this.toggleSwitch?this.propObject.toggle[t?"on":"off"]:this.hasSelect?this.getSelectText(t):t}},created:function(){var t=this,e=this;this.trackedDependecies={},this.trackedDependecies[this.propObject.id]="value",a.a.forOwn(this.propObject,function(t,r){n.i(f.b)(t)&&(e.trackedDependecies[t.id]=r)}),this.$store.subscribe(function(n,r){"muta_prop_change"!=n.type||n.payload.objId!=e.objId&&n.payload.objId!=e.$store.state.mutaObjects[e.objId].class_id||!a.a.has(e.trackedDependecies,n.payload.propId)||(e.changeMode=n.payload.eventSource,n.payload.propId==e.propObject.id?n.payload.value!=t.uiVal&&(e.inUserChange?(e.labelVal="Remote change to: "+e.displayValue(n.payload.value),e.afterObjectChange=!0):(e.labelVal="Remote change from "+e.displayValue(e.uiVal),e.inObjectChange=!0,e.uiVal=n.payload.value)):"read_only"!=e.trackedDependecies[n.payload.propId]&&(e.labelVal=e.trackedDependecies[n.payload.propId]+" changed",e.afterObjectChange=!0),e.updateToggleSwitch(!0))})},mounted:function(){if(this.toggleSwitch){var t=this,e=$("input[type='checkbox']#"+this.validId);e.bootstrapToggle(this.propObject.toggle),e.change(function(){t.uiVal=e.prop("checked"),t.onUserChange()})}}}},function(t,e,n){n(185),t.exports=n(26).RegExp.escape},function(t,e,n){var r=n(5),o=n(67),i=n(6)("species");t.exports=function(t){var e;return o(t)&&(e=t.constructor,"function"!=typeof e||e!==Array&&!o(e.prototype)||(e=void 0),r(e)&&(e=e[i],null===e&&(e=void 0))),void 0===e?Array:e}},function(t,e,n){"use strict";var r=n(3),o=Date.prototype.getTime,i=Date.prototype.toISOString,a=function(t){return t>9?t:"0"+t};t.exports=r(function(){return"0385-07-25T07:06:39.999Z"!=i.call(new Date(-5e13-1))})||!r(function(){i.call(new Date(NaN))})?function(){if(!isFinite(o.call(this)))throw RangeError("Invalid time value");var t=this,e=t.getUTCFullYear(),n=t.getUTCMilliseconds(),r=e<0?"-":e>9999?"+":"";return r+("00000"+Math.abs(e)).slice(r?-6:-4)+"-"+a(t.getUTCMonth()+1)+"-"+a(t.getUTCDate())+"T"+a(t.getUTCHours())+":"+a(t.getUTCMinutes())+":"+a(t.getUTCSeconds())+"."+(n>99?n:"0"+a(n))+"Z"}:i},function(t,e,n){"use strict";var r=n(1),o=n(30),i="number";t.exports=function(t){if("string"!==t&&t!==i&&"default"!==t)throw TypeError("Incorrect hint");return o(r(this),t!=i)}},function(t,e,n){var r=n(36),o=n(71),i=n(58);t.exports=function(t){var e=r(t),n=o.f;if(n)for(var a,u=n(t),s=i.f,c=0;u.length>c;)s.call(t,a=u[c++])&&e.push(a);return e}},function(t,e,n){var r=n(36),o=n(18);t.exports=function(t,e){for(var n,i=o(t),a=r(i),u=a.length,s=0;u>s;)if(i[n=a[s++]]===e)return n}},function(t,e,n){"use strict";var r=n(182),o=n(66),i=n(12);t.exports=function(){for(var t=i(this),e=arguments.length,n=Array(e),a=0,u=r._,s=!1;e>a;)(n[a]=arguments[a++])===u&&(s=!0);return function(){var r,i=this,a=arguments.length,c=0,f=0;if(!s&&!a)return o(t,n,i);if(r=n.slice(),s)for(;e>c;c++)r[c]===u&&(r[c]=arguments[f++]);for(;a>f;)r.push(arguments[f++]);return o(t,r,i)}}},function(t,e,n){t.exports=n(2)},function(t,e){t.exports=function(t,e){var n=e===Object(e)?function(t){return e[t]}:e;return function(e){return String(e).replace(t,n)}}},function(t,e){t.exports=Object.is||function(t,e){return t===e?0!==t||1/t===1/e:t!=t&&e!=e}},function(t,e,n){var r=n(0),o=n(183)(/[\\^$*+?.()|[\]{}]/g,"\\$&");
 r(r.S,"RegExp",{escape:function(t){return o(t)}})},function(t,e,n){var r=n(0);r(r.P,"Array",{copyWithin:n(116)}),n(34)("copyWithin")},function(t,e,n){"use strict";var r=n(0),o=n(25)(4);r(r.P+r.F*!n(24)([].every,!0),"Array",{every:function(t){return o(this,t,arguments[1])}})},function(t,e,n){var r=n(0);r(r.P,"Array",{fill:n(80)}),n(34)("fill")},function(t,e,n){"use strict";var r=n(0),o=n(25)(2);r(r.P+r.F*!n(24)([].filter,!0),"Array",{filter:function(t){return o(this,t,arguments[1])}})},function(t,e,n){"use strict";var r=n(0),o=n(25)(6),i="findIndex",a=!0;i in[]&&Array(1)[i](function(){a=!1}),r(r.P+r.F*a,"Array",{findIndex:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0)}}),n(34)(i)},function(t,e,n){"use strict";var r=n(0),o=n(25)(5),i="find",a=!0;i in[]&&Array(1)[i](function(){a=!1}),r(r.P+r.F*a,"Array",{find:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0)}}),n(34)(i)},function(t,e,n){"use strict";var r=n(0),o=n(25)(0),i=n(24)([].forEach,!0);r(r.P+r.F*!i,"Array",{forEach:function(t){return o(this,t,arguments[1])}})},function(t,e,n){"use strict";var r=n(23),o=n(0),i=n(11),a=n(126),u=n(88),s=n(10),c=n(82),f=n(104);o(o.S+o.F*!n(69)(function(t){Array.from(t)}),"Array",{from:function(t){var e,n,o,l,p=i(t),h="function"==typeof this?this:Array,d=arguments.length,v=d>1?arguments[1]:void 0,g=void 0!==v,y=0,m=f(p);if(g&&(v=r(v,d>2?arguments[2]:void 0,2)),void 0==m||h==Array&&u(m))for(e=s(p.length),n=new h(e);e>y;y++)c(n,y,g?v(p[y],y):p[y]);else for(l=m.call(p),n=new h;!(o=l.next()).done;y++)c(n,y,g?a(l,v,[o.value,y],!0):o.value);return n.length=y,n}})},function(t,e,n){"use strict";var r=n(0),o=n(62)(!1),i=[].indexOf,a=!!i&&1/[1].indexOf(1,-0)<0;r(r.P+r.F*(a||!n(24)(i)),"Array",{indexOf:function(t){return a?i.apply(this,arguments)||0:o(this,t,arguments[1])}})},function(t,e,n){var r=n(0);r(r.S,"Array",{isArray:n(67)})},function(t,e,n){"use strict";var r=n(0),o=n(18),i=[].join;r(r.P+r.F*(n(57)!=Object||!n(24)(i)),"Array",{join:function(t){return i.call(o(this),void 0===t?",":t)}})},function(t,e,n){"use strict";var r=n(0),o=n(18),i=n(29),a=n(10),u=[].lastIndexOf,s=!!u&&1/[1].lastIndexOf(1,-0)<0;r(r.P+r.F*(s||!n(24)(u)),"Array",{lastIndexOf:function(t){if(s)return u.apply(this,arguments)||0;var e=o(this),n=a(e.length),r=n-1;for(arguments.length>1&&(r=Math.min(r,i(arguments[1]))),r<0&&(r=n+r);r>=0;r--)if(r in e&&e[r]===t)return r||0;return-1}})},function(t,e,n){"use strict";var r=n(0),o=n(25)(1);r(r.P+r.F*!n(24)([].map,!0),"Array",{map:function(t){return o(this,t,arguments[1])}})},function(t,e,n){"use strict";var r=n(0),o=n(82);r(r.S+r.F*n(3)(function(){function t(){}return!(Array.of.call(t)instanceof t)}),"Array",{of:function(){for(var t=0,e=arguments.length,n=new("function"==typeof this?this:Array)(e);e>t;)o(n,t,arguments[t++]);return n.length=e,n}})},function(t,e,n){"use strict";var r=n(0),o=n(118);r(r.P+r.F*!n(24)([].reduceRight,!0),"Array",{reduceRight:function(t){return o(this,t,arguments.length,arguments[1],!0)}})},function(t,e,n){"use strict";var r=n(0),o=n(118);r(r.P+r.F*!n(24)([].reduce,!0),"Array",{reduce:function(t){return o(this,t,arguments.length,arguments[1],!1)}})},function(t,e,n){"use strict";var r=n(0),o=n(86),i=n(22),a=n(47),u=n(10),s=[].slice;r(r.P+r.F*n(3)(function(){o&&s.call(o)}),"Array",{slice:function(t,e){var n=u(this.length),r=i(this);if(e=void 0===e?n:e,"Array"==r)return s.call(this,t,e);for(var o=a(t,n),c=a(e,n),f=u(c-o),l=Array(f),p=0;p<f;p++)l[p]="String"==r?this.charAt(o+p):this[o+p];return l}})},function(t,e,n){"use strict";var r=n(0),o=n(25)(3);r(r.P+r.F*!n(24)([].some,!0),"Array",{some:function(t){return o(this,t,arguments[1])}})},function(t,e,n){"use strict";var r=n(0),o=n(12),i=n(11),a=n(3),u=[].sort,s=[1,2,3];r(r.P+r.F*(a(function(){s.sort(void 0)})||!a(function(){s.sort(null)})||!n(24)(u)),"Array",{sort:function(t){return void 0===t?u.call(i(this)):u.call(i(this),o(t))}})},function(t,e,n){n(46)("Array")},function(t,e,n){var r=n(0);r(r.S,"Date",{now:function(){return(new Date).getTime()}})},function(t,e,n){var r=n(0),o=n(177);r(r.P+r.F*(Date.prototype.toISOString!==o),"Date",{toISOString:o})},function(t,e,n){"use strict";var r=n(0),o=n(11),i=n(30);r(r.P+r.F*n(3)(function(){return null!==new Date(NaN).toJSON()||1!==Date.prototype.toJSON.call({toISOString:function(){return 1}})}),"Date",{toJSON:function(t){var e=o(this),n=i(e);return"number"!=typeof n||isFinite(n)?e.toISOString():null}})},function(t,e,n){var r=n(6)("toPrimitive"),o=Date.prototype;r in o||n(15)(o,r,n(178))},function(t,e,n){var r=Date.prototype,o="Invalid Date",i="toString",a=r[i],u=r.getTime;new Date(NaN)+""!=o&&n(16)(r,i,function(){var t=u.call(this);return t===t?a.call(this):o})},function(t,e,n){var r=n(0);r(r.P,"Function",{bind:n(119)})},function(t,e,n){"use strict";var r=n(5),o=n(20),i=n(6)("hasInstance"),a=Function.prototype;i in a||n(9).f(a,i,{value:function(t){if("function"!=typeof this||!r(t))return!1;if(!r(this.prototype))return t instanceof this;for(;t=o(t);)if(this.prototype===t)return!0;return!1}})},function(t,e,n){var r=n(9).f,o=Function.prototype,i=/^\s*function ([^ (]*)/,a="name";a in o||n(8)&&r(o,a,{configurable:!0,get:function(){try{return(""+this).match(i)[1]}catch(t){return""}}})},function(t,e,n){var r=n(0),o=n(129),i=Math.sqrt,a=Math.acosh;r(r.S+r.F*!(a&&710==Math.floor(a(Number.MAX_VALUE))&&a(1/0)==1/0),"Math",{acosh:function(t){return(t=+t)<1?NaN:t>94906265.62425156?Math.log(t)+Math.LN2:o(t-1+i(t-1)*i(t+1))}})},function(t,e,n){function r(t){return isFinite(t=+t)&&0!=t?t<0?-r(-t):Math.log(t+Math.sqrt(t*t+1)):t}var o=n(0),i=Math.asinh;o(o.S+o.F*!(i&&1/i(0)>0),"Math",{asinh:r})},function(t,e,n){var r=n(0),o=Math.atanh;r(r.S+r.F*!(o&&1/o(-0)<0),"Math",{atanh:function(t){return 0==(t=+t)?t:Math.log((1+t)/(1-t))/2}})},function(t,e,n){var r=n(0),o=n(92);r(r.S,"Math",{cbrt:function(t){return o(t=+t)*Math.pow(Math.abs(t),1/3)}})},function(t,e,n){var r=n(0);r(r.S,"Math",{clz32:function(t){return(t>>>=0)?31-Math.floor(Math.log(t+.5)*Math.LOG2E):32}})},function(t,e,n){var r=n(0),o=Math.exp;r(r.S,"Math",{cosh:function(t){return(o(t=+t)+o(-t))/2}})},function(t,e,n){var r=n(0),o=n(91);r(r.S+r.F*(o!=Math.expm1),"Math",{expm1:o})},function(t,e,n){var r=n(0);r(r.S,"Math",{fround:n(128)})},function(t,e,n){var r=n(0),o=Math.abs;r(r.S,"Math",{hypot:function(t,e){for(var n,r,i=0,a=0,u=arguments.length,s=0;a<u;)n=o(arguments[a++]),s<n?(r=s/n,i=i*r*r+1,s=n):n>0?(r=n/s,i+=r*r):i+=n;return s===1/0?1/0:s*Math.sqrt(i)}})},function(t,e,n){var r=n(0),o=Math.imul;r(r.S+r.F*n(3)(function(){return o(4294967295,5)!=-5||2!=o.length}),"Math",{imul:function(t,e){var n=65535,r=+t,o=+e,i=n&r,a=n&o;return 0|i*a+((n&r>>>16)*a+i*(n&o>>>16)<<16>>>0)}})},function(t,e,n){var r=n(0);r(r.S,"Math",{log10:function(t){return Math.log(t)*Math.LOG10E}})},function(t,e,n){var r=n(0);r(r.S,"Math",{log1p:n(129)})},function(t,e,n){var r=n(0);r(r.S,"Math",{log2:function(t){return Math.log(t)/Math.LN2}})},function(t,e,n){var r=n(0);r(r.S,"Math",{sign:n(92)})},function(t,e,n){var r=n(0),o=n(91),i=Math.exp;r(r.S+r.F*n(3)(function(){return!Math.sinh(-2e-17)!=-2e-17}),"Math",{sinh:function(t){return Math.abs(t=+t)<1?(o(t)-o(-t))/2:(i(t-1)-i(-t-1))*(Math.E/2)}})},function(t,e,n){var r=n(0),o=n(91),i=Math.exp;r(r.S,"Math",{tanh:function(t){var e=o(t=+t),n=o(-t);return e==1/0?1:n==1/0?-1:(e-n)/(i(t)+i(-t))}})},function(t,e,n){var r=n(0);r(r.S,"Math",{trunc:function(t){return(t>0?Math.floor:Math.ceil)(t)}})},function(t,e,n){"use strict";var r=n(2),o=n(14),i=n(22),a=n(87),u=n(30),s=n(3),c=n(43).f,f=n(19).f,l=n(9).f,p=n(52).trim,h="Number",d=r[h],v=d,g=d.prototype,y=i(n(42)(g))==h,m="trim"in String.prototype,b=function(t){var e=u(t,!1);if("string"==typeof e&&e.length>2){e=m?e.trim():p(e,3);var n,r,o,i=e.charCodeAt(0);if(43===i||45===i){if(n=e.charCodeAt(2),88===n||120===n)return NaN}else if(48===i){switch(e.charCodeAt(1)){case 66:case 98:r=2,o=49;break;case 79:case 111:r=8,o=55;break;default:return+e}for(var a,s=e.slice(2),c=0,f=s.length;c<f;c++)if(a=s.charCodeAt(c),a<48||a>o)return NaN;return parseInt(s,r)}}return+e};if(!d(" 0o1")||!d("0b1")||d("+0x1")){d=function(t){var e=arguments.length<1?0:t,n=this;return n instanceof d&&(y?s(function(){g.valueOf.call(n)}):i(n)!=h)?a(new v(b(e)),n,d):b(e)};for(var _,w=n(8)?c(v):"MAX_VALUE,MIN_VALUE,NaN,NEGATIVE_INFINITY,POSITIVE_INFINITY,EPSILON,isFinite,isInteger,isNaN,isSafeInteger,MAX_SAFE_INTEGER,MIN_SAFE_INTEGER,parseFloat,parseInt,isInteger".split(","),x=0;w.length>x;x++)o(v,_=w[x])&&!o(d,_)&&l(d,_,f(v,_));d.prototype=g,g.constructor=d,n(16)(r,h,d)}},function(t,e,n){var r=n(0);r(r.S,"Number",{EPSILON:Math.pow(2,-52)})},function(t,e,n){var r=n(0),o=n(2).isFinite;r(r.S,"Number",{isFinite:function(t){return"number"==typeof t&&o(t)}})},function(t,e,n){var r=n(0);r(r.S,"Number",{isInteger:n(125)})},function(t,e,n){var r=n(0);r(r.S,"Number",{isNaN:function(t){return t!=t}})},function(t,e,n){var r=n(0),o=n(125),i=Math.abs;r(r.S,"Number",{isSafeInteger:function(t){return o(t)&&i(t)<=9007199254740991}})},function(t,e,n){var r=n(0);r(r.S,"Number",{MAX_SAFE_INTEGER:9007199254740991})},function(t,e,n){var r=n(0);r(r.S,"Number",{MIN_SAFE_INTEGER:-9007199254740991})},function(t,e,n){var r=n(0),o=n(137);r(r.S+r.F*(Number.parseFloat!=o),"Number",{parseFloat:o})},function(t,e,n){var r=n(0),o=n(138);r(r.S+r.F*(Number.parseInt!=o),"Number",{parseInt:o})},function(t,e,n){"use strict";var r=n(0),o=n(29),i=n(115),a=n(99),u=1..toFixed,s=Math.floor,c=[0,0,0,0,0,0],f="Number.toFixed: incorrect invocation!",l="0",p=function(t,e){for(var n=-1,r=e;++n<6;)r+=t*c[n],c[n]=r%1e7,r=s(r/1e7)},h=function(t){for(var e=6,n=0;--e>=0;)n+=c[e],c[e]=s(n/t),n=n%t*1e7},d=function(){for(var t=6,e="";--t>=0;)if(""!==e||0===t||0!==c[t]){var n=String(c[t]);e=""===e?n:e+a.call(l,7-n.length)+n}return e},v=function(t,e,n){return 0===e?n:e%2===1?v(t,e-1,n*t):v(t*t,e/2,n)},g=function(t){for(var e=0,n=t;n>=4096;)e+=12,n/=4096;for(;n>=2;)e+=1,n/=2;return e};r(r.P+r.F*(!!u&&("0.000"!==8e-5.toFixed(3)||"1"!==.9.toFixed(0)||"1.25"!==1.255.toFixed(2)||"1000000000000000128"!==(0xde0b6b3a7640080).toFixed(0))||!n(3)(function(){u.call({})})),"Number",{toFixed:function(t){var e,n,r,u,s=i(this,f),c=o(t),y="",m=l;if(c<0||c>20)throw RangeError(f);if(s!=s)return"NaN";if(s<=-1e21||s>=1e21)return String(s);if(s<0&&(y="-",s=-s),s>1e-21)if(e=g(s*v(2,69,1))-69,n=e<0?s*v(2,-e,1):s/v(2,e,1),n*=4503599627370496,e=52-e,e>0){for(p(0,n),r=c;r>=7;)p(1e7,0),r-=7;for(p(v(10,r,1),0),r=e-1;r>=23;)h(1<<23),r-=23;h(1<<r),p(1,1),h(2),m=d()}else p(0,n),p(1<<-e,0),m=d()+a.call(l,c);return c>0?(u=m.length,m=y+(u<=c?"0."+a.call(l,c-u)+m:m.slice(0,u-c)+"."+m.slice(u-c))):m=y+m,m}})},function(t,e,n){"use strict";var r=n(0),o=n(3),i=n(115),a=1..toPrecision;r(r.P+r.F*(o(function(){return"1"!==a.call(1,void 0)})||!o(function(){a.call({})})),"Number",{toPrecision:function(t){var e=i(this,"Number#toPrecision: incorrect invocation!");return void 0===t?a.call(e):a.call(e,t)}})},function(t,e,n){var r=n(0);r(r.S+r.F,"Object",{assign:n(131)})},function(t,e,n){var r=n(0);r(r.S,"Object",{create:n(42)})},function(t,e,n){var r=n(0);r(r.S+r.F*!n(8),"Object",{defineProperties:n(132)})},function(t,e,n){var r=n(0);r(r.S+r.F*!n(8),"Object",{defineProperty:n(9).f})},function(t,e,n){var r=n(5),o=n(35).onFreeze;n(28)("freeze",function(t){return function(e){return t&&r(e)?t(o(e)):e}})},function(t,e,n){var r=n(18),o=n(19).f;n(28)("getOwnPropertyDescriptor",function(){return function(t,e){return o(r(t),e)}})},function(t,e,n){n(28)("getOwnPropertyNames",function(){return n(133).f})},function(t,e,n){var r=n(11),o=n(20);n(28)("getPrototypeOf",function(){return function(t){return o(r(t))}})},function(t,e,n){var r=n(5);n(28)("isExtensible",function(t){return function(e){return!!r(e)&&(!t||t(e))}})},function(t,e,n){var r=n(5);n(28)("isFrozen",function(t){return function(e){return!r(e)||!!t&&t(e)}})},function(t,e,n){var r=n(5);n(28)("isSealed",function(t){return function(e){return!r(e)||!!t&&t(e)}})},function(t,e,n){var r=n(0);r(r.S,"Object",{is:n(184)})},function(t,e,n){var r=n(11),o=n(36);n(28)("keys",function(){return function(t){return o(r(t))}})},function(t,e,n){var r=n(5),o=n(35).onFreeze;n(28)("preventExtensions",function(t){return function(e){return t&&r(e)?t(o(e)):e}})},function(t,e,n){var r=n(5),o=n(35).onFreeze;n(28)("seal",function(t){return function(e){return t&&r(e)?t(o(e)):e}})},function(t,e,n){var r=n(0);r(r.S,"Object",{setPrototypeOf:n(95).set})},function(t,e,n){"use strict";var r=n(56),o={};o[n(6)("toStringTag")]="z",o+""!="[object z]"&&n(16)(Object.prototype,"toString",function(){return"[object "+r(this)+"]"},!0)},function(t,e,n){var r=n(0),o=n(137);r(r.G+r.F*(parseFloat!=o),{parseFloat:o})},function(t,e,n){var r=n(0),o=n(138);r(r.G+r.F*(parseInt!=o),{parseInt:o})},function(t,e,n){"use strict";var r,o,i,a,u=n(41),s=n(2),c=n(23),f=n(56),l=n(0),p=n(5),h=n(12),d=n(39),v=n(40),g=n(75),y=n(101).set,m=n(93)(),b=n(94),_=n(139),w=n(140),x="Promise",O=s.TypeError,S=s.process,j=s[x],C="process"==f(S),E=function(){},k=o=b.f,A=!!function(){try{var t=j.resolve(1),e=(t.constructor={})[n(6)("species")]=function(t){t(E,E)};return(C||"function"==typeof PromiseRejectionEvent)&&t.then(E)instanceof e}catch(t){}}(),T=u?function(t,e){return t===e||t===j&&e===a}:function(t,e){return t===e},$=function(t){var e;return!(!p(t)||"function"!=typeof(e=t.then))&&e},I=function(t,e){if(!t._n){t._n=!0;var n=t._c;m(function(){for(var r=t._v,o=1==t._s,i=0,a=function(e){var n,i,a=o?e.ok:e.fail,u=e.resolve,s=e.reject,c=e.domain;try{a?(o||(2==t._h&&L(t),t._h=1),a===!0?n=r:(c&&c.enter(),n=a(r),c&&c.exit()),n===e.promise?s(O("Promise-chain cycle")):(i=$(n))?i.call(n,u,s):u(n)):s(r)}catch(t){s(t)}};n.length>i;)a(n[i++]);t._c=[],t._n=!1,e&&!t._h&&P(t)})}},P=function(t){y.call(s,function(){var e,n,r,o=t._v,i=M(t);if(i&&(e=_(function(){C?S.emit("unhandledRejection",o,t):(n=s.onunhandledrejection)?n({promise:t,reason:o}):(r=s.console)&&r.error&&r.error("Unhandled promise rejection",o)}),t._h=C||M(t)?2:1),t._a=void 0,i&&e.e)throw e.v})},M=function(t){if(1==t._h)return!1;for(var e,n=t._a||t._c,r=0;n.length>r;)if(e=n[r++],e.fail||!M(e.promise))return!1;return!0},L=function(t){y.call(s,function(){var e;C?S.emit("rejectionHandled",t):(e=s.onrejectionhandled)&&e({promise:t,reason:t._v})})},N=function(t){var e=this;e._d||(e._d=!0,e=e._w||e,e._v=t,e._s=2,e._a||(e._a=e._c.slice()),I(e,!0))},R=function(t){var e,n=this;if(!n._d){n._d=!0,n=n._w||n;try{if(n===t)throw O("Promise can't be resolved itself");(e=$(t))?m(function(){var r={_w:n,_d:!1};try{e.call(t,c(R,r,1),c(N,r,1))}catch(t){N.call(r,t)}}):(n._v=t,n._s=1,I(n,!1))}catch(t){N.call({_w:n,_d:!1},t)}}};A||(j=function(t){d(this,j,x,"_h"),h(t),r.call(this);try{t(c(R,this,1),c(N,this,1))}catch(t){N.call(this,t)}},r=function(t){this._c=[],this._a=void 0,this._s=0,this._d=!1,this._v=void 0,this._h=0,this._n=!1},r.prototype=n(45)(j.prototype,{then:function(t,e){var n=k(g(this,j));return n.ok="function"!=typeof t||t,n.fail="function"==typeof e&&e,n.domain=C?S.domain:void 0,this._c.push(n),this._a&&this._a.push(n),this._s&&I(this,!1),n.promise},catch:function(t){return this.then(void 0,t)}}),i=function(){var t=new r;this.promise=t,this.resolve=c(R,t,1),this.reject=c(N,t,1)},b.f=k=function(t){return T(j,t)?new i(t):o(t)}),l(l.G+l.W+l.F*!A,{Promise:j}),n(51)(j,x),n(46)(x),a=n(26)[x],l(l.S+l.F*!A,x,{reject:function(t){var e=k(this),n=e.reject;return n(t),e.promise}}),l(l.S+l.F*(u||!A),x,{resolve:function(t){return t instanceof j&&T(t.constructor,this)?t:w(this,t)}}),l(l.S+l.F*!(A&&n(69)(function(t){j.all(t).catch(E)})),x,{all:function(t){var e=this,n=k(e),r=n.resolve,o=n.reject,i=_(function(){var n=[],i=0,a=1;v(t,!1,function(t){var u=i++,s=!1;n.push(void 0),a++,e.resolve(t).then(function(t){s||(s=!0,n[u]=t,--a||r(n))},o)}),--a||r(n)});return i.e&&o(i.v),n.promise},race:function(t){var e=this,n=k(e),r=n.reject,o=_(function(){v(t,!1,function(t){e.resolve(t).then(n.resolve,r)})});return o.e&&r(o.v),n.promise}})},function(t,e,n){var r=n(0),o=n(12),i=n(1),a=(n(2).Reflect||{}).apply,u=Function.apply;r(r.S+r.F*!n(3)(function(){a(function(){})}),"Reflect",{apply:function(t,e,n){var r=o(t),s=i(n);return a?a(r,e,s):u.call(r,e,s)}})},function(t,e,n){var r=n(0),o=n(42),i=n(12),a=n(1),u=n(5),s=n(3),c=n(119),f=(n(2).Reflect||{}).construct,l=s(function(){function t(){}return!(f(function(){},[],t)instanceof t)}),p=!s(function(){f(function(){})});r(r.S+r.F*(l||p),"Reflect",{construct:function(t,e){i(t),a(e);var n=arguments.length<3?t:i(arguments[2]);if(p&&!l)return f(t,e,n);if(t==n){switch(e.length){case 0:return new t;case 1:return new t(e[0]);case 2:return new t(e[0],e[1]);case 3:return new t(e[0],e[1],e[2]);case 4:return new t(e[0],e[1],e[2],e[3])}var r=[null];return r.push.apply(r,e),new(c.apply(t,r))}var s=n.prototype,h=o(u(s)?s:Object.prototype),d=Function.apply.call(t,h,e);return u(d)?d:h}})},function(t,e,n){var r=n(9),o=n(0),i=n(1),a=n(30);o(o.S+o.F*n(3)(function(){Reflect.defineProperty(r.f({},1,{value:1}),1,{value:2})}),"Reflect",{defineProperty:function(t,e,n){i(t),e=a(e,!0),i(n);try{return r.f(t,e,n),!0}catch(t){return!1}}})},function(t,e,n){var r=n(0),o=n(19).f,i=n(1);r(r.S,"Reflect",{deleteProperty:function(t,e){var n=o(i(t),e);return!(n&&!n.configurable)&&delete t[e]}})},function(t,e,n){"use strict";var r=n(0),o=n(1),i=function(t){this._t=o(t),this._i=0;var e,n=this._k=[];for(e in t)n.push(e)};n(89)(i,"Object",function(){var t,e=this,n=e._k;do if(e._i>=n.length)return{value:void 0,done:!0};while(!((t=n[e._i++])in e._t));return{value:t,done:!1}}),r(r.S,"Reflect",{enumerate:function(t){return new i(t)}})},function(t,e,n){var r=n(19),o=n(0),i=n(1);o(o.S,"Reflect",{getOwnPropertyDescriptor:function(t,e){return r.f(i(t),e)}})},function(t,e,n){var r=n(0),o=n(20),i=n(1);r(r.S,"Reflect",{getPrototypeOf:function(t){return o(i(t))}})},function(t,e,n){function r(t,e){var n,u,f=arguments.length<3?t:arguments[2];return c(t)===f?t[e]:(n=o.f(t,e))?a(n,"value")?n.value:void 0!==n.get?n.get.call(f):void 0:s(u=i(t))?r(u,e,f):void 0}var o=n(19),i=n(20),a=n(14),u=n(0),s=n(5),c=n(1);u(u.S,"Reflect",{get:r})},function(t,e,n){var r=n(0);r(r.S,"Reflect",{has:function(t,e){return e in t}})},function(t,e,n){var r=n(0),o=n(1),i=Object.isExtensible;r(r.S,"Reflect",{isExtensible:function(t){return o(t),!i||i(t)}})},function(t,e,n){var r=n(0);r(r.S,"Reflect",{ownKeys:n(136)})},function(t,e,n){var r=n(0),o=n(1),i=Object.preventExtensions;r(r.S,"Reflect",{preventExtensions:function(t){o(t);try{return i&&i(t),!0}catch(t){return!1}}})},function(t,e,n){var r=n(0),o=n(95);o&&r(r.S,"Reflect",{setPrototypeOf:function(t,e){o.check(t,e);try{return o.set(t,e),!0}catch(t){return!1}}})},function(t,e,n){function r(t,e,n){var s,p,h=arguments.length<4?t:arguments[3],d=i.f(f(t),e);if(!d){if(l(p=a(t)))return r(p,e,n,h);d=c(0)}return u(d,"value")?!(d.writable===!1||!l(h))&&(s=i.f(h,e)||c(0),s.value=n,o.f(h,e,s),!0):void 0!==d.set&&(d.set.call(h,n),!0)}var o=n(9),i=n(19),a=n(20),u=n(14),s=n(0),c=n(44),f=n(1),l=n(5);s(s.S,"Reflect",{set:r})},function(t,e,n){var r=n(2),o=n(87),i=n(9).f,a=n(43).f,u=n(68),s=n(65),c=r.RegExp,f=c,l=c.prototype,p=/a/g,h=/a/g,d=new c(p)!==p;if(n(8)&&(!d||n(3)(function(){return h[n(6)("match")]=!1,c(p)!=p||c(h)==h||"/a/i"!=c(p,"i")}))){c=function(t,e){var n=this instanceof c,r=u(t),i=void 0===e;return!n&&r&&t.constructor===c&&i?t:o(d?new f(r&&!i?t.source:t,e):f((r=t instanceof c)?t.source:t,r&&i?s.call(t):e),n?this:l,c)};for(var v=(function(t){t in c||i(c,t,{configurable:!0,get:function(){return f[t]},set:function(e){f[t]=e}})}),g=a(f),y=0;g.length>y;)v(g[y++]);l.constructor=c,c.prototype=l,n(16)(r,"RegExp",c)}n(46)("RegExp")},function(t,e,n){n(64)("match",1,function(t,e,n){return[function(n){"use strict";var r=t(this),o=void 0==n?void 0:n[e];return void 0!==o?o.call(n,r):new RegExp(n)[e](String(r))},n]})},function(t,e,n){n(64)("replace",2,function(t,e,n){return[function(r,o){"use strict";var i=t(this),a=void 0==r?void 0:r[e];return void 0!==a?a.call(r,i,o):n.call(String(i),r,o)},n]})},function(t,e,n){n(64)("search",1,function(t,e,n){return[function(n){"use strict";var r=t(this),o=void 0==n?void 0:n[e];return void 0!==o?o.call(n,r):new RegExp(n)[e](String(r))},n]})},function(t,e,n){n(64)("split",2,function(t,e,r){"use strict";var o=n(68),i=r,a=[].push,u="split",s="length",c="lastIndex";if("c"=="abbc"[u](/(b)*/)[1]||4!="test"[u](/(?:)/,-1)[s]||2!="ab"[u](/(?:ab)*/)[s]||4!="."[u](/(.?)(.?)/)[s]||"."[u](/()()/)[s]>1||""[u](/.?/)[s]){var f=void 0===/()??/.exec("")[1];r=function(t,e){var n=String(this);if(void 0===t&&0===e)return[];if(!o(t))return i.call(n,t,e);var r,u,l,p,h,d=[],v=(t.ignoreCase?"i":"")+(t.multiline?"m":"")+(t.unicode?"u":"")+(t.sticky?"y":""),g=0,y=void 0===e?4294967295:e>>>0,m=new RegExp(t.source,v+"g");for(f||(r=new RegExp("^"+m.source+"$(?!\\s)",v));(u=m.exec(n))&&(l=u.index+u[0][s],!(l>g&&(d.push(n.slice(g,u.index)),!f&&u[s]>1&&u[0].replace(r,function(){for(h=1;h<arguments[s]-2;h++)void 0===arguments[h]&&(u[h]=void 0)}),u[s]>1&&u.index<n[s]&&a.apply(d,u.slice(1)),p=u[0][s],g=l,d[s]>=y)));)m[c]===u.index&&m[c]++;return g===n[s]?!p&&m.test("")||d.push(""):d.push(n.slice(g)),d[s]>y?d.slice(0,y):d}}else"0"[u](void 0,0)[s]&&(r=function(t,e){return void 0===t&&0===e?[]:i.call(this,t,e)});return[function(n,o){var i=t(this),a=void 0==n?void 0:n[e];return void 0!==a?a.call(n,i,o):r.call(String(i),n,o)},r]})},function(t,e,n){"use strict";n(145);var r=n(1),o=n(65),i=n(8),a="toString",u=/./[a],s=function(t){n(16)(RegExp.prototype,a,t,!0)};n(3)(function(){return"/a/b"!=u.call({source:"a",flags:"b"})})?s(function(){var t=r(this);return"/".concat(t.source,"/","flags"in t?t.flags:!i&&t instanceof RegExp?o.call(t):void 0)}):u.name!=a&&s(function(){return u.call(this)})},function(t,e,n){"use strict";n(17)("anchor",function(t){return function(e){return t(this,"a","name",e)}})},function(t,e,n){"use strict";n(17)("big",function(t){return function(){return t(this,"big","","")}})},function(t,e,n){"use strict";n(17)("blink",function(t){return function(){return t(this,"blink","","")}})},function(t,e,n){"use strict";n(17)("bold",function(t){return function(){return t(this,"b","","")}})},function(t,e,n){"use strict";var r=n(0),o=n(97)(!1);r(r.P,"String",{codePointAt:function(t){return o(this,t)}})},function(t,e,n){"use strict";var r=n(0),o=n(10),i=n(98),a="endsWith",u=""[a];r(r.P+r.F*n(85)(a),"String",{endsWith:function(t){var e=i(this,t,a),n=arguments.length>1?arguments[1]:void 0,r=o(e.length),s=void 0===n?r:Math.min(o(n),r),c=String(t);return u?u.call(e,c,s):e.slice(s-c.length,s)===c}})},function(t,e,n){"use strict";n(17)("fixed",function(t){return function(){return t(this,"tt","","")}})},function(t,e,n){"use strict";n(17)("fontcolor",function(t){return function(e){return t(this,"font","color",e)}})},function(t,e,n){"use strict";n(17)("fontsize",function(t){return function(e){return t(this,"font","size",e)}})},function(t,e,n){var r=n(0),o=n(47),i=String.fromCharCode,a=String.fromCodePoint;r(r.S+r.F*(!!a&&1!=a.length),"String",{fromCodePoint:function(t){for(var e,n=[],r=arguments.length,a=0;r>a;){if(e=+arguments[a++],o(e,1114111)!==e)throw RangeError(e+" is not a valid code point");n.push(e<65536?i(e):i(((e-=65536)>>10)+55296,e%1024+56320))}return n.join("")}})},function(t,e,n){"use strict";var r=n(0),o=n(98),i="includes";r(r.P+r.F*n(85)(i),"String",{includes:function(t){return!!~o(this,t,i).indexOf(t,arguments.length>1?arguments[1]:void 0)}})},function(t,e,n){"use strict";n(17)("italics",function(t){return function(){return t(this,"i","","")}})},function(t,e,n){"use strict";var r=n(97)(!0);n(90)(String,"String",function(t){this._t=String(t),this._i=0},function(){var t,e=this._t,n=this._i;return n>=e.length?{value:void 0,done:!0}:(t=r(e,n),this._i+=t.length,{value:t,done:!1})})},function(t,e,n){"use strict";n(17)("link",function(t){return function(e){return t(this,"a","href",e)}})},function(t,e,n){var r=n(0),o=n(18),i=n(10);r(r.S,"String",{raw:function(t){for(var e=o(t.raw),n=i(e.length),r=arguments.length,a=[],u=0;n>u;)a.push(String(e[u++])),u<r&&a.push(String(arguments[u]));return a.join("")}})},function(t,e,n){var r=n(0);r(r.P,"String",{repeat:n(99)})},function(t,e,n){"use strict";n(17)("small",function(t){return function(){return t(this,"small","","")}})},function(t,e,n){"use strict";var r=n(0),o=n(10),i=n(98),a="startsWith",u=""[a];r(r.P+r.F*n(85)(a),"String",{startsWith:function(t){var e=i(this,t,a),n=o(Math.min(arguments.length>1?arguments[1]:void 0,e.length)),r=String(t);return u?u.call(e,r,n):e.slice(n,n+r.length)===r}})},function(t,e,n){"use strict";n(17)("strike",function(t){return function(){return t(this,"strike","","")}})},function(t,e,n){"use strict";n(17)("sub",function(t){return function(){return t(this,"sub","","")}})},function(t,e,n){"use strict";n(17)("sup",function(t){return function(){return t(this,"sup","","")}})},function(t,e,n){"use strict";n(52)("trim",function(t){return function(){return t(this,3)}})},function(t,e,n){"use strict";var r=n(2),o=n(14),i=n(8),a=n(0),u=n(16),s=n(35).KEY,c=n(3),f=n(74),l=n(51),p=n(48),h=n(6),d=n(143),v=n(103),g=n(180),y=n(179),m=n(67),b=n(1),_=n(18),w=n(30),x=n(44),O=n(42),S=n(133),j=n(19),C=n(9),E=n(36),k=j.f,A=C.f,T=S.f,$=r.Symbol,I=r.JSON,P=I&&I.stringify,M="prototype",L=h("_hidden"),N=h("toPrimitive"),R={}.propertyIsEnumerable,F=f("symbol-registry"),U=f("symbols"),D=f("op-symbols"),V=Object[M],B="function"==typeof $,W=r.QObject,z=!W||!W[M]||!W[M].findChild,q=i&&c(function(){return 7!=O(A({},"a",{get:function(){return A(this,"a",{value:7}).a}})).a})?function(t,e,n){var r=k(V,e);r&&delete V[e],A(t,e,n),r&&t!==V&&A(V,e,r)}:A,H=function(t){var e=U[t]=O($[M]);return e._k=t,e},G=B&&"symbol"==typeof $.iterator?function(t){return"symbol"==typeof t}:function(t){return t instanceof $},J=function(t,e,n){return t===V&&J(D,e,n),b(t),e=w(e,!0),b(n),o(U,e)?(n.enumerable?(o(t,L)&&t[L][e]&&(t[L][e]=!1),n=O(n,{enumerable:x(0,!1)})):(o(t,L)||A(t,L,x(1,{})),t[L][e]=!0),q(t,e,n)):A(t,e,n)},K=function(t,e){b(t);for(var n,r=y(e=_(e)),o=0,i=r.length;i>o;)J(t,n=r[o++],e[n]);return t},Y=function(t,e){return void 0===e?O(t):K(O(t),e)},Z=function(t){var e=R.call(this,t=w(t,!0));return!(this===V&&o(U,t)&&!o(D,t))&&(!(e||!o(this,t)||!o(U,t)||o(this,L)&&this[L][t])||e)},X=function(t,e){if(t=_(t),e=w(e,!0),t!==V||!o(U,e)||o(D,e)){var n=k(t,e);return!n||!o(U,e)||o(t,L)&&t[L][e]||(n.enumerable=!0),n}},Q=function(t){for(var e,n=T(_(t)),r=[],i=0;n.length>i;)o(U,e=n[i++])||e==L||e==s||r.push(e);return r},tt=function(t){for(var e,n=t===V,r=T(n?D:_(t)),i=[],a=0;r.length>a;)!o(U,e=r[a++])||n&&!o(V,e)||i.push(U[e]);return i};B||($=function(){if(this instanceof $)throw TypeError("Symbol is not a constructor!");var t=p(arguments.length>0?arguments[0]:void 0),e=function(n){this===V&&e.call(D,n),o(this,L)&&o(this[L],t)&&(this[L][t]=!1),q(this,t,x(1,n))};return i&&z&&q(V,t,{configurable:!0,set:e}),H(t)},u($[M],"toString",function(){return this._k}),j.f=X,C.f=J,n(43).f=S.f=Q,n(58).f=Z,n(71).f=tt,i&&!n(41)&&u(V,"propertyIsEnumerable",Z,!0),d.f=function(t){return H(h(t))}),a(a.G+a.W+a.F*!B,{Symbol:$});for(var et="hasInstance,isConcatSpreadable,iterator,match,replace,search,species,split,toPrimitive,toStringTag,unscopables".split(","),nt=0;et.length>nt;)h(et[nt++]);for(var rt=E(h.store),ot=0;rt.length>ot;)v(rt[ot++]);a(a.S+a.F*!B,"Symbol",{for:function(t){return o(F,t+="")?F[t]:F[t]=$(t)},keyFor:function(t){if(G(t))return g(F,t);throw TypeError(t+" is not a symbol!")},useSetter:function(){z=!0},useSimple:function(){z=!1}}),a(a.S+a.F*!B,"Object",{create:Y,defineProperty:J,defineProperties:K,getOwnPropertyDescriptor:X,getOwnPropertyNames:Q,getOwnPropertySymbols:tt}),I&&a(a.S+a.F*(!B||c(function(){var t=$();return"[null]"!=P([t])||"{}"!=P({a:t})||"{}"!=P(Object(t))})),"JSON",{stringify:function(t){if(void 0!==t&&!G(t)){for(var e,n,r=[t],o=1;arguments.length>o;)r.push(arguments[o++]);return e=r[1],"function"==typeof e&&(n=e),!n&&m(e)||(e=function(t,e){if(n&&(e=n.call(this,t,e)),!G(e))return e}),r[1]=e,P.apply(I,r)}}}),$[M][N]||n(15)($[M],N,$[M].valueOf),l($,"Symbol"),l(Math,"Math",!0),l(r.JSON,"JSON",!0)},function(t,e,n){"use strict";var r=n(0),o=n(76),i=n(102),a=n(1),u=n(47),s=n(10),c=n(5),f=n(2).ArrayBuffer,l=n(75),p=i.ArrayBuffer,h=i.DataView,d=o.ABV&&f.isView,v=p.prototype.slice,g=o.VIEW,y="ArrayBuffer";r(r.G+r.W+r.F*(f!==p),{ArrayBuffer:p}),r(r.S+r.F*!o.CONSTR,y,{isView:function(t){return d&&d(t)||c(t)&&g in t}}),r(r.P+r.U+r.F*n(3)(function(){return!new p(2).slice(1,void 0).byteLength}),y,{slice:function(t,e){if(void 0!==v&&void 0===e)return v.call(a(this),t);for(var n=a(this).byteLength,r=u(t,n),o=u(void 0===e?n:e,n),i=new(l(this,p))(s(o-r)),c=new h(this),f=new h(i),d=0;r<o;)f.setUint8(d++,c.getUint8(r++));return i}}),n(46)(y)},function(t,e,n){var r=n(0);r(r.G+r.W+r.F*!n(76).ABV,{DataView:n(102).DataView})},function(t,e,n){n(32)("Float32",4,function(t){return function(e,n,r){return t(this,e,n,r)}})},function(t,e,n){n(32)("Float64",8,function(t){return function(e,n,r){return t(this,e,n,r)}})},function(t,e,n){n(32)("Int16",2,function(t){return function(e,n,r){return t(this,e,n,r)}})},function(t,e,n){n(32)("Int32",4,function(t){return function(e,n,r){return t(this,e,n,r)}})},function(t,e,n){n(32)("Int8",1,function(t){return function(e,n,r){return t(this,e,n,r)}})},function(t,e,n){n(32)("Uint16",2,function(t){return function(e,n,r){return t(this,e,n,r)}})},function(t,e,n){n(32)("Uint32",4,function(t){return function(e,n,r){return t(this,e,n,r)}})},function(t,e,n){n(32)("Uint8",1,function(t){return function(e,n,r){return t(this,e,n,r)}})},function(t,e,n){n(32)("Uint8",1,function(t){return function(e,n,r){return t(this,e,n,r)}},!0)},function(t,e,n){"use strict";var r=n(122),o=n(53),i="WeakSet";n(63)(i,function(t){return function(){return t(this,arguments.length>0?arguments[0]:void 0)}},{add:function(t){return r.def(o(this,i),t,!0)}},r,!1,!0)},function(t,e,n){"use strict";var r=n(0),o=n(123),i=n(11),a=n(10),u=n(12),s=n(81);r(r.P,"Array",{flatMap:function(t){var e,n,r=i(this);return u(t),e=a(r.length),n=s(r,0),o(n,r,r,e,0,1,t,arguments[1]),n}}),n(34)("flatMap")},function(t,e,n){"use strict";var r=n(0),o=n(123),i=n(11),a=n(10),u=n(29),s=n(81);r(r.P,"Array",{flatten:function(){var t=arguments[0],e=i(this),n=a(e.length),r=s(e,0);return o(r,e,e,n,0,void 0===t?1:u(t)),r}}),n(34)("flatten")},function(t,e,n){"use strict";var r=n(0),o=n(62)(!0);r(r.P,"Array",{includes:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0)}}),n(34)("includes")},function(t,e,n){var r=n(0),o=n(93)(),i=n(2).process,a="process"==n(22)(i);r(r.G,{asap:function(t){var e=a&&i.domain;o(e?e.bind(t):t)}})},function(t,e,n){var r=n(0),o=n(22);r(r.S,"Error",{isError:function(t){return"Error"===o(t)}})},function(t,e,n){var r=n(0);r(r.G,{global:n(2)})},function(t,e,n){n(72)("Map")},function(t,e,n){n(73)("Map")},function(t,e,n){var r=n(0);r(r.P+r.R,"Map",{toJSON:n(121)("Map")})},function(t,e,n){var r=n(0);r(r.S,"Math",{clamp:function(t,e,n){return Math.min(n,Math.max(e,t))}})},function(t,e,n){var r=n(0);r(r.S,"Math",{DEG_PER_RAD:Math.PI/180})},function(t,e,n){var r=n(0),o=180/Math.PI;r(r.S,"Math",{degrees:function(t){return t*o}})},function(t,e,n){var r=n(0),o=n(130),i=n(128);r(r.S,"Math",{fscale:function(t,e,n,r,a){return i(o(t,e,n,r,a))}})},function(t,e,n){var r=n(0);r(r.S,"Math",{iaddh:function(t,e,n,r){var o=t>>>0,i=e>>>0,a=n>>>0;return i+(r>>>0)+((o&a|(o|a)&~(o+a>>>0))>>>31)|0}})},function(t,e,n){var r=n(0);r(r.S,"Math",{imulh:function(t,e){var n=65535,r=+t,o=+e,i=r&n,a=o&n,u=r>>16,s=o>>16,c=(u*a>>>0)+(i*a>>>16);return u*s+(c>>16)+((i*s>>>0)+(c&n)>>16)}})},function(t,e,n){var r=n(0);r(r.S,"Math",{isubh:function(t,e,n,r){var o=t>>>0,i=e>>>0,a=n>>>0;return i-(r>>>0)-((~o&a|~(o^a)&o-a>>>0)>>>31)|0}})},function(t,e,n){var r=n(0);r(r.S,"Math",{RAD_PER_DEG:180/Math.PI})},function(t,e,n){var r=n(0),o=Math.PI/180;r(r.S,"Math",{radians:function(t){return t*o}})},function(t,e,n){var r=n(0);r(r.S,"Math",{scale:n(130)})},function(t,e,n){var r=n(0);r(r.S,"Math",{signbit:function(t){return(t=+t)!=t?t:0==t?1/t==1/0:t>0}})},function(t,e,n){var r=n(0);
 r(r.S,"Math",{umulh:function(t,e){var n=65535,r=+t,o=+e,i=r&n,a=o&n,u=r>>>16,s=o>>>16,c=(u*a>>>0)+(i*a>>>16);return u*s+(c>>>16)+((i*s>>>0)+(c&n)>>>16)}})},function(t,e,n){"use strict";var r=n(0),o=n(11),i=n(12),a=n(9);n(8)&&r(r.P+n(70),"Object",{__defineGetter__:function(t,e){a.f(o(this),t,{get:i(e),enumerable:!0,configurable:!0})}})},function(t,e,n){"use strict";var r=n(0),o=n(11),i=n(12),a=n(9);n(8)&&r(r.P+n(70),"Object",{__defineSetter__:function(t,e){a.f(o(this),t,{set:i(e),enumerable:!0,configurable:!0})}})},function(t,e,n){var r=n(0),o=n(135)(!0);r(r.S,"Object",{entries:function(t){return o(t)}})},function(t,e,n){var r=n(0),o=n(136),i=n(18),a=n(19),u=n(82);r(r.S,"Object",{getOwnPropertyDescriptors:function(t){for(var e,n,r=i(t),s=a.f,c=o(r),f={},l=0;c.length>l;)n=s(r,e=c[l++]),void 0!==n&&u(f,e,n);return f}})},function(t,e,n){"use strict";var r=n(0),o=n(11),i=n(30),a=n(20),u=n(19).f;n(8)&&r(r.P+n(70),"Object",{__lookupGetter__:function(t){var e,n=o(this),r=i(t,!0);do if(e=u(n,r))return e.get;while(n=a(n))}})},function(t,e,n){"use strict";var r=n(0),o=n(11),i=n(30),a=n(20),u=n(19).f;n(8)&&r(r.P+n(70),"Object",{__lookupSetter__:function(t){var e,n=o(this),r=i(t,!0);do if(e=u(n,r))return e.set;while(n=a(n))}})},function(t,e,n){var r=n(0),o=n(135)(!1);r(r.S,"Object",{values:function(t){return o(t)}})},function(t,e,n){"use strict";var r=n(0),o=n(2),i=n(26),a=n(93)(),u=n(6)("observable"),s=n(12),c=n(1),f=n(39),l=n(45),p=n(15),h=n(40),d=h.RETURN,v=function(t){return null==t?void 0:s(t)},g=function(t){var e=t._c;e&&(t._c=void 0,e())},y=function(t){return void 0===t._o},m=function(t){y(t)||(t._o=void 0,g(t))},b=function(t,e){c(t),this._c=void 0,this._o=t,t=new _(this);try{var n=e(t),r=n;null!=n&&("function"==typeof n.unsubscribe?n=function(){r.unsubscribe()}:s(n),this._c=n)}catch(e){return void t.error(e)}y(this)&&g(this)};b.prototype=l({},{unsubscribe:function(){m(this)}});var _=function(t){this._s=t};_.prototype=l({},{next:function(t){var e=this._s;if(!y(e)){var n=e._o;try{var r=v(n.next);if(r)return r.call(n,t)}catch(t){try{m(e)}finally{throw t}}}},error:function(t){var e=this._s;if(y(e))throw t;var n=e._o;e._o=void 0;try{var r=v(n.error);if(!r)throw t;t=r.call(n,t)}catch(t){try{g(e)}finally{throw t}}return g(e),t},complete:function(t){var e=this._s;if(!y(e)){var n=e._o;e._o=void 0;try{var r=v(n.complete);t=r?r.call(n,t):void 0}catch(t){try{g(e)}finally{throw t}}return g(e),t}}});var w=function(t){f(this,w,"Observable","_f")._f=s(t)};l(w.prototype,{subscribe:function(t){return new b(t,this._f)},forEach:function(t){var e=this;return new(i.Promise||o.Promise)(function(n,r){s(t);var o=e.subscribe({next:function(e){try{return t(e)}catch(t){r(t),o.unsubscribe()}},error:r,complete:n})})}}),l(w,{from:function(t){var e="function"==typeof this?this:w,n=v(c(t)[u]);if(n){var r=c(n.call(t));return r.constructor===e?r:new e(function(t){return r.subscribe(t)})}return new e(function(e){var n=!1;return a(function(){if(!n){try{if(h(t,!1,function(t){if(e.next(t),n)return d})===d)return}catch(t){if(n)throw t;return void e.error(t)}e.complete()}}),function(){n=!0}})},of:function(){for(var t=0,e=arguments.length,n=Array(e);t<e;)n[t]=arguments[t++];return new("function"==typeof this?this:w)(function(t){var e=!1;return a(function(){if(!e){for(var r=0;r<n.length;++r)if(t.next(n[r]),e)return;t.complete()}}),function(){e=!0}})}}),p(w.prototype,u,function(){return this}),r(r.G,{Observable:w}),n(46)("Observable")},function(t,e,n){"use strict";var r=n(0),o=n(26),i=n(2),a=n(75),u=n(140);r(r.P+r.R,"Promise",{finally:function(t){var e=a(this,o.Promise||i.Promise),n="function"==typeof t;return this.then(n?function(n){return u(e,t()).then(function(){return n})}:t,n?function(n){return u(e,t()).then(function(){throw n})}:t)}})},function(t,e,n){"use strict";var r=n(0),o=n(94),i=n(139);r(r.S,"Promise",{try:function(t){var e=o.f(this),n=i(t);return(n.e?e.reject:e.resolve)(n.v),e.promise}})},function(t,e,n){var r=n(31),o=n(1),i=r.key,a=r.set;r.exp({defineMetadata:function(t,e,n,r){a(t,e,o(n),i(r))}})},function(t,e,n){var r=n(31),o=n(1),i=r.key,a=r.map,u=r.store;r.exp({deleteMetadata:function(t,e){var n=arguments.length<3?void 0:i(arguments[2]),r=a(o(e),n,!1);if(void 0===r||!r.delete(t))return!1;if(r.size)return!0;var s=u.get(e);return s.delete(n),!!s.size||u.delete(e)}})},function(t,e,n){var r=n(146),o=n(117),i=n(31),a=n(1),u=n(20),s=i.keys,c=i.key,f=function(t,e){var n=s(t,e),i=u(t);if(null===i)return n;var a=f(i,e);return a.length?n.length?o(new r(n.concat(a))):a:n};i.exp({getMetadataKeys:function(t){return f(a(t),arguments.length<2?void 0:c(arguments[1]))}})},function(t,e,n){var r=n(31),o=n(1),i=n(20),a=r.has,u=r.get,s=r.key,c=function(t,e,n){var r=a(t,e,n);if(r)return u(t,e,n);var o=i(e);return null!==o?c(t,o,n):void 0};r.exp({getMetadata:function(t,e){return c(t,o(e),arguments.length<3?void 0:s(arguments[2]))}})},function(t,e,n){var r=n(31),o=n(1),i=r.keys,a=r.key;r.exp({getOwnMetadataKeys:function(t){return i(o(t),arguments.length<2?void 0:a(arguments[1]))}})},function(t,e,n){var r=n(31),o=n(1),i=r.get,a=r.key;r.exp({getOwnMetadata:function(t,e){return i(t,o(e),arguments.length<3?void 0:a(arguments[2]))}})},function(t,e,n){var r=n(31),o=n(1),i=n(20),a=r.has,u=r.key,s=function(t,e,n){var r=a(t,e,n);if(r)return!0;var o=i(e);return null!==o&&s(t,o,n)};r.exp({hasMetadata:function(t,e){return s(t,o(e),arguments.length<3?void 0:u(arguments[2]))}})},function(t,e,n){var r=n(31),o=n(1),i=r.has,a=r.key;r.exp({hasOwnMetadata:function(t,e){return i(t,o(e),arguments.length<3?void 0:a(arguments[2]))}})},function(t,e,n){var r=n(31),o=n(1),i=n(12),a=r.key,u=r.set;r.exp({metadata:function(t,e){return function(n,r){u(t,e,(void 0!==r?o:i)(n),a(r))}}})},function(t,e,n){n(72)("Set")},function(t,e,n){n(73)("Set")},function(t,e,n){var r=n(0);r(r.P+r.R,"Set",{toJSON:n(121)("Set")})},function(t,e,n){"use strict";var r=n(0),o=n(97)(!0);r(r.P,"String",{at:function(t){return o(this,t)}})},function(t,e,n){"use strict";var r=n(0),o=n(27),i=n(10),a=n(68),u=n(65),s=RegExp.prototype,c=function(t,e){this._r=t,this._s=e};n(89)(c,"RegExp String",function(){var t=this._r.exec(this._s);return{value:t,done:null===t}}),r(r.P,"String",{matchAll:function(t){if(o(this),!a(t))throw TypeError(t+" is not a regexp!");var e=String(this),n="flags"in s?String(t.flags):u.call(t),r=new RegExp(t.source,~n.indexOf("g")?n:"g"+n);return r.lastIndex=i(t.lastIndex),new c(r,e)}})},function(t,e,n){"use strict";var r=n(0),o=n(141);r(r.P,"String",{padEnd:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0,!1)}})},function(t,e,n){"use strict";var r=n(0),o=n(141);r(r.P,"String",{padStart:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0,!0)}})},function(t,e,n){"use strict";n(52)("trimLeft",function(t){return function(){return t(this,1)}},"trimStart")},function(t,e,n){"use strict";n(52)("trimRight",function(t){return function(){return t(this,2)}},"trimEnd")},function(t,e,n){n(103)("asyncIterator")},function(t,e,n){n(103)("observable")},function(t,e,n){var r=n(0);r(r.S,"System",{global:n(2)})},function(t,e,n){n(72)("WeakMap")},function(t,e,n){n(73)("WeakMap")},function(t,e,n){n(72)("WeakSet")},function(t,e,n){n(73)("WeakSet")},function(t,e,n){for(var r=n(105),o=n(36),i=n(16),a=n(2),u=n(15),s=n(50),c=n(6),f=c("iterator"),l=c("toStringTag"),p=s.Array,h={CSSRuleList:!0,CSSStyleDeclaration:!1,CSSValueList:!1,ClientRectList:!1,DOMRectList:!1,DOMStringList:!1,DOMTokenList:!0,DataTransferItemList:!1,FileList:!1,HTMLAllCollection:!1,HTMLCollection:!1,HTMLFormElement:!1,HTMLSelectElement:!1,MediaList:!0,MimeTypeArray:!1,NamedNodeMap:!1,NodeList:!0,PaintRequestList:!1,Plugin:!1,PluginArray:!1,SVGLengthList:!1,SVGNumberList:!1,SVGPathSegList:!1,SVGPointList:!1,SVGStringList:!1,SVGTransformList:!1,SourceBufferList:!1,StyleSheetList:!0,TextTrackCueList:!1,TextTrackList:!1,TouchList:!1},d=o(h),v=0;v<d.length;v++){var g,y=d[v],m=h[y],b=a[y],_=b&&b.prototype;if(_&&(_[f]||u(_,f,p),_[l]||u(_,l,y),s[y]=p,m))for(g in r)_[g]||i(_,g,r[g],!0)}},function(t,e,n){var r=n(0),o=n(101);r(r.G+r.B,{setImmediate:o.set,clearImmediate:o.clear})},function(t,e,n){var r=n(2),o=n(0),i=n(66),a=n(181),u=r.navigator,s=!!u&&/MSIE .\./.test(u.userAgent),c=function(t){return s?function(e,n){return t(i(a,[].slice.call(arguments,2),"function"==typeof e?e:Function(e)),n)}:t};o(o.G+o.B+o.F*s,{setTimeout:c(r.setTimeout),setInterval:c(r.setInterval)})},function(t,e,n){n(305),n(244),n(246),n(245),n(248),n(250),n(255),n(249),n(247),n(257),n(256),n(252),n(253),n(251),n(243),n(254),n(258),n(259),n(211),n(213),n(212),n(261),n(260),n(231),n(241),n(242),n(232),n(233),n(234),n(235),n(236),n(237),n(238),n(239),n(240),n(214),n(215),n(216),n(217),n(218),n(219),n(220),n(221),n(222),n(223),n(224),n(225),n(226),n(227),n(228),n(229),n(230),n(292),n(297),n(304),n(295),n(287),n(288),n(293),n(298),n(300),n(283),n(284),n(285),n(286),n(289),n(290),n(291),n(294),n(296),n(299),n(301),n(302),n(303),n(206),n(208),n(207),n(210),n(209),n(195),n(193),n(199),n(196),n(202),n(204),n(192),n(198),n(189),n(203),n(187),n(201),n(200),n(194),n(197),n(186),n(188),n(191),n(190),n(205),n(105),n(277),n(282),n(145),n(278),n(279),n(280),n(281),n(262),n(144),n(146),n(147),n(317),n(306),n(307),n(312),n(315),n(316),n(310),n(313),n(311),n(314),n(308),n(309),n(263),n(264),n(265),n(266),n(267),n(270),n(268),n(269),n(271),n(272),n(273),n(274),n(276),n(275),n(320),n(318),n(319),n(361),n(364),n(363),n(365),n(366),n(362),n(367),n(368),n(342),n(345),n(341),n(339),n(340),n(343),n(344),n(326),n(360),n(325),n(359),n(371),n(373),n(324),n(358),n(370),n(372),n(323),n(369),n(322),n(327),n(328),n(329),n(330),n(331),n(333),n(332),n(334),n(335),n(336),n(338),n(337),n(347),n(348),n(349),n(350),n(352),n(351),n(354),n(353),n(355),n(356),n(357),n(321),n(346),n(376),n(375),n(374),t.exports=n(26)},function(t,e,n){e=t.exports=n(106)(),e.push([t.i,"\n#main {\n    position: relative;\n    height: 100%;\n    overflow-y: auto;\n    padding: 0 15px;\n}\n.log-drawer {\n    position: fixed;\n    bottom: 0;\n    width: 100%;\n    margin-bottom: -307px;\n    transition: margin-bottom 0.3s ease-in-out;\n}\n.log-drawer-open {\n    margin-bottom: 0px;\n}\n@media (max-width: 992px) {\nbody {\n        padding-top: 0px;\n}\n}\n@media (min-width: 992px) {\n#main-wrapper {\n        float:right;\n}\n}\n@media (max-width: 992px) {\n#main-wrapper {\n        padding-top: 0px;\n}\n}\n@media (max-width: 992px) {\n#sidebar-wrapper {\n        position: static;\n        height:auto;\n        max-height: 300px;\n  \t\tborder-right:0;\n}\n}\n@media(max-width: 750px) {\n.log-drawer {\n        position: fixed;\n        bottom: 0;\n        width: 100%;\n        margin-bottom: -341px;\n        transition: margin-bottom 0.3s ease-in-out;\n}\n.log-drawer-open {\n        margin-bottom: 0px;\n}\n}\n",""])},function(t,e,n){e=t.exports=n(106)(),e.push([t.i,"\n.v-spinner .v-beat\n{\n    -webkit-animation: v-beatStretchDelay 0.7s infinite linear;\n            animation: v-beatStretchDelay 0.7s infinite linear;\n    -webkit-animation-fill-mode: both;\n\t          animation-fill-mode: both;\n    display: inline-block;\n}\n.v-spinner .v-beat-odd\n{\n  -webkit-animation-delay: 0s;\n          animation-delay: 0s;\n}\n.v-spinner .v-beat-even\n{\n  -webkit-animation-delay: 0.35s;\n          animation-delay: 0.35s;\n}\n@-webkit-keyframes v-beatStretchDelay\n{\n50%\n    {\n        -webkit-transform: scale(0.75);\n                transform: scale(0.75);\n        -webkit-opacity: 0.2;             \n                opacity: 0.2;\n}\n100%\n    {\n        -webkit-transform: scale(1);\n                transform: scale(1);\n        -webkit-opacity: 1;             \n                opacity: 1;\n}\n}\n@keyframes v-beatStretchDelay\n{\n50%\n    {\n        -webkit-transform: scale(0.75);\n                transform: scale(0.75);\n        -webkit-opacity: 0.2;             \n                opacity: 0.2;\n}\n100%\n    {\n        -webkit-transform: scale(1);\n                transform: scale(1);\n        -webkit-opacity: 1;             \n                opacity: 1;\n}\n}\n",""])},function(t,e,n){e=t.exports=n(106)(),e.push([t.i,"\n#sidebar-wrapper {\n    padding: 50px 0 0px 0;\n    /*position: fixed;*/\n}\n#sidebar {\n    position: relative;\n    height: 100%;\n    overflow-y: auto;\n}\n@media (min-width: 992px) {\n#sidebar-wrapper {\n        height: 100%;\n        border-right: 1px solid gray;\n}\n#main {\n        padding-top: 80px;\n}\n}\n@media (max-width: 991px) {\n.muta-fill {\n        height: 70px;\n}\n}\n",""])},function(t,e,n){(function(e){!function(e){"use strict";function n(t,e,n,r){var i=e&&e.prototype instanceof o?e:o,a=Object.create(i.prototype),u=new h(r||[]);return a._invoke=c(t,n,u),a}function r(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}function o(){}function i(){}function a(){}function u(t){["next","throw","return"].forEach(function(e){t[e]=function(t){return this._invoke(e,t)}})}function s(t){function n(e,o,i,a){var u=r(t[e],t,o);if("throw"!==u.type){var s=u.arg,c=s.value;return c&&"object"==typeof c&&m.call(c,"__await")?Promise.resolve(c.__await).then(function(t){n("next",t,i,a)},function(t){n("throw",t,i,a)}):Promise.resolve(c).then(function(t){s.value=t,i(s)},a)}a(u.arg)}function o(t,e){function r(){return new Promise(function(r,o){n(t,e,r,o)})}return i=i?i.then(r,r):r()}"object"==typeof e.process&&e.process.domain&&(n=e.process.domain.bind(n));var i;this._invoke=o}function c(t,e,n){var o=j;return function(i,a){if(o===E)throw new Error("Generator is already running");if(o===k){if("throw"===i)throw a;return v()}for(n.method=i,n.arg=a;;){var u=n.delegate;if(u){var s=f(u,n);if(s){if(s===A)continue;return s}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(o===j)throw o=k,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);o=E;var c=r(t,e,n);if("normal"===c.type){if(o=n.done?k:C,c.arg===A)continue;return{value:c.arg,done:n.done}}"throw"===c.type&&(o=k,n.method="throw",n.arg=c.arg)}}}function f(t,e){var n=t.iterator[e.method];if(n===g){if(e.delegate=null,"throw"===e.method){if(t.iterator.return&&(e.method="return",e.arg=g,f(t,e),"throw"===e.method))return A;e.method="throw",e.arg=new TypeError("The iterator does not provide a 'throw' method")}return A}var o=r(n,t.iterator,e.arg);if("throw"===o.type)return e.method="throw",e.arg=o.arg,e.delegate=null,A;var i=o.arg;return i?i.done?(e[t.resultName]=i.value,e.next=t.nextLoc,"return"!==e.method&&(e.method="next",e.arg=g),e.delegate=null,A):i:(e.method="throw",e.arg=new TypeError("iterator result is not an object"),e.delegate=null,A)}function l(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function p(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function h(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(l,this),this.reset(!0)}function d(t){if(t){var e=t[_];if(e)return e.call(t);if("function"==typeof t.next)return t;if(!isNaN(t.length)){var n=-1,r=function e(){for(;++n<t.length;)if(m.call(t,n))return e.value=t[n],e.done=!1,e;return e.value=g,e.done=!0,e};return r.next=r}}return{next:v}}function v(){return{value:g,done:!0}}var g,y=Object.prototype,m=y.hasOwnProperty,b="function"==typeof Symbol?Symbol:{},_=b.iterator||"@@iterator",w=b.asyncIterator||"@@asyncIterator",x=b.toStringTag||"@@toStringTag",O="object"==typeof t,S=e.regeneratorRuntime;if(S)return void(O&&(t.exports=S));S=e.regeneratorRuntime=O?t.exports:{},S.wrap=n;var j="suspendedStart",C="suspendedYield",E="executing",k="completed",A={},T={};T[_]=function(){return this};var $=Object.getPrototypeOf,I=$&&$($(d([])));I&&I!==y&&m.call(I,_)&&(T=I);var P=a.prototype=o.prototype=Object.create(T);i.prototype=P.constructor=a,a.constructor=i,a[x]=i.displayName="GeneratorFunction",S.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===i||"GeneratorFunction"===(e.displayName||e.name))},S.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,a):(t.__proto__=a,x in t||(t[x]="GeneratorFunction")),t.prototype=Object.create(P),t},S.awrap=function(t){return{__await:t}},u(s.prototype),s.prototype[w]=function(){return this},S.AsyncIterator=s,S.async=function(t,e,r,o){var i=new s(n(t,e,r,o));return S.isGeneratorFunction(e)?i:i.next().then(function(t){return t.done?t.value:i.next()})},u(P),P[x]="Generator",P[_]=function(){return this},P.toString=function(){return"[object Generator]"},S.keys=function(t){var e=[];for(var n in t)e.push(n);return e.reverse(),function n(){for(;e.length;){var r=e.pop();if(r in t)return n.value=r,n.done=!1,n}return n.done=!0,n}},S.values=d,h.prototype={constructor:h,reset:function(t){if(this.prev=0,this.next=0,this.sent=this._sent=g,this.done=!1,this.delegate=null,this.method="next",this.arg=g,this.tryEntries.forEach(p),!t)for(var e in this)"t"===e.charAt(0)&&m.call(this,e)&&!isNaN(+e.slice(1))&&(this[e]=g)},stop:function(){this.done=!0;var t=this.tryEntries[0],e=t.completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(t){function e(e,r){return i.type="throw",i.arg=t,n.next=e,r&&(n.method="next",n.arg=g),!!r}if(this.done)throw t;for(var n=this,r=this.tryEntries.length-1;r>=0;--r){var o=this.tryEntries[r],i=o.completion;if("root"===o.tryLoc)return e("end");if(o.tryLoc<=this.prev){var a=m.call(o,"catchLoc"),u=m.call(o,"finallyLoc");if(a&&u){if(this.prev<o.catchLoc)return e(o.catchLoc,!0);if(this.prev<o.finallyLoc)return e(o.finallyLoc)}else if(a){if(this.prev<o.catchLoc)return e(o.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<o.finallyLoc)return e(o.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&m.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var i=o?o.completion:{};return i.type=t,i.arg=e,o?(this.method="next",this.next=o.finallyLoc,A):this.complete(i)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),A},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),p(n),A}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;p(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(t,e,n){return this.delegate={iterator:d(t),resultName:e,nextLoc:n},"next"===this.method&&(this.arg=g),A}}}("object"==typeof e?e:"object"==typeof window?window:"object"==typeof self?self:this)}).call(e,n(7))},function(t,e){"use strict";t.exports=function(t,e){if(e=e.split(":")[0],t=+t,!t)return!1;switch(e){case"http":case"ws":return 80!==t;case"https":case"wss":return 443!==t;case"ftp":return 21!==t;case"gopher":return 70!==t;case"file":return!1}return 0!==t}},function(t,e,n){"use strict";(function(e){var r=n(392);t.exports=n(390)(r),"_sockjs_onload"in e&&setTimeout(e._sockjs_onload,1)}).call(e,n(7))},function(t,e,n){"use strict";function r(){i.call(this),this.initEvent("close",!1,!1),this.wasClean=!1,this.code=0,this.reason=""}var o=n(4),i=n(108);o(r,i),t.exports=r},function(t,e,n){"use strict";function r(t){i.call(this),this.initEvent("message",!1,!1),this.data=t}var o=n(4),i=n(108);o(r,i),t.exports=r},function(t,e,n){"use strict";function r(t){this._transport=t,t.on("message",this._transportMessage.bind(this)),t.on("close",this._transportClose.bind(this))}var o=n(33),i=n(61);r.prototype._transportClose=function(t,e){i.postMessage("c",o.stringify([t,e]))},r.prototype._transportMessage=function(t){i.postMessage("t",t)},r.prototype._send=function(t){this._transport.send(t)},r.prototype._close=function(){this._transport.close(),this._transport.removeAllListeners()},t.exports=r},function(t,e,n){"use strict";var r=n(21),o=n(37),i=n(33),a=n(386),u=n(150),s=n(61),c=n(151),f=function(){};t.exports=function(t,e){var n={};e.forEach(function(t){t.facadeTransport&&(n[t.facadeTransport.transportName]=t.facadeTransport)}),n[u.transportName]=u;var l;t.bootstrap_iframe=function(){var e;s.currentWindowId=c.hash.slice(1);var u=function(o){if(o.source===parent&&("undefined"==typeof l&&(l=o.origin),o.origin===l)){var u;try{u=i.parse(o.data)}catch(t){return void f("bad json",o.data)}if(u.windowId===s.currentWindowId)switch(u.type){case"s":var p;try{p=i.parse(u.data)}catch(t){f("bad json",u.data);break}var h=p[0],d=p[1],v=p[2],g=p[3];if(f(h,d,v,g),h!==t.version)throw new Error('Incompatible SockJS! Main site uses: "'+h+'", the iframe: "'+t.version+'".');if(!r.isOriginEqual(v,c.href)||!r.isOriginEqual(g,c.href))throw new Error("Can't connect to different domain from within an iframe. ("+c.href+", "+v+", "+g+")");e=new a(new n[d](v,g));break;case"m":e._send(u.data);break;case"c":e&&e._close(),e=null}}};o.attachEvent("message",u),s.postMessage("s")}}},function(t,e,n){"use strict";(function(e){function r(t,n){var r=this;o.call(this);var i=function(){var e=r.ifr=new s(c.transportName,n,t);e.once("message",function(t){if(t){var e;try{e=a.parse(t)}catch(e){return f("bad json",t),r.emit("finish"),void r.close()}var n=e[0],o=e[1];r.emit("finish",n,o)}r.close()}),e.once("close",function(){r.emit("finish"),r.close()})};e.document.body?i():u.attachEvent("load",i)}var o=n(13).EventEmitter,i=n(4),a=n(33),u=n(37),s=n(156),c=n(150),f=function(){};i(r,o),r.enabled=function(){return s.enabled()},r.prototype.close=function(){this.ifr&&this.ifr.close(),this.removeAllListeners(),this.ifr=null},t.exports=r}).call(e,n(7))},function(t,e,n){"use strict";function r(t,e){h(t);var n=this;o.call(this),setTimeout(function(){n.doXhr(t,e)},0)}var o=n(13).EventEmitter,i=n(4),a=n(21),u=n(110),s=n(78),c=n(59),f=n(401),l=n(388),p=n(149),h=function(){};i(r,o),r._getReceiver=function(t,e,n){return n.sameOrigin?new p(e,c):s.enabled?new p(e,s):u.enabled&&n.sameScheme?new p(e,u):l.enabled()?new l(t,e):new p(e,f)},r.prototype.doXhr=function(t,e){var n=this,o=a.addPath(t,"/info");h("doXhr",o),this.xo=r._getReceiver(t,o,e),this.timeoutRef=setTimeout(function(){h("timeout"),n._cleanup(!1),n.emit("finish")},r.timeout),this.xo.once("finish",function(t,e){h("finish",t,e),n._cleanup(!0),n.emit("finish",t,e)})},r.prototype._cleanup=function(t){h("_cleanup"),clearTimeout(this.timeoutRef),this.timeoutRef=null,!t&&this.xo&&this.xo.close(),this.xo=null},r.prototype.close=function(){h("close"),this.removeAllListeners(),this._cleanup(!1)},r.timeout=8e3,t.exports=r},function(t,e,n){"use strict";(function(e){function r(t,e,n){if(!(this instanceof r))return new r(t,e,n);if(arguments.length<1)throw new TypeError("Failed to construct 'SockJS: 1 argument required, but only 0 present");m.call(this),this.readyState=r.CONNECTING,this.extensions="",this.protocol="",n=n||{},n.protocols_whitelist&&g.warn("'protocols_whitelist' is DEPRECATED. Use 'transports' instead."),this._transportsWhitelist=n.transports,this._transportOptions=n.transportOptions||{};var o=n.sessionId||8;if("function"==typeof o)this._generateSessionId=o;else{if("number"!=typeof o)throw new TypeError("If sessionId is used in the options, it needs to be a number or a function.");this._generateSessionId=function(){return c.string(o)}}this._server=n.server||c.numberString(1e3);var i=new a(t);if(!i.host||!i.protocol)throw new SyntaxError("The URL '"+t+"' is invalid");if(i.hash)throw new SyntaxError("The URL must not contain a fragment");if("http:"!==i.protocol&&"https:"!==i.protocol)throw new SyntaxError("The URL's scheme must be either 'http:' or 'https:'. '"+i.protocol+"' is not allowed.");var u="https:"===i.protocol;if("https"===b.protocol&&!u)throw new Error("SecurityError: An insecure SockJS connection may not be initiated from a page loaded over HTTPS");e?Array.isArray(e)||(e=[e]):e=[];var s=e.sort();s.forEach(function(t,e){if(!t)throw new SyntaxError("The protocols entry '"+t+"' is invalid.");if(e<s.length-1&&t===s[e+1])throw new SyntaxError("The protocols entry '"+t+"' is duplicated.")});var f=l.getOrigin(b.href);this._origin=f?f.toLowerCase():null,i.set("pathname",i.pathname.replace(/\/+$/,"")),this.url=i.href,O("using url",this.url),this._urlInfo={nullOrigin:!v.hasDomain(),sameOrigin:l.isOriginEqual(this.url,b.href),sameScheme:l.isSchemeEqual(this.url,b.href)},this._ir=new x(this.url,this._urlInfo),this._ir.once("finish",this._receiveInfo.bind(this))}function o(t){return 1e3===t||t>=3e3&&t<=4999}n(391);var i,a=n(161),u=n(4),s=n(33),c=n(55),f=n(406),l=n(21),p=n(37),h=n(408),d=n(111),v=n(60),g=n(407),y=n(108),m=n(148),b=n(151),_=n(384),w=n(385),x=n(389),O=function(){};u(r,m),r.prototype.close=function(t,e){if(t&&!o(t))throw new Error("InvalidAccessError: Invalid code");if(e&&e.length>123)throw new SyntaxError("reason argument has an invalid length");if(this.readyState!==r.CLOSING&&this.readyState!==r.CLOSED){var n=!0;this._close(t||1e3,e||"Normal closure",n)}},r.prototype.send=function(t){if("string"!=typeof t&&(t=""+t),this.readyState===r.CONNECTING)throw new Error("InvalidStateError: The connection has not been established yet");this.readyState===r.OPEN&&this._transport.send(f.quote(t))},r.version=n(160),r.CONNECTING=0,r.OPEN=1,r.CLOSING=2,r.CLOSED=3,r.prototype._receiveInfo=function(t,e){if(O("_receiveInfo",e),this._ir=null,!t)return void this._close(1002,"Cannot connect to server");this._rto=this.countRTO(e),this._transUrl=t.base_url?t.base_url:this.url,t=d.extend(t,this._urlInfo),O("info",t);var n=i.filterToEnabled(this._transportsWhitelist,t);this._transports=n.main,O(this._transports.length+" enabled transports"),this._connect()},r.prototype._connect=function(){for(var t=this._transports.shift();t;t=this._transports.shift()){if(O("attempt",t.transportName),t.needBody&&(!e.document.body||"undefined"!=typeof e.document.readyState&&"complete"!==e.document.readyState&&"interactive"!==e.document.readyState))return O("waiting for body"),this._transports.unshift(t),void p.attachEvent("load",this._connect.bind(this));var n=this._rto*t.roundTrips||5e3;this._transportTimeoutId=setTimeout(this._transportTimeout.bind(this),n),O("using timeout",n);var r=l.addPath(this._transUrl,"/"+this._server+"/"+this._generateSessionId()),o=this._transportOptions[t.transportName];O("transport url",r);var i=new t(r,this._transUrl,o);return i.on("message",this._transportMessage.bind(this)),i.once("close",this._transportClose.bind(this)),i.transportName=t.transportName,void(this._transport=i)}this._close(2e3,"All transports failed",!1)},r.prototype._transportTimeout=function(){O("_transportTimeout"),this.readyState===r.CONNECTING&&this._transportClose(2007,"Transport timed out")},r.prototype._transportMessage=function(t){O("_transportMessage",t);var e,n=this,r=t.slice(0,1),o=t.slice(1);switch(r){case"o":return void this._open();case"h":return this.dispatchEvent(new y("heartbeat")),void O("heartbeat",this.transport)}if(o)try{e=s.parse(o)}catch(t){O("bad json",o)}if("undefined"==typeof e)return void O("empty payload",o);switch(r){case"a":Array.isArray(e)&&e.forEach(function(t){O("message",n.transport,t),n.dispatchEvent(new w(t))});break;case"m":O("message",this.transport,e),this.dispatchEvent(new w(e));break;case"c":Array.isArray(e)&&2===e.length&&this._close(e[0],e[1],!0)}},r.prototype._transportClose=function(t,e){return O("_transportClose",this.transport,t,e),this._transport&&(this._transport.removeAllListeners(),this._transport=null,this.transport=null),o(t)||2e3===t||this.readyState!==r.CONNECTING?void this._close(t,e):void this._connect()},r.prototype._open=function(){O("_open",this._transport.transportName,this.readyState),this.readyState===r.CONNECTING?(this._transportTimeoutId&&(clearTimeout(this._transportTimeoutId),this._transportTimeoutId=null),this.readyState=r.OPEN,this.transport=this._transport.transportName,this.dispatchEvent(new y("open")),O("connected",this.transport)):this._close(1006,"Server lost session")},r.prototype._close=function(t,e,n){O("_close",this.transport,t,e,n,this.readyState);var o=!1;if(this._ir&&(o=!0,this._ir.close(),this._ir=null),this._transport&&(this._transport.close(),this._transport=null,this.transport=null),this.readyState===r.CLOSED)throw new Error("InvalidStateError: SockJS has already been closed");this.readyState=r.CLOSING,setTimeout(function(){this.readyState=r.CLOSED,o&&this.dispatchEvent(new y("error"));var i=new _("close");i.wasClean=n||!1,i.code=t||1e3,i.reason=e,this.dispatchEvent(i),this.onmessage=this.onclose=this.onerror=null,O("disconnected")}.bind(this),0)},r.prototype.countRTO=function(t){return t>100?4*t:300+t},t.exports=function(t){return i=h(t),n(387)(r,t),r}}).call(e,n(7))},function(t,e){"use strict";function n(t){var e=+t;return e!==e?e=0:0!==e&&e!==1/0&&e!==-(1/0)&&(e=(e>0||-1)*Math.floor(Math.abs(e))),e}function r(t){return t>>>0}function o(){}var i,a=Array.prototype,u=Object.prototype,s=Function.prototype,c=String.prototype,f=a.slice,l=u.toString,p=function(t){return"[object Function]"===u.toString.call(t)},h=function(t){return"[object Array]"===l.call(t)},d=function(t){return"[object String]"===l.call(t)},v=Object.defineProperty&&function(){try{return Object.defineProperty({},"x",{}),!0}catch(t){return!1}}();i=v?function(t,e,n,r){!r&&e in t||Object.defineProperty(t,e,{configurable:!0,enumerable:!1,writable:!0,value:n})}:function(t,e,n,r){!r&&e in t||(t[e]=n)};var g=function(t,e,n){for(var r in e)u.hasOwnProperty.call(e,r)&&i(t,r,e[r],n)},y=function(t){if(null==t)throw new TypeError("can't convert "+t+" to object");return Object(t)};g(s,{bind:function(t){var e=this;if(!p(e))throw new TypeError("Function.prototype.bind called on incompatible "+e);for(var n=f.call(arguments,1),r=function(){if(this instanceof s){var r=e.apply(this,n.concat(f.call(arguments)));return Object(r)===r?r:this}return e.apply(t,n.concat(f.call(arguments)))},i=Math.max(0,e.length-n.length),a=[],u=0;u<i;u++)a.push("$"+u);var s=Function("binder","return function ("+a.join(",")+"){ return binder.apply(this, arguments); }")(r);return e.prototype&&(o.prototype=e.prototype,s.prototype=new o,o.prototype=null),s}}),g(Array,{isArray:h});var m=Object("a"),b="a"!==m[0]||!(0 in m),_=function(t){var e=!0,n=!0;return t&&(t.call("foo",function(t,n,r){"object"!=typeof r&&(e=!1)}),t.call([1],function(){n="string"==typeof this},"x")),!!t&&e&&n};g(a,{forEach:function(t){var e=y(this),n=b&&d(this)?this.split(""):e,r=arguments[1],o=-1,i=n.length>>>0;if(!p(t))throw new TypeError;for(;++o<i;)o in n&&t.call(r,n[o],o,e)}},!_(a.forEach));var w=Array.prototype.indexOf&&[0,1].indexOf(1,2)!==-1;g(a,{indexOf:function(t){var e=b&&d(this)?this.split(""):y(this),r=e.length>>>0;if(!r)return-1;var o=0;for(arguments.length>1&&(o=n(arguments[1])),o=o>=0?o:Math.max(0,r+o);o<r;o++)if(o in e&&e[o]===t)return o;return-1}},w);var x=c.split;2!=="ab".split(/(?:ab)*/).length||4!==".".split(/(.?)(.?)/).length||"t"==="tesst".split(/(s)*/)[1]||4!=="test".split(/(?:)/,-1).length||"".split(/.?/).length||".".split(/()()/).length>1?!function(){var t=void 0===/()??/.exec("")[1];c.split=function(e,n){var o=this;if(void 0===e&&0===n)return[];if("[object RegExp]"!==l.call(e))return x.call(this,e,n);var i,u,s,c,f=[],p=(e.ignoreCase?"i":"")+(e.multiline?"m":"")+(e.extended?"x":"")+(e.sticky?"y":""),h=0;for(e=new RegExp(e.source,p+"g"),o+="",t||(i=new RegExp("^"+e.source+"$(?!\\s)",p)),n=void 0===n?-1>>>0:r(n);(u=e.exec(o))&&(s=u.index+u[0].length,!(s>h&&(f.push(o.slice(h,u.index)),!t&&u.length>1&&u[0].replace(i,function(){for(var t=1;t<arguments.length-2;t++)void 0===arguments[t]&&(u[t]=void 0)}),u.length>1&&u.index<o.length&&a.push.apply(f,u.slice(1)),c=u[0].length,h=s,f.length>=n)));)e.lastIndex===u.index&&e.lastIndex++;return h===o.length?!c&&e.test("")||f.push(""):f.push(o.slice(h)),f.length>n?f.slice(0,n):f;
-}}():"0".split(void 0,0).length&&(c.split=function(t,e){return void 0===t&&0===e?[]:x.call(this,t,e)});var O=c.substr,S="".substr&&"b"!=="0b".substr(-1);g(c,{substr:function(t,e){return O.call(this,t<0&&(t=this.length+t)<0?0:t,e)}},S)},function(t,e,n){"use strict";t.exports=[n(402),n(404),n(158),n(154),n(109)(n(154)),n(155),n(109)(n(155)),n(159),n(403),n(109)(n(159)),n(394)]},function(t,e,n){"use strict";(function(e){var n=e.WebSocket||e.MozWebSocket;n?t.exports=function(t){return new n(t)}:t.exports=void 0}).call(e,n(7))},function(t,e,n){"use strict";(function(e){function r(t){if(!r.enabled())throw new Error("Transport created when disabled");i.call(this,t,"/jsonp",u,a)}var o=n(4),i=n(157),a=n(399),u=n(400);o(r,i),r.enabled=function(){return!!e.document},r.transportName="jsonp-polling",r.roundTrips=1,r.needBody=!0,t.exports=r}).call(e,n(7))},function(t,e,n){"use strict";function r(t,e){a(t),i.call(this),this.sendBuffer=[],this.sender=e,this.url=t}var o=n(4),i=n(13).EventEmitter,a=function(){};o(r,i),r.prototype.send=function(t){a("send",t),this.sendBuffer.push(t),this.sendStop||this.sendSchedule()},r.prototype.sendScheduleWait=function(){a("sendScheduleWait");var t,e=this;this.sendStop=function(){a("sendStop"),e.sendStop=null,clearTimeout(t)},t=setTimeout(function(){a("timeout"),e.sendStop=null,e.sendSchedule()},25)},r.prototype.sendSchedule=function(){a("sendSchedule",this.sendBuffer.length);var t=this;if(this.sendBuffer.length>0){var e="["+this.sendBuffer.join(",")+"]";this.sendStop=this.sender(this.url,e,function(e){t.sendStop=null,e?(a("error",e),t.emit("close",e.code||1006,"Sending error: "+e),t.close()):t.sendScheduleWait()}),this.sendBuffer=[]}},r.prototype._cleanup=function(){a("_cleanup"),this.removeAllListeners()},r.prototype.close=function(){a("close"),this._cleanup(),this.sendStop&&(this.sendStop(),this.sendStop=null)},t.exports=r},function(t,e,n){"use strict";function r(t,e,n){a(e),i.call(this),this.Receiver=t,this.receiveUrl=e,this.AjaxObject=n,this._scheduleReceiver()}var o=n(4),i=n(13).EventEmitter,a=function(){};o(r,i),r.prototype._scheduleReceiver=function(){a("_scheduleReceiver");var t=this,e=this.poll=new this.Receiver(this.receiveUrl,this.AjaxObject);e.on("message",function(e){a("message",e),t.emit("message",e)}),e.once("close",function(n,r){a("close",n,r,t.pollIsClosing),t.poll=e=null,t.pollIsClosing||("network"===r?t._scheduleReceiver():(t.emit("close",n||1006,r),t.removeAllListeners()))})},r.prototype.abort=function(){a("abort"),this.removeAllListeners(),this.pollIsClosing=!0,this.poll&&this.poll.abort()},t.exports=r},function(t,e,n){"use strict";function r(t){u(t),i.call(this);var e=this,n=this.es=new a(t);n.onmessage=function(t){u("message",t.data),e.emit("message",decodeURI(t.data))},n.onerror=function(t){u("error",n.readyState,t);var r=2!==n.readyState?"network":"permanent";e._cleanup(),e._close(r)}}var o=n(4),i=n(13).EventEmitter,a=n(153),u=function(){};o(r,i),r.prototype.abort=function(){u("abort"),this._cleanup(),this._close("user")},r.prototype._cleanup=function(){u("cleanup");var t=this.es;t&&(t.onmessage=t.onerror=null,t.close(),this.es=null)},r.prototype._close=function(t){u("close",t);var e=this;setTimeout(function(){e.emit("close",null,t),e.removeAllListeners()},200)},t.exports=r},function(t,e,n){"use strict";(function(e){function r(t){c(t),u.call(this);var n=this;i.polluteGlobalNamespace(),this.id="a"+s.string(6),t=a.addQuery(t,"c="+decodeURIComponent(i.WPrefix+"."+this.id)),c("using htmlfile",r.htmlfileEnabled);var o=r.htmlfileEnabled?i.createHtmlfile:i.createIframe;e[i.WPrefix][this.id]={start:function(){c("start"),n.iframeObj.loaded()},message:function(t){c("message",t),n.emit("message",t)},stop:function(){c("stop"),n._cleanup(),n._close("network")}},this.iframeObj=o(t,function(){c("callback"),n._cleanup(),n._close("permanent")})}var o=n(4),i=n(61),a=n(21),u=n(13).EventEmitter,s=n(55),c=function(){};o(r,u),r.prototype.abort=function(){c("abort"),this._cleanup(),this._close("user")},r.prototype._cleanup=function(){c("_cleanup"),this.iframeObj&&(this.iframeObj.cleanup(),this.iframeObj=null),delete e[i.WPrefix][this.id]},r.prototype._close=function(t){c("_close",t),this.emit("close",null,t),this.removeAllListeners()},r.htmlfileEnabled=!1;var f=["Active"].concat("Object").join("X");if(f in e)try{r.htmlfileEnabled=!!new e[f]("htmlfile")}catch(t){}r.enabled=r.htmlfileEnabled||i.iframeEnabled,t.exports=r}).call(e,n(7))},function(t,e,n){"use strict";(function(e){function r(t){f(t);var n=this;c.call(this),o.polluteGlobalNamespace(),this.id="a"+i.string(6);var a=u.addQuery(t,"c="+encodeURIComponent(o.WPrefix+"."+this.id));e[o.WPrefix][this.id]=this._callback.bind(this),this._createScript(a),this.timeoutId=setTimeout(function(){f("timeout"),n._abort(new Error("JSONP script loaded abnormally (timeout)"))},r.timeout)}var o=n(61),i=n(55),a=n(60),u=n(21),s=n(4),c=n(13).EventEmitter,f=function(){};s(r,c),r.prototype.abort=function(){if(f("abort"),e[o.WPrefix][this.id]){var t=new Error("JSONP user aborted read");t.code=1e3,this._abort(t)}},r.timeout=35e3,r.scriptErrorTimeout=1e3,r.prototype._callback=function(t){f("_callback",t),this._cleanup(),this.aborting||(t&&(f("message",t),this.emit("message",t)),this.emit("close",null,"network"),this.removeAllListeners())},r.prototype._abort=function(t){f("_abort",t),this._cleanup(),this.aborting=!0,this.emit("close",t.code,t.message),this.removeAllListeners()},r.prototype._cleanup=function(){if(f("_cleanup"),clearTimeout(this.timeoutId),this.script2&&(this.script2.parentNode.removeChild(this.script2),this.script2=null),this.script){var t=this.script;t.parentNode.removeChild(t),t.onreadystatechange=t.onerror=t.onload=t.onclick=null,this.script=null}delete e[o.WPrefix][this.id]},r.prototype._scriptError=function(){f("_scriptError");var t=this;this.errorTimer||(this.errorTimer=setTimeout(function(){t.loadedOkay||t._abort(new Error("JSONP script loaded abnormally (onerror)"))},r.scriptErrorTimeout))},r.prototype._createScript=function(t){f("_createScript",t);var n,r=this,o=this.script=e.document.createElement("script");if(o.id="a"+i.string(8),o.src=t,o.type="text/javascript",o.charset="UTF-8",o.onerror=this._scriptError.bind(this),o.onload=function(){f("onload"),r._abort(new Error("JSONP script loaded abnormally (onload)"))},o.onreadystatechange=function(){if(f("onreadystatechange",o.readyState),/loaded|closed/.test(o.readyState)){if(o&&o.htmlFor&&o.onclick){r.loadedOkay=!0;try{o.onclick()}catch(t){}}o&&r._abort(new Error("JSONP script loaded abnormally (onreadystatechange)"))}},"undefined"==typeof o.async&&e.document.attachEvent)if(a.isOpera())n=this.script2=e.document.createElement("script"),n.text="try{var a = document.getElementById('"+o.id+"'); if(a)a.onerror();}catch(x){};",o.async=n.async=!1;else{try{o.htmlFor=o.id,o.event="onclick"}catch(t){}o.async=!0}"undefined"!=typeof o.async&&(o.async=!0);var u=e.document.getElementsByTagName("head")[0];u.insertBefore(o,u.firstChild),n&&u.insertBefore(n,u.firstChild)},t.exports=r}).call(e,n(7))},function(t,e,n){"use strict";(function(e){function r(t){c("createIframe",t);try{return e.document.createElement('<iframe name="'+t+'">')}catch(r){var n=e.document.createElement("iframe");return n.name=t,n}}function o(){c("createForm"),i=e.document.createElement("form"),i.style.display="none",i.style.position="absolute",i.method="POST",i.enctype="application/x-www-form-urlencoded",i.acceptCharset="UTF-8",a=e.document.createElement("textarea"),a.name="d",i.appendChild(a),e.document.body.appendChild(i)}var i,a,u=n(55),s=n(21),c=function(){};t.exports=function(t,e,n){c(t,e),i||o();var f="a"+u.string(8);i.target=f,i.action=s.addQuery(s.addPath(t,"/jsonp_send"),"i="+f);var l=r(f);l.id=f,l.style.display="none",i.appendChild(l);try{a.value=e}catch(t){}i.submit();var p=function(t){c("completed",f,t),l.onerror&&(l.onreadystatechange=l.onerror=l.onload=null,setTimeout(function(){c("cleaning up",f),l.parentNode.removeChild(l),l=null},500),a.value="",n(t))};return l.onerror=function(){c("onerror",f),p()},l.onload=function(){c("onload",f),p()},l.onreadystatechange=function(t){c("onreadystatechange",f,l.readyState,t),"complete"===l.readyState&&p()},function(){c("aborted",f),p(new Error("Aborted"))}}}).call(e,n(7))},function(t,e,n){"use strict";function r(){var t=this;o.call(this),this.to=setTimeout(function(){t.emit("finish",200,"{}")},r.timeout)}var o=n(13).EventEmitter,i=n(4);i(r,o),r.prototype.close=function(){clearTimeout(this.to)},r.timeout=2e3,t.exports=r},function(t,e,n){"use strict";function r(t,e,n){if(!r.enabled())throw new Error("Transport created when disabled");u.call(this),c("constructor",t);var a=this,f=i.addPath(t,"/websocket");f="https"===f.slice(0,5)?"wss"+f.slice(5):"ws"+f.slice(4),this.url=f,this.ws=new s(this.url,[],n),this.ws.onmessage=function(t){c("message event",t.data),a.emit("message",t.data)},this.unloadRef=o.unloadAdd(function(){c("unload"),a.ws.close()}),this.ws.onclose=function(t){c("close event",t.code,t.reason),a.emit("close",t.code,t.reason),a._cleanup()},this.ws.onerror=function(t){c("error event",t),a.emit("close",1006,"WebSocket connection broken"),a._cleanup()}}var o=n(37),i=n(21),a=n(4),u=n(13).EventEmitter,s=n(393),c=function(){};a(r,u),r.prototype.send=function(t){var e="["+t+"]";c("send",e),this.ws.send(e)},r.prototype.close=function(){c("close");var t=this.ws;this._cleanup(),t&&t.close()},r.prototype._cleanup=function(){c("_cleanup");var t=this.ws;t&&(t.onmessage=t.onclose=t.onerror=null),o.unloadDel(this.unloadRef),this.unloadRef=this.ws=null,this.removeAllListeners()},r.enabled=function(){return c("enabled"),!!s},r.transportName="websocket",r.roundTrips=2,t.exports=r},function(t,e,n){"use strict";function r(t){if(!s.enabled)throw new Error("Transport created when disabled");i.call(this,t,"/xhr",u,s)}var o=n(4),i=n(54),a=n(158),u=n(77),s=n(110);o(r,i),r.enabled=a.enabled,r.transportName="xdr-polling",r.roundTrips=2,t.exports=r},function(t,e,n){"use strict";(function(e){function r(t){if(!s.enabled&&!u.enabled)throw new Error("Transport created when disabled");i.call(this,t,"/xhr_streaming",a,u)}var o=n(4),i=n(54),a=n(77),u=n(78),s=n(59),c=n(60);o(r,i),r.enabled=function(t){return!t.nullOrigin&&(!c.isOpera()&&u.enabled)},r.transportName="xhr-streaming",r.roundTrips=2,r.needBody=!!e.document,t.exports=r}).call(e,n(7))},function(t,e,n){"use strict";(function(e){e.crypto&&e.crypto.getRandomValues?t.exports.randomBytes=function(t){var n=new Uint8Array(t);return e.crypto.getRandomValues(n),n}:t.exports.randomBytes=function(t){for(var e=new Array(t),n=0;n<t;n++)e[n]=Math.floor(256*Math.random());return e}}).call(e,n(7))},function(t,e,n){"use strict";var r,o=n(33),i=/[\x00-\x1f\ud800-\udfff\ufffe\uffff\u0300-\u0333\u033d-\u0346\u034a-\u034c\u0350-\u0352\u0357-\u0358\u035c-\u0362\u0374\u037e\u0387\u0591-\u05af\u05c4\u0610-\u0617\u0653-\u0654\u0657-\u065b\u065d-\u065e\u06df-\u06e2\u06eb-\u06ec\u0730\u0732-\u0733\u0735-\u0736\u073a\u073d\u073f-\u0741\u0743\u0745\u0747\u07eb-\u07f1\u0951\u0958-\u095f\u09dc-\u09dd\u09df\u0a33\u0a36\u0a59-\u0a5b\u0a5e\u0b5c-\u0b5d\u0e38-\u0e39\u0f43\u0f4d\u0f52\u0f57\u0f5c\u0f69\u0f72-\u0f76\u0f78\u0f80-\u0f83\u0f93\u0f9d\u0fa2\u0fa7\u0fac\u0fb9\u1939-\u193a\u1a17\u1b6b\u1cda-\u1cdb\u1dc0-\u1dcf\u1dfc\u1dfe\u1f71\u1f73\u1f75\u1f77\u1f79\u1f7b\u1f7d\u1fbb\u1fbe\u1fc9\u1fcb\u1fd3\u1fdb\u1fe3\u1feb\u1fee-\u1fef\u1ff9\u1ffb\u1ffd\u2000-\u2001\u20d0-\u20d1\u20d4-\u20d7\u20e7-\u20e9\u2126\u212a-\u212b\u2329-\u232a\u2adc\u302b-\u302c\uaab2-\uaab3\uf900-\ufa0d\ufa10\ufa12\ufa15-\ufa1e\ufa20\ufa22\ufa25-\ufa26\ufa2a-\ufa2d\ufa30-\ufa6d\ufa70-\ufad9\ufb1d\ufb1f\ufb2a-\ufb36\ufb38-\ufb3c\ufb3e\ufb40-\ufb41\ufb43-\ufb44\ufb46-\ufb4e\ufff0-\uffff]/g,a=function(t){var e,n={},r=[];for(e=0;e<65536;e++)r.push(String.fromCharCode(e));return t.lastIndex=0,r.join("").replace(t,function(t){return n[t]="\\u"+("0000"+t.charCodeAt(0).toString(16)).slice(-4),""}),t.lastIndex=0,n};t.exports={quote:function(t){var e=o.stringify(t);return i.lastIndex=0,i.test(e)?(r||(r=a(i)),e.replace(i,function(t){return r[t]})):e}}},function(t,e,n){"use strict";(function(e){var n={};["log","debug","warn"].forEach(function(t){var r;try{r=e.console&&e.console[t]&&e.console[t].apply}catch(t){}n[t]=r?function(){return e.console[t].apply(e.console,arguments)}:"log"===t?function(){}:n.log}),t.exports=n}).call(e,n(7))},function(t,e,n){"use strict";var r=function(){};t.exports=function(t){return{filterToEnabled:function(e,n){var o={main:[],facade:[]};return e?"string"==typeof e&&(e=[e]):e=[],t.forEach(function(t){if(t)return"websocket"===t.transportName&&n.websocket===!1?void r("disabled from server","websocket"):e.length&&e.indexOf(t.transportName)===-1?void r("not in whitelist",t.transportName):void(t.enabled(n)?(r("enabled",t.transportName),o.main.push(t),t.facadeTransport&&o.facade.push(t.facadeTransport)):r("disabled",t.transportName))}),o}}}},function(t,e,n){var r;!function(){"use strict";function o(t){return a(u(t),arguments)}function i(t,e){return o.apply(null,[t].concat(e||[]))}function a(t,e){var n,r,i,a,u,c,f,l,p,h=1,d=t.length,v="";for(r=0;r<d;r++)if("string"==typeof t[r])v+=t[r];else if(Array.isArray(t[r])){if(a=t[r],a[2])for(n=e[h],i=0;i<a[2].length;i++){if(!n.hasOwnProperty(a[2][i]))throw new Error(o('[sprintf] property "%s" does not exist',a[2][i]));n=n[a[2][i]]}else n=a[1]?e[a[1]]:e[h++];if(s.not_type.test(a[8])&&s.not_primitive.test(a[8])&&n instanceof Function&&(n=n()),s.numeric_arg.test(a[8])&&"number"!=typeof n&&isNaN(n))throw new TypeError(o("[sprintf] expecting number but found %T",n));switch(s.number.test(a[8])&&(l=n>=0),a[8]){case"b":n=parseInt(n,10).toString(2);break;case"c":n=String.fromCharCode(parseInt(n,10));break;case"d":case"i":n=parseInt(n,10);break;case"j":n=JSON.stringify(n,null,a[6]?parseInt(a[6]):0);break;case"e":n=a[7]?parseFloat(n).toExponential(a[7]):parseFloat(n).toExponential();break;case"f":n=a[7]?parseFloat(n).toFixed(a[7]):parseFloat(n);break;case"g":n=a[7]?String(Number(n.toPrecision(a[7]))):parseFloat(n);break;case"o":n=(parseInt(n,10)>>>0).toString(8);break;case"s":n=String(n),n=a[7]?n.substring(0,a[7]):n;break;case"t":n=String(!!n),n=a[7]?n.substring(0,a[7]):n;break;case"T":n=Object.prototype.toString.call(n).slice(8,-1).toLowerCase(),n=a[7]?n.substring(0,a[7]):n;break;case"u":n=parseInt(n,10)>>>0;break;case"v":n=n.valueOf(),n=a[7]?n.substring(0,a[7]):n;break;case"x":n=(parseInt(n,10)>>>0).toString(16);break;case"X":n=(parseInt(n,10)>>>0).toString(16).toUpperCase()}s.json.test(a[8])?v+=n:(!s.number.test(a[8])||l&&!a[3]?p="":(p=l?"+":"-",n=n.toString().replace(s.sign,"")),c=a[4]?"0"===a[4]?"0":a[4].charAt(1):" ",f=a[6]-(p+n).length,u=a[6]&&f>0?c.repeat(f):"",v+=a[5]?p+n+u:"0"===c?p+u+n:u+p+n)}return v}function u(t){if(c[t])return c[t];for(var e,n=t,r=[],o=0;n;){if(null!==(e=s.text.exec(n)))r.push(e[0]);else if(null!==(e=s.modulo.exec(n)))r.push("%");else{if(null===(e=s.placeholder.exec(n)))throw new SyntaxError("[sprintf] unexpected placeholder");if(e[2]){o|=1;var i=[],a=e[2],u=[];if(null===(u=s.key.exec(a)))throw new SyntaxError("[sprintf] failed to parse named argument key");for(i.push(u[1]);""!==(a=a.substring(u[0].length));)if(null!==(u=s.key_access.exec(a)))i.push(u[1]);else{if(null===(u=s.index_access.exec(a)))throw new SyntaxError("[sprintf] failed to parse named argument key");i.push(u[1])}e[2]=i}else o|=2;if(3===o)throw new Error("[sprintf] mixing positional and named placeholders is not (yet) supported");r.push(e)}n=n.substring(e[0].length)}return c[t]=r}var s={not_string:/[^s]/,not_bool:/[^t]/,not_type:/[^T]/,not_primitive:/[^v]/,number:/[diefg]/,numeric_arg:/[bcdiefguxX]/,json:/[j]/,not_json:/[^j]/,text:/^[^\x25]+/,modulo:/^\x25{2}/,placeholder:/^\x25(?:([1-9]\d*)\$|\(([^\)]+)\))?(\+)?(0|'[^$])?(-)?(\d+)?(?:\.(\d+))?([b-gijostTuvxX])/,key:/^([a-z_][a-z_\d]*)/i,key_access:/^\.([a-z_][a-z_\d]*)/i,index_access:/^\[(\d+)\]/,sign:/^[\+\-]/},c=Object.create(null);e.sprintf=o,e.vsprintf=i,"undefined"!=typeof window&&(window.sprintf=o,window.vsprintf=i,r=function(){return{sprintf:o,vsprintf:i}}.call(e,n,e,t),!(void 0!==r&&(t.exports=r)))}()},function(t,e){"use strict";function n(t){return decodeURIComponent(t.replace(/\+/g," "))}function r(t){for(var e,r=/([^=?&]+)=?([^&]*)/g,o={};e=r.exec(t);o[n(e[1])]=n(e[2]));return o}function o(t,e){e=e||"";var n=[];"string"!=typeof e&&(e="?");for(var r in t)i.call(t,r)&&n.push(encodeURIComponent(r)+"="+encodeURIComponent(t[r]));return n.length?e+n.join("&"):""}var i=Object.prototype.hasOwnProperty;e.stringify=o,e.parse=r},function(t,e,n){var r,o;n(426),r=n(167);var i=n(418);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){var r,o;r=n(169);var i=n(420);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){var r,o;r=n(171);var i=n(419);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){var r,o;r=n(172);var i=n(421);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){var r,o;r=n(173);var i=n(424);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){var r,o;r=n(174);var i=n(423);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{attrs:{id:"app"}},[n("div",{staticClass:"navbar navbar-default navbar-fixed-top",attrs:{id:"header"}},[n("div",{staticClass:"navbar-header"},[t._m(0),t._v(" "),n("a",{staticClass:"navbar-brand",attrs:{href:"#"}},[n("span",{staticClass:"app-logo"},[t._v(" ")]),t._v(" "),n("span",{staticClass:"app-name"},[t._v(t._s(t.appName))]),t._v(" "),n("span",{staticClass:"badge"},[t._v(t._s(t.appStatus))])])]),t._v(" "),t._m(1)]),t._v(" "),n("router-view"),t._v(" "),n("div",{staticClass:"log-drawer",class:{"log-drawer-open":t.logDisplay}},[n("div",{staticClass:"log-lapel",on:{click:function(e){t.toggleLogDisplay()}}},[n("span",[t._v("Log")]),n("span",{staticClass:"badge badge-log"},[t._v(t._s(t.unseenLogCount))])]),t._v(" "),n("div",{staticClass:"log-pane"},[n("div",{staticClass:"log-controls form-inline"},[n("button",{staticClass:"btn btn-default",attrs:{type:"button","aria-label":"Delete log"},on:{click:function(e){t.clearLogs()}}},[t._v("\n                   Clear\n                ")]),t._v(" "),n("div",{staticClass:"input-group"},[n("span",{staticClass:"input-group-addon",attrs:{id:"basic-addon1"}},[t._v("\n                          Filter\n                      ")]),t._v(" "),n("input",{directives:[{name:"model",rawName:"v-model",value:t.logFilterString,expression:"logFilterString"}],staticClass:"form-control",attrs:{type:"text",placeholder:"Level or text","aria-describedby":"basic-addon1"},domProps:{value:t.logFilterString},on:{input:function(e){e.target.composing||(t.logFilterString=e.target.value)}}})])]),t._v(" "),n("div",{staticClass:"log-area",attrs:{id:"log-area"}},[n("ul",{staticClass:"log-list"},t._l(t.filteredLog,function(e){return n("li",{class:t.logStyle(e.levelname)},[t._v("\n                       "+t._s(t.logItem(e))+"\n                   ")])}))])])]),t._v(" "),n("div",{staticClass:"modal fade helpmodal",attrs:{tabindex:"-1",role:"dialog","aria-labelledby":"helpmodal","aria-hidden":"true",id:"helpmodal"}},[n("div",{staticClass:"modal-dialog modal-lg",attrs:{role:"document"}},[n("div",{staticClass:"modal-content"},[t._m(2),t._v(" "),n("div",{staticClass:"modal-body",domProps:{innerHTML:t._s(t.helpDoc)}}),t._v(" "),t._m(3)])])])],1)},staticRenderFns:[function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("button",{staticClass:"navbar-toggle collapsed",attrs:{type:"button","data-toggle":"collapse","data-target":".navbar-collapse"}},[n("i",{staticClass:"icon-reorder"})])},function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("nav",{staticClass:"collapse navbar-collapse"},[n("ul",{staticClass:"nav navbar-nav pull-right"},[n("li",[n("a",{attrs:{href:"#","data-toggle":"modal","data-target":"#helpmodal"}},[t._v("Help")])])])])},function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"modal-header"},[n("button",{staticClass:"close",attrs:{type:"button","data-dismiss":"modal","aria-label":"Close"}},[n("span",{attrs:{"aria-hidden":"true"}},[t._v("×")])]),t._v(" "),n("h4",{staticClass:"modal-title",attrs:{id:"myModalLabel"}},[t._v("Help")])])},function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"modal-footer"},[n("button",{staticClass:"btn btn-default",attrs:{type:"button","data-dismiss":"modal"}},[t._v("Close")])])}]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{directives:[{name:"show",rawName:"v-show",value:t.loading,expression:"loading"}],staticClass:"v-spinner"},[n("div",{staticClass:"v-beat v-beat-odd",style:t.spinnerStyle}),n("div",{staticClass:"v-beat v-beat-even",style:t.spinnerStyle}),n("div",{staticClass:"v-beat v-beat-odd",style:t.spinnerStyle})])},staticRenderFns:[]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"panel panel-default panel-prop",attrs:{id:"mp-"+t.validId}},["HTML"==t.propObject.value_type?[n("div",{staticClass:"panel-heading"},[t._v(t._s(t.propObject.name))]),t._v(" "),n("div",{staticClass:"panel-body",domProps:{innerHTML:t._s(t.htmlValue)}})]:[n("div",{staticClass:"panel-body"},[n("form",{staticClass:"form-horizontal"},[n("span",{staticClass:"pull-left control-label"},[t.propObject.doc?[n("a",{attrs:{href:"#"+t.validId+"-help","data-toggle":"collapse"}},[t._v("\n              "+t._s(t.propObject.name))])]:[t._v(t._s(t.propObject.name))]],2),t._v(" "),n("muta-prop-value",{attrs:{"prop-object":t.propObject,objId:t.objId}})],1),t._v(" "),n("div",{staticClass:"mutaprop-help collapse ",attrs:{id:t.validId+"-help"}},[n("hr"),t._v(" "),n("div",{staticClass:"help-block",domProps:{innerHTML:t._s(t.propObject.doc)}})])])]],2)},staticRenderFns:[]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"col-xs-12 col-md-2",attrs:{id:"sidebar-wrapper"}},[n("div",{attrs:{id:"sidebar"}},[n("ul",{staticClass:"nav list-group"},t._l(t.objectList,function(e){return n("li",[n("router-link",{class:["list-group-item",e==t.selectedObject?"sidebar-selected":""],attrs:{to:{name:"object",params:{id:e}}}},[t._v("\n                   "+t._s(e)+"\n                ")])],1)}))])])},staticRenderFns:[]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{attrs:{id:"muta-prop-list"}},["actionsProps"===t.displayType?[n("muta-prop-panel",{attrs:{"prop-list":t.actionList,"obj-id":t.objId,heading:"Actions"}}),t._v(" "),n("muta-prop-panel",{attrs:{"prop-list":t.propertyList,"obj-id":t.objId,heading:"Properties"}})]:t._e(),t._v(" "),[n("muta-prop-panel",{attrs:{"prop-list":t.hierarchyList.otherActions,"obj-id":t.objId,heading:"Actions"}}),t._v(" "),t._l(t.hierarchyList.hierarchy,function(e,r){return n("muta-prop-panel",{attrs:{"prop-list":e,"obj-id":t.objId,heading:r}})}),t._v(" "),n("muta-prop-panel",{attrs:{"prop-list":t.hierarchyList.otherProps,"obj-id":t.objId,heading:"Other Properties"}})]],2)},staticRenderFns:[]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"container-fluid",attrs:{id:"wrapper"}},[n("div",{staticClass:"row"},[t.$store.getters.mutaObjectCount>1?n("muta-object-list",{attrs:{"object-list":t.$store.state.mutaObjectList,"selected-object":t.viewedObjectId}}):t._e(),t._v(" "),n("div",{class:[t.$store.getters.mutaObjectCount>1?"col-md-10":"col-md-12","col-xs-12"],attrs:{id:"main-wrapper"}},[t.viewedObjectId?n("div",{attrs:{id:"main"}},[1==t.$store.getters.mutaObjectCount?n("div",{staticClass:"muta-fill"}):t._e(),t._v(" "),n("div",{staticClass:"page-header"},[n("h3",[t._v(t._s(t.viewedObjectId))])]),t._v(" "),t.mutaListLoaded?t._e():n("div",{staticClass:"text-center"},[n("beat-loader",{attrs:{loading:!t.mutaListLoaded,color:"#003394",height:"200px",width:"200px"}})],1),t._v(" "),t.mutaObjectAvailable?t._e():n("div",[t._m(0)]),t._v(" "),t.mutaObjectAvailable&&!t.objectConnectionExists?n("div",[t._m(1)]):t._e(),t._v(" "),t.mutaListLoaded&&t.mutaObjectAvailable?n("muta-prop-list",{attrs:{"prop-list":t.mutaProps,"obj-id":t.viewedObjectId}}):t._e()],1):n("div",{attrs:{id:"main"}},[n("div",{staticClass:"alert alert-info",attrs:{role:"alert"}},[t._v("\n                Select an object to control.\n            ")])])])],1)])},staticRenderFns:[function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"alert alert-danger",attrs:{role:"alert"}},[n("strong",[t._v("Error!")]),t._v(" Object is not available.\n                ")])},function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"alert alert-danger",attrs:{role:"alert"}},[n("strong",[t._v("Connection to object lost!")]),t._v("\n                    Changes will not be applied.\n                ")])}]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("span",{staticClass:"pull-right form-inline"},[t.isChangeLabelVisible?n("label",{class:t.labelClass},[t._v("\n        "+t._s(t.labelVal)+"\n    ")]):t._e(),t._v(" "),t.hasSelect?[n("select",{directives:[{name:"model",rawName:"v-model",value:t.uiVal,expression:"uiVal"}],staticClass:"form-control",class:t.inputClass,attrs:{disabled:t.read_only},on:{change:[function(e){var n=Array.prototype.filter.call(e.target.options,function(t){return t.selected}).map(function(t){var e="_value"in t?t._value:t.value;return e});t.uiVal=e.target.multiple?n:n[0]},t.onUserChange],click:t.onSelectClick}},t._l(t.selectItems,function(e){return n("option",{domProps:{value:e.value}},[t._v("\n                "+t._s(e.text)+"\n            ")])}))]:["INT"==t.propObject.value_type||"REAL"==t.propObject.value_type?n("input",{directives:[{name:"model",rawName:"v-model.number",value:t.uiVal,expression:"uiVal",modifiers:{number:!0}}],staticClass:"form-control",class:t.inputClass,attrs:{type:"number",min:t.min_val,max:t.max_val,step:t.step,disabled:t.read_only},domProps:{value:t.uiVal},on:{change:t.onUserChange,keyup:function(e){return"button"in e||!t._k(e.keyCode,"enter",13)?void t.onUserChange(e):null},input:function(e){e.target.composing||(t.uiVal=t._n(e.target.value))},blur:function(e){t.$forceUpdate()}}}):t._e(),t._v(" "),"BOOL"==t.propObject.value_type?n("input",{directives:[{name:"model",rawName:"v-model",value:t.uiVal,expression:"uiVal"}],class:t.inputClass,attrs:{type:"checkbox",disabled:t.read_only,id:t.validId},domProps:{checked:Array.isArray(t.uiVal)?t._i(t.uiVal,null)>-1:t.uiVal},on:{change:t.onUserChange,__c:function(e){var n=t.uiVal,r=e.target,o=!!r.checked;if(Array.isArray(n)){var i=null,a=t._i(n,i);r.checked?a<0&&(t.uiVal=n.concat(i)):a>-1&&(t.uiVal=n.slice(0,a).concat(n.slice(a+1)))}else t.uiVal=o}}}):t._e(),t._v(" "),"STRING"==t.propObject.value_type?n("input",{directives:[{name:"model",rawName:"v-model",value:t.uiVal,expression:"uiVal"}],staticClass:"form-control",class:t.inputClass,attrs:{type:"text",disabled:t.read_only,maxlength:t.max_val},domProps:{value:t.uiVal},on:{change:t.onUserChange,keyup:function(e){return"button"in e||!t._k(e.keyCode,"enter",13)?void t.onUserChange(e):null},input:function(e){e.target.composing||(t.uiVal=e.target.value)}}}):t._e(),t._v(" "),"action"==t.propObject.type?n("button",{staticClass:"btn btn-primary",attrs:{type:"button",disabled:t.read_only},on:{click:t.actionExecuted}},[t._v("\n            Action\n        ")]):t._e()]],2)},staticRenderFns:[]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return t.hasContent?n("div",{staticClass:"panel panel-default panel-proplist"},[n("div",{staticClass:"panel-heading"},[n("a",{attrs:{"data-toggle":"collapse",href:"#"+t.collapseName}},[t._v("\n            "+t._s(t.heading))])]),t._v(" "),n("div",{staticClass:"panel-collapse collapse in",attrs:{id:t.collapseName}},t._l(t.propList,function(e){return n("muta-prop",{attrs:{"prop-object":e,"obj-id":t.objId}})}))]):t._e()},staticRenderFns:[]}},function(t,e,n){var r=n(378);"string"==typeof r&&(r=[[t.i,r,""]]);n(113)(r,{});r.locals&&(t.exports=r.locals)},function(t,e,n){var r=n(379);"string"==typeof r&&(r=[[t.i,r,""]]);n(113)(r,{});r.locals&&(t.exports=r.locals)},function(t,e,n){var r=n(380);"string"==typeof r&&(r=[[t.i,r,""]]);n(113)(r,{});r.locals&&(t.exports=r.locals)},function(t,e){(function(e){t.exports=e}).call(e,{})},function(t,e){},function(t,e,n){"use strict";var r=n(38),o=n.n(r),i=n(164),a=n.n(i),u=n(165),s=n.n(u),c=n(166),f=n(114),l=n(163),p=(n.n(l),n(79)),h=n(49),d=n.n(h);o.a.use(c.a),o.a.use(f.a),window.eventBus=new o.a;var v=new c.a({history:!1,routes:[{path:"/objects/:id",name:"object",component:s.a},{path:"/objects",component:s.a},{path:"/",redirect:"/objects"}]}),g=new f.a.Store({state:{mutaObjectList:[],mutaObjects:{},mutaProps:{},selectedObjectId:null},mutations:{set_muta_objects:function(t,e){t.mutaObjectList=e},set_selected_object_id:function(t,e){t.selectedObjectId=e},set_muta_object:function(t,e){console.log("Commiting"),console.log(e),o.a.set(t.mutaObjects,e.obj_id,e);var r=!0,i=!1,a=void 0;try{for(var u,s=e.props[Symbol.iterator]();!(r=(u=s.next()).done);r=!0){var c=u.value,f=n.i(p.c)(d.a.get(c,"class_scope",!1)?e.class_id:e.obj_id,c.id);o.a.set(t.mutaProps,f,{value:c.value,eventSource:null}),console.log("PropID: "+f)}}catch(t){i=!0,a=t}finally{try{!r&&s.return&&s.return()}finally{if(i)throw a}}},muta_prop_change:function(t,e){o.a.set(t.mutaProps,n.i(p.c)(e.objId,e.propId),{value:e.value,eventSource:e.eventSource})}},getters:{mutaObjectCount:function(t){return t.mutaObjectList.length},getMutaProp:function(t){return function(e,n){return d.a.find(t.mutaObjects[e].props,{id:n})}},getMutaPropValue:function(t,e){return function(r,o){var i=null;return i=d.a.get(e.getMutaProp(r,o),"class_scope",!1)?t.mutaObjects[r].class_id:r,t.mutaProps[n.i(p.c)(i,o)].value}},getMutaPropChange:function(t){return function(e,r){return t.mutaProps[n.i(p.c)(e,r)]}},getDynamicValue:function(t,e){return function(t,r){return n.i(p.b)(r)?e.getMutaPropValue(t,r.id):r}}}});new o.a({render:function(t){return t(a.a)},router:v,store:g}).$mount("#app")}]);
\ No newline at end of file
+}}():"0".split(void 0,0).length&&(c.split=function(t,e){return void 0===t&&0===e?[]:x.call(this,t,e)});var O=c.substr,S="".substr&&"b"!=="0b".substr(-1);g(c,{substr:function(t,e){return O.call(this,t<0&&(t=this.length+t)<0?0:t,e)}},S)},function(t,e,n){"use strict";t.exports=[n(402),n(404),n(158),n(154),n(109)(n(154)),n(155),n(109)(n(155)),n(159),n(403),n(109)(n(159)),n(394)]},function(t,e,n){"use strict";(function(e){var n=e.WebSocket||e.MozWebSocket;n?t.exports=function(t){return new n(t)}:t.exports=void 0}).call(e,n(7))},function(t,e,n){"use strict";(function(e){function r(t){if(!r.enabled())throw new Error("Transport created when disabled");i.call(this,t,"/jsonp",u,a)}var o=n(4),i=n(157),a=n(399),u=n(400);o(r,i),r.enabled=function(){return!!e.document},r.transportName="jsonp-polling",r.roundTrips=1,r.needBody=!0,t.exports=r}).call(e,n(7))},function(t,e,n){"use strict";function r(t,e){a(t),i.call(this),this.sendBuffer=[],this.sender=e,this.url=t}var o=n(4),i=n(13).EventEmitter,a=function(){};o(r,i),r.prototype.send=function(t){a("send",t),this.sendBuffer.push(t),this.sendStop||this.sendSchedule()},r.prototype.sendScheduleWait=function(){a("sendScheduleWait");var t,e=this;this.sendStop=function(){a("sendStop"),e.sendStop=null,clearTimeout(t)},t=setTimeout(function(){a("timeout"),e.sendStop=null,e.sendSchedule()},25)},r.prototype.sendSchedule=function(){a("sendSchedule",this.sendBuffer.length);var t=this;if(this.sendBuffer.length>0){var e="["+this.sendBuffer.join(",")+"]";this.sendStop=this.sender(this.url,e,function(e){t.sendStop=null,e?(a("error",e),t.emit("close",e.code||1006,"Sending error: "+e),t.close()):t.sendScheduleWait()}),this.sendBuffer=[]}},r.prototype._cleanup=function(){a("_cleanup"),this.removeAllListeners()},r.prototype.close=function(){a("close"),this._cleanup(),this.sendStop&&(this.sendStop(),this.sendStop=null)},t.exports=r},function(t,e,n){"use strict";function r(t,e,n){a(e),i.call(this),this.Receiver=t,this.receiveUrl=e,this.AjaxObject=n,this._scheduleReceiver()}var o=n(4),i=n(13).EventEmitter,a=function(){};o(r,i),r.prototype._scheduleReceiver=function(){a("_scheduleReceiver");var t=this,e=this.poll=new this.Receiver(this.receiveUrl,this.AjaxObject);e.on("message",function(e){a("message",e),t.emit("message",e)}),e.once("close",function(n,r){a("close",n,r,t.pollIsClosing),t.poll=e=null,t.pollIsClosing||("network"===r?t._scheduleReceiver():(t.emit("close",n||1006,r),t.removeAllListeners()))})},r.prototype.abort=function(){a("abort"),this.removeAllListeners(),this.pollIsClosing=!0,this.poll&&this.poll.abort()},t.exports=r},function(t,e,n){"use strict";function r(t){u(t),i.call(this);var e=this,n=this.es=new a(t);n.onmessage=function(t){u("message",t.data),e.emit("message",decodeURI(t.data))},n.onerror=function(t){u("error",n.readyState,t);var r=2!==n.readyState?"network":"permanent";e._cleanup(),e._close(r)}}var o=n(4),i=n(13).EventEmitter,a=n(153),u=function(){};o(r,i),r.prototype.abort=function(){u("abort"),this._cleanup(),this._close("user")},r.prototype._cleanup=function(){u("cleanup");var t=this.es;t&&(t.onmessage=t.onerror=null,t.close(),this.es=null)},r.prototype._close=function(t){u("close",t);var e=this;setTimeout(function(){e.emit("close",null,t),e.removeAllListeners()},200)},t.exports=r},function(t,e,n){"use strict";(function(e){function r(t){c(t),u.call(this);var n=this;i.polluteGlobalNamespace(),this.id="a"+s.string(6),t=a.addQuery(t,"c="+decodeURIComponent(i.WPrefix+"."+this.id)),c("using htmlfile",r.htmlfileEnabled);var o=r.htmlfileEnabled?i.createHtmlfile:i.createIframe;e[i.WPrefix][this.id]={start:function(){c("start"),n.iframeObj.loaded()},message:function(t){c("message",t),n.emit("message",t)},stop:function(){c("stop"),n._cleanup(),n._close("network")}},this.iframeObj=o(t,function(){c("callback"),n._cleanup(),n._close("permanent")})}var o=n(4),i=n(61),a=n(21),u=n(13).EventEmitter,s=n(55),c=function(){};o(r,u),r.prototype.abort=function(){c("abort"),this._cleanup(),this._close("user")},r.prototype._cleanup=function(){c("_cleanup"),this.iframeObj&&(this.iframeObj.cleanup(),this.iframeObj=null),delete e[i.WPrefix][this.id]},r.prototype._close=function(t){c("_close",t),this.emit("close",null,t),this.removeAllListeners()},r.htmlfileEnabled=!1;var f=["Active"].concat("Object").join("X");if(f in e)try{r.htmlfileEnabled=!!new e[f]("htmlfile")}catch(t){}r.enabled=r.htmlfileEnabled||i.iframeEnabled,t.exports=r}).call(e,n(7))},function(t,e,n){"use strict";(function(e){function r(t){f(t);var n=this;c.call(this),o.polluteGlobalNamespace(),this.id="a"+i.string(6);var a=u.addQuery(t,"c="+encodeURIComponent(o.WPrefix+"."+this.id));e[o.WPrefix][this.id]=this._callback.bind(this),this._createScript(a),this.timeoutId=setTimeout(function(){f("timeout"),n._abort(new Error("JSONP script loaded abnormally (timeout)"))},r.timeout)}var o=n(61),i=n(55),a=n(60),u=n(21),s=n(4),c=n(13).EventEmitter,f=function(){};s(r,c),r.prototype.abort=function(){if(f("abort"),e[o.WPrefix][this.id]){var t=new Error("JSONP user aborted read");t.code=1e3,this._abort(t)}},r.timeout=35e3,r.scriptErrorTimeout=1e3,r.prototype._callback=function(t){f("_callback",t),this._cleanup(),this.aborting||(t&&(f("message",t),this.emit("message",t)),this.emit("close",null,"network"),this.removeAllListeners())},r.prototype._abort=function(t){f("_abort",t),this._cleanup(),this.aborting=!0,this.emit("close",t.code,t.message),this.removeAllListeners()},r.prototype._cleanup=function(){if(f("_cleanup"),clearTimeout(this.timeoutId),this.script2&&(this.script2.parentNode.removeChild(this.script2),this.script2=null),this.script){var t=this.script;t.parentNode.removeChild(t),t.onreadystatechange=t.onerror=t.onload=t.onclick=null,this.script=null}delete e[o.WPrefix][this.id]},r.prototype._scriptError=function(){f("_scriptError");var t=this;this.errorTimer||(this.errorTimer=setTimeout(function(){t.loadedOkay||t._abort(new Error("JSONP script loaded abnormally (onerror)"))},r.scriptErrorTimeout))},r.prototype._createScript=function(t){f("_createScript",t);var n,r=this,o=this.script=e.document.createElement("script");if(o.id="a"+i.string(8),o.src=t,o.type="text/javascript",o.charset="UTF-8",o.onerror=this._scriptError.bind(this),o.onload=function(){f("onload"),r._abort(new Error("JSONP script loaded abnormally (onload)"))},o.onreadystatechange=function(){if(f("onreadystatechange",o.readyState),/loaded|closed/.test(o.readyState)){if(o&&o.htmlFor&&o.onclick){r.loadedOkay=!0;try{o.onclick()}catch(t){}}o&&r._abort(new Error("JSONP script loaded abnormally (onreadystatechange)"))}},"undefined"==typeof o.async&&e.document.attachEvent)if(a.isOpera())n=this.script2=e.document.createElement("script"),n.text="try{var a = document.getElementById('"+o.id+"'); if(a)a.onerror();}catch(x){};",o.async=n.async=!1;else{try{o.htmlFor=o.id,o.event="onclick"}catch(t){}o.async=!0}"undefined"!=typeof o.async&&(o.async=!0);var u=e.document.getElementsByTagName("head")[0];u.insertBefore(o,u.firstChild),n&&u.insertBefore(n,u.firstChild)},t.exports=r}).call(e,n(7))},function(t,e,n){"use strict";(function(e){function r(t){c("createIframe",t);try{return e.document.createElement('<iframe name="'+t+'">')}catch(r){var n=e.document.createElement("iframe");return n.name=t,n}}function o(){c("createForm"),i=e.document.createElement("form"),i.style.display="none",i.style.position="absolute",i.method="POST",i.enctype="application/x-www-form-urlencoded",i.acceptCharset="UTF-8",a=e.document.createElement("textarea"),a.name="d",i.appendChild(a),e.document.body.appendChild(i)}var i,a,u=n(55),s=n(21),c=function(){};t.exports=function(t,e,n){c(t,e),i||o();var f="a"+u.string(8);i.target=f,i.action=s.addQuery(s.addPath(t,"/jsonp_send"),"i="+f);var l=r(f);l.id=f,l.style.display="none",i.appendChild(l);try{a.value=e}catch(t){}i.submit();var p=function(t){c("completed",f,t),l.onerror&&(l.onreadystatechange=l.onerror=l.onload=null,setTimeout(function(){c("cleaning up",f),l.parentNode.removeChild(l),l=null},500),a.value="",n(t))};return l.onerror=function(){c("onerror",f),p()},l.onload=function(){c("onload",f),p()},l.onreadystatechange=function(t){c("onreadystatechange",f,l.readyState,t),"complete"===l.readyState&&p()},function(){c("aborted",f),p(new Error("Aborted"))}}}).call(e,n(7))},function(t,e,n){"use strict";function r(){var t=this;o.call(this),this.to=setTimeout(function(){t.emit("finish",200,"{}")},r.timeout)}var o=n(13).EventEmitter,i=n(4);i(r,o),r.prototype.close=function(){clearTimeout(this.to)},r.timeout=2e3,t.exports=r},function(t,e,n){"use strict";function r(t,e,n){if(!r.enabled())throw new Error("Transport created when disabled");u.call(this),c("constructor",t);var a=this,f=i.addPath(t,"/websocket");f="https"===f.slice(0,5)?"wss"+f.slice(5):"ws"+f.slice(4),this.url=f,this.ws=new s(this.url,[],n),this.ws.onmessage=function(t){c("message event",t.data),a.emit("message",t.data)},this.unloadRef=o.unloadAdd(function(){c("unload"),a.ws.close()}),this.ws.onclose=function(t){c("close event",t.code,t.reason),a.emit("close",t.code,t.reason),a._cleanup()},this.ws.onerror=function(t){c("error event",t),a.emit("close",1006,"WebSocket connection broken"),a._cleanup()}}var o=n(37),i=n(21),a=n(4),u=n(13).EventEmitter,s=n(393),c=function(){};a(r,u),r.prototype.send=function(t){var e="["+t+"]";c("send",e),this.ws.send(e)},r.prototype.close=function(){c("close");var t=this.ws;this._cleanup(),t&&t.close()},r.prototype._cleanup=function(){c("_cleanup");var t=this.ws;t&&(t.onmessage=t.onclose=t.onerror=null),o.unloadDel(this.unloadRef),this.unloadRef=this.ws=null,this.removeAllListeners()},r.enabled=function(){return c("enabled"),!!s},r.transportName="websocket",r.roundTrips=2,t.exports=r},function(t,e,n){"use strict";function r(t){if(!s.enabled)throw new Error("Transport created when disabled");i.call(this,t,"/xhr",u,s)}var o=n(4),i=n(54),a=n(158),u=n(77),s=n(110);o(r,i),r.enabled=a.enabled,r.transportName="xdr-polling",r.roundTrips=2,t.exports=r},function(t,e,n){"use strict";(function(e){function r(t){if(!s.enabled&&!u.enabled)throw new Error("Transport created when disabled");i.call(this,t,"/xhr_streaming",a,u)}var o=n(4),i=n(54),a=n(77),u=n(78),s=n(59),c=n(60);o(r,i),r.enabled=function(t){return!t.nullOrigin&&(!c.isOpera()&&u.enabled)},r.transportName="xhr-streaming",r.roundTrips=2,r.needBody=!!e.document,t.exports=r}).call(e,n(7))},function(t,e,n){"use strict";(function(e){e.crypto&&e.crypto.getRandomValues?t.exports.randomBytes=function(t){var n=new Uint8Array(t);return e.crypto.getRandomValues(n),n}:t.exports.randomBytes=function(t){for(var e=new Array(t),n=0;n<t;n++)e[n]=Math.floor(256*Math.random());return e}}).call(e,n(7))},function(t,e,n){"use strict";var r,o=n(33),i=/[\x00-\x1f\ud800-\udfff\ufffe\uffff\u0300-\u0333\u033d-\u0346\u034a-\u034c\u0350-\u0352\u0357-\u0358\u035c-\u0362\u0374\u037e\u0387\u0591-\u05af\u05c4\u0610-\u0617\u0653-\u0654\u0657-\u065b\u065d-\u065e\u06df-\u06e2\u06eb-\u06ec\u0730\u0732-\u0733\u0735-\u0736\u073a\u073d\u073f-\u0741\u0743\u0745\u0747\u07eb-\u07f1\u0951\u0958-\u095f\u09dc-\u09dd\u09df\u0a33\u0a36\u0a59-\u0a5b\u0a5e\u0b5c-\u0b5d\u0e38-\u0e39\u0f43\u0f4d\u0f52\u0f57\u0f5c\u0f69\u0f72-\u0f76\u0f78\u0f80-\u0f83\u0f93\u0f9d\u0fa2\u0fa7\u0fac\u0fb9\u1939-\u193a\u1a17\u1b6b\u1cda-\u1cdb\u1dc0-\u1dcf\u1dfc\u1dfe\u1f71\u1f73\u1f75\u1f77\u1f79\u1f7b\u1f7d\u1fbb\u1fbe\u1fc9\u1fcb\u1fd3\u1fdb\u1fe3\u1feb\u1fee-\u1fef\u1ff9\u1ffb\u1ffd\u2000-\u2001\u20d0-\u20d1\u20d4-\u20d7\u20e7-\u20e9\u2126\u212a-\u212b\u2329-\u232a\u2adc\u302b-\u302c\uaab2-\uaab3\uf900-\ufa0d\ufa10\ufa12\ufa15-\ufa1e\ufa20\ufa22\ufa25-\ufa26\ufa2a-\ufa2d\ufa30-\ufa6d\ufa70-\ufad9\ufb1d\ufb1f\ufb2a-\ufb36\ufb38-\ufb3c\ufb3e\ufb40-\ufb41\ufb43-\ufb44\ufb46-\ufb4e\ufff0-\uffff]/g,a=function(t){var e,n={},r=[];for(e=0;e<65536;e++)r.push(String.fromCharCode(e));return t.lastIndex=0,r.join("").replace(t,function(t){return n[t]="\\u"+("0000"+t.charCodeAt(0).toString(16)).slice(-4),""}),t.lastIndex=0,n};t.exports={quote:function(t){var e=o.stringify(t);return i.lastIndex=0,i.test(e)?(r||(r=a(i)),e.replace(i,function(t){return r[t]})):e}}},function(t,e,n){"use strict";(function(e){var n={};["log","debug","warn"].forEach(function(t){var r;try{r=e.console&&e.console[t]&&e.console[t].apply}catch(t){}n[t]=r?function(){return e.console[t].apply(e.console,arguments)}:"log"===t?function(){}:n.log}),t.exports=n}).call(e,n(7))},function(t,e,n){"use strict";var r=function(){};t.exports=function(t){return{filterToEnabled:function(e,n){var o={main:[],facade:[]};return e?"string"==typeof e&&(e=[e]):e=[],t.forEach(function(t){if(t)return"websocket"===t.transportName&&n.websocket===!1?void r("disabled from server","websocket"):e.length&&e.indexOf(t.transportName)===-1?void r("not in whitelist",t.transportName):void(t.enabled(n)?(r("enabled",t.transportName),o.main.push(t),t.facadeTransport&&o.facade.push(t.facadeTransport)):r("disabled",t.transportName))}),o}}}},function(t,e,n){var r;!function(){"use strict";function o(t){return a(u(t),arguments)}function i(t,e){return o.apply(null,[t].concat(e||[]))}function a(t,e){var n,r,i,a,u,c,f,l,p,h=1,d=t.length,v="";for(r=0;r<d;r++)if("string"==typeof t[r])v+=t[r];else if(Array.isArray(t[r])){if(a=t[r],a[2])for(n=e[h],i=0;i<a[2].length;i++){if(!n.hasOwnProperty(a[2][i]))throw new Error(o('[sprintf] property "%s" does not exist',a[2][i]));n=n[a[2][i]]}else n=a[1]?e[a[1]]:e[h++];if(s.not_type.test(a[8])&&s.not_primitive.test(a[8])&&n instanceof Function&&(n=n()),s.numeric_arg.test(a[8])&&"number"!=typeof n&&isNaN(n))throw new TypeError(o("[sprintf] expecting number but found %T",n));switch(s.number.test(a[8])&&(l=n>=0),a[8]){case"b":n=parseInt(n,10).toString(2);break;case"c":n=String.fromCharCode(parseInt(n,10));break;case"d":case"i":n=parseInt(n,10);break;case"j":n=JSON.stringify(n,null,a[6]?parseInt(a[6]):0);break;case"e":n=a[7]?parseFloat(n).toExponential(a[7]):parseFloat(n).toExponential();break;case"f":n=a[7]?parseFloat(n).toFixed(a[7]):parseFloat(n);break;case"g":n=a[7]?String(Number(n.toPrecision(a[7]))):parseFloat(n);break;case"o":n=(parseInt(n,10)>>>0).toString(8);break;case"s":n=String(n),n=a[7]?n.substring(0,a[7]):n;break;case"t":n=String(!!n),n=a[7]?n.substring(0,a[7]):n;break;case"T":n=Object.prototype.toString.call(n).slice(8,-1).toLowerCase(),n=a[7]?n.substring(0,a[7]):n;break;case"u":n=parseInt(n,10)>>>0;break;case"v":n=n.valueOf(),n=a[7]?n.substring(0,a[7]):n;break;case"x":n=(parseInt(n,10)>>>0).toString(16);break;case"X":n=(parseInt(n,10)>>>0).toString(16).toUpperCase()}s.json.test(a[8])?v+=n:(!s.number.test(a[8])||l&&!a[3]?p="":(p=l?"+":"-",n=n.toString().replace(s.sign,"")),c=a[4]?"0"===a[4]?"0":a[4].charAt(1):" ",f=a[6]-(p+n).length,u=a[6]&&f>0?c.repeat(f):"",v+=a[5]?p+n+u:"0"===c?p+u+n:u+p+n)}return v}function u(t){if(c[t])return c[t];for(var e,n=t,r=[],o=0;n;){if(null!==(e=s.text.exec(n)))r.push(e[0]);else if(null!==(e=s.modulo.exec(n)))r.push("%");else{if(null===(e=s.placeholder.exec(n)))throw new SyntaxError("[sprintf] unexpected placeholder");if(e[2]){o|=1;var i=[],a=e[2],u=[];if(null===(u=s.key.exec(a)))throw new SyntaxError("[sprintf] failed to parse named argument key");for(i.push(u[1]);""!==(a=a.substring(u[0].length));)if(null!==(u=s.key_access.exec(a)))i.push(u[1]);else{if(null===(u=s.index_access.exec(a)))throw new SyntaxError("[sprintf] failed to parse named argument key");i.push(u[1])}e[2]=i}else o|=2;if(3===o)throw new Error("[sprintf] mixing positional and named placeholders is not (yet) supported");r.push(e)}n=n.substring(e[0].length)}return c[t]=r}var s={not_string:/[^s]/,not_bool:/[^t]/,not_type:/[^T]/,not_primitive:/[^v]/,number:/[diefg]/,numeric_arg:/[bcdiefguxX]/,json:/[j]/,not_json:/[^j]/,text:/^[^\x25]+/,modulo:/^\x25{2}/,placeholder:/^\x25(?:([1-9]\d*)\$|\(([^\)]+)\))?(\+)?(0|'[^$])?(-)?(\d+)?(?:\.(\d+))?([b-gijostTuvxX])/,key:/^([a-z_][a-z_\d]*)/i,key_access:/^\.([a-z_][a-z_\d]*)/i,index_access:/^\[(\d+)\]/,sign:/^[\+\-]/},c=Object.create(null);e.sprintf=o,e.vsprintf=i,"undefined"!=typeof window&&(window.sprintf=o,window.vsprintf=i,r=function(){return{sprintf:o,vsprintf:i}}.call(e,n,e,t),!(void 0!==r&&(t.exports=r)))}()},function(t,e){"use strict";function n(t){return decodeURIComponent(t.replace(/\+/g," "))}function r(t){for(var e,r=/([^=?&]+)=?([^&]*)/g,o={};e=r.exec(t);o[n(e[1])]=n(e[2]));return o}function o(t,e){e=e||"";var n=[];"string"!=typeof e&&(e="?");for(var r in t)i.call(t,r)&&n.push(encodeURIComponent(r)+"="+encodeURIComponent(t[r]));return n.length?e+n.join("&"):""}var i=Object.prototype.hasOwnProperty;e.stringify=o,e.parse=r},function(t,e,n){var r,o;n(426),r=n(167);var i=n(418);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){var r,o;r=n(169);var i=n(420);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){var r,o;r=n(171);var i=n(419);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){var r,o;r=n(172);var i=n(421);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){var r,o;r=n(173);var i=n(424);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e,n){var r,o;r=n(174);var i=n(423);o=r=r||{},"object"!=typeof r.default&&"function"!=typeof r.default||(o=r=r.default),"function"==typeof o&&(o=o.options),o.render=i.render,o.staticRenderFns=i.staticRenderFns,t.exports=r},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{attrs:{id:"app"}},[n("div",{staticClass:"navbar navbar-default navbar-fixed-top",attrs:{id:"header"}},[n("div",{staticClass:"navbar-header"},[t._m(0),t._v(" "),n("a",{staticClass:"navbar-brand",attrs:{href:"#"}},[n("span",{staticClass:"app-logo"},[t._v(" ")]),t._v(" "),n("span",{staticClass:"app-name"},[t._v(t._s(t.appName))]),t._v(" "),n("span",{staticClass:"badge"},[t._v(t._s(t.appStatus))])])]),t._v(" "),t._m(1)]),t._v(" "),n("router-view"),t._v(" "),n("div",{staticClass:"log-drawer",class:{"log-drawer-open":t.logDisplay}},[n("div",{staticClass:"log-lapel",on:{click:function(e){t.toggleLogDisplay()}}},[n("span",[t._v("Log")]),n("span",{staticClass:"badge badge-log"},[t._v(t._s(t.unseenLogCount))])]),t._v(" "),n("div",{staticClass:"log-pane"},[n("div",{staticClass:"log-controls form-inline"},[n("button",{staticClass:"btn btn-default",attrs:{type:"button","aria-label":"Delete log"},on:{click:function(e){t.clearLogs()}}},[t._v("\n                   Clear\n                ")]),t._v(" "),n("div",{staticClass:"input-group"},[n("span",{staticClass:"input-group-addon",attrs:{id:"basic-addon1"}},[t._v("\n                          Filter\n                      ")]),t._v(" "),n("input",{directives:[{name:"model",rawName:"v-model",value:t.logFilterString,expression:"logFilterString"}],staticClass:"form-control",attrs:{type:"text",placeholder:"Level or text","aria-describedby":"basic-addon1"},domProps:{value:t.logFilterString},on:{input:function(e){e.target.composing||(t.logFilterString=e.target.value)}}})])]),t._v(" "),n("div",{staticClass:"log-area",attrs:{id:"log-area"}},[n("ul",{staticClass:"log-list"},t._l(t.filteredLog,function(e){return n("li",{class:t.logStyle(e.levelname)},[t._v("\n                       "+t._s(t.logItem(e))+"\n                   ")])}))])])]),t._v(" "),n("div",{staticClass:"modal fade helpmodal",attrs:{tabindex:"-1",role:"dialog","aria-labelledby":"helpmodal","aria-hidden":"true",id:"helpmodal"}},[n("div",{staticClass:"modal-dialog modal-lg",attrs:{role:"document"}},[n("div",{staticClass:"modal-content"},[t._m(2),t._v(" "),n("div",{staticClass:"modal-body",domProps:{innerHTML:t._s(t.helpDoc)}}),t._v(" "),t._m(3)])])])],1)},staticRenderFns:[function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("button",{staticClass:"navbar-toggle collapsed",attrs:{type:"button","data-toggle":"collapse","data-target":".navbar-collapse"}},[n("i",{staticClass:"icon-reorder"})])},function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("nav",{staticClass:"collapse navbar-collapse"},[n("ul",{staticClass:"nav navbar-nav pull-right"},[n("li",[n("a",{attrs:{href:"#","data-toggle":"modal","data-target":"#helpmodal"}},[t._v("Help")])])])])},function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"modal-header"},[n("button",{staticClass:"close",attrs:{type:"button","data-dismiss":"modal","aria-label":"Close"}},[n("span",{attrs:{"aria-hidden":"true"}},[t._v("×")])]),t._v(" "),n("h4",{staticClass:"modal-title",attrs:{id:"myModalLabel"}},[t._v("Help")])])},function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"modal-footer"},[n("button",{staticClass:"btn btn-default",attrs:{type:"button","data-dismiss":"modal"}},[t._v("Close")])])}]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{directives:[{name:"show",rawName:"v-show",value:t.loading,expression:"loading"}],staticClass:"v-spinner"},[n("div",{staticClass:"v-beat v-beat-odd",style:t.spinnerStyle}),n("div",{staticClass:"v-beat v-beat-even",style:t.spinnerStyle}),n("div",{staticClass:"v-beat v-beat-odd",style:t.spinnerStyle})])},staticRenderFns:[]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"panel panel-default panel-prop",attrs:{id:"mp-"+t.validId}},["HTML"==t.propObject.value_type?[n("div",{staticClass:"panel-heading"},[t._v(t._s(t.propObject.name))]),t._v(" "),n("div",{staticClass:"panel-body",domProps:{innerHTML:t._s(t.htmlValue)}})]:[n("div",{staticClass:"panel-body"},[n("form",{staticClass:"form-horizontal"},[n("span",{staticClass:"pull-left control-label"},[t.propObject.doc?[n("a",{attrs:{href:"#"+t.validId+"-help","data-toggle":"collapse"}},[t._v("\n              "+t._s(t.propObject.name))])]:[t._v(t._s(t.propObject.name))]],2),t._v(" "),n("muta-prop-value",{attrs:{"prop-object":t.propObject,objId:t.objId}})],1),t._v(" "),n("div",{staticClass:"mutaprop-help collapse ",attrs:{id:t.validId+"-help"}},[n("hr"),t._v(" "),n("div",{staticClass:"help-block",domProps:{innerHTML:t._s(t.propObject.doc)}})])])]],2)},staticRenderFns:[]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"col-xs-12 col-md-2",attrs:{id:"sidebar-wrapper"}},[n("div",{attrs:{id:"sidebar"}},[n("ul",{staticClass:"nav list-group"},t._l(t.objectList,function(e){return n("li",[n("router-link",{class:["list-group-item",e==t.selectedObject?"sidebar-selected":""],attrs:{to:{name:"object",params:{id:e}}}},[t._v("\n                   "+t._s(e)+"\n                ")])],1)}))])])},staticRenderFns:[]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{attrs:{id:"muta-prop-list"}},["actionsProps"===t.displayType?[n("muta-prop-panel",{attrs:{"prop-list":t.actionList,"obj-id":t.objId,heading:"Actions"}}),t._v(" "),n("muta-prop-panel",{attrs:{"prop-list":t.propertyList,"obj-id":t.objId,heading:"Properties"}})]:t._e(),t._v(" "),[n("muta-prop-panel",{attrs:{"prop-list":t.hierarchyList.otherActions,"obj-id":t.objId,heading:"Actions"}}),t._v(" "),t._l(t.hierarchyList.hierarchy,function(e,r){return n("muta-prop-panel",{attrs:{"prop-list":e,"obj-id":t.objId,heading:r}})}),t._v(" "),n("muta-prop-panel",{attrs:{"prop-list":t.hierarchyList.otherProps,"obj-id":t.objId,heading:"Other Properties"}})]],2)},staticRenderFns:[]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"container-fluid",attrs:{id:"wrapper"}},[n("div",{staticClass:"row"},[t.$store.getters.mutaObjectCount>1?n("muta-object-list",{attrs:{"object-list":t.$store.state.mutaObjectList,"selected-object":t.viewedObjectId}}):t._e(),t._v(" "),n("div",{class:[t.$store.getters.mutaObjectCount>1?"col-md-10":"col-md-12","col-xs-12"],attrs:{id:"main-wrapper"}},[t.viewedObjectId?n("div",{attrs:{id:"main"}},[1==t.$store.getters.mutaObjectCount?n("div",{staticClass:"muta-fill"}):t._e(),t._v(" "),n("div",{staticClass:"page-header"},[n("h3",[t._v(t._s(t.viewedObjectId))])]),t._v(" "),t.mutaListLoaded?t._e():n("div",{staticClass:"text-center"},[n("beat-loader",{attrs:{loading:!t.mutaListLoaded,color:"#003394",height:"200px",width:"200px"}})],1),t._v(" "),t.mutaObjectAvailable?t._e():n("div",[t._m(0)]),t._v(" "),t.mutaObjectAvailable&&!t.objectConnectionExists?n("div",[t._m(1)]):t._e(),t._v(" "),t.mutaListLoaded&&t.mutaObjectAvailable?n("muta-prop-list",{attrs:{"prop-list":t.mutaProps,"obj-id":t.viewedObjectId}}):t._e()],1):n("div",{attrs:{id:"main"}},[n("div",{staticClass:"alert alert-info",attrs:{role:"alert"}},[t._v("\n                Select an object to control.\n            ")])])])],1)])},staticRenderFns:[function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"alert alert-danger",attrs:{role:"alert"}},[n("strong",[t._v("Error!")]),t._v(" Object is not available.\n                ")])},function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("div",{staticClass:"alert alert-danger",attrs:{role:"alert"}},[n("strong",[t._v("Connection to object lost!")]),t._v("\n                    Changes will not be applied.\n                ")])}]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return n("span",{staticClass:"pull-right form-inline"},[t.isChangeLabelVisible?n("label",{class:t.labelClass},[t._v("\n        "+t._s(t.labelVal)+"\n    ")]):t._e(),t._v(" "),t.hasSelect?[n("select",{directives:[{name:"model",rawName:"v-model",value:t.uiVal,expression:"uiVal"}],staticClass:"form-control",class:t.inputClass,attrs:{disabled:t.read_only},on:{change:[function(e){var n=Array.prototype.filter.call(e.target.options,function(t){return t.selected}).map(function(t){var e="_value"in t?t._value:t.value;return e});t.uiVal=e.target.multiple?n:n[0]},t.onUserChange],click:t.onSelectClick}},t._l(t.selectItems,function(e){return n("option",{domProps:{value:e.value}},[t._v("\n                "+t._s(e.text)+"\n            ")])}))]:["INT"==t.propObject.value_type||"REAL"==t.propObject.value_type?n("input",{directives:[{name:"model",rawName:"v-model.number",value:t.uiVal,expression:"uiVal",modifiers:{number:!0}}],staticClass:"form-control",class:t.inputClass,attrs:{type:"number",min:t.min_val,max:t.max_val,step:t.step,disabled:t.read_only},domProps:{value:t.uiVal},on:{change:t.onUserChange,keyup:function(e){return"button"in e||!t._k(e.keyCode,"enter",13)?void t.onUserChange(e):null},input:function(e){e.target.composing||(t.uiVal=t._n(e.target.value))},blur:function(e){t.$forceUpdate()}}}):t._e(),t._v(" "),"BOOL"==t.propObject.value_type?n("input",{directives:[{name:"model",rawName:"v-model",value:t.uiVal,expression:"uiVal"}],class:t.inputClass,attrs:{type:"checkbox",disabled:t.read_only,id:t.validId},domProps:{checked:Array.isArray(t.uiVal)?t._i(t.uiVal,null)>-1:t.uiVal},on:{change:t.onUserChange,__c:function(e){var n=t.uiVal,r=e.target,o=!!r.checked;if(Array.isArray(n)){var i=null,a=t._i(n,i);r.checked?a<0&&(t.uiVal=n.concat(i)):a>-1&&(t.uiVal=n.slice(0,a).concat(n.slice(a+1)))}else t.uiVal=o}}}):t._e(),t._v(" "),"STRING"==t.propObject.value_type?n("input",{directives:[{name:"model",rawName:"v-model",value:t.uiVal,expression:"uiVal"}],staticClass:"form-control",class:t.inputClass,attrs:{type:"text",disabled:t.read_only,maxlength:t.max_val},domProps:{value:t.uiVal},on:{change:t.onUserChange,keyup:function(e){return"button"in e||!t._k(e.keyCode,"enter",13)?void t.onUserChange(e):null},input:function(e){e.target.composing||(t.uiVal=e.target.value)}}}):t._e(),t._v(" "),"action"==t.propObject.type?n("button",{staticClass:"btn btn-primary",attrs:{type:"button",disabled:t.read_only},on:{click:t.actionExecuted}},[t._v("\n            Action\n        ")]):t._e()]],2)},staticRenderFns:[]}},function(t,e){t.exports={render:function(){var t=this,e=t.$createElement,n=t._self._c||e;return t.hasContent?n("div",{staticClass:"panel panel-default panel-proplist"},[n("div",{staticClass:"panel-heading"},[n("a",{attrs:{"data-toggle":"collapse",href:"#"+t.collapseName}},[t._v("\n            "+t._s(t.heading))])]),t._v(" "),n("div",{staticClass:"panel-collapse collapse in",attrs:{id:t.collapseName}},t._l(t.propList,function(e){return n("muta-prop",{attrs:{"prop-object":e,"obj-id":t.objId}})}))]):t._e()},staticRenderFns:[]}},function(t,e,n){var r=n(378);"string"==typeof r&&(r=[[t.i,r,""]]);n(113)(r,{});r.locals&&(t.exports=r.locals)},function(t,e,n){var r=n(379);"string"==typeof r&&(r=[[t.i,r,""]]);n(113)(r,{});r.locals&&(t.exports=r.locals)},function(t,e,n){var r=n(380);"string"==typeof r&&(r=[[t.i,r,""]]);n(113)(r,{});r.locals&&(t.exports=r.locals)},function(t,e){(function(e){t.exports=e}).call(e,{})},function(t,e){},function(t,e,n){"use strict";var r=n(38),o=n.n(r),i=n(164),a=n.n(i),u=n(165),s=n.n(u),c=n(166),f=n(114),l=n(163),p=(n.n(l),n(79)),h=n(49),d=n.n(h);o.a.use(c.a),o.a.use(f.a),window.eventBus=new o.a;var v=new c.a({history:!1,routes:[{path:"/objects/:id",name:"object",component:s.a},{path:"/objects",component:s.a},{path:"/",redirect:"/objects"}]}),g=new f.a.Store({state:{mutaObjectList:[],mutaObjects:{},mutaProps:{},selectedObjectId:null},mutations:{set_muta_objects:function(t,e){t.mutaObjectList=e},set_selected_object_id:function(t,e){t.selectedObjectId=e},set_muta_object:function(t,e){console.log("Commiting"),console.log(e),o.a.set(t.mutaObjects,e.obj_id,e);var r=!0,i=!1,a=void 0;try{for(var u,s=e.props[Symbol.iterator]();!(r=(u=s.next()).done);r=!0){var c=u.value,f=n.i(p.c)(d.a.get(c,"class_scope",!1)?e.class_id:e.obj_id,c.id);o.a.set(t.mutaProps,f,{value:c.value,eventSource:null}),console.log("PropID: "+f)}}catch(t){i=!0,a=t}finally{try{!r&&s.return&&s.return()}finally{if(i)throw a}}},muta_prop_change:function(t,e){var r=n.i(p.c)(e.objId,e.propId),i=e.value;if(d.a.has(e,"patch")){var a=t.mutaProps[r];if(!a||a.version!==e.base)return void window.eventBus.$emit("muta_prop_resync",e);i=a.value.slice(0,e.patch[0])+e.patch[2]+a.value.slice(e.patch[0]+e.patch[1])}o.a.set(t.mutaProps,r,{value:i,eventSource:e.eventSource,version:e.version})}},getters:{mutaObjectCount:function(t){return t.mutaObjectList.length},getMutaProp:function(t){return function(e,n){return d.a.find(t.mutaObjects[e].props,{id:n})}},getMutaPropValue:function(t,e){return function(r,o){var i=null;return i=d.a.get(e.getMutaProp(r,o),"class_scope",!1)?t.mutaObjects[r].class_id:r,t.mutaProps[n.i(p.c)(i,o)].value}},getMutaPropChange:function(t){return function(e,r){return t.mutaProps[n.i(p.c)(e,r)]}},getDynamicValue:function(t,e){return function(t,r){return n.i(p.b)(r)?e.getMutaPropValue(t,r.id):r}}}});new o.a({render:function(t){return t(a.a)},router:v,store:g}).$mount("#app")}]);
\ No newline at end of file
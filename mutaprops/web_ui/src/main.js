@@ -54,10 +54,25 @@ const store = new Vuex.Store({
         },
         muta_prop_change (state, mutaPropChange) {
             // console.log("Storing prop change");
-            Vue.set(state.mutaProps,
-                globalPropId( mutaPropChange.objId, mutaPropChange.propId),
-                { "value": mutaPropChange.value,
-                  "eventSource": mutaPropChange.eventSource }
+            let propId = globalPropId(mutaPropChange.objId,
+                                      mutaPropChange.propId);
+            let value = mutaPropChange.value;
+            if (_.has(mutaPropChange, 'patch')) {
+                // Large strings may come as a patch against the last value
+                let current = state.mutaProps[propId];
+                if (!current || current.version !== mutaPropChange.base) {
+                    // Base value was missed, full value has to be fetched
+                    window.eventBus.$emit('muta_prop_resync', mutaPropChange);
+                    return;
+                }
+                let [start, deleteCount, text] = mutaPropChange.patch;
+                value = current.value.slice(0, start) + text +
+                    current.value.slice(start + deleteCount);
+            }
+            Vue.set(state.mutaProps, propId,
+                { "value": value,
+                  "eventSource": mutaPropChange.eventSource,
+                  "version": mutaPropChange.version }
                   );
         }
     },
@@ -35,6 +35,10 @@ setup(
                  'mutaprops'},
     include_package_data=True,
     install_requires=requirements,
+    extras_require={
+        'msgpack': ['msgpack>=0.5.2'],
+        'brotli': ['brotli>=1.0.0'],
+    },
     license="MIT license",
     zip_safe=False,
     keywords=['mutaprops', 'GUI', 'HTML5', 'autogenerated'],
@@ -10,19 +10,1429 @@ Tests for `mutaprops` module.
 
 
 import sys
+import json
+import time
+import threading
+import asyncio
+import logging
 import unittest
+from collections import namedtuple
+
+import sockjs
 
 from mutaprops import mutaprops
+from mutaprops import utils
+from mutaprops import managers
+from mutaprops.assets import AssetBundle, StaticAsset
+from mutaprops.history import HistoryBuffer
+from mutaprops.streaming import SampleStreamer, encode_frame, decode_frame
+from mutaprops.notifications import ChangeCoalescer, DeltaEncoder, \
+    Subscription, ChangeBridge
+from mutaprops.managers import HttpMutaManager
+from mutaprops import *
+from mutaprops.mutaprops import MutaSource, MutaPropError, ChangeDetection
+
+
+@mutaprop_class("Parrot")
+class Parrot(object):
+    """ Norwegian *Blue*."""
+
+    def __init__(self):
+        self._volts = 4000
+        self._pining = True
+
+    @mutasource
+    def pining(self):
+        return self._pining
+
+    @mutaproperty("Voltage", MutaTypes.INT, min_val=0, max_val=5000,
+                  read_only=pining, hierarchy='Electrics')
+    def volts(self):
+        """ Voltage needed to make it *voom*."""
+        return self._volts
+
+    @volts.setter
+    def volts(self, value):
+        self._volts = value
+
+    @mutaprop_action("Nail to the perch")
+    def nail(self):
+        self._pining = False
+
+
+@mutaprop_class("Async parrot")
+class AsyncParrot(object):
+
+    def __init__(self):
+        self._volts = 4000
+        self._nailed = False
+
+    @mutaproperty("Voltage", MutaTypes.INT)
+    async def volts(self):
+        await asyncio.sleep(0)
+        return self._volts
+
+    @volts.setter
+    async def volts(self, value):
+        await asyncio.sleep(0)
+        self._volts = value
+
+    @mutaproperty("Nailed", MutaTypes.BOOL)
+    async def nailed(self):
+        return self._nailed
+
+    @mutaprop_action("Nail to the perch")
+    async def nail(self):
+        self._nailed = True
+
+
+@mutaprop_class("Slow parrot", blocking=True)
+class SlowParrot(object):
+
+    def __init__(self):
+        self.threads = set()
+        self.active = 0
+        self.max_active = 0
+
+    @mutaproperty("Voltage", MutaTypes.INT)
+    def volts(self):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+        self.active -= 1
+        return 4000
+
+    @mutaproperty("Fast voltage", MutaTypes.INT, blocking=False)
+    def fast_volts(self):
+        self.threads.add(threading.get_ident())
+        return 10
+
+
+@mutaprop_class("Bus parrot", change_detection='cached')
+class BusParrot(object):
+
+    def __init__(self):
+        self.reads = 0
+        self.broken = False
+        self._volts = 0
+        self._squawk = ''
+
+    @mutaproperty("Voltage", MutaTypes.INT)
+    def volts(self):
+        self.reads += 1
+        return self._volts
+
+    @volts.setter
+    def volts(self, value):
+        if self.broken:
+            raise ValueError("Bus is down.")
+        self._volts = value
+
+    @mutaproperty("Squawk", MutaTypes.STRING, change_detection='always')
+    def squawk(self):
+        self.reads += 1
+        return self._squawk
+
+    @squawk.setter
+    def squawk(self, value):
+        self._squawk = value
+
+
+@mutaprop_class("Polled parrot")
+class PolledParrot(object):
+
+    def __init__(self):
+        self.register = 0
+        self.reads = 0
+
+    @mutaproperty("Register", MutaTypes.INT, poll_interval=0.02, history=4)
+    def volts(self):
+        self.reads += 1
+        return self.register
+
+    @mutasource(poll_interval=0.02)
+    def alive(self):
+        return self.register > 0
+
+
+@mutaprop_class("Streamed parrot")
+class StreamedParrot(object):
+
+    def __init__(self):
+        self._current = 0.0
 
+    @mutaproperty("Current", MutaTypes.REAL, stream=True, history=10)
+    def current(self):
+        return self._current
+
+    @current.setter
+    def current(self, value):
+        self._current = value
 
 
 class TestMutaprops(unittest.TestCase):
 
     def setUp(self):
-        pass
+        self.parrot = Parrot()
+        self.parrot.muta_init("Parrot #1")
 
     def tearDown(self):
         pass
 
     def test_000_something(self):
         pass
+
+    def test_to_json_matches_to_dict(self):
+        self.assertEqual(json.loads(self.parrot.to_json()),
+                         self.parrot.to_dict())
+        for prop in self.parrot.props.values():
+            self.assertEqual(json.loads(prop.to_json(obj=self.parrot)),
+                             prop.to_dict(obj=self.parrot))
+
+    def test_schema_is_cached(self):
+        volts = self.parrot.props['volts']
+        self.assertIs(volts.schema(), volts.schema())
+        self.assertNotIn('value', volts.schema())
+        self.assertEqual(volts.schema()['read_only'],
+                         {'type': 'source', 'id': 'pining'})
+        self.assertIs(Parrot.class_schema(), Parrot.class_schema())
+
+    def test_value_overlay_is_live(self):
+        volts = self.parrot.props['volts']
+        self.assertEqual(volts.to_dict(obj=self.parrot)['value'], 4000)
+        self.parrot.volts = 10
+        self.assertEqual(json.loads(volts.to_json(obj=self.parrot))['value'],
+                         10)
+        self.assertNotIn('value', self.parrot.props['nail'].to_dict(
+            obj=self.parrot))
+
+    def test_prop_values(self):
+        self.assertEqual(dict(self.parrot.prop_values()),
+                         {'pining': True, 'volts': 4000})
+        self.assertEqual(dict(self.parrot.prop_values(['volts', 'nail',
+                                                       'unknown'])),
+                         {'volts': 4000})
+
+    def test_schema_and_values_tags(self):
+        schema_tag = self.parrot.schema_tag()
+        values_tag = self.parrot.values_tag(self.parrot.prop_values())
+        self.parrot.volts = 10
+        self.assertEqual(self.parrot.schema_tag(), schema_tag)
+        self.assertNotEqual(self.parrot.values_tag(self.parrot.prop_values()),
+                            values_tag)
+        values = self.parrot.prop_values()
+        self.assertEqual(self.parrot.to_json(values), self.parrot.to_json())
+
+
+    def test_coroutine_props(self):
+        parrot = AsyncParrot()
+        parrot.muta_init("Parrot #2")
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(dict(loop.run_until_complete(
+                parrot.gather_prop_values())),
+                {'volts': 4000, 'nailed': False})
+            loop.run_until_complete(parrot.props['volts'].muta_set(parrot, 3))
+            loop.run_until_complete(parrot.props['nail'].muta_call(parrot))
+            self.assertEqual(dict(loop.run_until_complete(
+                parrot.gather_prop_values())),
+                {'volts': 3, 'nailed': True})
+        finally:
+            loop.close()
+        with self.assertRaises(MutaPropError):
+            parrot.volts = 5
+
+    def test_change_detection(self):
+        parrot = BusParrot()
+        changes = []
+        parrot.muta_init("Parrot #3", lambda *args: changes.append(args[1:]))
+        parrot.volts = 1
+        parrot.volts = 1
+        parrot.props['volts'].muta_set(parrot, 1)
+        parrot.squawk = 'x'
+        parrot.squawk = 'x'
+        parrot.volts = 2
+        self.assertEqual(parrot.reads, 0)
+        self.assertEqual(changes, [('volts', 1), ('squawk', 'x'),
+                                   ('squawk', 'x'), ('volts', 2)])
+
+        # Failed set isn't remembered, the retry goes through
+        parrot.broken = True
+        with self.assertRaises(ValueError):
+            parrot.volts = 3
+        with self.assertRaises(ValueError):
+            parrot.props['volts'].muta_set(parrot, 4)
+        self.assertTrue(parrot.props['volts'].is_change(parrot, 4))
+        parrot.broken = False
+        parrot.volts = 3
+        self.assertEqual(changes[-1], ('volts', 3))
+
+        volts = parrot.props['volts']
+        volts._muta_change_detection = ChangeDetection.HASH
+        volts.remember_value(parrot, 5)
+        self.assertFalse(volts.is_change(parrot, 5))
+        self.assertTrue(volts.is_change(parrot, 6))
+
+    def test_typecast(self):
+        self.assertIs(MutaTypes.typecast(MutaTypes.BOOL, 'True'), True)
+        self.assertIs(MutaTypes.typecast(MutaTypes.BOOL, False), False)
+        self.assertEqual(MutaTypes.typecast(MutaTypes.INT, '42'), 42)
+        self.assertEqual(MutaTypes.typecast(MutaTypes.REAL, 1), 1.0)
+        self.assertEqual(MutaTypes.typecast(MutaTypes.STRING, 7), '7')
+
+
+    def test_prop_table_shared(self):
+        other = Parrot()
+        other.muta_init("Parrot #2")
+        self.assertIs(other.props, self.parrot.props)
+        self.assertEqual(list(self.parrot.props), ['pining', 'volts', 'nail'])
+
+    def test_prop_table_invalidation(self):
+
+        class Sub(Parrot):
+            pass
+
+        self.assertEqual(list(Sub.muta_prop_table()),
+                         list(self.parrot.props))
+        Sub.extra = MutaSource('extra', None, None, fget=lambda obj: 1)
+        Parrot.muta_invalidate_props()
+        self.assertIn('extra', Sub.muta_prop_table())
+        self.assertNotIn('extra', Parrot.muta_prop_table())
+
+    def test_select_props(self):
+        def ids(props):
+            return [prop.prop_id for prop in props]
+
+        self.assertEqual(ids(self.parrot.select_props()),
+                         ['pining', 'volts', 'nail'])
+        self.assertEqual(ids(self.parrot.select_props(hierarchy='Electrics')),
+                         ['volts'])
+        self.assertEqual(ids(self.parrot.select_props(hierarchy='Electric')),
+                         [])
+        self.assertEqual(ids(self.parrot.select_props(
+            prop_types=['source', 'action'])), ['pining', 'nail'])
+        self.assertEqual(ids(self.parrot.select_props(
+            prop_types=['property'], prop_ids=['volts', 'nail'])), ['volts'])
+
+    def test_compact_props(self):
+        volts = Parrot.volts
+        self.assertFalse(hasattr(volts, '__dict__'))
+        self.assertEqual(volts.__doc__, " Voltage needed to make it *voom*.")
+        self.assertTrue(mutaprops.MutaProperty.__doc__.startswith("Emulate"))
+
+        def fget(obj):
+            """ Getter docstring."""
+            return 0
+
+        # Decorator steps copy the prop, keeping its order and docstring
+        getter_only = mutaprops.MutaProperty('volts', 'Voltage', MutaTypes.INT,
+                                             max_val=5000).getter(fget)
+        self.assertEqual(getter_only.__doc__, " Getter docstring.")
+        with_setter = getter_only.setter(min_val=10)(lambda obj, value: None)
+        self.assertEqual(with_setter.definition_order,
+                         getter_only.definition_order)
+        self.assertEqual(with_setter.__doc__, getter_only.__doc__)
+        self.assertEqual(with_setter.schema()['min_val'], 10)
+        self.assertEqual(with_setter.schema()['max_val'], 5000)
+        self.assertTrue(with_setter.is_writeable())
+        self.assertFalse(getter_only.is_writeable())
+
+
+FakeRequest = namedtuple('FakeRequest', ['headers', 'query'])
+
+
+class TestAssets(unittest.TestCase):
+
+    def setUp(self):
+        self.assets = AssetBundle()
+        self.assets.add(StaticAsset.from_bytes('app.js', b'var x = 1;' * 100))
+
+    def test_compressed_variant(self):
+        resp = self.assets.response(
+            FakeRequest({'Accept-Encoding': 'br;q=0, gzip'}, {}), 'app.js')
+        self.assertEqual(resp.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(resp.headers['Cache-Control'], 'no-cache')
+        resp = self.assets.response(FakeRequest({}, {}), 'app.js')
+        self.assertNotIn('Content-Encoding', resp.headers)
+
+    def test_versioned_url(self):
+        html = self.assets.versioned_html(
+            '<script src="dist/app.js"></script><img src="dist/x.png">')
+        url = self.assets.url('app.js')
+        self.assertIn(url, html)
+        self.assertIn('"dist/x.png"', html)
+        resp = self.assets.response(
+            FakeRequest({}, {'v': url.split('=')[1]}), 'app.js')
+        self.assertIn('immutable', resp.headers['Cache-Control'])
+
+
+class TestUtils(unittest.TestCase):
+
+    def test_lru_cache_eviction(self):
+        cache = utils.LruCache(maxsize=2)
+        cache.get_or_create('a', str.upper)
+        cache.get_or_create('b', str.upper)
+        cache.get_or_create('a', str.upper)  # 'a' is now most recent
+        cache.get_or_create('c', str.upper)
+        self.assertEqual(list(cache.keys()), ['a', 'c'])
+        self.assertEqual(cache.info(), {'hits': 1, 'misses': 3,
+                                        'size': 2, 'maxsize': 2})
+
+    def test_lru_cache_assignment_bounded(self):
+        cache = utils.LruCache(maxsize=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache.lookup('a'), 1)  # 'a' is now most recent
+        cache['c'] = 3
+        self.assertEqual(list(cache.keys()), ['a', 'c'])
+        self.assertIsNone(cache.lookup('b'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_rest_to_html_cached(self):
+        doc = "Some *unique* docstring for the cache test."
+        before = utils.rest_cache_info()
+        first = utils.rest_to_html(doc)
+        second = utils.rest_to_html(doc)
+        after = utils.rest_cache_info()
+        self.assertIs(first, second)
+        self.assertIn('<em>unique</em>', first)
+        self.assertEqual(after['misses'] - before['misses'], 1)
+        self.assertEqual(after['hits'] - before['hits'], 1)
+        self.assertIsNone(utils.rest_to_html(None))
+
+    def test_prerender_prop_subclass_docs(self):
+        class RegisterProperty(mutaprops.MutaProperty):
+            """ Register *subclass* docstring for the prerender test."""
+
+        @mutaprop_class("Register parrot")
+        class RegisterParrot(object):
+            reg = RegisterProperty('reg', "Register", MutaTypes.INT,
+                                   fget=lambda self: 1,
+                                   doc="Register *own* prerendered doc.")
+
+        self.assertIn("Register *own* prerendered doc.",
+                      utils._rest_html_cache)
+        self.assertNotIn(RegisterProperty.__doc__, utils._rest_html_cache)
+
+    def test_preferred_type(self):
+        if managers.msgpack is None:
+            self.skipTest("msgpack not installed")
+        preferred = managers._preferred_type
+        self.assertEqual(preferred('application/msgpack'),
+                         'application/msgpack')
+        self.assertEqual(preferred('application/msgpack;q=0, '
+                                   'application/json'), 'application/json')
+        self.assertEqual(preferred('application/x-msgpack; q=0.5, */*'),
+                         'application/json')
+        self.assertEqual(preferred('application/json;q=0.8, '
+                                   'application/msgpack; charset=x; q=0.9'),
+                         'application/msgpack')
+        self.assertEqual(preferred('text/html, application/msgpack;q=0'),
+                         'application/json')
+        self.assertEqual(preferred(''), 'application/json')
+
+
+class TestChangeCoalescer(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.batches = []
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _run(self, delay):
+        self.loop.run_until_complete(asyncio.sleep(delay))
+
+    def test_interval_keeps_latest_value(self):
+        coalescer = ChangeCoalescer(self.loop, self.batches.append,
+                                    interval=0.01)
+        for value in range(100):
+            coalescer.push('obj', 'speed', value, 'object')
+        coalescer.push('obj', 'name', 'x', 'user')
+        self._run(0.05)
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual([(c['propId'], c['value']) for c in self.batches[0]],
+                         [('speed', 99), ('name', 'x')])
+
+    def test_max_rate(self):
+        coalescer = ChangeCoalescer(self.loop, self.batches.append,
+                                    max_rate=20)
+        coalescer.push('obj', 'speed', 1, 'object')
+        self._run(0.01)
+        coalescer.push('obj', 'speed', 2, 'object')
+        coalescer.push('obj', 'speed', 3, 'object')
+        self._run(0.01)
+        self.assertEqual(len(self.batches), 1)  # Held back by the rate limit
+        self._run(0.06)
+        self.assertEqual([b[0]['value'] for b in self.batches], [1, 3])
+
+
+class TestChangeBridge(unittest.TestCase):
+
+    def test_threads_coalesced(self):
+        loop = asyncio.new_event_loop()
+        batches = []
+        bridge = ChangeBridge(loop, batches.append)
+
+        def produce(obj_id):
+            for i in range(1000):
+                bridge.push(obj_id, 'volts', i)
+
+        threads = [threading.Thread(target=produce, args=(obj_id,))
+                   for obj_id in ('a', 'b')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        loop.run_until_complete(asyncio.sleep(0))
+        loop.close()
+
+        self.assertEqual(bridge.pending_count, 0)
+        self.assertEqual(sorted(batches[-1]),
+                         [('a', 'volts', 999), ('b', 'volts', 999)])
+
+
+class TestDeltaEncoder(unittest.TestCase):
+
+    @staticmethod
+    def _change(value):
+        return {'objId': 'obj', 'propId': 'html', 'value': value,
+                'eventSource': 'object'}
+
+    @staticmethod
+    def _progress(percent):
+        return ('<div class="progress">' * 20 +
+                '<div style="width: {0}%;">{0}%</div>'.format(percent) +
+                '</div>' * 20)
+
+    def test_patches_apply(self):
+        encoder = DeltaEncoder(threshold=100, resync=5)
+        first = encoder.encode(self._change(self._progress(10)))
+        self.assertEqual(first['version'], 1)
+        client_value = first['value']
+
+        for percent in (15, 20, 100, 5):
+            msg = encoder.encode(self._change(self._progress(percent)))
+            self.assertNotIn('value', msg)
+            self.assertEqual(msg['base'], msg['version'] - 1)
+            start, delete_count, text = msg['patch']
+            client_value = (client_value[:start] + text +
+                            client_value[start + delete_count:])
+            self.assertEqual(client_value, self._progress(percent))
+
+        # Periodic resync
+        self.assertIn('value', encoder.encode(self._change(self._progress(6))))
+        self.assertEqual(encoder.version('obj', 'html', self._progress(6)), 6)
+
+    def test_short_values_untouched(self):
+        encoder = DeltaEncoder(threshold=100)
+        change = self._change('short')
+        self.assertIs(encoder.encode(change), change)
+
+    def test_versions_survive_short_values(self):
+        encoder = DeltaEncoder(threshold=100)
+        first = encoder.encode(self._change(self._progress(10)))
+        self.assertEqual(first['version'], 1)
+        encoder.encode(self._change('short'))
+        self.assertIsNone(encoder.version('obj', 'html', self._progress(10)))
+
+        # Long value again: sent whole, under a version the client never saw
+        second = encoder.encode(self._change(self._progress(20)))
+        self.assertEqual(second['value'], self._progress(20))
+        self.assertEqual(second['version'], 3)
+        patch = encoder.encode(self._change(self._progress(30)))
+        self.assertEqual((patch['base'], patch['version']), (3, 4))
+
+
+class FakeSession(object):
+
+    def __init__(self, session_id, manager):
+        self.id = session_id
+        self.manager = manager
+        self.frames = []
+
+    def send_frame(self, frame):
+        self.frames.append(json.loads(frame[1:])[0])
+
+
+class FakeSessionManager(object):
+
+    def __init__(self):
+        self.sessions = []
+
+    def broadcast(self, msg):
+        for session in self.sessions:
+            session.frames.append(msg)
+
+
+class TestSubscriptions(unittest.TestCase):
+
+    Msg = namedtuple('Msg', ['tp', 'data'])
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.man = HttpMutaManager("Test", loop=self.loop,
+                                   proxy_log=logging.getLogger('test'))
+        self.sockjs_manager = FakeSessionManager()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _open(self, session_id):
+        session = FakeSession(session_id, self.sockjs_manager)
+        self.sockjs_manager.sessions.append(session)
+        self.man._sockjs_handler(self.Msg(sockjs.MSG_OPEN, None), session)
+        return session
+
+    def _send(self, session, data):
+        self.man._sockjs_handler(self.Msg(sockjs.MSG_MESSAGE,
+                                          json.dumps(data)), session)
+
+    def test_routing(self):
+        first = self._open('first')
+        second = self._open('second')
+        third = self._open('third')
+        self._send(first, {'type': 'subscribe', 'objects': ['a']})
+        self._send(second, {'type': 'subscribe', 'props': [['b', 'x']]})
+
+        self.man._properties_change([('a', 'x', 1), ('b', 'x', 2),
+                                     ('b', 'y', 3)])
+        self.man._property_change('c', 'x', 4)
+
+        self.assertEqual([[c['objId'] for c in f['params']['changes']]
+                          for f in first.frames], [['a']])
+        self.assertEqual([[c['propId'] for c in f['params']['changes']]
+                          for f in second.frames], [['x']])
+        self.assertEqual(len(third.frames), 2)  # Not subscribed, gets all
+
+        self._send(first, {'type': 'subscribe_all'})
+        self.man._property_change('c', 'x', 5)
+        self.assertEqual(first.frames[-1]['params']['value'], 5)
+        self.assertEqual(len(second.frames), 1)
+
+    def test_log_forwarding(self):
+        man = HttpMutaManager("Test", loop=self.loop,
+                              proxy_log=logging.getLogger('test.logs'),
+                              log_interval=0, log_max_rate=3)
+        man._sockjs_manager = self.sockjs_manager
+        everything = FakeSession('everything', self.sockjs_manager)
+        errors = FakeSession('errors', self.sockjs_manager)
+        self.sockjs_manager.sessions.extend([everything, errors])
+        for session in (everything, errors):
+            man._sockjs_sessions[session.id] = (session, Subscription())
+        man._client_message(man._sockjs_sessions['errors'][1],
+                            {'type': 'log_level', 'level': 'ERROR'})
+
+        log = logging.getLogger('test.logs')
+        log.setLevel(logging.DEBUG)
+        log.error("Parrot is %s", "dead")
+        for i in range(5):
+            log.info("Parrot is resting")
+        man._log_handler.flush()  # As by logging.shutdown(), sends nothing
+        self.assertEqual(everything.frames, [])
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        log.removeHandler(man._log_handler)
+
+        records = everything.frames[0]['params']['records']
+        self.assertEqual(len(everything.frames), 1)
+        self.assertEqual([record['msg'] for record in records],
+                         ["Parrot is dead"] + ["Parrot is resting"] * 2 +
+                         ["3 log records dropped (more than 3 records/s)."])
+        self.assertEqual(
+            [record['msg'] for record in errors.frames[0]['params']['records']],
+            ["Parrot is dead"])
+        self.assertEqual(len(man._log_handler.recent(logging.WARNING)), 2)
+
+    def test_binary_clients(self):
+        if managers.msgpack is None:
+            self.skipTest("msgpack not installed")
+        ws = FakeWebSocket()
+        subscription = Subscription()
+        subscription.subscribe(objects=['b'])
+        self.man._binary_clients[ws] = subscription
+        self.man._properties_change([('a', 'x', 1), ('b', 'x', 'ab')])
+        self.assertEqual(
+            managers._decode_body(ws.frames[0], managers.CONTENT_MSGPACK),
+            {'type': 'properties_change',
+             'params': {'changes': [{'objId': 'b', 'propId': 'x',
+                                     'value': 'ab', 'eventSource': 'object'}]}})
+
+
+class FakeWebSocket(object):
+
+    closed = False
+
+    def __init__(self):
+        self.frames = []
+        self.texts = []
+
+    def send_bytes(self, data):
+        self.frames.append(data)
+
+    def send_str(self, data):
+        self.texts.append(data)
+
+
+class TestBlocking(unittest.TestCase):
+
+    def test_offload_serialized(self):
+        loop = asyncio.new_event_loop()
+        man = HttpMutaManager("Test", loop=loop, blocking_workers=4,
+                              proxy_log=logging.getLogger('test'))
+        parrot = SlowParrot()
+        man.add_object(parrot, "Slow parrot")
+
+        async def read_all():
+            return await asyncio.gather(
+                *(parrot.gather_prop_values(offload=man._offload)
+                  for i in range(3)))
+
+        try:
+            values = loop.run_until_complete(read_all())
+        finally:
+            man._get_executor().shutdown()
+            loop.close()
+        self.assertEqual([dict(value) for value in values],
+                         [{'volts': 4000, 'fast_volts': 10}] * 3)
+        self.assertEqual(parrot.max_active, 1)
+        self.assertIn(threading.get_ident(), parrot.threads)
+        self.assertGreater(len(parrot.threads), 1)  # Executor used
+
+
+class FakeResponse(object):
+
+    content_type = managers.CONTENT_JSON
+    headers = {}
+
+    def __init__(self, data, status=200):
+        self.status = status
+        self._body = json.dumps(data).encode('utf-8')
+
+    @asyncio.coroutine
+    def read(self):
+        return self._body
+
+
+class FakeHttpSession(object):
+
+    def __init__(self, data):
+        self.data = data
+        self.requests = []
+
+    @asyncio.coroutine
+    def get(self, address, **kwargs):
+        self.requests.append(address)
+        return FakeResponse(self.data)
+
+
+class TestMirror(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.man = HttpMutaManager("Test", loop=self.loop, mirror_max_age=60,
+                                   proxy_log=logging.getLogger('test'))
+        self.remote = managers.HttpManagerProxy('http://remote')
+        self.remote._host_manager = self.man
+        self.remote._is_attached = True
+        self.remote._session = FakeHttpSession(
+            {'id': 'parrot', 'props': [{'id': 'volts', 'value': 1},
+                                       {'id': 'text', 'value': 'ab'},
+                                       {'id': 'stun'}]})
+        self.remote._add_remote_object('parrot')
+        self.obj = self.remote._registered_objects['parrot']
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _value(self, prop_id):
+        resp = self.loop.run_until_complete(self.obj.get_prop_value(prop_id))
+        return json.loads(resp.body.decode('utf-8'))
+
+    def test_reads_served_from_mirror(self):
+        self.assertEqual(self._value('volts'), 1)
+        self.remote._mirror_changes([{'objId': 'parrot', 'propId': 'volts',
+                                      'value': 2}])
+        self.assertEqual(self._value('volts'), 2)
+        self.assertEqual(self.loop.run_until_complete(
+            self.obj.mirrored_values()), {'volts': 2, 'text': 'ab'})
+        self.assertEqual(len(self.remote.session.requests), 1)
+
+        self.remote._mirror_changes([{'objId': 'parrot', 'propId': 'text',
+                                      'value': 'abc', 'version': 1},
+                                     {'objId': 'parrot', 'propId': 'text',
+                                      'patch': [1, 1, 'XY'], 'base': 1,
+                                      'version': 2}])
+        self.assertEqual(self._value('text'), 'aXYc')
+        self.assertEqual(len(self.remote.session.requests), 1)
+
+        # Patch of unknown base forces reload
+        self.remote._mirror_changes([{'objId': 'parrot', 'propId': 'text',
+                                      'patch': [0, 0, 'x'], 'base': 7,
+                                      'version': 8}])
+        self.assertEqual(self._value('text'), 'ab')
+        self.assertEqual(len(self.remote.session.requests), 2)
+
+    def test_max_age(self):
+        self._value('volts')
+        self.obj._mirror_time -= 61
+        self._value('volts')
+        self.assertEqual(len(self.remote.session.requests), 2)
+
+
+class FakeSnapshotResponse(object):
+
+    status = 200
+    content_type = managers.CONTENT_NDJSON
+
+    def __init__(self, records):
+        self.content = self
+        self._lines = [json.dumps(record).encode('utf-8') + b'\n'
+                       for record in records]
+
+    @asyncio.coroutine
+    def readline(self):
+        return self._lines.pop(0) if self._lines else b''
+
+
+class FakeSnapshotSession(object):
+
+    def __init__(self):
+        self.records = []
+        self.params = []
+
+    @asyncio.coroutine
+    def get(self, address, params=None, **kwargs):
+        self.params.append(params)
+        return FakeSnapshotResponse(self.records)
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.man = HttpMutaManager("Test", loop=self.loop, mirror_max_age=60,
+                                   proxy_log=logging.getLogger('test'))
+        self.parrot = Parrot()
+        self.parrot.muta_init("parrot")
+        self.remote = managers.HttpManagerProxy('http://remote')
+        self.remote._host_manager = self.man
+        self.remote._is_attached = True
+        self.remote._session = FakeSnapshotSession()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _record(self, with_schema=True):
+        temp = {'objId': 'parrot', 'schemaTag': self.parrot.schema_tag(),
+                'values': self.parrot.prop_values()}
+        if with_schema:
+            temp['schema'] = self.parrot.schema_to_dict()
+        return temp
+
+    def test_schema_reused(self):
+        session = self.remote.session
+        session.records = [self._record()]
+        self.assertTrue(self.loop.run_until_complete(
+            self.remote._load_snapshot()))
+        self.assertEqual(session.params[0], [])
+
+        self.remote._remove_remote_object('parrot')
+        session.records = [self._record(with_schema=False)]
+        self.loop.run_until_complete(self.remote._load_snapshot())
+        self.assertEqual(session.params[1],
+                         [('known', self.parrot.schema_tag())])
+
+        record = self.loop.run_until_complete(
+            self.remote._registered_objects['parrot'].snapshot_record())
+        self.assertEqual(record, self._record())
+        self.assertEqual([prop['id'] for prop in record['schema']['props']],
+                         list(self.parrot.props.keys()))
+
+
+class FakeManagerProxy(object):
+
+    is_being_removed = False
+
+    def __init__(self, address, delay, fails):
+        self.address = address
+        self.is_attached = False
+        self.reconnect_stats = managers.ReconnectStats()
+        self._delay = delay
+        self._fails = fails
+
+    @asyncio.coroutine
+    def attach(self, host_manager):
+        yield from asyncio.sleep(self._delay)
+        if self._fails:
+            raise managers.MutaManagerError("Parrot is dead")
+        self.is_attached = True
+
+
+class TestReconnector(unittest.TestCase):
+
+    def test_dead_manager_doesnt_block(self):
+        loop = asyncio.new_event_loop()
+        man = HttpMutaManager("Test", loop=loop, reconnect_max_delay=1,
+                              proxy_log=logging.getLogger('test'))
+        dead = FakeManagerProxy('http://dead', delay=0.3, fails=True)
+        alive = FakeManagerProxy('http://alive', delay=0.01, fails=False)
+        man._add_manager_proxy(dead)
+        man._add_manager_proxy(alive)
+
+        task = loop.create_task(man._remote_manager_reconnector(period=0.05))
+        loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertTrue(alive.is_attached)
+        self.assertEqual(dead.reconnect_stats.attempts, 0)  # Still waiting
+
+        loop.run_until_complete(asyncio.sleep(0.3))
+        task.cancel()
+        loop.run_until_complete(asyncio.sleep(0))
+        loop.close()
+
+        stats = man.reconnect_stats()
+        self.assertEqual(stats['http://alive']['successes'], 1)
+        self.assertTrue(stats['http://alive']['attached'])
+        self.assertEqual(stats['http://dead']['failures'], 1)
+        self.assertEqual(stats['http://dead']['lastError'], "Parrot is dead")
+        self.assertGreaterEqual(stats['http://dead']['lastLatency'], 0.3)
+
+    def test_backoff(self):
+        stats = managers.ReconnectStats()
+        delays = []
+        for i in range(6):
+            stats.failed(100, 0.1, "error", 1, 10)
+            delays.append(stats.next_attempt - 100)
+        for delay, full in zip(delays, [1, 2, 4, 8, 10, 10]):
+            self.assertTrue(full / 2 <= delay <= full)
+        stats.succeeded(0.1)
+        self.assertTrue(stats.due(0))
+
+
+class TestPolling(unittest.TestCase):
+
+    def test_only_changes_notified(self):
+        loop = asyncio.new_event_loop()
+        man = HttpMutaManager("Test", loop=loop,
+                              proxy_log=logging.getLogger('test'))
+        sockjs_manager = FakeSessionManager()
+        session = FakeSession('client', sockjs_manager)
+        sockjs_manager.sessions.append(session)
+        man._sockjs_manager = sockjs_manager
+        man._sockjs_sessions[session.id] = (session, Subscription())
+
+        parrot = PolledParrot()
+        man.add_object(parrot, "Polled parrot")
+        loop.run_until_complete(asyncio.sleep(0.05))
+        parrot.register = 5
+        loop.run_until_complete(asyncio.sleep(0.05))
+        stats = man.poll_stats()
+        man.remove_object(parrot)
+        loop.run_until_complete(asyncio.sleep(0))
+        loop.close()
+
+        changes = [(change['propId'], change['value'])
+                   for frame in session.frames
+                   if frame['type'] == 'properties_change'
+                   for change in frame['params']['changes']]
+        # The first poll only seeds the last values
+        self.assertEqual(changes, [('volts', 5), ('alive', True)])
+        self.assertGreater(parrot.reads, 2)
+        self.assertEqual(stats['groups'][0]['interval'], 0.02)
+        self.assertEqual(stats['groups'][0]['props'], 2)
+        self.assertGreater(stats['groups'][0]['ticks'], 2)
+
+
+class TestHistory(unittest.TestCase):
+
+    def test_wraparound(self):
+        history = HistoryBuffer(3)
+        for i in range(5):
+            history.append(float(i), i * 10)
+        history.append(5.0, "not a number")
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history.samples(),
+                         {'t': [2.0, 3.0, 4.0], 'v': [20.0, 30.0, 40.0]})
+        self.assertEqual(history.samples(2.5, 3.0),
+                         {'t': [3.0], 'v': [30.0]})
+        self.assertEqual(history.samples(10.0), {'t': [], 'v': []})
+
+    def test_downsample(self):
+        history = HistoryBuffer(100)
+        for i in range(10):
+            history.append(float(i), (-1) ** i * i)
+        temp = history.downsample(2, 0.0, 10.0)
+        self.assertEqual(temp['t'], [0.0, 5.0])
+        self.assertEqual(temp['min'], [-3.0, -9.0])
+        self.assertEqual(temp['max'], [4.0, 8.0])
+        self.assertEqual(temp['count'], [5, 5])
+
+    def test_numeric_only(self):
+        with self.assertRaises(MutaPropError):
+            mutaprops.MutaProperty('name', 'Name', MutaTypes.STRING,
+                                   history=10)
+
+    def test_manager_records(self):
+        loop = asyncio.new_event_loop()
+        man = HttpMutaManager("Test", loop=loop,
+                              proxy_log=logging.getLogger('test'))
+        parrot = PolledParrot()
+        man.add_object(parrot, "Polled parrot")
+        for value in range(6):
+            man._property_change("Polled parrot", 'volts', value)
+        man._property_change("Polled parrot", 'alive', True)
+
+        temp = man.prop_history("Polled parrot", 'volts')
+        self.assertEqual(temp['v'], [2.0, 3.0, 4.0, 5.0])
+        with self.assertRaises(KeyError):
+            man.prop_history("Polled parrot", 'alive')
+        man.remove_object(parrot)
+        with self.assertRaises(KeyError):
+            man.prop_history("Polled parrot", 'volts')
+        loop.run_until_complete(asyncio.sleep(0))
+        loop.close()
+
+
+class TestStreaming(unittest.TestCase):
+
+    def test_frame(self):
+        from array import array
+        frame = encode_frame([(3, array('d', [1.0, 2.0]),
+                               array('q', [-5, 7])),
+                              (4, array('d', [1.5]), array('d', [0.25]))])
+        blocks = decode_frame(frame)
+        self.assertEqual([(channel, list(times), list(values))
+                          for channel, times, values in blocks],
+                         [(3, [1.0, 2.0], [-5, 7]), (4, [1.5], [0.25])])
+        with self.assertRaises(ValueError):
+            decode_frame(frame[:-4])
+
+    def test_decimation(self):
+        loop = asyncio.new_event_loop()
+        sent = []
+        streamer = SampleStreamer(loop, lambda client, frame:
+                                  sent.append((client, frame)))
+        self.assertEqual(streamer.add_channel('obj', 'a', 'q'), 0)
+        self.assertEqual(streamer.add_channel('obj', 'b', 'd'), 1)
+        streamer.add_client('all')
+        streamer.add_client('half', decimation=2)
+        streamer.add_client('also half', decimation=2)
+        streamer.add_client('only b')
+        streamer.subscription('only b').subscribe(props=[('obj', 'b')])
+
+        self.assertFalse(streamer.push('obj', 'c', 1))
+        for i in range(3):
+            self.assertTrue(streamer.push('obj', 'a', i, timestamp=i))
+        streamer.push('obj', 'b', 0.5, timestamp=0)
+        streamer.flush()
+        for i in range(3, 5):
+            streamer.push('obj', 'a', i, timestamp=i)
+        streamer.flush()
+        loop.close()
+
+        received = {}
+        for client, frame in sent:
+            received.setdefault(client, []).extend(
+                (channel, list(values))
+                for channel, times, values in decode_frame(frame))
+        self.assertEqual(received['all'], [(0, [0, 1, 2]), (1, [0.5]),
+                                           (0, [3, 4])])
+        # Decimation continues across the frames
+        self.assertEqual(received['half'], [(0, [0, 2]), (1, [0.5]),
+                                            (0, [4])])
+        self.assertEqual(received['half'], received['also half'])
+        self.assertEqual(received['only b'], [(1, [0.5])])
+
+    def test_closed_loop(self):
+        loop = asyncio.new_event_loop()
+        streamer = SampleStreamer(loop, lambda client, frame: None)
+        streamer.add_channel('obj', 'a', 'd')
+        loop.close()
+        errors = []
+
+        def push():
+            try:
+                streamer.push('obj', 'a', 1.0)
+            except Exception as e:
+                errors.append(e)
+
+        # Samples from other threads after the shutdown are dropped
+        thread = threading.Thread(target=push)
+        thread.start()
+        thread.join()
+        self.assertEqual(errors, [])
+
+    def test_manager_streams(self):
+        loop = asyncio.new_event_loop()
+        man = HttpMutaManager("Test", loop=loop,
+                              proxy_log=logging.getLogger('test'))
+        sockjs_manager = FakeSessionManager()
+        session = FakeSession('client', sockjs_manager)
+        sockjs_manager.sessions.append(session)
+        man._sockjs_manager = sockjs_manager
+        man._sockjs_sessions[session.id] = (session, Subscription())
+        ws = FakeWebSocket()
+        man._streamer.add_client(ws)
+
+        parrot = StreamedParrot()
+        man.add_object(parrot, "Streamed parrot")
+        for value in (1.0, 2.0, 3.0):
+            parrot.current = value
+        man._streamer.flush()
+        history = man.prop_history("Streamed parrot", 'current')
+        man.remove_object(parrot)
+        loop.run_until_complete(asyncio.sleep(0))
+        loop.close()
+
+        # Regular notifications get only the latest value
+        self.assertEqual([(change['propId'], change['value'])
+                          for frame in session.frames
+                          if frame['type'] == 'properties_change'
+                          for change in frame['params']['changes']],
+                         [('current', 3.0)])
+        self.assertEqual(history['v'], [1.0, 2.0, 3.0])
+        [(channel, times, values)] = decode_frame(ws.frames[0])
+        self.assertEqual(list(values), [1.0, 2.0, 3.0])
+        channels = json.loads(ws.texts[0])['channels']
+        self.assertEqual(channels, [{'channel': channel,
+                                     'objId': "Streamed parrot",
+                                     'propId': 'current', 'typecode': 'd'}])
+
+
+def panel_register(i):
+    def fget(self):
+        self.reads.append(i)
+        return i
+
+    fget.__name__ = 'reg_{0}'.format(i)
+    return mutaproperty("Register {0}".format(i), MutaTypes.INT,
+                        hierarchy='Bank {0}/Status'.format(i // 5))(fget)
+
+
+class PanelBase(object):
+
+    def __init__(self):
+        self.reads = []
+
+
+Panel = mutaprop_class("Panel")(type('Panel', (PanelBase,), {
+    'reg_{0}'.format(i): panel_register(i) for i in range(20)}))
+
+
+class TestPropsPaging(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.man = HttpMutaManager("Test", loop=self.loop,
+                                   proxy_log=logging.getLogger('test'))
+        self.panel = Panel()
+        self.man.add_object(self.panel, "panel")
+
+    def tearDown(self):
+        self.man.remove_object(self.panel)
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+
+    def get_props(self, query):
+        from aiohttp.test_utils import make_mocked_request
+        request = make_mocked_request(
+            'GET', '/api/objects/panel/props?' + query,
+            match_info={'obj_id': 'panel'})
+        return self.loop.run_until_complete(self.man._get_props(request))
+
+    def test_paging(self):
+        resp = self.get_props('hierarchy=Bank 1&offset=1&limit=2')
+        self.assertEqual([prop['value'] for prop in json.loads(resp.text)],
+                         [6, 7])
+        self.assertEqual(resp.headers[HttpMutaManager.HEADER_TOTAL], '5')
+        # Only the returned props were read
+        self.assertEqual(self.panel.reads, [6, 7])
+
+        resp = self.get_props('prop_id=reg_3&prop_id=reg_17&type=property')
+        self.assertEqual([prop['id'] for prop in json.loads(resp.text)],
+                         ['reg_3', 'reg_17'])
+
+    def test_bad_query(self):
+        self.assertEqual(self.get_props('limit=-1').status, 400)
+        self.assertEqual(self.get_props('type=widget').status, 400)
+
+
+@mutaprop_class("Wired parrot")
+class WiredParrot(object):
+
+    def __init__(self):
+        self._volts = 0
+        self._wired = False
+
+    @mutaproperty("Voltage", MutaTypes.INT)
+    def volts(self):
+        return self._volts
+
+    @volts.setter
+    def volts(self, value):
+        self._volts = value
+
+    @mutaproperty("Age", MutaTypes.INT)
+    def age(self):
+        return 3
+
+    @mutasource
+    def wired(self):
+        return self._wired
+
+    @wired.setter
+    def wired(self, value):
+        self._wired = value
+
+
+class TestSetValues(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.man = HttpMutaManager("Test", loop=self.loop,
+                                   proxy_log=logging.getLogger('test'))
+        sockjs_manager = FakeSessionManager()
+        self.session = FakeSession('client', sockjs_manager)
+        sockjs_manager.sessions.append(self.session)
+        self.man._sockjs_manager = sockjs_manager
+        self.man._sockjs_sessions[self.session.id] = (self.session,
+                                                      Subscription())
+        self.parrot = WiredParrot()
+        self.man.add_object(self.parrot, "wired")
+
+    def tearDown(self):
+        self.man.remove_object(self.parrot)
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+
+    def put(self, path, data=None):
+        from aiohttp.test_utils import TestClient, TestServer
+
+        @asyncio.coroutine
+        def request():
+            client = TestClient(TestServer(self.man._app), loop=self.loop)
+            yield from client.start_server()
+            try:
+                resp = yield from client.put(path, json=data)
+                return resp.status, (yield from resp.json())
+            finally:
+                yield from client.close()
+
+        return self.loop.run_until_complete(request())
+
+    def notified(self):
+        return [(change['objId'], change['propId'], change['value'])
+                for frame in self.session.frames
+                if frame['type'] == 'properties_change'
+                for change in frame['params']['changes']]
+
+    def test_mixed_batch(self):
+        status, results = self.put('/api/objects/wired/values',
+                                   {'volts': 5, 'nothing': 1, 'age': 4,
+                                    'wired': True})
+        self.assertEqual(status, 200)
+        self.assertEqual({prop_id: result['status']
+                          for prop_id, result in results.items()},
+                         {'volts': 200, 'nothing': 404, 'age': 405,
+                          'wired': 405})
+        self.assertEqual(self.parrot.volts, 5)
+        self.assertFalse(self.parrot.wired)
+        self.assertEqual(self.notified(), [('wired', 'volts', 5)])
+
+    def test_all_values(self):
+        status, results = self.put('/api/values',
+                                   {'wired': {'volts': 'x', 'age': 1},
+                                    'missing': {'volts': 1}})
+        self.assertEqual(status, 200)
+        self.assertEqual(results['wired']['volts']['status'], 400)
+        self.assertEqual(results['wired']['age']['status'], 405)
+        self.assertEqual(results['missing']['volts']['status'], 404)
+
+        status, results = self.put('/api/values',
+                                   {'wired': {'volts': '7', 'wired': 1}})
+        self.assertEqual(results['wired']['volts']['status'], 200)
+        self.assertEqual(results['wired']['wired']['status'], 405)
+        self.assertEqual(self.notified(), [('wired', 'volts', 7)])
+
+    def test_streamed_single_prop(self):
+        ws = FakeWebSocket()
+        self.man._streamer.add_client(ws)
+        streamed = StreamedParrot()
+        self.man.add_object(streamed, "streamed")
+        try:
+            status, result = self.put(
+                '/api/objects/streamed/props/current?value=2.5')
+            self.man._streamer.flush()
+        finally:
+            self.man.remove_object(streamed)
+
+        self.assertEqual(status, 200)
+        [(channel, times, values)] = decode_frame(ws.frames[0])
+        self.assertEqual(list(values), [2.5])
+        self.assertEqual(self.notified(), [('streamed', 'current', 2.5)])
+
+
+class TestAttach(unittest.TestCase):
+
+    def test_first_view_from_snapshot(self):
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        loop = asyncio.new_event_loop()
+        master = HttpMutaManager("Master", loop=loop,
+                                 proxy_log=logging.getLogger('test'))
+        slave = HttpMutaManager("Slave", loop=loop,
+                                proxy_log=logging.getLogger('test'))
+        parrot = Parrot()
+        slave.add_object(parrot, "parrot")
+        requests = []
+
+        @web.middleware
+        @asyncio.coroutine
+        def count(request, handler):
+            requests.append(request.path)
+            return (yield from handler(request))
+
+        slave._app.middlewares.append(count)
+        server = TestServer(slave._app, loop=loop)
+
+        @asyncio.coroutine
+        def scenario():
+            yield from server.start_server(loop=loop)
+            proxy = managers.HttpManagerProxy(str(server.make_url('')))
+            yield from proxy.attach(master)
+            try:
+                requests.clear()
+                obj = master._muta_objects['parrot']
+                first = yield from obj.get_object()
+                second = yield from obj.get_object()
+                return first, second
+            finally:
+                yield from proxy.detach()
+                yield from master._on_shutdown(master._app)
+                yield from server.close()
+
+        first, second = loop.run_until_complete(
+            asyncio.wait_for(scenario(), 10))
+        loop.close()
+
+        self.assertEqual(json.loads(first.body)['props'],
+                         parrot.props_to_dict())
+        # Only the second view goes to the slave
+        self.assertEqual(requests, ['/api/objects/parrot'])
+        self.assertEqual(json.loads(second.body)['props'],
+                         parrot.props_to_dict())
+
+    def test_broken_snapshot(self):
+        from aiohttp.test_utils import TestServer
+
+        loop = asyncio.new_event_loop()
+        master = HttpMutaManager("Master", loop=loop,
+                                 proxy_log=logging.getLogger('test'))
+        slave = HttpMutaManager("Slave", loop=loop,
+                                proxy_log=logging.getLogger('test'))
+        slave.add_object(Parrot(), "parrot")
+        slave.add_object(Parrot(), "budgie")
+        server = TestServer(slave._app, loop=loop)
+
+        @asyncio.coroutine
+        def scenario():
+            yield from server.start_server(loop=loop)
+            proxy = managers.HttpManagerProxy(str(server.make_url('')))
+            read_records = proxy._read_records
+
+            @asyncio.coroutine
+            def broken(resp, callback):
+                def first_only(record):
+                    if proxy._registered_objects:
+                        raise ConnectionResetError("Stream broken")
+                    callback(record)
+                yield from read_records(resp, first_only)
+
+            proxy._read_records = broken
+            try:
+                with self.assertRaises(ConnectionResetError):
+                    yield from proxy.attach(master)
+                left = (set(master._muta_objects),
+                        dict(proxy._registered_objects))
+
+                proxy._read_records = read_records
+                yield from proxy.attach(master)
+                served = {obj_id: master._muta_objects[obj_id]
+                          for obj_id in ("parrot", "budgie")}
+                return left, served, dict(proxy._registered_objects)
+            finally:
+                yield from proxy.detach()
+                yield from master._on_shutdown(master._app)
+                yield from server.close()
+
+        left, served, registered = loop.run_until_complete(
+            asyncio.wait_for(scenario(), 10))
+        loop.close()
+
+        self.assertEqual(left, (set(), {}))
+        # The host serves the proxies updated by the mirror
+        for obj_id, obj in served.items():
+            self.assertIs(obj, registered[obj_id])
+
+    def test_shared_client_session(self):
+        from aiohttp.test_utils import TestServer
+
+        loop = asyncio.new_event_loop()
+        master = HttpMutaManager("Master", loop=loop,
+                                 proxy_log=logging.getLogger('test'),
+                                 client_limit=7, client_limit_per_host=4,
+                                 client_timeout=3)
+        servers = []
+        for obj_id in ("parrot", "budgie"):
+            slave = HttpMutaManager("Slave", loop=loop,
+                                    proxy_log=logging.getLogger('test'))
+            slave.add_object(Parrot(), obj_id)
+            servers.append(TestServer(slave._app, loop=loop))
+
+        @asyncio.coroutine
+        def scenario():
+            proxies = []
+            for server in servers:
+                yield from server.start_server(loop=loop)
+                proxies.append(
+                    managers.HttpManagerProxy(str(server.make_url(''))))
+            try:
+                for proxy in proxies:
+                    yield from proxy.attach(master)
+                obj = master._muta_objects['parrot']
+                yield from obj.get_props()
+                sessions = [proxy.session for proxy in proxies]
+                sessions.append(obj._session)
+                yield from proxies[0].detach()
+                open_after_detach = not master.client_session.closed
+            finally:
+                yield from proxies[1].detach()
+                yield from master._on_shutdown(master._app)
+                for server in servers:
+                    yield from server.close()
+            return sessions, obj, open_after_detach
+
+        session = master.client_session
+        connector = session.connector
+        sessions, obj, open_after_detach = loop.run_until_complete(
+            asyncio.wait_for(scenario(), 10))
+        loop.close()
+
+        self.assertTrue(all(temp is session for temp in sessions))
+        self.assertEqual(connector.limit, 7)
+        self.assertEqual(connector.limit_per_host, 4)
+        # The read timeout is only on the request/response calls
+        self.assertIs(obj._timeout, master.client_request_timeout)
+        if managers.ClientTimeout is not None:
+            self.assertIsNone(session.timeout.sock_read)
+            self.assertEqual(session.timeout.connect, 3)
+            self.assertEqual(master.client_request_timeout.sock_read, 3)
+        else:  # aiohttp < 3.3
+            self.assertEqual(session._conn_timeout, 3)
+            self.assertEqual(master.client_request_timeout, 3)
+        # Detach keeps the shared session, shutdown closes it
+        self.assertTrue(open_after_detach)
+        self.assertTrue(session.closed)
+        self.assertTrue(connector.closed)